@@ -12,6 +12,7 @@ from .orchestration import (
     PROD_STAGE,
     CONVERSION_JOB_NAME,
     METRICS_FILENAME,
+    INTERMEDIATE_METRICS_FILENAME,
     BENCHMARK_FILENAME,
     CHECKPOINT_DIRNAME,
     OUTPUTS_DIRNAME,
@@ -42,6 +43,7 @@ __all__ = [
     "PROD_STAGE",
     "CONVERSION_JOB_NAME",
     "METRICS_FILENAME",
+    "INTERMEDIATE_METRICS_FILENAME",
     "BENCHMARK_FILENAME",
     "CHECKPOINT_DIRNAME",
     "OUTPUTS_DIRNAME",
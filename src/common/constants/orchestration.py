@@ -21,6 +21,7 @@ CONVERSION_JOB_NAME = "model-conversion"
 
 # File and directory naming constants
 METRICS_FILENAME = "metrics.json"
+INTERMEDIATE_METRICS_FILENAME = "intermediate_metrics.jsonl"
 BENCHMARK_FILENAME = "benchmark.json"
 CHECKPOINT_DIRNAME = "checkpoint"
 OUTPUTS_DIRNAME = "outputs"
@@ -16,6 +16,11 @@ from .tokenization_utils import (
     prepare_onnx_inputs,
     get_offset_mapping,
     prepare_onnx_inputs_with_offsets,
+    tokenize_for_onnx,
+    OnnxTokenization,
+    bucket_length,
+    pad_to_length,
+    DEFAULT_PADDING_BUCKETS,
 )
 from .platform_detection import detect_platform, resolve_platform_checkpoint_path
 from .mlflow_setup import (
@@ -46,6 +51,11 @@ __all__ = [
     "prepare_onnx_inputs",
     "get_offset_mapping",
     "prepare_onnx_inputs_with_offsets",
+    "tokenize_for_onnx",
+    "OnnxTokenization",
+    "bucket_length",
+    "pad_to_length",
+    "DEFAULT_PADDING_BUCKETS",
     "detect_platform",
     "resolve_platform_checkpoint_path",
     "setup_mlflow_cross_platform",
@@ -0,0 +1,453 @@
+from __future__ import annotations
+
+"""Archive formats for checkpoint archives: tar, parallel gzip and zstd.
+
+Archives are always written and read as tar streams, so they can be written
+to any binary file object. ``tar.gz`` archives are compressed in blocks on a
+thread pool; each block is a complete gzip member, which every gzip reader
+(``tarfile``, ``tar xzf``) reads as one stream. ``tar.zst`` needs the optional
+``zstandard`` package.
+
+An archive may end with a ``.archive_manifest.json`` member listing the
+SHA-256 of every file; ``extract_archive`` verifies files against it.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import posixpath
+import queue
+import tarfile
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import IO, Any, Dict, Optional
+
+from .logging_utils import get_logger
+
+logger = get_logger(__name__)
+
+# Archive format -> file suffix
+ARCHIVE_FORMATS = {
+    "tar": ".tar",
+    "tar.gz": ".tar.gz",
+    "tar.zst": ".tar.zst",
+}
+DEFAULT_ARCHIVE_FORMAT = "tar.gz"
+ARCHIVE_MANIFEST_NAME = ".archive_manifest.json"
+
+_DEFAULT_COMPRESSION_LEVELS = {"tar.gz": 6, "tar.zst": 3}
+_GZIP_BLOCK_SIZE = 4 * 1024 * 1024
+_COPY_CHUNK_SIZE = 1024 * 1024
+
+
+def default_threads() -> int:
+    """Threads used for compression and extraction when not configured."""
+    return max(1, min(8, os.cpu_count() or 1))
+
+
+def archive_suffix(archive_format: str) -> str:
+    """
+    File suffix of an archive format.
+
+    Args:
+        archive_format: One of ``ARCHIVE_FORMATS``.
+
+    Returns:
+        Suffix such as ".tar.gz".
+
+    Raises:
+        ValueError: If the format is unknown.
+    """
+    if archive_format not in ARCHIVE_FORMATS:
+        raise ValueError(
+            f"Unknown archive format '{archive_format}'. "
+            f"Supported: {', '.join(ARCHIVE_FORMATS)}"
+        )
+    return ARCHIVE_FORMATS[archive_format]
+
+
+def detect_archive_format(path: str | Path) -> Optional[str]:
+    """
+    Archive format of a file name, or None if it is not an archive.
+
+    Args:
+        path: File path or name (".tgz" is read as "tar.gz").
+
+    Returns:
+        Archive format or None.
+    """
+    name = str(path).lower()
+    if name.endswith(".tgz"):
+        return "tar.gz"
+    # Longest suffix first so ".tar.gz" is not read as ".gz"
+    for archive_format, suffix in sorted(
+        ARCHIVE_FORMATS.items(), key=lambda item: len(item[1]), reverse=True
+    ):
+        if name.endswith(suffix):
+            return archive_format
+    return None
+
+
+def strip_archive_suffix(name: str) -> str:
+    """Remove an archive suffix (e.g. "checkpoint.tar.gz" -> "checkpoint")."""
+    archive_format = detect_archive_format(name)
+    if archive_format is None:
+        return name
+    suffix = ".tgz" if name.lower().endswith(".tgz") else ARCHIVE_FORMATS[archive_format]
+    return name[: -len(suffix)]
+
+
+def _import_zstandard() -> Any:
+    try:
+        import zstandard
+    except ImportError as e:
+        raise ImportError(
+            "tar.zst archives require the 'zstandard' package (pip install zstandard)"
+        ) from e
+    return zstandard
+
+
+def _gzip_member(block: bytes, compression_level: int) -> bytes:
+    # mtime=0 makes gzip.compress use zlib in one call, which releases the GIL
+    return gzip.compress(block, compresslevel=compression_level, mtime=0)
+
+
+class ParallelGzipWriter:
+    """
+    Gzip writer that compresses blocks on a thread pool (like pigz).
+
+    Output is a sequence of gzip members written in order. Closing the writer
+    finishes the stream but does not close the underlying file object.
+    """
+
+    def __init__(
+        self,
+        fileobj: IO[bytes],
+        compression_level: int = 6,
+        threads: Optional[int] = None,
+        block_size: int = _GZIP_BLOCK_SIZE,
+    ):
+        """
+        Initialize the writer.
+
+        Args:
+            fileobj: Binary file object to write the compressed stream to.
+            compression_level: Gzip level (1 fastest - 9 smallest).
+            threads: Compression threads (default: ``default_threads()``).
+            block_size: Uncompressed bytes per gzip member.
+        """
+        threads = threads or default_threads()
+        self._fileobj = fileobj
+        self._compression_level = compression_level
+        self._block_size = block_size
+        self._buffer = bytearray()
+        self._executor = ThreadPoolExecutor(max_workers=threads, thread_name_prefix="gzip")
+        self._pending: deque = deque()
+        self._max_pending = 2 * threads
+        self._closed = False
+
+    def write(self, data: bytes) -> int:
+        """Buffer data and compress every full block."""
+        self._buffer += data
+        while len(self._buffer) >= self._block_size:
+            self._submit(bytes(self._buffer[: self._block_size]))
+            del self._buffer[: self._block_size]
+        return len(data)
+
+    def _submit(self, block: bytes) -> None:
+        self._pending.append(
+            self._executor.submit(_gzip_member, block, self._compression_level))
+        # Bound memory: write finished blocks once enough are queued
+        while len(self._pending) > self._max_pending:
+            self._fileobj.write(self._pending.popleft().result())
+
+    def flush(self) -> None:
+        """No-op: data is written as blocks complete (see ``close``)."""
+
+    def close(self) -> None:
+        """Compress the remaining data and write all pending blocks."""
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            if self._buffer:
+                self._submit(bytes(self._buffer))
+                self._buffer.clear()
+            while self._pending:
+                self._fileobj.write(self._pending.popleft().result())
+        finally:
+            self._executor.shutdown(wait=True)
+
+
+class _UncompressedWriter:
+    """Pass-through writer whose close() leaves the file object open."""
+
+    def __init__(self, fileobj: IO[bytes]):
+        self._fileobj = fileobj
+
+    def write(self, data: bytes) -> int:
+        return self._fileobj.write(data)
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+def open_archive_writer(
+    fileobj: IO[bytes],
+    archive_format: str = DEFAULT_ARCHIVE_FORMAT,
+    compression_level: Optional[int] = None,
+    threads: Optional[int] = None,
+) -> Any:
+    """
+    Wrap a binary file object with the compressor of an archive format.
+
+    Write a tar stream to the result (``tarfile.open(fileobj=..., mode="w|")``)
+    and close it to finish compression; ``fileobj`` is left open.
+
+    Args:
+        fileobj: Binary file object receiving the archive.
+        archive_format: One of ``ARCHIVE_FORMATS``.
+        compression_level: Compression level (format default if None).
+        threads: Compression threads (default: ``default_threads()``).
+
+    Returns:
+        Writable file object.
+
+    Raises:
+        ValueError: If the format is unknown.
+        ImportError: If "tar.zst" is used without ``zstandard``.
+    """
+    archive_suffix(archive_format)
+    if archive_format == "tar":
+        return _UncompressedWriter(fileobj)
+    level = compression_level or _DEFAULT_COMPRESSION_LEVELS[archive_format]
+    if archive_format == "tar.gz":
+        return ParallelGzipWriter(fileobj, compression_level=level, threads=threads)
+    zstandard = _import_zstandard()
+    compressor = zstandard.ZstdCompressor(level=level, threads=threads or -1)
+    return compressor.stream_writer(fileobj, closefd=False)
+
+
+class _PrefetchReader:
+    """Reads a stream ahead on a background thread (decompression overlaps file writes)."""
+
+    def __init__(self, stream: IO[bytes], chunk_size: int = _COPY_CHUNK_SIZE, depth: int = 8):
+        self._queue: queue.Queue = queue.Queue(maxsize=depth)
+        self._chunk = b""
+        self._offset = 0
+        self._eof = False
+        self._error: Optional[BaseException] = None
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._fill, args=(stream, chunk_size), name="archive-prefetch", daemon=True)
+        self._thread.start()
+
+    def _fill(self, stream: IO[bytes], chunk_size: int) -> None:
+        try:
+            while not self._stop.is_set():
+                chunk = stream.read(chunk_size)
+                self._queue.put(chunk)
+                if not chunk:
+                    return
+        except BaseException as e:
+            self._error = e
+            self._queue.put(b"")
+
+    def read(self, size: int = -1) -> bytes:
+        parts = []
+        remaining = size
+        while size < 0 or remaining > 0:
+            if self._offset >= len(self._chunk):
+                if self._eof:
+                    break
+                self._chunk, self._offset = self._queue.get(), 0
+                if not self._chunk:
+                    self._eof = True
+                    if self._error is not None:
+                        raise self._error
+                    break
+            end = len(self._chunk) if size < 0 else min(len(self._chunk), self._offset + remaining)
+            parts.append(self._chunk[self._offset:end])
+            remaining -= end - self._offset
+            self._offset = end
+        return b"".join(parts)
+
+    def close(self) -> None:
+        self._stop.set()
+        # Unblock the filler if the queue is full
+        while self._thread.is_alive():
+            try:
+                self._queue.get(timeout=0.1)
+            except queue.Empty:
+                pass
+
+
+def _open_decompressed(fileobj: IO[bytes], archive_format: str) -> IO[bytes]:
+    if archive_format == "tar.gz":
+        return gzip.GzipFile(fileobj=fileobj, mode="rb")
+    if archive_format == "tar.zst":
+        return _import_zstandard().ZstdDecompressor().stream_reader(fileobj, closefd=False)
+    return fileobj
+
+
+def _member_target(extract_to: Path, member: tarfile.TarInfo) -> Path:
+    name = posixpath.normpath(member.name)
+    if name.startswith(("/", "..")) or os.path.isabs(name):
+        raise ValueError(f"Archive member outside extraction directory: {member.name}")
+    return extract_to / name
+
+
+def _copy_hashed(src: IO[bytes], target: Path, size: int) -> str:
+    digest = hashlib.sha256()
+    target.parent.mkdir(parents=True, exist_ok=True)
+    with open(target, "wb") as out:
+        remaining = size
+        while remaining > 0:
+            chunk = src.read(min(_COPY_CHUNK_SIZE, remaining))
+            if not chunk:
+                raise ValueError(f"Unexpected end of archive data for {target.name}")
+            digest.update(chunk)
+            out.write(chunk)
+            remaining -= len(chunk)
+    return digest.hexdigest()
+
+
+def _extract_member_at_offset(archive_path: Path, member: tarfile.TarInfo, target: Path) -> str:
+    with open(archive_path, "rb") as f:
+        f.seek(member.offset_data)
+        digest = _copy_hashed(f, target, member.size)
+    os.utime(target, (member.mtime, member.mtime))
+    return digest
+
+
+def _extract_uncompressed(
+    archive_path: Path, extract_to: Path, threads: int
+) -> tuple[Dict[str, str], Optional[Dict[str, Any]]]:
+    """Extract a plain tar by copying members from their offsets in parallel."""
+    digests: Dict[str, str] = {}
+    manifest = None
+    with tarfile.open(archive_path, "r:") as tar:
+        members = tar.getmembers()
+        files = []
+        for member in members:
+            if member.name == ARCHIVE_MANIFEST_NAME:
+                manifest = json.load(tar.extractfile(member))
+            elif member.isdir():
+                _member_target(extract_to, member).mkdir(parents=True, exist_ok=True)
+            elif member.isfile():
+                files.append(member)
+            else:
+                logger.debug(f"Skipping non-regular archive member: {member.name}")
+    with ThreadPoolExecutor(max_workers=threads, thread_name_prefix="untar") as executor:
+        futures = {
+            member.name: executor.submit(
+                _extract_member_at_offset, archive_path, member, _member_target(extract_to, member))
+            for member in files
+        }
+        for name, future in futures.items():
+            digests[name] = future.result()
+    return digests, manifest
+
+
+def _extract_stream(
+    archive_path: Path, extract_to: Path, archive_format: str
+) -> tuple[Dict[str, str], Optional[Dict[str, Any]]]:
+    """Extract a compressed tar, decompressing on a background thread."""
+    digests: Dict[str, str] = {}
+    manifest = None
+    with open(archive_path, "rb") as raw:
+        reader = _PrefetchReader(_open_decompressed(raw, archive_format))
+        try:
+            with tarfile.open(fileobj=reader, mode="r|") as tar:
+                for member in tar:
+                    if member.name == ARCHIVE_MANIFEST_NAME:
+                        manifest = json.load(tar.extractfile(member))
+                    elif member.isdir():
+                        _member_target(extract_to, member).mkdir(parents=True, exist_ok=True)
+                    elif member.isfile():
+                        target = _member_target(extract_to, member)
+                        digests[member.name] = _copy_hashed(
+                            tar.extractfile(member), target, member.size)
+                        os.utime(target, (member.mtime, member.mtime))
+                    else:
+                        logger.debug(f"Skipping non-regular archive member: {member.name}")
+        finally:
+            reader.close()
+    return digests, manifest
+
+
+def verify_archive_manifest(manifest: Dict[str, Any], digests: Dict[str, str]) -> None:
+    """
+    Check extracted files against the hashes of an archive manifest.
+
+    Manifest file paths are relative to ``manifest["extracted_path"]`` (the
+    archive's root directory).
+
+    Args:
+        manifest: Archive manifest with ``files`` entries (``path``, ``sha256``).
+        digests: SHA-256 of each extracted member, by member name.
+
+    Raises:
+        ValueError: If a file is missing or its hash differs.
+    """
+    root = manifest.get("extracted_path", "")
+    for entry in manifest.get("files", []):
+        expected = entry.get("sha256")
+        if not expected:
+            continue
+        name = posixpath.join(root, entry["path"]) if root else entry["path"]
+        actual = digests.get(name)
+        if actual is None:
+            raise ValueError(f"File listed in archive manifest is missing: {name}")
+        if actual != expected:
+            raise ValueError(f"Checksum mismatch for {name}: archive is corrupt")
+
+
+def extract_archive(
+    archive_path: Path,
+    extract_to: Path,
+    archive_format: Optional[str] = None,
+    threads: Optional[int] = None,
+) -> Optional[Dict[str, Any]]:
+    """
+    Extract a tar, tar.gz or tar.zst archive and verify it against its manifest.
+
+    Plain tar members are copied in parallel; compressed archives are
+    decompressed on a background thread while files are written.
+
+    Args:
+        archive_path: Archive file.
+        extract_to: Directory to extract into (created if missing).
+        archive_format: Format (detected from the file name if None).
+        threads: Extraction threads for plain tar (default: ``default_threads()``).
+
+    Returns:
+        The archive manifest, or None if the archive has none.
+
+    Raises:
+        ValueError: If the format is unknown, a member would be written outside
+            ``extract_to``, or a file fails manifest verification.
+    """
+    archive_path = Path(archive_path)
+    archive_format = archive_format or detect_archive_format(archive_path)
+    if archive_format is None:
+        raise ValueError(f"Not a supported archive: {archive_path}")
+    archive_suffix(archive_format)
+
+    extract_to = Path(extract_to)
+    extract_to.mkdir(parents=True, exist_ok=True)
+    if archive_format == "tar":
+        digests, manifest = _extract_uncompressed(
+            archive_path, extract_to, threads or default_threads())
+    else:
+        digests, manifest = _extract_stream(archive_path, extract_to, archive_format)
+
+    if manifest is not None:
+        verify_archive_manifest(manifest, digests)
+    return manifest
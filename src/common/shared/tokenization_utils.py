@@ -26,39 +26,91 @@ lifecycle:
 
 """Shared tokenization utilities for ONNX inference and testing."""
 
-from typing import Dict, Optional, Set
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Set, Tuple, Union
 import numpy as np
 from transformers import PreTrainedTokenizer
 
+# Sequence lengths that dynamically padded batches are rounded up to. A small
+# fixed set keeps ONNX Runtime's per-shape memory plans reusable.
+DEFAULT_PADDING_BUCKETS: Tuple[int, ...] = (32, 64, 128, 256, 512)
 
-def prepare_onnx_inputs(
-    tokenizer: PreTrainedTokenizer,
-    text: str,
+
+def bucket_length(
+    length: int,
+    padding_buckets: Sequence[int],
     max_length: int,
-    input_names: Optional[Set[str]] = None,
-) -> Dict[str, np.ndarray]:
+) -> int:
     """
-    Prepare tokenized inputs for ONNX inference.
+    Round a sequence length up to the nearest padding bucket.
     
     Args:
-        tokenizer: Tokenizer instance.
-        text: Input text to tokenize.
-        max_length: Maximum sequence length.
-        input_names: Optional set of expected input names from ONNX model.
-                     If provided, only includes inputs that the model expects.
+        length: Longest (unpadded) sequence length in the batch.
+        padding_buckets: Allowed padded lengths.
+        max_length: Maximum sequence length; never exceeded.
     
     Returns:
-        Dictionary of tokenized inputs ready for ONNX Runtime (int64 arrays).
+        Smallest bucket that fits ``length``, capped at ``max_length``.
     """
-    # Tokenize text
-    tokenizer_output = tokenizer(
-        text,
-        return_tensors="np",
-        padding="max_length",
-        truncation=True,
-        max_length=max_length,
-    )
+    for bucket in sorted(padding_buckets):
+        if bucket >= length:
+            return min(bucket, max_length)
+    return max_length
+
+
+def pad_to_length(
+    array: np.ndarray,
+    target_length: int,
+    pad_value: int = 0,
+    padding_side: str = "right",
+) -> np.ndarray:
+    """
+    Pad the sequence axis (axis 1) of a batched array to ``target_length``.
     
+    Args:
+        array: Array of shape (batch, seq_len, ...).
+        target_length: Desired sequence length.
+        pad_value: Fill value for the new positions.
+        padding_side: "right" or "left", matching the tokenizer.
+    
+    Returns:
+        Padded array (the input itself if it is already long enough).
+    """
+    missing = target_length - array.shape[1]
+    if missing <= 0:
+        return array
+    pad_width = [(0, 0)] * array.ndim
+    pad_width[1] = (missing, 0) if padding_side == "left" else (0, missing)
+    return np.pad(array, pad_width, mode="constant", constant_values=pad_value)
+
+
+def _pad_encoding_to_bucket(
+    tokenizer: PreTrainedTokenizer,
+    encoding: Dict[str, np.ndarray],
+    max_length: int,
+    padding_buckets: Sequence[int],
+) -> Dict[str, np.ndarray]:
+    """Pad every array of a longest-padded encoding up to its length bucket."""
+    target = bucket_length(encoding["input_ids"].shape[1], padding_buckets, max_length)
+    padding_side = getattr(tokenizer, "padding_side", "right")
+    pad_token_id = tokenizer.pad_token_id if tokenizer.pad_token_id is not None else 0
+    return {
+        k: pad_to_length(
+            v,
+            target,
+            pad_token_id if k == "input_ids" else 0,
+            padding_side,
+        )
+        for k, v in encoding.items()
+    }
+
+
+def _build_onnx_feeds(
+    tokenizer: PreTrainedTokenizer,
+    tokenizer_output: Dict[str, np.ndarray],
+    input_names: Optional[Set[str]] = None,
+) -> Dict[str, np.ndarray]:
+    """Filter tokenizer output to the model inputs and convert them to int64."""
     # Prepare feeds for ONNX
     feeds: Dict[str, np.ndarray] = {}
     
@@ -90,10 +142,49 @@ def prepare_onnx_inputs(
     return feeds
 
 
+def prepare_onnx_inputs(
+    tokenizer: PreTrainedTokenizer,
+    text: Union[str, List[str]],
+    max_length: int,
+    input_names: Optional[Set[str]] = None,
+    padding_buckets: Optional[Sequence[int]] = None,
+) -> Dict[str, np.ndarray]:
+    """
+    Prepare tokenized inputs for ONNX inference.
+    
+    Args:
+        tokenizer: Tokenizer instance.
+        text: Input text to tokenize, or a list of texts to tokenize as one batch.
+        max_length: Maximum sequence length.
+        input_names: Optional set of expected input names from ONNX model.
+                     If provided, only includes inputs that the model expects.
+        padding_buckets: Optional bucket lengths. If provided, pads only to the
+                         longest sequence rounded up to the nearest bucket
+                         instead of always padding to ``max_length``.
+    
+    Returns:
+        Dictionary of tokenized inputs ready for ONNX Runtime (int64 arrays).
+    """
+    # Tokenize text
+    tokenizer_output = tokenizer(
+        text,
+        return_tensors="np",
+        padding="longest" if padding_buckets else "max_length",
+        truncation=True,
+        max_length=max_length,
+    )
+    if padding_buckets:
+        tokenizer_output = _pad_encoding_to_bucket(
+            tokenizer, dict(tokenizer_output), max_length, padding_buckets)
+    
+    return _build_onnx_feeds(tokenizer, tokenizer_output, input_names)
+
+
 def get_offset_mapping(
     tokenizer: PreTrainedTokenizer,
     text: str,
     max_length: int,
+    padding_buckets: Optional[Sequence[int]] = None,
 ) -> Optional[np.ndarray]:
     """
     Get token offset mapping from tokenizer.
@@ -102,6 +193,7 @@ def get_offset_mapping(
         tokenizer: Tokenizer instance.
         text: Input text.
         max_length: Maximum sequence length.
+        padding_buckets: Optional bucket lengths (see ``prepare_onnx_inputs``).
     
     Returns:
         Offset mapping array of shape (seq_len, 2) or None if unavailable.
@@ -111,7 +203,7 @@ def get_offset_mapping(
         tokenizer_output = tokenizer(
             text,
             return_offsets_mapping=True,
-            padding="max_length",
+            padding="longest" if padding_buckets else "max_length",
             truncation=True,
             max_length=max_length,
         )
@@ -119,7 +211,18 @@ def get_offset_mapping(
         if "offset_mapping" in tokenizer_output:
             offset_mapping_list = tokenizer_output["offset_mapping"]
             if offset_mapping_list and len(offset_mapping_list) > 0:
-                return np.array(offset_mapping_list[0], dtype=np.int32)
+                offset_mapping = np.array(offset_mapping_list, dtype=np.int32)
+                # A single string yields (seq_len, 2); batched output adds a leading axis
+                if offset_mapping.ndim == 3:
+                    offset_mapping = offset_mapping[0]
+                if padding_buckets:
+                    target = bucket_length(len(offset_mapping), padding_buckets, max_length)
+                    offset_mapping = pad_to_length(
+                        offset_mapping[np.newaxis],
+                        target,
+                        padding_side=getattr(tokenizer, "padding_side", "right"),
+                    )[0]
+                return offset_mapping
     except Exception:
         # Offset mapping is optional - return None if unavailable
         pass
@@ -127,34 +230,162 @@ def get_offset_mapping(
     return None
 
 
+@dataclass
+class OnnxTokenization:
+    """
+    Everything inference needs from one tokenizer call.
+    
+    Attributes:
+        feeds: ONNX Runtime inputs (int64 arrays of shape (batch, seq_len)).
+        attention_mask: Attention mask of shape (batch, seq_len).
+        offset_mapping: Character offsets of shape (batch, seq_len, 2), or None
+            if the tokenizer cannot produce them.
+        non_padding_ids: Per row, the input ids where attention_mask == 1.
+        sample_mapping: For sliding-window tokenization, the index of the
+            source text of each row (window); None when rows are texts.
+    """
+    
+    feeds: Dict[str, np.ndarray]
+    attention_mask: np.ndarray
+    offset_mapping: Optional[np.ndarray]
+    non_padding_ids: List[np.ndarray]
+    sample_mapping: Optional[np.ndarray] = None
+    
+    @classmethod
+    def from_feeds(
+        cls,
+        feeds: Dict[str, np.ndarray],
+        offset_mapping: Optional[np.ndarray] = None,
+        attention_mask: Optional[np.ndarray] = None,
+        sample_mapping: Optional[np.ndarray] = None,
+    ) -> "OnnxTokenization":
+        """
+        Build a tokenization from ONNX feeds.
+        
+        Args:
+            feeds: ONNX inputs; must contain ``input_ids``.
+            offset_mapping: Optional offsets of shape (batch, seq_len, 2).
+            attention_mask: Attention mask; taken from ``feeds`` (or all ones)
+                when not given.
+            sample_mapping: Optional window-to-text index (see class docs).
+        
+        Returns:
+            OnnxTokenization instance.
+        """
+        input_ids = feeds["input_ids"]
+        if attention_mask is None:
+            attention_mask = feeds.get("attention_mask")
+        if attention_mask is None:
+            attention_mask = np.ones_like(input_ids)
+        non_padding_ids = [
+            ids[mask == 1] for ids, mask in zip(input_ids, attention_mask)
+        ]
+        return cls(feeds, attention_mask, offset_mapping, non_padding_ids, sample_mapping)
+    
+    @property
+    def has_overflow(self) -> bool:
+        """Whether any text was split into more than one window."""
+        return (
+            self.sample_mapping is not None
+            and len(self.sample_mapping) > len(np.unique(self.sample_mapping))
+        )
+    
+    @property
+    def input_ids(self) -> np.ndarray:
+        """Input ids of shape (batch, seq_len)."""
+        return self.feeds["input_ids"]
+
+
+def tokenize_for_onnx(
+    tokenizer: PreTrainedTokenizer,
+    text: Union[str, List[str]],
+    max_length: int,
+    input_names: Optional[Set[str]] = None,
+    padding_buckets: Optional[Sequence[int]] = None,
+    stride: Optional[int] = None,
+) -> OnnxTokenization:
+    """
+    Tokenize once and return ONNX feeds, attention mask and offset mapping.
+    
+    Replaces separate ``prepare_onnx_inputs`` and ``get_offset_mapping`` calls,
+    which tokenize the same text twice. Several texts are tokenized in one
+    batched call.
+    
+    Args:
+        tokenizer: Tokenizer instance (a fast tokenizer is needed for offsets).
+        text: Input text, or a list of texts to tokenize as one batch.
+        max_length: Maximum sequence length.
+        input_names: Optional set of expected input names from ONNX model.
+        padding_buckets: Optional bucket lengths (see ``prepare_onnx_inputs``).
+        stride: If set, texts longer than ``max_length`` are split into
+            overlapping windows sharing ``stride`` tokens instead of being
+            truncated; ``sample_mapping`` then maps rows to texts.
+    
+    Returns:
+        OnnxTokenization with a leading batch axis on every array.
+    """
+    texts = [text] if isinstance(text, str) else list(text)
+    tokenize_kwargs = dict(
+        return_tensors="np",
+        padding="longest" if padding_buckets else "max_length",
+        truncation=True,
+        max_length=max_length,
+    )
+    if stride is not None:
+        if not getattr(tokenizer, "is_fast", False):
+            raise ValueError("Sliding-window tokenization requires a fast tokenizer")
+        tokenize_kwargs.update(return_overflowing_tokens=True, stride=stride)
+    try:
+        encoding = dict(tokenizer(texts, return_offsets_mapping=True, **tokenize_kwargs))
+    except NotImplementedError:
+        # Slow (Python) tokenizers cannot return offsets
+        encoding = dict(tokenizer(texts, **tokenize_kwargs))
+    
+    sample_mapping = encoding.pop("overflow_to_sample_mapping", None)
+    if sample_mapping is not None:
+        sample_mapping = np.asarray(sample_mapping)
+    
+    if padding_buckets:
+        encoding = _pad_encoding_to_bucket(
+            tokenizer, encoding, max_length, padding_buckets)
+    
+    offset_mapping = encoding.pop("offset_mapping", None)
+    if offset_mapping is not None:
+        offset_mapping = np.asarray(offset_mapping, dtype=np.int32)
+    
+    attention_mask = encoding.get("attention_mask")
+    feeds = _build_onnx_feeds(tokenizer, encoding, input_names)
+    return OnnxTokenization.from_feeds(
+        feeds, offset_mapping, attention_mask, sample_mapping)
+
+
 def prepare_onnx_inputs_with_offsets(
     tokenizer: PreTrainedTokenizer,
     text: str,
     max_length: int,
     input_names: Optional[Set[str]] = None,
+    padding_buckets: Optional[Sequence[int]] = None,
 ) -> tuple[Dict[str, np.ndarray], Optional[np.ndarray]]:
     """
     Prepare ONNX inputs and offset mapping in one call.
     
-    This is more efficient than calling prepare_onnx_inputs and get_offset_mapping
-    separately, as it can reuse tokenization results.
+    Uses a single tokenizer call (see ``tokenize_for_onnx``).
     
     Args:
         tokenizer: Tokenizer instance.
         text: Input text to tokenize.
         max_length: Maximum sequence length.
         input_names: Optional set of expected input names from ONNX model.
+        padding_buckets: Optional bucket lengths (see ``prepare_onnx_inputs``).
     
     Returns:
         Tuple of (feeds_dict, offset_mapping).
         - feeds_dict: Dictionary of tokenized inputs for ONNX.
-        - offset_mapping: Offset mapping array or None.
+        - offset_mapping: Offset mapping array of shape (seq_len, 2) or None.
     """
-    # First tokenize for ONNX (without offsets for speed)
-    feeds = prepare_onnx_inputs(tokenizer, text, max_length, input_names)
-    
-    # Then get offset mapping separately (can be slower, but done once)
-    offset_mapping = get_offset_mapping(tokenizer, text, max_length)
-    
-    return feeds, offset_mapping
-
+    tokenization = tokenize_for_onnx(
+        tokenizer, text, max_length, input_names, padding_buckets)
+    offset_mapping = tokenization.offset_mapping
+    if offset_mapping is not None:
+        offset_mapping = offset_mapping[0]
+    return tokenization.feeds, offset_mapping
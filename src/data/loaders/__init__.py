@@ -8,6 +8,13 @@ from .dataset_loader import (
     load_dataset,
     build_label_list,
     ResumeNERDataset,
+    align_annotations_to_tokens,
+    encode_annotations_to_labels,
+)
+
+from .tokenized_cache import (
+    TokenizedDataset,
+    load_or_build_tokenized_dataset,
 )
 
 # Import from benchmark_loader (moved from benchmarking/data_loader.py)
@@ -19,6 +26,10 @@ __all__ = [
     "load_dataset",
     "build_label_list",
     "ResumeNERDataset",
+    "align_annotations_to_tokens",
+    "encode_annotations_to_labels",
+    "TokenizedDataset",
+    "load_or_build_tokenized_dataset",
     "load_test_texts",
 ]
 
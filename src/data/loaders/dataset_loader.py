@@ -8,7 +8,7 @@ responsibility:
   - Build label lists from configuration
   - Split datasets with optional stratification
   - Normalize text for tokenization
-  - Encode annotations to labels
+  - Align annotations to token labels (IO or BIO)
 inputs:
   - JSON dataset files
   - Data configuration
@@ -29,8 +29,9 @@ lifecycle:
 import json
 import re
 from pathlib import Path
-from typing import Any, Dict, List, Tuple, Optional, TYPE_CHECKING, cast
+from typing import Any, Dict, List, Sequence, Tuple, Optional, TYPE_CHECKING, cast
 
+import numpy as np
 from sklearn.model_selection import train_test_split
 
 if TYPE_CHECKING:
@@ -275,33 +276,220 @@ def normalize_text_for_tokenization(raw_text: Any) -> str:
         return ""
 
 
+def uses_bio_labels(label2id: Dict[str, int]) -> bool:
+    """Whether a label mapping uses ``B-``/``I-`` prefixed tags."""
+    return any(label.startswith("B-") for label in label2id)
+
+
+def align_annotations_to_tokens(
+    annotations: Sequence[Optional[Sequence[Sequence[Any]]]],
+    offsets: Sequence[Any],
+    label2id: Dict[str, int],
+    bio: bool = False,
+) -> List[np.ndarray]:
+    """
+    Label the tokens of a batch of documents from character-level annotations.
+
+    A token takes the label of the first annotation (in list order) that it
+    overlaps; ``(0, 0)`` special tokens and uncovered tokens are labelled
+    ``O``. The whole batch is aligned in one pass: token and annotation
+    spans are laid out on a single row-major axis and matched with
+    ``np.searchsorted``, so cost grows with tokens plus annotations rather
+    than their product.
+
+    Args:
+        annotations: Per-document annotations as [start, end, entity_type].
+        offsets: Per-document token offsets of shape (seq_len, 2). Rows may
+            have different lengths.
+        label2id: Mapping from label strings to integer IDs.
+        bio: If True, emit ``B-``/``I-`` prefixed labels, starting a new
+            ``B-`` at the first token of each annotation.
+
+    Returns:
+        One array of label IDs per document, aligned with its offsets.
+    """
+    if len(offsets) == 0:
+        return []
+    o_id = label2id["O"]
+    offset_arrays = [np.asarray(o, dtype=np.int64).reshape(-1, 2) for o in offsets]
+    lengths = [len(o) for o in offset_arrays]
+    split_points = np.cumsum(lengths)[:-1]
+    tokens = np.concatenate(offset_arrays)
+    labels = np.full(len(tokens), o_id, dtype=np.int64)
+
+    ann_rows: List[int] = []
+    ann_spans: List[Tuple[int, int]] = []
+    ann_types: List[str] = []
+    for row, doc_annotations in enumerate(annotations):
+        for ann_start, ann_end, ent, *_ in doc_annotations or []:
+            ann_rows.append(row)
+            ann_spans.append((int(ann_start), int(ann_end)))
+            ann_types.append(ent)
+    if not ann_spans or not len(tokens):
+        return np.split(labels, split_points)
+
+    # Special tokens (0, 0) never overlap an annotation; leaving them out
+    # keeps the remaining offsets sorted
+    real = np.flatnonzero((tokens[:, 0] != 0) | (tokens[:, 1] != 0))
+    token_rows = np.repeat(np.arange(len(offset_arrays)), lengths)[real]
+    spans = np.asarray(ann_spans, dtype=np.int64)
+    # Offset each document onto its own stretch of one axis so spans of
+    # different documents can never match
+    stride = int(max(tokens.max(), spans.max())) + 1
+    token_starts = token_rows * stride + tokens[real, 0]
+    token_ends = token_rows * stride + tokens[real, 1]
+    ann_base = np.asarray(ann_rows, dtype=np.int64) * stride
+    ann_starts = ann_base + spans[:, 0]
+    ann_ends = ann_base + spans[:, 1]
+
+    # A token overlaps an annotation iff token_end > ann_start and token_start < ann_end
+    if np.all(np.diff(token_starts) >= 0) and np.all(np.diff(token_ends) >= 0):
+        first = np.searchsorted(token_ends, ann_starts, side="right")
+        stop = np.searchsorted(token_starts, ann_ends, side="left")
+        counts = np.maximum(stop - first, 0)
+        ann_idx = np.repeat(np.arange(len(spans)), counts)
+        run_starts = np.repeat(np.cumsum(counts) - counts, counts)
+        token_idx = np.repeat(first, counts) + np.arange(counts.sum()) - run_starts
+    else:
+        # Offsets out of order (unusual tokenizers): compare all pairs
+        overlap = (token_ends[:, None] > ann_starts[None, :]) & (
+            token_starts[:, None] < ann_ends[None, :])
+        token_idx, ann_idx = np.nonzero(overlap)
+
+    # Earlier annotations take precedence over later overlapping ones
+    no_match = len(spans)
+    owner = np.full(len(real), no_match, dtype=np.int64)
+    np.minimum.at(owner, token_idx, ann_idx)
+    covered = owner < no_match
+
+    if bio:
+        inside_ids = np.array([label2id.get(f"I-{t}", o_id) for t in ann_types] + [o_id])
+        begin_ids = np.array([label2id.get(f"B-{t}", o_id) for t in ann_types] + [o_id])
+        begins = np.ones(len(real), dtype=bool)
+        begins[1:] = owner[1:] != owner[:-1]
+        real_labels = np.where(begins, begin_ids[owner], inside_ids[owner])
+    else:
+        type_ids = np.array([label2id.get(t, o_id) for t in ann_types] + [o_id])
+        real_labels = type_ids[owner]
+    labels[real[covered]] = real_labels[covered]
+    return np.split(labels, split_points)
+
+
 def encode_annotations_to_labels(
     text: str,
     annotations: List[List[Any]],
     offsets: List[Tuple[int, int]],
     label2id: Dict[str, int],
+    bio: bool = False,
 ) -> List[int]:
     """
     Encode character-level annotations to token-level labels.
 
+    Single-document wrapper around ``align_annotations_to_tokens``.
+
     Args:
         text: Original text string.
         annotations: List of annotations as [start, end, entity_type].
         offsets: List of token offset tuples (start, end).
         label2id: Mapping from label strings to integer IDs.
+        bio: If True, emit ``B-``/``I-`` prefixed labels.
 
     Returns:
         List of label IDs corresponding to each token.
     """
-    labels = []
-    for start, end in offsets:
-        lab = "O"
-        for ann_start, ann_end, ent in annotations:
-            if not (end <= ann_start or start >= ann_end):
-                lab = ent
-                break
-        labels.append(label2id.get(lab, label2id["O"]))
-    return labels
+    labels = align_annotations_to_tokens([annotations], [offsets], label2id, bio=bio)[0]
+    return list(map(int, labels))
+
+
+def prepare_sample_for_tokenization(
+    item: Any, idx: int
+) -> Tuple[str, List[List[Any]]]:
+    """
+    Normalize and validate a sample's text and annotations for tokenization.
+
+    Args:
+        item: Sample dictionary with "text" and "annotations" keys.
+        idx: Index of the sample (used in error messages).
+
+    Returns:
+        Tuple of (text, annotations). Text is a non-empty plain ``str`` with
+        invalid UTF-8 removed; annotations is always a list.
+
+    Raises:
+        TypeError: If the sample is not a dictionary or its text cannot be
+            normalized to a string.
+    """
+    # Ensure item is a dictionary
+    if not isinstance(item, dict):
+        raise TypeError(
+            f"Expected dict for sample at index {idx}, got {type(item)}: {item}"
+        )
+
+    # Get and normalize text
+    raw_text = item.get("text", "")
+    text = normalize_text_for_tokenization(raw_text)
+
+    # Ensure text is a string after normalization
+    if not isinstance(text, str):
+        raise TypeError(
+            f"Text must be a string after normalization, got {type(text)}: {text}. "
+            f"Original raw_text type: {type(raw_text)}, value: {raw_text}. "
+            f"Item keys: {list(item.keys()) if isinstance(item, dict) else 'N/A'}"
+        )
+
+    # Ensure text is a proper string (not bytes or other string-like types)
+    # Convert to plain str if it's a subclass
+    if not type(text) is str:  # Use 'is' not 'isinstance' to catch subclasses
+        text = str(text)
+
+    # Ensure text is not empty (tokenizer may fail on empty strings)
+    if not text or not text.strip():
+        # Use a placeholder if text is empty
+        text = " "
+
+    # Final validation: ensure text is a plain Python str
+    if not isinstance(text, str) or not type(text) is str:
+        raise TypeError(
+            f"Text validation failed: type={type(text)}, isinstance(str)={isinstance(text, str)}, "
+            f"value={repr(text[:100])}"
+        )
+
+    annotations = item.get("annotations", []) or []
+
+    # Ensure annotations is a list
+    if not isinstance(annotations, list):
+        annotations = []
+
+    # Additional validation: ensure text is valid UTF-8
+    # Handle surrogate characters and other invalid UTF-8 by cleaning them
+    try:
+        # Try to encode/decode to check validity
+        text.encode('utf-8').decode('utf-8')
+    except (UnicodeEncodeError, UnicodeDecodeError) as e:
+        # Clean invalid UTF-8 characters (surrogates, etc.)
+        # Replace invalid characters with a placeholder or remove them
+        try:
+            # Try encoding with error handling
+            text = text.encode(
+                'utf-8', errors='replace').decode('utf-8', errors='replace')
+        except Exception:
+            # If that fails, remove surrogate characters manually
+            # Surrogate characters are in the range \ud800-\udfff
+            text = re.sub(r'[\ud800-\udfff]', '', text)
+            # If text becomes empty after cleaning, use placeholder
+            if not text.strip():
+                text = " "
+
+    # Final type check - must be a plain Python string
+    if not isinstance(text, str) or type(text) is not str:
+        raise TypeError(
+            f"CRITICAL: Text is not a string before tokenizer call. "
+            f"Type: {type(text)}, Value: {repr(text[:100])}, "
+            f"Index: {idx}, Item keys: {list(item.keys())}, "
+            f"Raw text type: {type(raw_text)}, Raw text: {repr(raw_text[:100]) if isinstance(raw_text, str) else raw_text}"
+        )
+
+    return text, annotations
 
 
 # Import Dataset lazily - only when ResumeNERDataset is actually instantiated
@@ -338,10 +526,22 @@ class ResumeNERDataset:
         self.tokenizer = tokenizer
         self.max_length = max_length
         self.label2id = label2id
+        self._lengths: Optional[np.ndarray] = None
 
     def __len__(self) -> int:
         return len(self.samples)
 
+    @property
+    def lengths(self) -> np.ndarray:
+        """Token count of each sample (tokenized once in one batch call, then cached)."""
+        if self._lengths is None:
+            texts = [
+                prepare_sample_for_tokenization(item, i)[0] for i, item in enumerate(self.samples)
+            ]
+            encoded = self.tokenizer(texts, truncation=True, max_length=self.max_length)
+            self._lengths = np.array([len(ids) for ids in encoded["input_ids"]], dtype=np.int64)
+        return self._lengths
+
     def __getitem__(self, idx: int) -> Dict[str, "torch.Tensor"]:
         """
         Encode a single sample.
@@ -355,79 +555,10 @@ class ResumeNERDataset:
         orchestration pipeline can be validated.
         """
         item = self.samples[idx]
-
-        # Ensure item is a dictionary
-        if not isinstance(item, dict):
-            raise TypeError(
-                f"Expected dict for sample at index {idx}, got {type(item)}: {item}"
-            )
-
-        # Get and normalize text
+        text, annotations = prepare_sample_for_tokenization(item, idx)
         raw_text = item.get("text", "")
-        text = normalize_text_for_tokenization(raw_text)
-
-        # Ensure text is a string after normalization
-        if not isinstance(text, str):
-            raise TypeError(
-                f"Text must be a string after normalization, got {type(text)}: {text}. "
-                f"Original raw_text type: {type(raw_text)}, value: {raw_text}. "
-                f"Item keys: {list(item.keys()) if isinstance(item, dict) else 'N/A'}"
-            )
-
-        # Ensure text is a proper string (not bytes or other string-like types)
-        # Convert to plain str if it's a subclass
-        if not type(text) is str:  # Use 'is' not 'isinstance' to catch subclasses
-            text = str(text)
-
-        # Ensure text is not empty (tokenizer may fail on empty strings)
-        if not text or not text.strip():
-            # Use a placeholder if text is empty
-            text = " "
-
-        # Final validation: ensure text is a plain Python str
-        if not isinstance(text, str) or not type(text) is str:
-            raise TypeError(
-                f"Text validation failed: type={type(text)}, isinstance(str)={isinstance(text, str)}, "
-                f"value={repr(text[:100])}"
-            )
-
-        annotations = item.get("annotations", []) or []
-
-        # Ensure annotations is a list
-        if not isinstance(annotations, list):
-            annotations = []
-
         supports_offsets = bool(getattr(self.tokenizer, "is_fast", False))
 
-        # Additional validation: ensure text is valid UTF-8
-        # Handle surrogate characters and other invalid UTF-8 by cleaning them
-        try:
-            # Try to encode/decode to check validity
-            text.encode('utf-8').decode('utf-8')
-        except (UnicodeEncodeError, UnicodeDecodeError) as e:
-            # Clean invalid UTF-8 characters (surrogates, etc.)
-            # Replace invalid characters with a placeholder or remove them
-            try:
-                # Try encoding with error handling
-                text = text.encode(
-                    'utf-8', errors='replace').decode('utf-8', errors='replace')
-            except Exception:
-                # If that fails, remove surrogate characters manually
-                # Surrogate characters are in the range \ud800-\udfff
-                text = re.sub(r'[\ud800-\udfff]', '', text)
-                # If text becomes empty after cleaning, use placeholder
-                if not text.strip():
-                    text = " "
-
-        # Final type check - must be a plain Python string
-        if not isinstance(text, str) or type(text) is not str:
-            raise TypeError(
-                f"CRITICAL: Text is not a string before tokenizer call. "
-                f"Type: {type(text)}, Value: {repr(text[:100])}, "
-                f"Index: {idx}, Item keys: {list(item.keys())}, "
-                f"Raw text type: {type(raw_text)}, Raw text: {repr(raw_text[:100]) if isinstance(raw_text, str) else raw_text}"
-            )
-
         # Final check before tokenizer call
         try:
             encoded = self.tokenizer(
@@ -455,7 +586,7 @@ class ResumeNERDataset:
         if supports_offsets and "offset_mapping" in encoded:
             offsets = encoded.pop("offset_mapping")[0].tolist()
             labels = encode_annotations_to_labels(
-                text, annotations, offsets, self.label2id
+                text, annotations, offsets, self.label2id, bio=uses_bio_labels(self.label2id)
             )
         else:
             seq_len = encoded["input_ids"].shape[1]
@@ -0,0 +1,340 @@
+"""
+@meta
+name: tokenized_cache
+type: utility
+domain: data
+responsibility:
+  - Tokenize datasets once and cache token ids, masks and labels on disk
+  - Serve cached encodings as memory-mapped token classification datasets
+  - Share one cache across HPO trials, CV folds, refit and final training
+inputs:
+  - Dataset samples
+  - Tokenizer and max_length
+  - Label mapping
+outputs:
+  - Memory-mapped token classification datasets
+tags:
+  - utility
+  - data
+  - caching
+ci:
+  runnable: true
+  needs_gpu: false
+  needs_cloud: false
+lifecycle:
+  status: active
+"""
+
+"""Pre-tokenized, memory-mapped dataset cache."""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import uuid
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, TYPE_CHECKING, Union
+
+import numpy as np
+
+from .dataset_loader import (
+    align_annotations_to_tokens,
+    prepare_sample_for_tokenization,
+    uses_bio_labels,
+)
+
+if TYPE_CHECKING:
+    import torch
+
+logger = logging.getLogger(__name__)
+
+# Per-sample token rows: tokenizer output lists or aligned label arrays
+_Rows = List[Union[List[int], np.ndarray]]
+
+# Bump when the on-disk layout or the encoding logic changes
+CACHE_FORMAT_VERSION = 2
+
+_META_FILE = "meta.json"
+_OFFSETS_FILE = "offsets.npy"
+_LABELS_KEY = "labels"
+_TOKENIZE_BATCH_SIZE = 256
+
+
+def dataset_fingerprint(samples: Sequence[Dict[str, Any]]) -> str:
+    """
+    Hash dataset samples (text and annotations) in order.
+
+    Args:
+        samples: Dataset samples.
+
+    Returns:
+        Hex SHA-256 digest of the samples.
+    """
+    digest = hashlib.sha256()
+    for sample in samples:
+        digest.update(json.dumps(sample, sort_keys=True, default=str).encode("utf-8"))
+        digest.update(b"\n")
+    return digest.hexdigest()
+
+
+def _tokenizer_identity(tokenizer: Any) -> Dict[str, Any]:
+    """Settings that determine how a tokenizer encodes text."""
+    return {
+        "name": getattr(tokenizer, "name_or_path", ""),
+        "class": type(tokenizer).__name__,
+        "vocab_size": len(tokenizer),
+        "is_fast": bool(getattr(tokenizer, "is_fast", False)),
+        "truncation_side": getattr(tokenizer, "truncation_side", "right"),
+    }
+
+
+def tokenized_cache_key(
+    samples: Sequence[Dict[str, Any]],
+    tokenizer: Any,
+    max_length: int,
+    label2id: Dict[str, int],
+) -> str:
+    """
+    Cache key for a dataset encoded with a given tokenizer and label set.
+
+    Args:
+        samples: Dataset samples.
+        tokenizer: Tokenizer instance.
+        max_length: Maximum sequence length.
+        label2id: Mapping from label strings to integer IDs.
+
+    Returns:
+        Hex SHA-256 key.
+    """
+    payload = {
+        "version": CACHE_FORMAT_VERSION,
+        "dataset": dataset_fingerprint(samples),
+        "tokenizer": _tokenizer_identity(tokenizer),
+        "max_length": max_length,
+        "label2id": label2id,
+    }
+    return hashlib.sha256(
+        json.dumps(payload, sort_keys=True, default=str).encode("utf-8")
+    ).hexdigest()
+
+
+class TokenizedDataset:
+    """
+    Token classification dataset backed by memory-mapped arrays.
+
+    Each encoding key (``input_ids``, ``attention_mask``, ``labels``, ...) is
+    one flat int32 array holding every sample's tokens back to back, with
+    ``offsets[i]:offsets[i + 1]`` delimiting sample ``i``. Items match
+    ``ResumeNERDataset`` output. Subsets (e.g. CV folds) share the arrays.
+    """
+
+    def __init__(
+        self,
+        arrays: Dict[str, np.ndarray],
+        offsets: np.ndarray,
+        indices: Optional[np.ndarray] = None,
+        path: Optional[Path] = None,
+    ) -> None:
+        """
+        Initialize the dataset.
+
+        Args:
+            arrays: Flat token arrays by encoding key.
+            offsets: Sample boundaries into the flat arrays (length n + 1).
+            indices: Optional sample indices visible through this dataset.
+            path: Cache entry directory the arrays are mapped from, if any.
+        """
+        self.arrays = arrays
+        self.offsets = offsets
+        self.path = path
+        self.indices = (
+            np.arange(len(offsets) - 1) if indices is None else np.asarray(indices, dtype=np.int64)
+        )
+
+    @classmethod
+    def load(cls, path: Path) -> "TokenizedDataset":
+        """
+        Open a cache directory written by ``load_or_build_tokenized_dataset``.
+
+        Args:
+            path: Cache entry directory.
+
+        Returns:
+            Dataset over memory-mapped arrays.
+        """
+        with open(path / _META_FILE, "r", encoding="utf-8") as f:
+            meta = json.load(f)
+        arrays = {
+            key: np.load(path / f"{key}.npy", mmap_mode="r") for key in meta["keys"]
+        }
+        offsets = np.load(path / _OFFSETS_FILE)
+        if len(offsets) != meta["num_samples"] + 1:
+            raise ValueError(f"Offsets do not match sample count in {path}")
+        return cls(arrays, offsets, path=path)
+
+    @property
+    def lengths(self) -> np.ndarray:
+        """Token count of each visible sample."""
+        return np.asarray(self.offsets[self.indices + 1] - self.offsets[self.indices])
+
+    def subset(self, indices: Sequence[int]) -> "TokenizedDataset":
+        """
+        View a subset of samples without copying token arrays.
+
+        Args:
+            indices: Sample indices relative to this dataset.
+
+        Returns:
+            Dataset over the selected samples.
+        """
+        selected = self.indices[np.asarray(indices, dtype=np.int64)]
+        return TokenizedDataset(self.arrays, self.offsets, selected, path=self.path)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Spawned DataLoader workers re-map the files instead of receiving copies
+        state = self.__dict__.copy()
+        if self.path is not None:
+            state["arrays"] = list(self.arrays)
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        if state["path"] is not None:
+            state["arrays"] = {
+                key: np.load(state["path"] / f"{key}.npy", mmap_mode="r") for key in state["arrays"]
+            }
+        self.__dict__.update(state)
+
+    def __len__(self) -> int:
+        return len(self.indices)
+
+    def __getitem__(self, idx: int) -> Dict[str, "torch.Tensor"]:
+        import torch
+
+        row = self.indices[idx]
+        start, end = self.offsets[row], self.offsets[row + 1]
+        return {
+            key: torch.from_numpy(np.array(array[start:end], dtype=np.int64))
+            for key, array in self.arrays.items()
+        }
+
+
+def _encode_samples(
+    samples: Sequence[Dict[str, Any]],
+    tokenizer: Any,
+    max_length: int,
+    label2id: Dict[str, int],
+) -> Dict[str, _Rows]:
+    """Tokenize samples in batches and align their labels."""
+    supports_offsets = bool(getattr(tokenizer, "is_fast", False))
+    o_label = label2id.get("O", 0)
+    encoded: Dict[str, _Rows] = {}
+
+    for batch_start in range(0, len(samples), _TOKENIZE_BATCH_SIZE):
+        prepared = [
+            prepare_sample_for_tokenization(item, batch_start + i)
+            for i, item in enumerate(samples[batch_start:batch_start + _TOKENIZE_BATCH_SIZE])
+        ]
+        texts = [text for text, _ in prepared]
+        batch = tokenizer(
+            texts,
+            truncation=True,
+            max_length=max_length,
+            return_offsets_mapping=supports_offsets,
+        )
+        offset_mappings = batch.pop("offset_mapping", None)
+
+        for key, rows in batch.items():
+            encoded.setdefault(key, []).extend(rows)
+        labels: List[np.ndarray]
+        if offset_mappings is not None:
+            labels = align_annotations_to_tokens(
+                [annotations for _, annotations in prepared], offset_mappings, label2id,
+                bio=uses_bio_labels(label2id))
+        else:
+            labels = [np.full(len(ids), o_label, dtype=np.int64) for ids in batch["input_ids"]]
+        encoded.setdefault(_LABELS_KEY, []).extend(labels)
+
+    return encoded
+
+
+def _write_cache(path: Path, encoded: Dict[str, _Rows], num_samples: int) -> None:
+    """Write flat token arrays, offsets and metadata to ``path``."""
+    path.mkdir(parents=True)
+    lengths = np.fromiter(
+        (len(row) for row in encoded.get(_LABELS_KEY, [])), dtype=np.int64, count=num_samples)
+    offsets = np.zeros(num_samples + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    np.save(path / _OFFSETS_FILE, offsets)
+
+    if num_samples == 0:
+        # Empty split (e.g. no validation data): nothing was tokenized
+        encoded = {key: [] for key in ("input_ids", "attention_mask", _LABELS_KEY)}
+    for key, rows in encoded.items():
+        flat = (
+            np.concatenate([np.asarray(row, dtype=np.int32) for row in rows])
+            if rows else np.empty(0, dtype=np.int32)
+        )
+        np.save(path / f"{key}.npy", flat)
+
+    with open(path / _META_FILE, "w", encoding="utf-8") as f:
+        json.dump(
+            {"version": CACHE_FORMAT_VERSION, "num_samples": num_samples, "keys": list(encoded)},
+            f,
+        )
+
+
+def load_or_build_tokenized_dataset(
+    samples: Sequence[Dict[str, Any]],
+    tokenizer: Any,
+    max_length: int,
+    label2id: Dict[str, int],
+    cache_dir: Path,
+) -> TokenizedDataset:
+    """
+    Load a tokenized dataset from the cache, building it on a miss.
+
+    Entries are keyed by dataset fingerprint, tokenizer, ``max_length`` and
+    label mapping, so every trial, fold and training run over the same data
+    reuses one encoding. Builds are written to a temporary directory and
+    renamed into place, so concurrent processes never see a partial entry.
+
+    Args:
+        samples: Dataset samples with "text" and "annotations" keys.
+        tokenizer: Tokenizer instance.
+        max_length: Maximum sequence length.
+        label2id: Mapping from label strings to integer IDs.
+        cache_dir: Root directory of the tokenization cache.
+
+    Returns:
+        Dataset over the cached, memory-mapped encodings.
+    """
+    cache_dir = Path(cache_dir)
+    key = tokenized_cache_key(samples, tokenizer, max_length, label2id)
+    entry_dir = cache_dir / key[:16]
+
+    if entry_dir.exists():
+        try:
+            dataset = TokenizedDataset.load(entry_dir)
+            logger.debug(f"Loaded tokenized dataset from cache: {entry_dir}")
+            return dataset
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Rebuilding unreadable tokenization cache {entry_dir}: {e}")
+            shutil.rmtree(entry_dir, ignore_errors=True)
+
+    logger.info(f"Tokenizing {len(samples)} samples into cache: {entry_dir}")
+    encoded = _encode_samples(samples, tokenizer, max_length, label2id)
+
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    tmp_dir = cache_dir / f".{key[:16]}.{os.getpid()}.{uuid.uuid4().hex[:8]}.tmp"
+    try:
+        _write_cache(tmp_dir, encoded, len(samples))
+        os.rename(tmp_dir, entry_dir)
+    except OSError:
+        # Another process finished the same entry first; use theirs
+        if not (entry_dir / _META_FILE).exists():
+            raise
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    return TokenizedDataset.load(entry_dir)
@@ -49,6 +49,43 @@ class APIConfig:
     # Model inference settings
     MAX_SEQUENCE_LENGTH: int = int(os.getenv("MAX_SEQUENCE_LENGTH", "512"))
     ONNX_PROVIDERS: List[str] = ["CPUExecutionProvider"]  # Can add CUDAExecutionProvider for GPU
+    # Session pool: concurrent runs go to idle sessions. Intra-op threads of 0
+    # split the cores across sessions (at most 4 each). Affinities are one
+    # ORT "session.intra_op_thread_affinities" value per session, "|"-separated.
+    ONNX_SESSION_POOL_SIZE: int = int(os.getenv("ONNX_SESSION_POOL_SIZE", "1"))
+    ONNX_INTRA_OP_THREADS: int = int(os.getenv("ONNX_INTRA_OP_THREADS", "0"))
+    ONNX_INTER_OP_THREADS: int = int(os.getenv("ONNX_INTER_OP_THREADS", "1"))
+    ONNX_EXECUTION_MODE: str = os.getenv("ONNX_EXECUTION_MODE", "sequential").lower()
+    ONNX_CPU_AFFINITY: List[str] = [
+        a.strip() for a in os.getenv("ONNX_CPU_AFFINITY", "").split("|") if a.strip()
+    ]
+    # Pad batches only to the longest sequence, rounded up to one of these lengths.
+    # Set to an empty string to always pad to MAX_SEQUENCE_LENGTH.
+    PADDING_BUCKETS: List[int] = [
+        int(b) for b in os.getenv("PADDING_BUCKETS", "32,64,128,256,512").split(",") if b.strip()
+    ]
+
+    # Largest batch run in one session call; bigger batches are sorted by
+    # length and split so each sub-batch pads only to its own bucket (0 disables)
+    INFERENCE_SUB_BATCH_SIZE: int = int(os.getenv("INFERENCE_SUB_BATCH_SIZE", "16"))
+
+    # Sliding windows: split texts longer than MAX_SEQUENCE_LENGTH into
+    # overlapping windows instead of truncating them (opt-in: changes output
+    # for long texts compared to plain truncation)
+    ENABLE_SLIDING_WINDOW: bool = os.getenv("ENABLE_SLIDING_WINDOW", "false").lower() == "true"
+    SLIDING_WINDOW_STRIDE: int = int(os.getenv("SLIDING_WINDOW_STRIDE", "128"))
+
+    # Memory guard for long-running processes: "off" or "arena_shrink"
+    # (release unused ONNX Runtime CPU arena memory every N session runs)
+    MEMORY_GUARD_MODE: str = os.getenv("MEMORY_GUARD_MODE", "off").lower()
+    ARENA_SHRINK_INTERVAL: int = int(os.getenv("ARENA_SHRINK_INTERVAL", "100"))
+
+    # Micro-batching: coalesce concurrent /predict requests into one session run
+    ENABLE_MICRO_BATCHING: bool = os.getenv("ENABLE_MICRO_BATCHING", "true").lower() == "true"
+    MICRO_BATCH_MAX_SIZE: int = int(os.getenv("MICRO_BATCH_MAX_SIZE", "16"))
+    MICRO_BATCH_MAX_WAIT_MS: float = float(os.getenv("MICRO_BATCH_MAX_WAIT_MS", "5"))
+    # Texts waiting for the micro-batcher beyond this get a 503
+    MICRO_BATCH_MAX_QUEUE: int = int(os.getenv("MICRO_BATCH_MAX_QUEUE", "64"))
 
     # CORS settings
     CORS_ORIGINS: List[str] = os.getenv("CORS_ORIGINS", "*").split(",") if os.getenv("CORS_ORIGINS") else ["*"]
@@ -61,6 +98,23 @@ class APIConfig:
     PDF_EXTRACTOR: str = os.getenv("PDF_EXTRACTOR", "pymupdf")  # pymupdf or pdfplumber
     OCR_EXTRACTOR: str = os.getenv("OCR_EXTRACTOR", "easyocr")  # easyocr or pytesseract
 
+    # Prediction result cache keyed by content hash and model fingerprint.
+    # RESULT_CACHE_DIR enables an on-disk tier shared across restarts.
+    ENABLE_RESULT_CACHE: bool = os.getenv("ENABLE_RESULT_CACHE", "false").lower() == "true"
+    RESULT_CACHE_MAX_ENTRIES: int = int(os.getenv("RESULT_CACHE_MAX_ENTRIES", "1024"))
+    RESULT_CACHE_TTL_SECONDS: float = float(os.getenv("RESULT_CACHE_TTL_SECONDS", "3600"))
+    RESULT_CACHE_DIR: Optional[Path] = (
+        Path(os.environ["RESULT_CACHE_DIR"]) if os.getenv("RESULT_CACHE_DIR") else None
+    )
+    RESULT_CACHE_DISK_MAX_MB: int = int(os.getenv("RESULT_CACHE_DISK_MAX_MB", "512"))
+
+    # Worker pools that keep extraction and inference off the event loop.
+    # Requests beyond workers + queue get a 503 instead of waiting.
+    EXTRACTION_WORKERS: int = int(os.getenv("EXTRACTION_WORKERS", "2"))
+    EXTRACTION_MAX_QUEUE: int = int(os.getenv("EXTRACTION_MAX_QUEUE", "16"))
+    INFERENCE_WORKERS: int = int(os.getenv("INFERENCE_WORKERS", "0"))  # 0: one per ONNX session
+    INFERENCE_MAX_QUEUE: int = int(os.getenv("INFERENCE_MAX_QUEUE", "64"))
+
     @classmethod
     def set_model_paths(cls, onnx_path: Path, checkpoint_dir: Path) -> None:
         """Set model paths from command line arguments."""
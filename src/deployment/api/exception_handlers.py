@@ -34,6 +34,7 @@ from .exceptions import (
     TextExtractionError,
     InvalidFileTypeError,
     FileSizeExceededError,
+    ServiceOverloadedError,
 )
 from .models import ErrorResponse
 
@@ -95,4 +96,15 @@ def register_exception_handlers(app: FastAPI) -> None:
                 message=str(exc),
             ).dict(),
         )
-
+    
+    @app.exception_handler(ServiceOverloadedError)
+    async def service_overloaded_handler(request, exc: ServiceOverloadedError):
+        """Handle saturated worker pools with a retryable 503."""
+        return JSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            content=ErrorResponse(
+                error="ServiceOverloadedError",
+                message=str(exc),
+            ).dict(),
+            headers={"Retry-After": "1"},
+        )
@@ -37,3 +37,7 @@ class InferenceError(APIException):
     pass
 
 
+class ServiceOverloadedError(APIException):
+    """Raised when a worker pool's queue is full."""
+
+    pass
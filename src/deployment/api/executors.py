@@ -0,0 +1,162 @@
+"""
+@meta
+name: api_executors
+type: utility
+domain: deployment
+responsibility:
+  - Run blocking text extraction and model inference off the event loop
+  - Bound worker pools and queue depth with backpressure
+inputs:
+  - Blocking callables from route handlers
+outputs:
+  - Awaitable results
+tags:
+  - utility
+  - api
+  - concurrency
+ci:
+  runnable: true
+  needs_gpu: false
+  needs_cloud: false
+lifecycle:
+  status: active
+"""
+
+"""Bounded worker pools for CPU-bound work in async route handlers."""
+
+import asyncio
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+from .config import APIConfig
+from .exceptions import ServiceOverloadedError
+
+logger = logging.getLogger(__name__)
+
+
+class BoundedExecutor:
+    """
+    Thread pool that rejects work once too many tasks are pending.
+
+    At most ``max_workers`` tasks run at once and ``max_queue`` more may
+    wait; further submissions raise ``ServiceOverloadedError`` (served as a
+    503) instead of piling up behind a slow OCR or inference job.
+    """
+
+    def __init__(self, name: str, max_workers: int, max_queue: int):
+        """
+        Initialize the pool.
+
+        Args:
+            name: Pool name, used for thread names and error messages.
+            max_workers: Number of worker threads.
+            max_queue: Number of tasks allowed to wait for a worker.
+        """
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be >= 1, got {max_workers}")
+        if max_queue < 0:
+            raise ValueError(f"max_queue must be >= 0, got {max_queue}")
+
+        self.name = name
+        self.max_workers = max_workers
+        self.capacity = max_workers + max_queue
+        self._executor = ThreadPoolExecutor(max_workers, thread_name_prefix=f"api-{name}")
+        self._slots = threading.BoundedSemaphore(self.capacity)
+        self._pending = 0
+        self._lock = threading.Lock()
+
+    @property
+    def pending(self) -> int:
+        """Tasks currently running or waiting."""
+        return self._pending
+
+    def submit(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Future:
+        """
+        Submit a blocking callable.
+
+        Args:
+            fn: Callable to run on a worker thread.
+            *args: Positional arguments for ``fn``.
+            **kwargs: Keyword arguments for ``fn``.
+
+        Returns:
+            Future resolved with the result of ``fn``.
+
+        Raises:
+            ServiceOverloadedError: If running plus queued tasks are at capacity.
+        """
+        if not self._slots.acquire(blocking=False):
+            logger.warning(f"{self.name} pool saturated ({self.capacity} tasks pending)")
+            raise ServiceOverloadedError(
+                f"Server is busy: {self.name} queue is full, retry later")
+        with self._lock:
+            self._pending += 1
+        try:
+            future = self._executor.submit(fn, *args, **kwargs)
+        except BaseException:
+            self._release()
+            raise
+        future.add_done_callback(lambda _: self._release())
+        return future
+
+    async def run(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Run a blocking callable on the pool and await its result."""
+        return await asyncio.wrap_future(self.submit(fn, *args, **kwargs))
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the worker threads."""
+        self._executor.shutdown(wait=wait)
+
+    def _release(self) -> None:
+        """Free the slot of a finished (or failed to submit) task."""
+        with self._lock:
+            self._pending -= 1
+        self._slots.release()
+
+
+# Global pools, created on first use
+_extraction_executor: Optional[BoundedExecutor] = None
+_inference_executor: Optional[BoundedExecutor] = None
+_executors_lock = threading.Lock()
+
+
+def get_extraction_executor() -> BoundedExecutor:
+    """Get the pool for PDF/OCR text extraction."""
+    global _extraction_executor
+
+    with _executors_lock:
+        if _extraction_executor is None:
+            _extraction_executor = BoundedExecutor(
+                "extraction",
+                APIConfig.EXTRACTION_WORKERS,
+                APIConfig.EXTRACTION_MAX_QUEUE,
+            )
+        return _extraction_executor
+
+
+def get_inference_executor() -> BoundedExecutor:
+    """Get the pool for model inference (one worker per ONNX session by default)."""
+    global _inference_executor
+
+    with _executors_lock:
+        if _inference_executor is None:
+            _inference_executor = BoundedExecutor(
+                "inference",
+                APIConfig.INFERENCE_WORKERS or APIConfig.ONNX_SESSION_POOL_SIZE,
+                APIConfig.INFERENCE_MAX_QUEUE,
+            )
+        return _inference_executor
+
+
+def shutdown_executors() -> None:
+    """Stop both worker pools; they are recreated on next use."""
+    global _extraction_executor, _inference_executor
+
+    with _executors_lock:
+        for executor in (_extraction_executor, _inference_executor):
+            if executor is not None:
+                executor.shutdown(wait=False)
+        _extraction_executor = None
+        _inference_executor = None
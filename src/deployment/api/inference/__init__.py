@@ -2,6 +2,8 @@
 
 from .engine import ONNXModelLoader, InferenceRunner
 from .decoder import EntityDecoder
+from .batching import MicroBatchScheduler
+from .session_pool import SessionPool
 
 # Import ONNXInferenceEngine from parent module (inference.py) for backward compatibility
 # Since there's both a module (inference.py) and a package (inference/), Python prioritizes
@@ -27,6 +29,7 @@ try:
             onnx_path: Path,
             checkpoint_dir: Path,
             providers: Optional[List[str]] = None,
+            window_stride: Optional[int] = None,
         ):
             """
             Initialize the inference engine.
@@ -35,6 +38,8 @@ try:
                 onnx_path: Path to ONNX model file.
                 checkpoint_dir: Path to checkpoint directory containing tokenizer and config.
                 providers: ONNX Runtime providers (default: CPUExecutionProvider).
+                window_stride: Token overlap between sliding windows for texts
+                    longer than the max length (default: from config).
             """
             # Initialize components
             self._model_loader = ONNXModelLoader(
@@ -43,6 +48,7 @@ try:
                 self._model_loader.session,
                 self._model_loader.tokenizer,
                 self._model_loader.max_length,
+                window_stride=window_stride,
             )
             self._decoder = EntityDecoder(self._model_loader.id2label)
 
@@ -56,6 +62,21 @@ try:
             self.label2id = self._model_loader.label2id
             self.max_length = self._model_loader.max_length
 
+        def inference_settings(self) -> Dict[str, Any]:
+            """
+            Settings besides the model weights that change prediction output.
+
+            Returns:
+                Dictionary with max_length, window_stride (None when sliding
+                windows are off) and padding_buckets.
+            """
+            runner = self._inference_runner
+            return {
+                "max_length": runner.max_length,
+                "window_stride": runner.window_stride,
+                "padding_buckets": list(runner.padding_buckets),
+            }
+
         def predict_tokens(
             self,
             text: str,
@@ -133,6 +154,46 @@ try:
                 return_confidence,
             )
             return entities
+
+        def predict_batch(
+            self,
+            texts: List[str],
+            max_length: Optional[int] = None,
+            return_confidence: bool = True,
+        ) -> List[List[Dict[str, Any]]]:
+            """
+            Prediction pipeline for several texts with one ONNX session run.
+
+            Args:
+                texts: Input texts.
+                max_length: Maximum sequence length.
+                return_confidence: Whether to return confidence scores.
+
+            Returns:
+                One list of entity dictionaries per input text.
+            """
+            token_outputs = self._inference_runner.predict_tokens_batch(
+                texts, max_length)
+            if all(offsets is not None for *_, offsets in token_outputs):
+                return self._decoder.decode_batch(
+                    texts,
+                    [logits[:len(tokens)] for logits, tokens, _, _ in token_outputs],
+                    [output["attention_mask"][0] for _, _, output, _ in token_outputs],
+                    [offsets for *_, offsets in token_outputs],
+                    return_confidence,
+                )
+            return [
+                self.decode_entities(
+                    text,
+                    logits,
+                    tokens,
+                    tokenizer_output,
+                    offset_mapping,
+                    return_confidence,
+                )
+                for text, (logits, tokens, tokenizer_output, offset_mapping)
+                in zip(texts, token_outputs)
+            ]
 except Exception as e:
     # If import fails, set to None (will not be exported)
     ONNXInferenceEngine = None
@@ -156,6 +217,8 @@ __all__ = [
     "ONNXModelLoader",
     "InferenceRunner",
     "EntityDecoder",
+    "MicroBatchScheduler",
+    "SessionPool",
 ]
 
 if ONNXInferenceEngine is not None:
@@ -0,0 +1,242 @@
+"""
+@meta
+name: micro_batching
+type: utility
+domain: deployment
+responsibility:
+  - Coalesce concurrent single-text predictions into micro-batches
+  - Run one batched inference call per micro-batch
+  - Dispatch micro-batches to a bounded inference pool
+  - Scatter per-text results back to waiting callers
+inputs:
+  - Input texts submitted by request handlers
+outputs:
+  - Futures resolved with per-text results
+tags:
+  - utility
+  - api
+  - inference
+  - batching
+ci:
+  runnable: true
+  needs_gpu: false
+  needs_cloud: false
+lifecycle:
+  status: active
+"""
+
+"""Dynamic micro-batching scheduler for ONNX inference."""
+
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, List, Optional, Tuple, TYPE_CHECKING
+
+from ..exceptions import ServiceOverloadedError
+
+if TYPE_CHECKING:
+    from ..executors import BoundedExecutor
+
+logger = logging.getLogger(__name__)
+
+# Sentinel placed on the queue to stop the worker thread
+_STOP = object()
+
+
+class MicroBatchScheduler:
+    """
+    Gathers pending texts for a short window and runs them as one batch.
+
+    Callers submit single texts and receive a ``concurrent.futures.Future``
+    (await it with ``asyncio.wrap_future`` from async handlers). A background
+    worker collects up to ``max_batch_size`` texts, waiting at most
+    ``max_wait_ms`` after the first one arrives, calls ``batch_fn`` once for
+    the whole group and resolves each future with its own result.
+
+    At most ``max_queue_size`` texts wait for the worker; further submissions
+    raise ``ServiceOverloadedError`` (served as a 503) instead of queueing.
+
+    Without an ``executor`` each batch runs on the worker thread itself. With
+    one, every flushed batch is submitted to it, so up to
+    ``executor.max_workers`` batches run at once (each borrowing its own
+    pooled ONNX session) while the worker keeps collecting the next batch.
+    """
+
+    def __init__(
+        self,
+        batch_fn: Callable[[List[str]], List[Any]],
+        max_batch_size: int = 16,
+        max_wait_ms: float = 5.0,
+        max_queue_size: int = 64,
+        executor: Optional["BoundedExecutor"] = None,
+    ):
+        """
+        Initialize the scheduler and start its worker thread.
+
+        Args:
+            batch_fn: Function mapping a list of texts to one result per text.
+            max_batch_size: Maximum number of texts per batch.
+            max_wait_ms: Maximum time to wait for more texts after the first.
+            max_queue_size: Maximum number of texts waiting for the worker.
+            executor: Optional pool to run batches on; by default batches
+                run one at a time on the worker thread.
+        """
+        if max_batch_size < 1:
+            raise ValueError(f"max_batch_size must be >= 1, got {max_batch_size}")
+        if max_wait_ms < 0:
+            raise ValueError(f"max_wait_ms must be >= 0, got {max_wait_ms}")
+        if max_queue_size < 1:
+            raise ValueError(f"max_queue_size must be >= 1, got {max_queue_size}")
+
+        self.batch_fn = batch_fn
+        self.max_batch_size = max_batch_size
+        self.max_wait_s = max_wait_ms / 1000.0
+
+        self.max_queue_size = max_queue_size
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=max_queue_size)
+        self.executor = executor
+        # One slot per concurrently running batch; the worker only starts
+        # collecting once a slot is free, so texts keep accumulating into
+        # larger batches while every session is busy
+        self._max_in_flight = executor.max_workers if executor is not None else 1
+        self._in_flight = threading.Semaphore(self._max_in_flight)
+        self._closed = False
+        self._worker = threading.Thread(
+            target=self._run, name="onnx-micro-batcher", daemon=True)
+        self._worker.start()
+
+    def submit(self, text: str) -> Future:
+        """
+        Queue a text for the next micro-batch.
+
+        Args:
+            text: Input text.
+
+        Returns:
+            Future resolved with the result ``batch_fn`` produced for ``text``.
+
+        Raises:
+            ServiceOverloadedError: If ``max_queue_size`` texts are already waiting.
+        """
+        if self._closed:
+            raise RuntimeError("MicroBatchScheduler is closed")
+        future: Future = Future()
+        try:
+            self._queue.put_nowait((text, future))
+        except queue.Full:
+            logger.warning(
+                f"Micro-batch queue saturated ({self.max_queue_size} texts waiting)")
+            raise ServiceOverloadedError(
+                "Server is busy: micro-batch queue is full, retry later") from None
+        return future
+
+    def close(self, timeout: Optional[float] = 5.0) -> None:
+        """
+        Stop the worker after it drains already-queued and in-flight texts.
+
+        Args:
+            timeout: Seconds to wait for the worker thread to exit.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            # Blocks only while the queue is full; the worker keeps draining it
+            self._queue.put(_STOP, timeout=timeout)
+        except queue.Full:
+            logger.warning("Micro-batch worker did not drain its queue before close")
+            return
+        self._worker.join(timeout)
+        # Wait for batches still running on the executor
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for _ in range(self._max_in_flight):
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            if not self._in_flight.acquire(timeout=remaining):
+                logger.warning("Micro-batches still running at close")
+                return
+
+    def _collect(self, first: Tuple[str, Future]) -> Tuple[List[Tuple[str, Future]], bool]:
+        """Collect a batch starting from ``first``; report whether to stop."""
+        batch = [first]
+        deadline = time.monotonic() + self.max_wait_s
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            try:
+                item = self._queue.get(timeout=remaining) if remaining > 0 \
+                    else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is _STOP:
+                return batch, True
+            batch.append(item)
+        return batch, False
+
+    def _run(self) -> None:
+        """Worker loop: collect, run and scatter until closed."""
+        while True:
+            self._in_flight.acquire()
+            item = self._queue.get()
+            if item is _STOP:
+                self._in_flight.release()
+                return
+            batch, stop = self._collect(item)
+            self._dispatch(batch)
+            if stop:
+                return
+
+    def _dispatch(self, batch: List[Tuple[str, Future]]) -> None:
+        """Run a batch inline or on the executor, freeing its slot when done."""
+        if self.executor is None:
+            try:
+                self._run_batch(batch)
+            finally:
+                self._in_flight.release()
+            return
+
+        try:
+            future = self.executor.submit(self._run_batch, batch)
+        except Exception as e:
+            # Executor saturated by other routes (or shut down): fail the
+            # batch instead of blocking the collector
+            self._in_flight.release()
+            for _, fut in batch:
+                if fut.set_running_or_notify_cancel():
+                    fut.set_exception(e)
+            return
+        future.add_done_callback(lambda _: self._in_flight.release())
+
+    def _run_batch(self, batch: List[Tuple[str, Future]]) -> None:
+        """Run ``batch_fn`` over a batch and resolve the futures."""
+        # Drop futures cancelled while waiting in the queue
+        batch = [(text, fut) for text, fut in batch if fut.set_running_or_notify_cancel()]
+        if not batch:
+            return
+
+        texts = [text for text, _ in batch]
+        start = time.time()
+        try:
+            results = self.batch_fn(texts)
+            if len(results) != len(texts):
+                raise RuntimeError(
+                    f"batch_fn returned {len(results)} results for {len(texts)} texts")
+        except Exception as e:
+            if len(batch) == 1:
+                batch[0][1].set_exception(e)
+                return
+            # Isolate the failure: rerun texts one by one so a single bad
+            # input does not fail every request coalesced with it
+            logger.warning(
+                f"Micro-batch of {len(batch)} failed ({e}); retrying texts individually")
+            for text, fut in batch:
+                try:
+                    fut.set_result(self.batch_fn([text])[0])
+                except Exception as single_error:
+                    fut.set_exception(single_error)
+            return
+
+        logger.debug(
+            f"Micro-batch of {len(batch)} text(s) completed in {time.time() - start:.3f}s")
+        for (_, fut), result in zip(batch, results):
+            fut.set_result(result)
@@ -6,6 +6,7 @@ domain: deployment
 responsibility:
   - Entity decoding from token predictions
   - Convert token predictions to entity spans
+  - Vectorized batch decoding of BIO and flat labels
 inputs:
   - Model logits
   - Token sequences
@@ -28,7 +29,7 @@ lifecycle:
 """Entity decoding from token predictions."""
 
 import logging
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, List, Optional, Sequence, Tuple, Any
 
 import numpy as np
 
@@ -46,6 +47,134 @@ class EntityDecoder:
             id2label: Mapping from label IDs to label strings.
         """
         self.id2label = id2label
+        self._entity_types, self._label_type_ids, self._label_is_begin = (
+            self._build_label_tables(id2label))
+    
+    @staticmethod
+    def _build_label_tables(
+        id2label: Dict[int, str],
+    ) -> Tuple[List[str], np.ndarray, np.ndarray]:
+        """
+        Build per-label-id lookup tables for vectorized decoding.
+        
+        ``B-X``, ``I-X`` and flat ``X`` labels share the entity type ``X``;
+        ``O`` and ids missing from ``id2label`` map to type -1.
+        
+        Returns:
+            Tuple of (entity_types, label_type_ids, label_is_begin).
+        """
+        size = max(id2label, default=-1) + 1
+        type_ids = np.full(size, -1, dtype=np.int64)
+        is_begin = np.zeros(size, dtype=bool)
+        entity_types: List[str] = []
+        for label_id, label in id2label.items():
+            if label_id < 0 or label == "O":
+                continue
+            entity_type = label[2:] if label.startswith(("B-", "I-")) else label
+            if entity_type not in entity_types:
+                entity_types.append(entity_type)
+            type_ids[label_id] = entity_types.index(entity_type)
+            is_begin[label_id] = label.startswith("B-")
+        return entity_types, type_ids, is_begin
+    
+    def decode_batch(
+        self,
+        texts: Sequence[str],
+        logits: Sequence[np.ndarray],
+        attention_mask: Sequence[np.ndarray],
+        offset_mapping: Sequence[np.ndarray],
+        return_confidence: bool = True,
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Decode entity spans for a batch of texts with NumPy operations.
+        
+        Argmax, softmax confidences and special-token masks are computed over
+        all tokens of the batch at once; entity boundaries come from
+        run-lengths of entity type ids, so Python-level work scales with the
+        number of entities rather than tokens. Rows may have different
+        sequence lengths.
+        
+        Args:
+            texts: Original input texts.
+            logits: Logits per text, (batch, seq_len, num_labels) or a list
+                of (seq_len, num_labels) arrays.
+            attention_mask: Attention mask per text (seq_len,).
+            offset_mapping: Token offsets per text (seq_len, 2).
+            return_confidence: Whether to compute confidence scores.
+        
+        Returns:
+            One list of entity dictionaries per text, as ``decode_entities``.
+        """
+        row_spans, row_logits, row_ids = [], [], []
+        for row, text in enumerate(texts):
+            text_logits = np.asarray(logits[row])
+            offsets = np.asarray(offset_mapping[row]).reshape(-1, 2)
+            mask = np.asarray(attention_mask[row]).reshape(-1)
+            n = min(len(text_logits), len(offsets))
+            token_mask = np.zeros(n, dtype=bool)
+            token_mask[:min(n, len(mask))] = mask[:n] == 1
+            
+            # Keep real tokens with a valid span: drops padding and special
+            # tokens ((0, 0) offsets) exactly like the per-token path
+            starts, ends = offsets[:n, 0], offsets[:n, 1]
+            keep = np.flatnonzero(
+                token_mask & (starts >= 0) & (starts < ends) & (ends <= len(text)))
+            row_spans.append(offsets[keep])
+            row_logits.append(text_logits[keep])
+            row_ids.append(np.full(len(keep), row, dtype=np.int64))
+        
+        results: List[List[Dict[str, Any]]] = [[] for _ in texts]
+        if not row_spans:
+            return results
+        spans = np.concatenate(row_spans)
+        token_logits = np.concatenate(row_logits)
+        rows = np.concatenate(row_ids)
+        if len(spans) == 0:
+            return results
+        
+        predictions = np.argmax(token_logits, axis=-1)
+        in_table = predictions < len(self._label_type_ids)
+        lookup = np.where(in_table, predictions, 0)
+        types = np.where(in_table, self._label_type_ids[lookup], -1)
+        begins = in_table & self._label_is_begin[lookup]
+        
+        # An entity starts at a non-O token that is B-, changes type or
+        # starts a new text; other non-O tokens extend the running entity
+        is_entity = types >= 0
+        prev_types = np.concatenate(([-1], types[:-1]))
+        prev_rows = np.concatenate(([-1], rows[:-1]))
+        is_start = is_entity & (begins | (types != prev_types) | (rows != prev_rows))
+        
+        entity_tokens = np.flatnonzero(is_entity)
+        if len(entity_tokens) == 0:
+            return results
+        groups = np.cumsum(is_start)[entity_tokens] - 1
+        first_tokens = np.flatnonzero(is_start)
+        last_tokens = entity_tokens[np.concatenate((groups[1:] != groups[:-1], [True]))]
+        
+        confidences = None
+        if return_confidence:
+            # Max softmax probability is 1 / sum(exp(logits - max))
+            entity_logits = token_logits[entity_tokens]
+            shifted = entity_logits - np.max(entity_logits, axis=-1, keepdims=True)
+            token_confidences = 1.0 / np.sum(np.exp(shifted), axis=-1)
+            confidences = (
+                np.bincount(groups, weights=token_confidences)
+                / np.bincount(groups))
+        
+        for k, (first, last) in enumerate(zip(first_tokens.tolist(), last_tokens.tolist())):
+            row = int(rows[first])
+            start, end = int(spans[first, 0]), int(spans[last, 1])
+            results[row].append(
+                {
+                    "text": texts[row][start:end],
+                    "label": self._entity_types[types[first]],
+                    "start": start,
+                    "end": end,
+                    "confidence": float(confidences[k]) if confidences is not None else None,
+                }
+            )
+        return results
     
     def decode_entities(
         self,
@@ -70,15 +199,29 @@ class EntityDecoder:
         Returns:
             List of entity dictionaries with text, label, start, end, confidence.
         """
-        # Get predictions (argmax over labels)
-        predictions = np.argmax(logits, axis=-1)  # Shape: (seq_len,)
-        
         # Get attention mask
         attention_mask = tokenizer_output.get("attention_mask", None)
         if attention_mask is not None:
             attention_mask = attention_mask[0]
         else:
-            attention_mask = np.ones(len(predictions), dtype=np.int64)
+            attention_mask = np.ones(len(logits), dtype=np.int64)
+        
+        if offset_mapping is not None and np.ndim(offset_mapping) == 2:
+            try:
+                return self.decode_batch(
+                    [text],
+                    [logits[:len(tokens)]],
+                    [attention_mask],
+                    [offset_mapping],
+                    return_confidence,
+                )[0]
+            except Exception as e:
+                logger.warning(
+                    f"Vectorized decoding failed: {e}, falling back to per-token decoding")
+        
+        # Per-token fallback for missing or malformed offset mappings
+        # Get predictions (argmax over labels)
+        predictions = np.argmax(logits, axis=-1)  # Shape: (seq_len,)
         
         # Convert predictions to labels (aligned with all tokens)
         labels = []
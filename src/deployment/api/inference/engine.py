@@ -28,11 +28,11 @@ lifecycle:
 
 """ONNX model loading and inference execution."""
 
+import threading
 import time
 import logging
-import gc
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Set, TYPE_CHECKING
+from typing import Dict, List, Optional, Tuple, Set, Union, TYPE_CHECKING
 
 import numpy as np
 
@@ -42,9 +42,11 @@ if TYPE_CHECKING:
 
 from ..config import APIConfig
 from ..exceptions import InferenceError, ModelNotLoadedError
+from .session_pool import SessionPool
 from common.shared.tokenization_utils import (
-    prepare_onnx_inputs,
-    get_offset_mapping,
+    OnnxTokenization,
+    bucket_length,
+    tokenize_for_onnx,
 )
 
 logger = logging.getLogger(__name__)
@@ -71,7 +73,7 @@ class ONNXModelLoader:
         self.checkpoint_dir = Path(checkpoint_dir)
         self.providers = providers or APIConfig.ONNX_PROVIDERS
 
-        self.session: Optional["ort.InferenceSession"] = None
+        self.session: Optional[SessionPool] = None
         self.tokenizer: Optional["AutoTokenizer"] = None
         self.id2label: Dict[int, str] = {}
         self.label2id: Dict[str, int] = {}
@@ -81,7 +83,6 @@ class ONNXModelLoader:
 
     def load(self) -> None:
         """Load ONNX model, tokenizer, and label mappings."""
-        import onnxruntime as ort
         from transformers import AutoTokenizer, AutoConfig
         
         if not self.onnx_path.exists():
@@ -90,31 +91,17 @@ class ONNXModelLoader:
             raise FileNotFoundError(
                 f"Checkpoint directory not found: {self.checkpoint_dir}")
 
-        # Load ONNX model with optimized session options to prevent memory leaks
+        # Load ONNX model into a pool of sessions; threading, execution mode
+        # and affinity come from config so they can be tuned per pod size
         try:
-            # Configure session options to prevent memory accumulation
-            sess_options = ort.SessionOptions()
-            # Enable memory reuse to prevent accumulation across runs
-            sess_options.enable_mem_reuse = True
-            # Keep memory pattern enabled for performance
-            sess_options.enable_mem_pattern = True
-            # Enable CPU memory arena
-            sess_options.enable_cpu_mem_arena = True
-            
-            # Optimize thread settings based on CPU cores for better performance
-            import os
-            num_cores = os.cpu_count() or 1
-            # Use up to 4 threads for intra-op parallelism (good balance for most CPUs)
-            # Keep inter-op at 1 to avoid thread contention
-            sess_options.inter_op_num_threads = 1
-            sess_options.intra_op_num_threads = min(4, max(1, num_cores))
-            # Set execution mode to sequential to prevent thread pool issues
-            sess_options.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
-
-            self.session = ort.InferenceSession(
-                str(self.onnx_path),
-                sess_options=sess_options,
-                providers=self.providers,
+            self.session = SessionPool(
+                self.onnx_path,
+                self.providers,
+                num_sessions=APIConfig.ONNX_SESSION_POOL_SIZE,
+                intra_op_threads=APIConfig.ONNX_INTRA_OP_THREADS or None,
+                inter_op_threads=APIConfig.ONNX_INTER_OP_THREADS,
+                execution_mode=APIConfig.ONNX_EXECUTION_MODE,
+                cpu_affinities=APIConfig.ONNX_CPU_AFFINITY or None,
             )
         except Exception as e:
             raise InferenceError(f"Failed to load ONNX model: {e}") from e
@@ -147,21 +134,53 @@ class InferenceRunner:
 
     def __init__(
         self,
-        session: "ort.InferenceSession",
+        session: Union["ort.InferenceSession", SessionPool],
         tokenizer: "AutoTokenizer",
         max_length: int,
+        padding_buckets: Optional[List[int]] = None,
+        window_stride: Optional[int] = None,
+        memory_guard_mode: Optional[str] = None,
+        sub_batch_size: Optional[int] = None,
     ):
         """
         Initialize inference runner.
 
         Args:
-            session: ONNX Runtime inference session.
+            session: ONNX Runtime inference session or session pool.
             tokenizer: Tokenizer instance.
             max_length: Maximum sequence length.
+            padding_buckets: Bucket lengths for dynamic padding
+                (default: from config; empty pads to max_length).
+            window_stride: Tokens shared by consecutive windows when a text
+                exceeds max_length (default: from config; None truncates).
+            memory_guard_mode: "off" or "arena_shrink" (default: from config).
+            sub_batch_size: Maximum rows per session run; larger batches are
+                sorted by length and split (default: from config; 0 disables).
         """
         self.session = session
         self.tokenizer = tokenizer
         self.max_length = max_length
+        # Input names are fixed by the exported graph; read them once
+        self.input_names: Optional[Set[str]] = (
+            {i.name for i in session.get_inputs()} if session is not None else None)
+        self.padding_buckets = (
+            APIConfig.PADDING_BUCKETS if padding_buckets is None else padding_buckets)
+        self.sub_batch_size = (
+            APIConfig.INFERENCE_SUB_BATCH_SIZE if sub_batch_size is None else sub_batch_size)
+        if window_stride is None and APIConfig.ENABLE_SLIDING_WINDOW:
+            window_stride = APIConfig.SLIDING_WINDOW_STRIDE
+        self.window_stride = window_stride
+
+        # Memory guard: shrink the CPU arena every N session runs instead of
+        # forcing garbage collection on every request
+        self.memory_guard_mode = memory_guard_mode or APIConfig.MEMORY_GUARD_MODE
+        if self.memory_guard_mode not in ("off", "arena_shrink"):
+            raise ValueError(f"Unknown memory guard mode: {self.memory_guard_mode}")
+        self.arena_shrink_interval = max(1, APIConfig.ARENA_SHRINK_INTERVAL)
+        self.run_count = 0
+        self.arena_shrink_count = 0
+        # Session pool threads run concurrently; the counters are updated under this lock
+        self._run_count_lock = threading.Lock()
 
     def predict_tokens(
         self,
@@ -178,44 +197,191 @@ class InferenceRunner:
         Returns:
             Tuple of (logits, tokens, tokenizer_output, offset_mapping).
         """
+        return self.predict_tokens_batch([text], max_length)[0]
+
+    def predict_tokens_batch(
+        self,
+        texts: List[str],
+        max_length: Optional[int] = None,
+    ) -> List[Tuple[np.ndarray, List[str], Dict[str, np.ndarray], Optional[np.ndarray]]]:
+        """
+        Run inference on several texts with a single ONNX session run.
+
+        The texts are tokenized together so their feeds stack along the
+        dynamic ``batch`` axis exported by ``export_to_onnx``. With a window
+        stride, texts longer than ``max_length`` are split into overlapping
+        windows that run in the same session call; their logits are merged
+        back into one sequence per text (see ``_merge_windows``). Batches
+        larger than ``sub_batch_size`` run as length-sorted sub-batches.
+
+        Args:
+            texts: Input texts.
+            max_length: Maximum sequence length (default: from config).
+
+        Returns:
+            One (logits, tokens, tokenizer_output, offset_mapping) tuple per
+            input text, in input order.
+        """
         if self.session is None or self.tokenizer is None:
             raise ModelNotLoadedError(
                 "Model not loaded. Ensure model loader has been initialized.")
 
         max_len = max_length or self.max_length
 
-        # Get input names from ONNX model
-        input_names = {i.name for i in self.session.get_inputs()}
-        logger.debug(f"ONNX model requires inputs: {input_names}")
-
         # Prepare ONNX inputs using shared utilities
         token_start = time.time()
         try:
-            logger.info(
-                f"Starting tokenization for text length={len(text)}, max_length={max_len}")
 
-            feeds = prepare_onnx_inputs(
+            # One tokenizer call yields feeds, attention mask and offsets
+            tokenization = tokenize_for_onnx(
                 self.tokenizer,
-                text,
+                texts,
                 max_len,
-                input_names,
+                self.input_names,
+                self.padding_buckets,
+                stride=self._stride_for(max_len),
             )
+            feeds = tokenization.feeds
 
-            logger.info(
-                f"ONNX tokenization completed in {time.time() - token_start:.3f}s")
-            logger.debug(f"Tokenizer output keys: {list(feeds.keys())}")
-
-            # Get offset mapping separately
-            offset_mapping = get_offset_mapping(self.tokenizer, text, max_len)
-            if offset_mapping is not None:
-                logger.debug(
-                    f"Offset mapping obtained: shape={offset_mapping.shape}")
+            logger.debug(
+                f"Tokenized {len(texts)} text(s) in {time.time() - token_start:.3f}s, "
+                f"feeds: {list(feeds.keys())}")
 
         except Exception as e:
             logger.error(
                 f"Tokenization failed after {time.time() - token_start:.3f}s: {e}")
             raise InferenceError(f"Tokenization failed: {e}") from e
 
+        logits = self._run_sub_batches(tokenization)
+
+        if tokenization.has_overflow:
+            logger.debug(
+                f"Merging {len(feeds['input_ids'])} windows for {len(texts)} text(s)")
+            return [
+                self._merge_windows(tokenization, logits, text_index)
+                for text_index in range(len(texts))
+            ]
+
+        results = []
+        for row in range(len(texts)):
+            # Keep a (1, seq_len) view per text so decoding sees the same
+            # layout as a single-text tokenizer output.
+            tokenizer_output = {k: v[row:row + 1] for k, v in feeds.items()}
+            tokenizer_output["attention_mask"] = tokenization.attention_mask[row:row + 1]
+            offset_mapping = (
+                tokenization.offset_mapping[row]
+                if tokenization.offset_mapping is not None else None)
+            tokens = self._decode_tokens(tokenization, row)
+            results.append((logits[row], tokens, tokenizer_output, offset_mapping))
+
+        return results
+
+    def _run_sub_batches(self, tokenization: OnnxTokenization) -> np.ndarray:
+        """
+        Run a tokenized batch as length-sorted sub-batches.
+
+        Rows are sorted by token count and split into groups of at most
+        ``sub_batch_size``; each group is trimmed to its own padding bucket
+        before its session run, so short texts are not padded to the
+        longest text of the whole batch.
+
+        Args:
+            tokenization: Batched tokenization (one row per text or window).
+
+        Returns:
+            Logits of shape (num_rows, seq_len, num_labels) in row order;
+            positions trimmed from a sub-batch are zero (they are padding).
+        """
+        feeds = tokenization.feeds
+        num_rows, seq_len = tokenization.attention_mask.shape
+        if not self.sub_batch_size or num_rows <= self.sub_batch_size:
+            return self._run_session(feeds)
+
+        lengths = tokenization.attention_mask.sum(axis=1)
+        order = np.argsort(lengths, kind="stable")
+        left_padded = getattr(self.tokenizer, "padding_side", "right") == "left"
+
+        logits = None
+        for start in range(0, num_rows, self.sub_batch_size):
+            rows = order[start:start + self.sub_batch_size]
+            width = seq_len
+            if self.padding_buckets:
+                width = bucket_length(
+                    int(lengths[rows].max()), self.padding_buckets, seq_len)
+            cols = slice(seq_len - width, None) if left_padded else slice(0, width)
+
+            sub_logits = self._run_session(
+                {name: array[rows][:, cols] for name, array in feeds.items()})
+            if logits is None:
+                logits = np.zeros(
+                    (num_rows, seq_len, sub_logits.shape[-1]), dtype=sub_logits.dtype)
+            logits[rows, cols] = sub_logits
+
+        logger.debug(
+            f"Ran {num_rows} rows as {-(-num_rows // self.sub_batch_size)} sub-batch(es)")
+        return logits
+
+    def _stride_for(self, max_len: int) -> Optional[int]:
+        """Window stride usable with ``max_len``, or None to truncate."""
+        if self.window_stride is None or not getattr(self.tokenizer, "is_fast", False):
+            return None
+        # The overlap must leave room for new tokens in every window
+        return max(0, min(self.window_stride, max_len // 2))
+
+    def _merge_windows(
+        self,
+        tokenization: OnnxTokenization,
+        logits: np.ndarray,
+        text_index: int,
+    ) -> Tuple[np.ndarray, List[str], Dict[str, np.ndarray], np.ndarray]:
+        """
+        Merge the windows of one text into a single token sequence.
+
+        Tokens are identified by their character span in the original text,
+        so a token seen by several overlapping windows appears once with the
+        mean of its logits. Special and padding tokens are dropped.
+
+        Args:
+            tokenization: Windowed tokenization with offsets and sample mapping.
+            logits: Logits of all windows (num_windows, seq_len, num_labels).
+            text_index: Index of the text to merge.
+
+        Returns:
+            Tuple of (logits, tokens, tokenizer_output, offset_mapping) for the
+            whole text, in the same layout as a single-window prediction.
+        """
+        rows = np.flatnonzero(tokenization.sample_mapping == text_index)
+        offsets = tokenization.offset_mapping[rows]
+        keep = (tokenization.attention_mask[rows] == 1) & (offsets[..., 1] > offsets[..., 0])
+
+        spans = offsets[keep]
+        spans, first, inverse = np.unique(
+            spans, axis=0, return_index=True, return_inverse=True)
+        inverse = inverse.reshape(-1)
+
+        window_logits = logits[rows][keep]
+        merged = np.zeros((len(spans), window_logits.shape[-1]), dtype=np.float32)
+        np.add.at(merged, inverse, window_logits)
+        merged /= np.bincount(inverse, minlength=len(spans))[:, None]
+
+        input_ids = tokenization.input_ids[rows][keep][first]
+        tokenizer_output = {
+            "input_ids": input_ids[None, :],
+            "attention_mask": np.ones((1, len(spans)), dtype=np.int64),
+        }
+        tokens = self.tokenizer.convert_ids_to_tokens(input_ids.tolist())
+        return merged, tokens, tokenizer_output, spans
+
+    def _run_session(self, feeds: Dict[str, np.ndarray]) -> np.ndarray:
+        """
+        Run the ONNX session on prepared feeds.
+
+        Args:
+            feeds: ONNX input feeds with a leading batch dimension.
+
+        Returns:
+            Logits array of shape (batch_size, seq_len, num_labels).
+        """
         # Run inference with timeout detection
         inference_start = time.time()
         inference_timeout = 25.0  # 25 seconds timeout per inference
@@ -225,7 +391,7 @@ class InferenceRunner:
 
             # Run inference - ONNX Runtime doesn't support timeout directly,
             # but we can detect if it takes too long
-            outputs = self.session.run(None, feeds)
+            outputs = self.session.run(None, feeds, self._next_run_options())
 
             elapsed = time.time() - inference_start
             if elapsed > inference_timeout:
@@ -235,16 +401,12 @@ class InferenceRunner:
                     f"Inference took too long ({elapsed:.3f}s). "
                     "The model may be stuck or overloaded.")
 
+            # ORT hands back arrays that own their buffers, so no copy is needed
             logits = outputs[0]  # Shape: (batch_size, seq_len, num_labels)
             logger.debug(
                 f"ONNX inference completed in {elapsed:.3f}s, "
                 f"logits shape: {logits.shape}")
 
-            # Explicitly delete outputs array to help GC free memory
-            # Note: logits is a view into outputs[0], so we extract it first
-            logits = np.array(logits)  # Make independent copy
-            del outputs
-
         except InferenceError:
             # Re-raise inference errors as-is
             raise
@@ -254,41 +416,56 @@ class InferenceRunner:
                 f"ONNX inference failed after {elapsed:.3f}s: {e}")
             raise InferenceError(f"Inference failed: {e}") from e
 
-        # Get tokenizer output for token decoding
-        # We need to get the original tokenizer output (before int64 conversion)
-        # Re-tokenize to get the original format, or reconstruct from feeds
-        # For efficiency, we'll reconstruct from feeds but keep original types
-        tokenizer_output = {}
-        for k, v in feeds.items():
-            # Keep the int64 format for consistency, but tokenizer can handle it
-            tokenizer_output[k] = v
+        return logits
+
+    def _next_run_options(self) -> Optional["ort.RunOptions"]:
+        """
+        Count a session run and return run options for the memory guard.
+
+        With ``arena_shrink`` mode, every ``arena_shrink_interval``-th run asks
+        ONNX Runtime to release unused CPU arena memory once the run ends.
+
+        Returns:
+            RunOptions requesting arena shrinkage, or None for a plain run.
+        """
+        with self._run_count_lock:
+            self.run_count += 1
+            run_count = self.run_count
+            if self.memory_guard_mode != "arena_shrink" \
+                    or run_count % self.arena_shrink_interval != 0:
+                return None
+            self.arena_shrink_count += 1
+            shrink_count = self.arena_shrink_count
+
+        import onnxruntime as ort
+
+        run_options = ort.RunOptions()
+        run_options.add_run_config_entry(
+            "memory.enable_memory_arena_shrinkage", "cpu:0")
+        logger.debug(
+            f"Shrinking CPU memory arena after run {run_count} "
+            f"({shrink_count} shrink(s) so far)")
+        return run_options
+
+    def _decode_tokens(self, tokenization: OnnxTokenization, row: int) -> List[str]:
+        """
+        Convert input ids of one text back to token strings.
 
-        # Clear feeds after creating tokenizer_output to free memory
-        del feeds
-        gc.collect()
+        Args:
+            tokenization: Batched tokenization.
+            row: Index of the text in the batch.
 
-        # Get tokens for decoding - only convert non-padding tokens for efficiency
+        Returns:
+            Token list with padding positions as empty strings.
+        """
+        # Only convert non-padding tokens for efficiency
         token_decode_start = time.time()
-        input_ids = None
-        attention_mask = None
-        non_padding_indices = None
         try:
-            # Handle case where tokenizer_output is empty (e.g., in tests with mocked tokenizers)
-            if not tokenizer_output or "input_ids" not in tokenizer_output:
-                raise KeyError("input_ids")
-            input_ids = tokenizer_output["input_ids"][0]
-            attention_mask = tokenizer_output.get("attention_mask", None)
-            if attention_mask is not None:
-                attention_mask = attention_mask[0]
-            else:
-                attention_mask = np.ones(len(input_ids), dtype=np.int32)
-
-            # Only convert tokens that are not padding (where attention_mask == 1)
-            non_padding_indices = np.where(attention_mask == 1)[0]
+            input_ids = tokenization.input_ids[row]
+            non_padding_indices = np.flatnonzero(tokenization.attention_mask[row] == 1)
             if len(non_padding_indices) > 0:
-                non_padding_ids = input_ids[non_padding_indices]
                 non_padding_tokens = self.tokenizer.convert_ids_to_tokens(
-                    non_padding_ids.tolist())
+                    tokenization.non_padding_ids[row].tolist())
                 # Create full token list with padding tokens as empty strings
                 tokens = [""] * len(input_ids)
                 for idx, token in zip(non_padding_indices, non_padding_tokens):
@@ -297,22 +474,11 @@ class InferenceRunner:
                 tokens = self.tokenizer.convert_ids_to_tokens(
                     input_ids.tolist())
 
-            logger.info(
+            logger.debug(
                 f"Token decoding completed in {time.time() - token_decode_start:.3f}s "
                 f"for {len(non_padding_indices)} non-padding tokens")
         except Exception as e:
             logger.error(f"Token decoding failed: {e}")
-            # Fallback: create empty tokens list
-            tokens = []
             raise InferenceError(f"Token decoding failed: {e}") from e
-        finally:
-            # Clean up intermediate arrays (only if they were assigned)
-            if input_ids is not None:
-                del input_ids
-            if attention_mask is not None:
-                del attention_mask
-            if non_padding_indices is not None:
-                del non_padding_indices
-            gc.collect()
-
-        return logits[0], tokens, tokenizer_output, offset_mapping
+
+        return tokens
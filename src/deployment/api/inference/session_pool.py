@@ -0,0 +1,193 @@
+"""
+@meta
+name: session_pool
+type: utility
+domain: deployment
+responsibility:
+  - Build ONNX Runtime sessions with configurable threading
+  - Dispatch session runs to idle sessions
+inputs:
+  - ONNX model paths
+  - Threading, execution mode and CPU affinity settings
+outputs:
+  - Pooled ONNX Runtime sessions
+tags:
+  - utility
+  - api
+  - inference
+  - onnx
+ci:
+  runnable: true
+  needs_gpu: false
+  needs_cloud: false
+lifecycle:
+  status: active
+"""
+
+"""Pool of ONNX Runtime sessions for concurrent inference."""
+
+import logging
+import os
+import queue
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import onnxruntime as ort
+
+logger = logging.getLogger(__name__)
+
+EXECUTION_MODES = ("sequential", "parallel")
+
+
+def default_intra_op_threads(num_sessions: int) -> int:
+    """
+    Intra-op threads per session when not configured.
+
+    Splits the machine's cores across sessions (at most 4 threads each) so
+    a pool never oversubscribes the CPU.
+
+    Args:
+        num_sessions: Number of sessions in the pool.
+
+    Returns:
+        Thread count for each session's intra-op pool.
+    """
+    num_cores = os.cpu_count() or 1
+    return max(1, min(4, num_cores // max(1, num_sessions)))
+
+
+class SessionPool:
+    """
+    Fixed set of ONNX Runtime sessions over one model.
+
+    Each ``run`` borrows an idle session, blocking until one is free, so
+    ``num_sessions`` runs execute concurrently with ``intra_op_threads``
+    threads each. The pool exposes ``run``/``get_inputs``/``get_outputs``
+    like a single ``InferenceSession``.
+    """
+
+    def __init__(
+        self,
+        onnx_path: Path,
+        providers: List[str],
+        num_sessions: int = 1,
+        intra_op_threads: Optional[int] = None,
+        inter_op_threads: int = 1,
+        execution_mode: str = "sequential",
+        cpu_affinities: Optional[List[str]] = None,
+    ):
+        """
+        Create the pool's sessions.
+
+        Args:
+            onnx_path: Path to ONNX model file.
+            providers: ONNX Runtime providers.
+            num_sessions: Number of sessions to create.
+            intra_op_threads: Threads per session for intra-op parallelism
+                (default: cores split across sessions, at most 4).
+            inter_op_threads: Threads per session for inter-op parallelism.
+            execution_mode: "sequential" or "parallel" graph execution.
+            cpu_affinities: Optional intra-op thread affinities, one entry per
+                session in ONNX Runtime's ``session.intra_op_thread_affinities``
+                format (e.g. "1;2" pins the two extra threads of a
+                3-thread session to cores 1 and 2).
+        """
+        if num_sessions < 1:
+            raise ValueError(f"num_sessions must be >= 1, got {num_sessions}")
+        if execution_mode not in EXECUTION_MODES:
+            raise ValueError(
+                f"execution_mode must be one of {EXECUTION_MODES}, got {execution_mode!r}")
+        if cpu_affinities and len(cpu_affinities) != num_sessions:
+            raise ValueError(
+                f"Expected one CPU affinity per session ({num_sessions}), "
+                f"got {len(cpu_affinities)}")
+
+        self.onnx_path = Path(onnx_path)
+        self.providers = providers
+        self.intra_op_threads = intra_op_threads or default_intra_op_threads(num_sessions)
+        self.inter_op_threads = inter_op_threads
+        self.execution_mode = execution_mode
+
+        self.sessions: List["ort.InferenceSession"] = [
+            self._create_session(cpu_affinities[i] if cpu_affinities else None)
+            for i in range(num_sessions)
+        ]
+        self._idle: "queue.Queue[ort.InferenceSession]" = queue.Queue()
+        for session in self.sessions:
+            self._idle.put(session)
+
+        logger.info(
+            f"Created {num_sessions} ONNX session(s) with "
+            f"{self.intra_op_threads} intra-op / {inter_op_threads} inter-op thread(s), "
+            f"{execution_mode} execution")
+
+    @property
+    def size(self) -> int:
+        """Number of sessions in the pool."""
+        return len(self.sessions)
+
+    def _create_session(self, cpu_affinity: Optional[str]) -> "ort.InferenceSession":
+        """Create one session with the pool's options."""
+        import onnxruntime as ort
+
+        sess_options = ort.SessionOptions()
+        # Reuse memory across runs and keep the CPU arena for performance
+        sess_options.enable_mem_reuse = True
+        sess_options.enable_mem_pattern = True
+        sess_options.enable_cpu_mem_arena = True
+
+        sess_options.intra_op_num_threads = self.intra_op_threads
+        sess_options.inter_op_num_threads = self.inter_op_threads
+        sess_options.execution_mode = (
+            ort.ExecutionMode.ORT_PARALLEL if self.execution_mode == "parallel"
+            else ort.ExecutionMode.ORT_SEQUENTIAL)
+        if cpu_affinity:
+            sess_options.add_session_config_entry(
+                "session.intra_op_thread_affinities", cpu_affinity)
+
+        return ort.InferenceSession(
+            str(self.onnx_path),
+            sess_options=sess_options,
+            providers=self.providers,
+        )
+
+    @contextmanager
+    def acquire(self, timeout: Optional[float] = None) -> Iterator["ort.InferenceSession"]:
+        """
+        Borrow an idle session for the duration of the block.
+
+        Args:
+            timeout: Seconds to wait for an idle session (default: forever).
+
+        Yields:
+            An ONNX Runtime session not used by any other caller.
+        """
+        try:
+            session = self._idle.get(timeout=timeout)
+        except queue.Empty:
+            raise TimeoutError(
+                f"No idle ONNX session within {timeout}s ({self.size} in pool)") from None
+        try:
+            yield session
+        finally:
+            self._idle.put(session)
+
+    def run(
+        self,
+        output_names: Optional[List[str]],
+        input_feed: Dict[str, Any],
+        run_options: Optional["ort.RunOptions"] = None,
+    ) -> List[Any]:
+        """Run the model on an idle session (same signature as ``InferenceSession.run``)."""
+        with self.acquire() as session:
+            return session.run(output_names, input_feed, run_options)
+
+    def get_inputs(self) -> List[Any]:
+        """Model input metadata."""
+        return self.sessions[0].get_inputs()
+
+    def get_outputs(self) -> List[Any]:
+        """Model output metadata."""
+        return self.sessions[0].get_outputs()
@@ -28,14 +28,18 @@ lifecycle:
 from pathlib import Path
 from typing import Optional, Dict, Any
 
-from .inference import ONNXInferenceEngine
+from .inference import ONNXInferenceEngine, MicroBatchScheduler
 from .config import APIConfig
+from .executors import get_inference_executor
 from .exceptions import ModelNotLoadedError
+from .result_cache import ResultCache, fingerprint_file, inference_fingerprint
 
 
 # Global model instance
 _engine: Optional[ONNXInferenceEngine] = None
 _model_info: Optional[Dict[str, Any]] = None
+_batcher: Optional[MicroBatchScheduler] = None
+_result_cache: Optional[ResultCache] = None
 
 
 def initialize_model(
@@ -51,7 +55,7 @@ def initialize_model(
         checkpoint_dir: Path to checkpoint directory.
         providers: ONNX Runtime providers.
     """
-    global _engine, _model_info
+    global _engine, _model_info, _batcher, _result_cache
 
     try:
         _engine = ONNXInferenceEngine(onnx_path, checkpoint_dir, providers)
@@ -64,6 +68,38 @@ def initialize_model(
     except Exception as e:
         raise ModelNotLoadedError(f"Failed to initialize model: {e}") from e
 
+    shutdown_batcher()
+    if APIConfig.ENABLE_MICRO_BATCHING:
+        engine = _engine
+        _batcher = MicroBatchScheduler(
+            lambda texts: engine.predict_batch(texts, return_confidence=True),
+            max_batch_size=APIConfig.MICRO_BATCH_MAX_SIZE,
+            max_wait_ms=APIConfig.MICRO_BATCH_MAX_WAIT_MS,
+            max_queue_size=APIConfig.MICRO_BATCH_MAX_QUEUE,
+            # Run batches on the inference pool so each one can borrow any
+            # idle pooled session and the pool's worker limit applies
+            executor=get_inference_executor(),
+        )
+
+    # Results are keyed by the model's content hash and the inference
+    # settings, so loading a different ONNX file or changing max length,
+    # sliding windows or padding buckets invalidates everything cached before
+    if APIConfig.ENABLE_RESULT_CACHE:
+        fingerprint = inference_fingerprint(
+            fingerprint_file(_engine.onnx_path), _engine.inference_settings())
+        if _result_cache is None:
+            _result_cache = ResultCache(
+                max_entries=APIConfig.RESULT_CACHE_MAX_ENTRIES,
+                ttl_seconds=APIConfig.RESULT_CACHE_TTL_SECONDS,
+                disk_dir=APIConfig.RESULT_CACHE_DIR,
+                disk_max_bytes=APIConfig.RESULT_CACHE_DISK_MAX_MB * 1024 * 1024,
+                model_fingerprint=fingerprint,
+            )
+        else:
+            _result_cache.set_model(fingerprint)
+    else:
+        _result_cache = None
+
 
 def get_engine() -> ONNXInferenceEngine:
     """Get the global inference engine instance."""
@@ -72,6 +108,25 @@ def get_engine() -> ONNXInferenceEngine:
     return _engine
 
 
+def get_batcher() -> Optional[MicroBatchScheduler]:
+    """Get the micro-batching scheduler, or None when micro-batching is disabled."""
+    return _batcher
+
+
+def get_result_cache() -> Optional[ResultCache]:
+    """Get the prediction result cache, or None when caching is disabled."""
+    return _result_cache
+
+
+def shutdown_batcher() -> None:
+    """Stop the micro-batching scheduler if one is running."""
+    global _batcher
+
+    if _batcher is not None:
+        _batcher.close()
+        _batcher = None
+
+
 def get_model_info() -> Dict[str, Any]:
     """Get model information."""
     if _model_info is None:
@@ -1,6 +1,6 @@
 """Pydantic models for API requests and responses."""
 
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from pydantic import BaseModel, Field
 
 
@@ -56,6 +56,8 @@ class ModelInfoResponse(BaseModel):
     entity_types: List[str] = Field(..., description="Supported entity types")
     max_sequence_length: int = Field(..., description="Maximum sequence length")
     version: str = Field(..., description="Model version")
+    cache: Optional[Dict[str, Any]] = Field(
+        None, description="Prediction cache statistics (when caching is enabled)")
 
 
 class ErrorResponse(BaseModel):
@@ -0,0 +1,306 @@
+"""
+@meta
+name: result_cache
+type: utility
+domain: deployment
+responsibility:
+  - Cache prediction results by content hash and model fingerprint
+  - In-process LRU tier and optional on-disk tier with TTL and size eviction
+  - Hit/miss statistics
+inputs:
+  - Raw file bytes or input texts
+  - Prediction results
+outputs:
+  - Cached prediction results
+tags:
+  - utility
+  - api
+  - caching
+ci:
+  runnable: true
+  needs_gpu: false
+  needs_cloud: false
+lifecycle:
+  status: active
+"""
+
+"""Content-addressed cache for prediction results."""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def fingerprint_file(path: Path) -> str:
+    """
+    Hash a file's contents (e.g. an ONNX model) in chunks.
+
+    Args:
+        path: File to hash.
+
+    Returns:
+        Hex SHA-256 digest of the file bytes.
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def inference_fingerprint(model_fingerprint: str, settings: Mapping[str, Any]) -> str:
+    """
+    Combine a model fingerprint with the inference settings that shape output.
+
+    Results computed with a different max length, sliding-window stride or
+    padding buckets must not be served after a config change, including
+    from a disk tier that outlives the process.
+
+    Args:
+        model_fingerprint: Fingerprint of the model file.
+        settings: JSON-serializable inference settings.
+
+    Returns:
+        Hex SHA-256 digest of both.
+    """
+    digest = hashlib.sha256(model_fingerprint.encode("utf-8"))
+    digest.update(json.dumps(dict(settings), sort_keys=True).encode("utf-8"))
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """
+    Two-tier cache of JSON-serializable prediction results.
+
+    Keys combine the model fingerprint (see ``inference_fingerprint``) with a
+    hash of the request content, so results from a different model or
+    inference configuration never match. The memory tier is an
+    LRU bounded by entry count; the optional disk tier stores one JSON file
+    per key under a per-model directory and is bounded by total bytes. Both
+    tiers expire entries after ``ttl_seconds``.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl_seconds: float = 3600.0,
+        disk_dir: Optional[Path] = None,
+        disk_max_bytes: int = 512 * 1024 * 1024,
+        model_fingerprint: str = "",
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum entries in the memory tier.
+            ttl_seconds: Entry lifetime in seconds (0 disables expiry).
+            disk_dir: Directory for the disk tier (default: memory only).
+            disk_max_bytes: Maximum total size of the disk tier.
+            model_fingerprint: Fingerprint of the loaded model.
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.disk_dir = Path(disk_dir) if disk_dir else None
+        self.disk_max_bytes = disk_max_bytes
+        self.model_fingerprint = model_fingerprint
+
+        self._memory: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._disk_bytes = 0
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        if self.disk_dir is not None:
+            self._model_dir.mkdir(parents=True, exist_ok=True)
+            self._disk_bytes = sum(
+                p.stat().st_size for p in self._model_dir.glob("*.json"))
+
+    @property
+    def _model_dir(self) -> Path:
+        """Disk tier directory for the current model."""
+        return self.disk_dir / (self.model_fingerprint[:16] or "default")
+
+    def text_key(self, text: str) -> str:
+        """
+        Cache key for a text prediction.
+
+        Only trailing whitespace is normalized away: it produces no tokens,
+        while any other change would shift the entity offsets returned.
+        """
+        return self._key(b"text", text.rstrip().encode("utf-8"))
+
+    def file_key(self, file_content: bytes, extractor: str) -> str:
+        """Cache key for a file prediction with a given text extractor."""
+        return self._key(b"file", extractor.encode("utf-8"), file_content)
+
+    def _key(self, *parts: bytes) -> str:
+        """Hash the model fingerprint and request parts into a key."""
+        digest = hashlib.sha256(self.model_fingerprint.encode("utf-8"))
+        for part in parts:
+            digest.update(len(part).to_bytes(8, "little"))
+            digest.update(part)
+        return digest.hexdigest()
+
+    def set_model(self, model_fingerprint: str) -> None:
+        """
+        Switch to a newly loaded model, invalidating results of the old one.
+
+        Args:
+            model_fingerprint: Fingerprint of the loaded model.
+        """
+        if model_fingerprint == self.model_fingerprint:
+            return
+        logger.info("Model changed; invalidating prediction cache")
+        self.clear()
+        with self._lock:
+            self.model_fingerprint = model_fingerprint
+            if self.disk_dir is not None:
+                self._model_dir.mkdir(parents=True, exist_ok=True)
+                self._disk_bytes = sum(
+                    p.stat().st_size for p in self._model_dir.glob("*.json"))
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Look up a result in memory, then on disk.
+
+        Args:
+            key: Key from ``text_key`` or ``file_key``.
+
+        Returns:
+            The cached result, or None on a miss.
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None and not self._expired(entry[0], now):
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            if entry is not None:
+                del self._memory[key]
+
+            value = self._disk_get(key, now)
+            if value is not None:
+                self._memory_put(key, value, now)
+                self.hits += 1
+                self.disk_hits += 1
+                return value
+
+            self.misses += 1
+            return None
+
+    def put(self, key: str, value: Any) -> None:
+        """
+        Store a JSON-serializable result in both tiers.
+
+        Args:
+            key: Key from ``text_key`` or ``file_key``.
+            value: Result to cache.
+        """
+        now = time.time()
+        with self._lock:
+            self._memory_put(key, value, now)
+            self._disk_put(key, value, now)
+
+    def clear(self) -> None:
+        """Drop all entries of the current model from both tiers."""
+        with self._lock:
+            self._memory.clear()
+            if self.disk_dir is not None:
+                shutil.rmtree(self._model_dir, ignore_errors=True)
+                self._disk_bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and tier sizes."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "memory_entries": len(self._memory),
+                "disk_bytes": self._disk_bytes,
+            }
+
+    def _expired(self, created: float, now: float) -> bool:
+        """Whether an entry created at ``created`` has outlived the TTL."""
+        return self.ttl_seconds > 0 and now - created > self.ttl_seconds
+
+    def _memory_put(self, key: str, value: Any, now: float) -> None:
+        """Insert into the LRU tier, evicting the least recently used entries."""
+        self._memory[key] = (now, value)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+            self.evictions += 1
+
+    def _disk_get(self, key: str, now: float) -> Optional[Any]:
+        """Read an entry from the disk tier, dropping it if expired or corrupt."""
+        if self.disk_dir is None:
+            return None
+        path = self._model_dir / f"{key}.json"
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+            if not self._expired(entry["created"], now):
+                return entry["value"]
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Dropping unreadable cache entry {path.name}: {e}")
+        self._disk_remove(path)
+        return None
+
+    def _disk_put(self, key: str, value: Any, now: float) -> None:
+        """Write an entry to the disk tier and enforce its size limit."""
+        if self.disk_dir is None:
+            return
+        path = self._model_dir / f"{key}.json"
+        tmp_path = path.with_suffix(".tmp")
+        try:
+            self._model_dir.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"created": now, "value": value}, f)
+            previous = path.stat().st_size if path.exists() else 0
+            os.replace(tmp_path, path)
+            self._disk_bytes += path.stat().st_size - previous
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"Failed to write cache entry {path.name}: {e}")
+            return
+        if self._disk_bytes > self.disk_max_bytes:
+            self._disk_evict()
+
+    def _disk_evict(self) -> None:
+        """Delete the oldest disk entries until under 90% of the size limit."""
+        entries = sorted(
+            self._model_dir.glob("*.json"), key=lambda p: p.stat().st_mtime)
+        target = int(self.disk_max_bytes * 0.9)
+        for path in entries:
+            if self._disk_bytes <= target:
+                break
+            self._disk_remove(path)
+            self.evictions += 1
+
+    def _disk_remove(self, path: Path) -> None:
+        """Remove one disk entry and update the size total."""
+        try:
+            size = path.stat().st_size
+            path.unlink()
+            self._disk_bytes = max(0, self._disk_bytes - size)
+        except OSError:
+            pass
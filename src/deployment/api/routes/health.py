@@ -27,7 +27,7 @@ lifecycle:
 
 from fastapi import HTTPException, status
 
-from ..model_loader import get_model_info, is_model_loaded
+from ..model_loader import get_model_info, get_result_cache, is_model_loaded
 from ..models import HealthResponse, ModelInfoResponse
 
 
@@ -50,5 +50,8 @@ async def model_info():
         )
     
     info = get_model_info()
+    cache = get_result_cache()
+    if cache is not None:
+        info["cache"] = cache.stats()
     return ModelInfoResponse(**info)
 
@@ -30,13 +30,14 @@ lifecycle:
 import time
 import logging
 import asyncio
-from typing import Optional, List
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Optional, List
 import numpy as np
 from fastapi import HTTPException, status, UploadFile, File, Form
+from fastapi.concurrency import run_in_threadpool
 
 from ..config import APIConfig
-from ..model_loader import get_engine, is_model_loaded
+from ..executors import get_extraction_executor, get_inference_executor
+from ..model_loader import get_engine, get_batcher, get_result_cache, is_model_loaded
 from ..models import (
     TextRequest,
     BatchTextRequest,
@@ -48,6 +49,7 @@ from ..exceptions import (
     TextExtractionError,
     InvalidFileTypeError,
     FileSizeExceededError,
+    ServiceOverloadedError,
 )
 from ..extractors import (
     extract_text_from_pdf,
@@ -56,6 +58,7 @@ from ..extractors import (
     validate_file,
 )
 from ..response_converters import convert_entities_to_response
+from ..result_cache import ResultCache
 
 logger = logging.getLogger(__name__)
 
@@ -72,8 +75,8 @@ async def predict_debug(request: TextRequest):
         engine = get_engine()
 
         # Get raw predictions
-        logits, tokens, tokenizer_output, offset_mapping = engine.predict_tokens(
-            request.text)
+        logits, tokens, tokenizer_output, offset_mapping = await get_inference_executor().run(
+            engine.predict_tokens, request.text)
 
         # Handle logits shape - ensure it's 2D (seq_len, num_labels)
         if len(logits.shape) == 1:
@@ -91,27 +94,18 @@ async def predict_debug(request: TextRequest):
         else:
             attention_mask = [1] * len(tokens)
 
-        # Process offset mapping (simplified - just for debug display)
-        token_offsets = []
+        # Offset mapping comes from the same tokenizer call as the feeds,
+        # shaped (seq_len, 2); (0, 0) marks special and padding tokens
+        token_offsets = [None] * len(tokens)
         if offset_mapping is not None:
             try:
-                if hasattr(offset_mapping, 'shape') and len(offset_mapping.shape) == 2:
-                    for i in range(min(len(offset_mapping), len(tokens))):
-                        offset = offset_mapping[i]
-                        if hasattr(offset, '__len__') and len(offset) >= 2:
-                            start, end = int(offset[0]), int(offset[1])
-                        else:
-                            start, end = int(offset), int(offset)
-                        if start == 0 and end == 0:
-                            token_offsets.append(None)
-                        else:
-                            token_offsets.append((start, end))
-                else:
-                    token_offsets = [None] * len(tokens)
-            except Exception:
+                offsets = np.asarray(offset_mapping).reshape(-1, 2)[:len(tokens)]
+                token_offsets = [
+                    None if start == 0 and end == 0 else (start, end)
+                    for start, end in offsets.tolist()
+                ]
+            except ValueError:
                 token_offsets = [None] * len(tokens)
-        else:
-            token_offsets = [None] * len(tokens)
 
         # Get entities
         entities = engine.decode_entities(
@@ -152,6 +146,8 @@ async def predict_debug(request: TextRequest):
 
         return debug_info
 
+    except ServiceOverloadedError:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -159,6 +155,13 @@ async def predict_debug(request: TextRequest):
         )
 
 
+async def _cache_call(cache: ResultCache, fn: Callable[..., Any], *args: Any) -> Any:
+    """Run result-cache work off the event loop when it may touch the disk tier."""
+    if cache.disk_dir is None:
+        return fn(*args)
+    return await run_in_threadpool(fn, *args)
+
+
 async def predict(request: TextRequest):
     """Single text prediction endpoint."""
     if not is_model_loaded():
@@ -171,8 +174,23 @@ async def predict(request: TextRequest):
         engine = get_engine()
         start_time = time.time()
 
-        # Direct prediction (removed redundant debug code that computed predictions twice)
-        entities_dict = engine.predict(request.text, return_confidence=True)
+        cache = get_result_cache()
+        cache_key = cache.text_key(request.text) if cache is not None else None
+        entities_dict = None
+        if cache is not None:
+            entities_dict = await _cache_call(cache, cache.get, cache_key)
+
+        if entities_dict is None:
+            # Coalesce with concurrent requests when micro-batching is enabled,
+            # otherwise run a direct single-text prediction
+            batcher = get_batcher()
+            if batcher is not None:
+                entities_dict = await asyncio.wrap_future(batcher.submit(request.text))
+            else:
+                entities_dict = await get_inference_executor().run(
+                    engine.predict, request.text, return_confidence=True)
+            if cache is not None:
+                await _cache_call(cache, cache.put, cache_key, entities_dict)
 
         processing_time = (time.time() - start_time) * 1000  # Convert to ms
 
@@ -190,38 +208,42 @@ async def predict(request: TextRequest):
         )
 
 
-def _process_single_text(text: str, index: int, engine, max_text_time: float) -> tuple:
-    """Process a single text and return result with index for ordering."""
-    text_start = time.time()
-    try:
-        # Validate text before processing
-        if not isinstance(text, str):
-            raise ValueError(f"Text {index+1} is not a string: {type(text)}")
-        if not text.strip():
-            raise ValueError(f"Text {index+1} is empty")
-        if len(text) > APIConfig.MAX_SEQUENCE_LENGTH * 10:  # Rough estimate
-            raise ValueError(
-                f"Text {index+1} too long: {len(text)} characters (max ~{APIConfig.MAX_SEQUENCE_LENGTH * 10})")
-
-        logger.debug(f"Processing text {index+1} ({len(text)} chars)")
-        entities_dict = engine.predict(text, return_confidence=True)
-        text_time = (time.time() - text_start) * 1000
-
-        # Check if processing took too long
-        if (time.time() - text_start) > max_text_time:
-            raise TimeoutError(f"Text {index+1} processing exceeded {max_text_time}s")
+def _validate_text(text: str, index: int) -> None:
+    """Validate one batch text, raising ValueError with a per-text message."""
+    if not isinstance(text, str):
+        raise ValueError(f"Text {index+1} is not a string: {type(text)}")
+    if not text.strip():
+        raise ValueError(f"Text {index+1} is empty")
+    if len(text) > APIConfig.MAX_SEQUENCE_LENGTH * 10:  # Rough estimate
+        raise ValueError(
+            f"Text {index+1} too long: {len(text)} characters (max ~{APIConfig.MAX_SEQUENCE_LENGTH * 10})")
 
-        entities = convert_entities_to_response(entities_dict)
-        return (index, PredictionResponse(entities=entities, processing_time_ms=text_time), None)
+
+def _predict_texts(engine, texts: List[str]) -> List[tuple]:
+    """
+    Predict several texts with one batched engine call.
+
+    If the batched call fails, texts are retried one by one so a single bad
+    input only fails its own prediction.
+
+    Returns:
+        One (entities_dict, error) tuple per text; error is None on success.
+    """
+    try:
+        results = engine.predict_batch(texts, return_confidence=True)
+        if len(results) != len(texts):
+            raise InferenceError(
+                f"Engine returned {len(results)} results for {len(texts)} texts")
+        return [(entities, None) for entities in results]
     except Exception as e:
-        elapsed = (time.time() - text_start) * 1000
-        error_msg = f"Text {index+1} failed: {str(e)} (took {elapsed:.1f}ms)"
-        logger.error(error_msg, exc_info=True)
-        return (index, PredictionResponse(entities=[], processing_time_ms=elapsed), error_msg)
+        if len(texts) == 1:
+            return [(None, e)]
+        logger.warning(f"Batched inference failed ({e}); retrying texts individually")
+        return [_predict_texts(engine, [text])[0] for text in texts]
 
 
 async def predict_batch(request: BatchTextRequest):
-    """Batch text prediction endpoint with parallel processing."""
+    """Batch text prediction endpoint running all texts through one batched inference."""
     if not is_model_loaded():
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
@@ -237,47 +259,62 @@ async def predict_batch(request: BatchTextRequest):
     try:
         engine = get_engine()
         start_time = time.time()
-        max_text_time = 30.0  # Maximum time per text in seconds
 
-        # Use parallel processing for batch requests (I/O-bound inference can benefit from threading)
-        # For small batches, sequential may be faster due to overhead, but parallel helps with larger batches
-        use_parallel = len(request.texts) >= 3  # Use parallel for 3+ items
-        
-        if use_parallel:
-            # Process texts in parallel using ThreadPoolExecutor
-            # Note: ONNX inference is CPU-bound, but GIL allows some parallelism for I/O
-            max_workers = min(4, len(request.texts))  # Limit to 4 workers to avoid contention
-            results = [None] * len(request.texts)
-            errors = []
-            
-            with ThreadPoolExecutor(max_workers=max_workers) as executor:
-                futures = {
-                    executor.submit(_process_single_text, text, i, engine, max_text_time): i
-                    for i, text in enumerate(request.texts)
-                }
-                
-                for future in as_completed(futures):
-                    try:
-                        index, prediction, error = future.result()
-                        results[index] = prediction
-                        if error:
-                            errors.append(error)
-                    except Exception as e:
-                        idx = futures[future]
-                        logger.error(f"Text {idx+1} processing failed: {e}", exc_info=True)
-                        errors.append(f"Text {idx+1} failed: {str(e)}")
-                        results[idx] = PredictionResponse(entities=[], processing_time_ms=0)
-            
-            predictions = results
-        else:
-            # Sequential processing for small batches (lower overhead)
-            predictions = []
-            errors = []
-            for i, text in enumerate(request.texts):
-                _, prediction, error = _process_single_text(text, i, engine, max_text_time)
-                predictions.append(prediction)
-                if error:
-                    errors.append(error)
+        predictions: List[Optional[PredictionResponse]] = [None] * len(request.texts)
+        errors = []
+
+        # Validate up front so invalid texts are reported without
+        # affecting the batch
+        valid_indices = []
+        for i, text in enumerate(request.texts):
+            try:
+                _validate_text(text, i)
+                valid_indices.append(i)
+            except ValueError as e:
+                errors.append(str(e))
+                predictions[i] = PredictionResponse(entities=[], processing_time_ms=0)
+
+        # Serve repeated texts from the result cache
+        cache = get_result_cache()
+        if cache is not None:
+            uncached_indices = []
+            cached_results = await _cache_call(
+                cache, lambda: [cache.get(cache.text_key(request.texts[i])) for i in valid_indices])
+            for i, cached in zip(valid_indices, cached_results):
+                if cached is None:
+                    uncached_indices.append(i)
+                else:
+                    predictions[i] = PredictionResponse(
+                        entities=convert_entities_to_response(cached),
+                        processing_time_ms=(time.time() - start_time) * 1000,
+                    )
+            valid_indices = uncached_indices
+
+        # One tokenization and length-sorted sub-batched session runs for
+        # all remaining texts (see InferenceRunner.predict_tokens_batch)
+        if valid_indices:
+            infer_start = time.time()
+            results = await get_inference_executor().run(
+                _predict_texts, engine, [request.texts[i] for i in valid_indices])
+            infer_time = (time.time() - infer_start) * 1000
+
+            to_cache = []
+            for i, (entities_dict, error) in zip(valid_indices, results):
+                if error is not None:
+                    error_msg = f"Text {i+1} failed: {error}"
+                    logger.error(error_msg)
+                    errors.append(error_msg)
+                    predictions[i] = PredictionResponse(
+                        entities=[], processing_time_ms=infer_time)
+                else:
+                    to_cache.append((request.texts[i], entities_dict))
+                    predictions[i] = PredictionResponse(
+                        entities=convert_entities_to_response(entities_dict),
+                        processing_time_ms=infer_time,
+                    )
+            if cache is not None and to_cache:
+                await _cache_call(cache, lambda: [
+                    cache.put(cache.text_key(text), entities) for text, entities in to_cache])
 
         total_time = (time.time() - start_time) * 1000
 
@@ -322,24 +359,37 @@ async def predict_file(
         # Detect file type
         file_type = detect_file_type(file_content, file.filename or "")
 
+        # Same bytes with the same extractor and model give the same result
+        start_time = time.time()
+        cache = get_result_cache()
+        cache_key = None
+        if cache is not None:
+            cache_key = cache.file_key(file_content, _resolve_extractor(file_type, extractor))
+            cached = await _cache_call(cache, cache.get, cache_key)
+            if cached is not None:
+                return PredictionResponse(
+                    entities=convert_entities_to_response(cached["entities"]),
+                    processing_time_ms=(time.time() - start_time) * 1000,
+                    extracted_text=cached["extracted_text"],
+                )
+
         # Extract text
         start_extract = time.time()
-        if file_type == "application/pdf":
-            pdf_extractor = _normalize_extractor(extractor, APIConfig.PDF_EXTRACTOR)
-            extracted_text = extract_text_from_pdf(file_content, pdf_extractor)
-        elif file_type.startswith("image/"):
-            ocr_extractor = _normalize_extractor(extractor, APIConfig.OCR_EXTRACTOR)
-            extracted_text = extract_text_from_image(file_content, ocr_extractor)
-        else:
-            raise InvalidFileTypeError(f"Unsupported file type: {file_type}")
+        extracted_text = await get_extraction_executor().run(
+            _extract_text, file_content, file_type, extractor)
 
         extract_time = (time.time() - start_extract) * 1000
 
         # Run NER prediction
         engine = get_engine()
         start_infer = time.time()
-        entities_dict = engine.predict(extracted_text, return_confidence=True)
+        entities_dict = await get_inference_executor().run(
+            engine.predict, extracted_text, return_confidence=True)
         infer_time = (time.time() - start_infer) * 1000
+        if cache is not None:
+            await _cache_call(
+                cache, cache.put, cache_key,
+                {"extracted_text": extracted_text, "entities": entities_dict})
 
         # Convert to Entity models
         entities = convert_entities_to_response(entities_dict)
@@ -370,6 +420,23 @@ def _normalize_extractor(extractor: Optional[str], default: str) -> str:
     return extractor.strip()
 
 
+def _resolve_extractor(file_type: str, extractor: Optional[str]) -> str:
+    """Name the extractor used for a file type, e.g. "pdf:pymupdf"."""
+    if file_type == "application/pdf":
+        return f"pdf:{_normalize_extractor(extractor, APIConfig.PDF_EXTRACTOR)}"
+    if file_type.startswith("image/"):
+        return f"image:{_normalize_extractor(extractor, APIConfig.OCR_EXTRACTOR)}"
+    raise InvalidFileTypeError(f"Unsupported file type: {file_type}")
+
+
+def _extract_text(file_content: bytes, file_type: str, extractor: Optional[str]) -> str:
+    """Extract text from a PDF or image (blocking; run on the extraction pool)."""
+    kind, name = _resolve_extractor(file_type, extractor).split(":", 1)
+    if kind == "pdf":
+        return extract_text_from_pdf(file_content, name)
+    return extract_text_from_image(file_content, name)
+
+
 async def _process_single_file(file: UploadFile, index: int, extractor: Optional[str], engine) -> tuple:
     """Process a single file and return result with index for ordering."""
     file_start = time.time()
@@ -380,18 +447,25 @@ async def _process_single_file(file: UploadFile, index: int, extractor: Optional
         # Detect file type
         file_type = detect_file_type(file_content, file.filename or "")
 
-        # Extract text
-        if file_type == "application/pdf":
-            pdf_extractor = _normalize_extractor(extractor, APIConfig.PDF_EXTRACTOR)
-            extracted_text = extract_text_from_pdf(file_content, pdf_extractor)
-        elif file_type.startswith("image/"):
-            ocr_extractor = _normalize_extractor(extractor, APIConfig.OCR_EXTRACTOR)
-            extracted_text = extract_text_from_image(file_content, ocr_extractor)
-        else:
-            raise InvalidFileTypeError(f"Unsupported file type: {file_type}")
+        cache = get_result_cache()
+        cached = None
+        if cache is not None:
+            cache_key = cache.file_key(file_content, _resolve_extractor(file_type, extractor))
+            cached = await _cache_call(cache, cache.get, cache_key)
 
-        # Run NER prediction
-        entities_dict = engine.predict(extracted_text, return_confidence=True)
+        if cached is not None:
+            extracted_text, entities_dict = cached["extracted_text"], cached["entities"]
+        else:
+            # Extract text and run NER prediction on the worker pools so other
+            # files' extraction overlaps this file's inference
+            extracted_text = await get_extraction_executor().run(
+                _extract_text, file_content, file_type, extractor)
+            entities_dict = await get_inference_executor().run(
+                engine.predict, extracted_text, return_confidence=True)
+            if cache is not None:
+                await _cache_call(
+                    cache, cache.put, cache_key,
+                    {"extracted_text": extracted_text, "entities": entities_dict})
 
         file_time = (time.time() - file_start) * 1000
 
@@ -403,6 +477,8 @@ async def _process_single_file(file: UploadFile, index: int, extractor: Optional
             processing_time_ms=file_time,
             extracted_text=extracted_text,
         ), None)
+    except ServiceOverloadedError:
+        raise
     except Exception as e:
         elapsed = (time.time() - file_start) * 1000
         error_msg = f"File {index+1} ({file.filename or 'unknown'}) failed: {str(e)} (took {elapsed:.1f}ms)"
@@ -446,6 +522,10 @@ async def predict_file_batch(
                 for i, file in enumerate(files)
             ]
             results = await asyncio.gather(*tasks, return_exceptions=True)
+            # Saturated pools fail the whole request with a retryable 503
+            for result in results:
+                if isinstance(result, ServiceOverloadedError):
+                    raise result
             
             predictions = []
             errors = []
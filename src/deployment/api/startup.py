@@ -27,8 +27,9 @@ lifecycle:
 
 from fastapi import FastAPI
 
-from .model_loader import initialize_model, is_model_loaded
+from .model_loader import initialize_model, is_model_loaded, shutdown_batcher
 from .config import APIConfig
+from .executors import shutdown_executors
 
 
 def startup_event(app: FastAPI) -> None:
@@ -51,7 +52,8 @@ def startup_event(app: FastAPI) -> None:
 
 def shutdown_event(app: FastAPI) -> None:
     """Shutdown event handler."""
-    # Cleanup if needed
+    shutdown_batcher()
+    shutdown_executors()
     app.state.model_loaded = False
 
 
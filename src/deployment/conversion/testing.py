@@ -36,7 +36,7 @@ import onnxruntime as ort
 from transformers import AutoTokenizer
 
 from common.shared.logging_utils import get_script_logger
-from common.shared.tokenization_utils import prepare_onnx_inputs
+from common.shared.tokenization_utils import tokenize_for_onnx
 
 _log = get_script_logger("conversion.testing")
 
@@ -71,12 +71,12 @@ def run_smoke_test(onnx_path: Path, checkpoint_dir: Path) -> None:
     input_names = {i.name for i in sess.get_inputs()}
     
     # Prepare inputs using shared utilities
-    feeds = prepare_onnx_inputs(
+    feeds = tokenize_for_onnx(
         tokenizer,
         "Jane Doe is a software engineer.",
         16,  # max_length
         input_names,
-    )
+    ).feeds
     
     # Only feed expected inputs (some models omit token_type_ids)
     feeds = {k: v for k, v in feeds.items() if k in input_names}
@@ -35,6 +35,7 @@ from typing import Any, Dict, List, Optional
 from common.shared.argument_parsing import validate_path_exists
 from common.shared.logging_utils import get_script_logger
 from common.shared.script_setup import setup_script_paths
+from common.shared.tokenization_utils import DEFAULT_PADDING_BUCKETS
 
 # Setup script paths for absolute imports
 # This allows the script to be run directly: python src/evaluation/benchmarking/cli.py
@@ -54,6 +55,7 @@ def benchmark_model(
     warmup_iterations: int = 10,
     device: Optional[str] = None,
     max_length: int = 512,
+    padding_buckets: Optional[List[int]] = None,
 ) -> Dict[str, Any]:
     """Benchmark model inference performance across different batch sizes."""
     # Use absolute imports to support both module import and direct script execution
@@ -72,6 +74,8 @@ def benchmark_model(
         warmup_iterations: Number of warmup iterations.
         device: Device to use ('cuda', 'cpu', or None for auto-detect).
         max_length: Maximum sequence length.
+        padding_buckets: Bucket lengths for dynamic padding (None or empty
+            pads each batch to its longest sequence).
 
     Returns:
         Dictionary with benchmark results for each batch size.
@@ -102,6 +106,7 @@ def benchmark_model(
             device=device_obj,
             max_length=max_length,
             count=warmup_iterations,
+            padding_buckets=padding_buckets,
         )
         
         # Run inference and collect latencies
@@ -112,6 +117,7 @@ def benchmark_model(
             device=device_obj,
             max_length=max_length,
             num_iterations=num_iterations,
+            padding_buckets=padding_buckets,
         )
         
         # Calculate statistics
@@ -184,6 +190,17 @@ def parse_args() -> argparse.Namespace:
         default=512,
         help="Maximum sequence length (default: 512)",
     )
+    parser.add_argument(
+        "--padding-buckets",
+        type=int,
+        nargs="*",
+        default=list(DEFAULT_PADDING_BUCKETS),
+        help=(
+            "Pad each batch to its longest sequence rounded up to one of these lengths, "
+            "matching the API (default: 32 64 128 256 512). "
+            "Pass the flag without values to pad to the longest sequence only"
+        ),
+    )
     
     return parser.parse_args()
 
@@ -217,6 +234,7 @@ def main() -> None:
         warmup_iterations=args.warmup,
         device=args.device,
         max_length=args.max_length,
+        padding_buckets=args.padding_buckets,
     )
     
     # Save results
@@ -27,7 +27,7 @@ lifecycle:
 
 """Inference execution and measurement for benchmarking."""
 
-from typing import List, TYPE_CHECKING
+from typing import Dict, List, Optional, Sequence, TYPE_CHECKING, Union
 
 if TYPE_CHECKING:
     import torch
@@ -38,12 +38,49 @@ WARMUP_PROGRESS_INTERVAL = 10  # Show progress every N warmup iterations
 BATCH_PROGRESS_INTERVAL = 20  # Show progress every N batch iterations
 
 
+def _tokenize_to_device(
+    tokenizer: "AutoTokenizer",
+    texts: Union[str, List[str]],
+    device: "torch.device",
+    max_length: int,
+    padding_buckets: Optional[Sequence[int]] = None,
+) -> Dict[str, "torch.Tensor"]:
+    """
+    Tokenize texts and move them to the device.
+
+    Pads to the longest sequence, or to its length bucket when
+    ``padding_buckets`` is given so measurements match the API's padding.
+    """
+    import torch
+
+    if not padding_buckets:
+        inputs = tokenizer(
+            texts,
+            return_tensors="pt",
+            padding=True,
+            truncation=True,
+            max_length=max_length,
+        )
+        return {k: v.to(device) for k, v in inputs.items()}
+
+    from common.shared.tokenization_utils import prepare_onnx_inputs
+
+    feeds = prepare_onnx_inputs(
+        tokenizer,
+        texts,
+        max_length,
+        padding_buckets=padding_buckets,
+    )
+    return {k: torch.from_numpy(v).to(device) for k, v in feeds.items()}
+
+
 def run_single_inference(
     model: "AutoModelForTokenClassification",
     tokenizer: "AutoTokenizer",
     text: str,
     device: "torch.device",
     max_length: int = 512,
+    padding_buckets: Optional[Sequence[int]] = None,
 ) -> float:
     """
     Measure single document inference time.
@@ -54,6 +91,7 @@ def run_single_inference(
         text: Input text to process.
         device: Device to run inference on.
         max_length: Maximum sequence length.
+        padding_buckets: Optional bucket lengths for dynamic padding.
 
     Returns:
         Inference time in milliseconds.
@@ -62,14 +100,7 @@ def run_single_inference(
     import time
     
     # Tokenize
-    inputs = tokenizer(
-        text,
-        return_tensors="pt",
-        padding=True,
-        truncation=True,
-        max_length=max_length,
-    )
-    inputs = {k: v.to(device) for k, v in inputs.items()}
+    inputs = _tokenize_to_device(tokenizer, text, device, max_length, padding_buckets)
     
     # Measure inference time
     start = time.perf_counter()
@@ -88,6 +119,7 @@ def run_warmup_iterations(
     device: "torch.device",
     max_length: int = 512,
     count: int = 10,
+    padding_buckets: Optional[Sequence[int]] = None,
 ) -> None:
     """
     Run warmup iterations to avoid cold start effects.
@@ -99,6 +131,7 @@ def run_warmup_iterations(
         device: Device to run inference on.
         max_length: Maximum sequence length.
         count: Number of warmup iterations.
+        padding_buckets: Optional bucket lengths for dynamic padding.
     """
     import torch
     
@@ -107,14 +140,8 @@ def run_warmup_iterations(
     
     print(f"    Warmup: {count} iterations...", flush=True, end="")
     for i in range(count):
-        inputs = tokenizer(
-            texts,
-            return_tensors="pt",
-            padding=True,
-            truncation=True,
-            max_length=max_length,
-        )
-        inputs = {k: v.to(device) for k, v in inputs.items()}
+        inputs = _tokenize_to_device(
+            tokenizer, texts, device, max_length, padding_buckets)
         with torch.no_grad():
             _ = model(**inputs)
         # Show progress every N iterations
@@ -130,6 +157,7 @@ def run_batch_inference(
     device: "torch.device",
     max_length: int = 512,
     num_iterations: int = 100,
+    padding_buckets: Optional[Sequence[int]] = None,
 ) -> List[float]:
     """
     Measure batch inference latency for multiple iterations.
@@ -141,6 +169,7 @@ def run_batch_inference(
         device: Device to run inference on.
         max_length: Maximum sequence length.
         num_iterations: Number of iterations to measure.
+        padding_buckets: Optional bucket lengths for dynamic padding.
 
     Returns:
         List of latency measurements in milliseconds.
@@ -153,14 +182,8 @@ def run_batch_inference(
     # Actual measurement
     print(f"    Measurement: {num_iterations} iterations...", flush=True, end="")
     for i in range(num_iterations):
-        inputs = tokenizer(
-            texts,
-            return_tensors="pt",
-            padding=True,
-            truncation=True,
-            max_length=max_length,
-        )
-        inputs = {k: v.to(device) for k, v in inputs.items()}
+        inputs = _tokenize_to_device(
+            tokenizer, texts, device, max_length, padding_buckets)
         
         start = time.perf_counter()
         with torch.no_grad():
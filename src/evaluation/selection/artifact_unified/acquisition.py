@@ -33,18 +33,18 @@ lifecycle:
 This module provides the unified API for artifact acquisition across all stages.
 It orchestrates discovery, validation, and download from multiple sources.
 
-**Single Source of Truth (SSOT)**: This module is the SSOT for tar.gz extraction
-logic. All tar.gz extraction functionality should use `_extract_tar_gz()` from
-this module to avoid duplication.
+**Single Source of Truth (SSOT)**: This module is the SSOT for checkpoint archive
+extraction logic. All archive extraction functionality should use `_extract_archive()`
+from this module to avoid duplication.
 """
 import shutil
-import tarfile
 from pathlib import Path
 from typing import Any, Callable, Dict, Optional
 
 import mlflow
 # MlflowClient import removed - use create_mlflow_client() from infrastructure.tracking.mlflow.client instead
 
+from common.shared.archive_utils import detect_archive_format, extract_archive
 from common.shared.logging_utils import get_logger
 from common.shared.platform_detection import detect_platform
 from evaluation.selection.artifact_unified.discovery import (
@@ -597,7 +597,8 @@ def _download_from_mlflow(
                 if "checkpoint" in p.lower() or "best_trial" in p.lower()
             ]
             if checkpoint_artifacts:
-                # Prefer best_trial_checkpoint
+                # Prefer archives over their manifests, then best_trial_checkpoint
+                checkpoint_artifacts.sort(key=lambda p: detect_archive_format(p) is None)
                 for path in checkpoint_artifacts:
                     if "best_trial_checkpoint" in path.lower():
                         artifact_path = path
@@ -632,34 +633,37 @@ def _download_from_mlflow(
         
         downloaded_path = Path(downloaded_path)
         
-        # Extract if tar.gz
+        # Extract if archive (tar, tar.gz or tar.zst)
         try:
-            if downloaded_path.is_file() and downloaded_path.suffixes == ['.tar', '.gz']:
-                logger.debug(f"Extracting tar.gz file: {downloaded_path}")
-                # Extract to destination directory (not to tar.gz's parent)
-                extracted_path = _extract_tar_gz(downloaded_path, extract_to=destination)
-                # Clean up tar.gz file after extraction
+            if downloaded_path.is_file() and detect_archive_format(downloaded_path):
+                logger.debug(f"Extracting archive: {downloaded_path}")
+                # Extract to destination directory (not to archive's parent)
+                extracted_path = _extract_archive(downloaded_path, extract_to=destination)
+                # Clean up archive file after extraction
                 try:
                     downloaded_path.unlink()
-                    logger.debug(f"Cleaned up tar.gz file: {downloaded_path}")
+                    logger.debug(f"Cleaned up archive file: {downloaded_path}")
                 except Exception as e:
-                    logger.debug(f"Could not clean up tar.gz file: {e}")
+                    logger.debug(f"Could not clean up archive file: {e}")
                 downloaded_path = extracted_path
             elif downloaded_path.is_dir():
-                tar_files = list(downloaded_path.glob("*.tar.gz")) + list(downloaded_path.glob("*.tgz"))
-                if tar_files:
-                    logger.debug(f"Found tar.gz file in directory, extracting: {tar_files[0]}")
+                archive_files = sorted(
+                    p for p in downloaded_path.iterdir()
+                    if p.is_file() and detect_archive_format(p)
+                )
+                if archive_files:
+                    logger.debug(f"Found archive in directory, extracting: {archive_files[0]}")
                     # Extract to destination directory
-                    extracted_path = _extract_tar_gz(tar_files[0], extract_to=destination)
-                    # Clean up tar.gz file after extraction
+                    extracted_path = _extract_archive(archive_files[0], extract_to=destination)
+                    # Clean up archive file after extraction
                     try:
-                        tar_files[0].unlink()
-                        logger.debug(f"Cleaned up tar.gz file: {tar_files[0]}")
+                        archive_files[0].unlink()
+                        logger.debug(f"Cleaned up archive file: {archive_files[0]}")
                     except Exception as e:
-                        logger.debug(f"Could not clean up tar.gz file: {e}")
+                        logger.debug(f"Could not clean up archive file: {e}")
                     downloaded_path = extracted_path
         except Exception as e:
-            logger.error(f"Failed to extract tar.gz file: {e}", exc_info=True)
+            logger.error(f"Failed to extract archive: {e}", exc_info=True)
             return None
         
         # Find checkpoint in extracted directory if needed
@@ -711,75 +715,52 @@ def _download_from_mlflow(
         return None
 
 
-def _extract_tar_gz(tar_path: Path, extract_to: Optional[Path] = None) -> Path:
+def _extract_archive(archive_path: Path, extract_to: Optional[Path] = None) -> Path:
     """
-    Extract tar.gz file and return path to extracted directory.
+    Extract a checkpoint archive and return path to extracted directory.
     
+    Supports tar, tar.gz and tar.zst (see ``common.shared.archive_utils``);
+    files are verified against the archive's manifest hashes when present.
     If the archive has a single root directory, moves its contents to extract_to
     to avoid nested directory structures.
     """
     if extract_to is None:
-        extract_to = tar_path.parent
+        extract_to = archive_path.parent
     
     extract_to = Path(extract_to)
     extract_to.mkdir(parents=True, exist_ok=True)
     
-    with tarfile.open(tar_path, 'r:gz') as tar:
-        members = tar.getmembers()
-        if members:
-            # Extract to a temporary subdirectory first
-            temp_extract = extract_to / "_temp_extract"
-            temp_extract.mkdir(exist_ok=True)
-            tar.extractall(path=temp_extract)
-            
-            # Check if archive has a single root directory
-            root_names = {Path(m.name).parts[0] for m in members if m.name}
-            if len(root_names) == 1:
-                root_name = list(root_names)[0]
-                root_path = temp_extract / root_name
-                
-                if root_path.exists():
-                    # Move contents of root directory to extract_to
-                    import shutil
-                    for item in root_path.iterdir():
-                        dest_item = extract_to / item.name
-                        if dest_item.exists():
-                            if dest_item.is_dir():
-                                shutil.rmtree(dest_item)
-                            else:
-                                dest_item.unlink()
-                        shutil.move(str(item), str(extract_to))
-                    
-                    # Clean up temp directory
-                    try:
-                        shutil.rmtree(temp_extract)
-                    except Exception as e:
-                        logger.debug(f"Could not clean up temp extract directory: {e}")
-                    
-                    return extract_to
-                else:
-                    return temp_extract
+    # Extract to a temporary subdirectory first
+    temp_extract = extract_to / "_temp_extract"
+    if temp_extract.exists():
+        shutil.rmtree(temp_extract)
+    temp_extract.mkdir()
+    extract_archive(archive_path, temp_extract)
+    
+    root_items = list(temp_extract.iterdir())
+    if not root_items:
+        shutil.rmtree(temp_extract, ignore_errors=True)
+        return extract_to
+    
+    # If archive has a single root directory, move its contents instead
+    if len(root_items) == 1 and root_items[0].is_dir():
+        items = list(root_items[0].iterdir())
+    else:
+        items = root_items
+    
+    for item in items:
+        dest_item = extract_to / item.name
+        if dest_item.exists():
+            if dest_item.is_dir():
+                shutil.rmtree(dest_item)
             else:
-                # Multiple root items - move all to extract_to
-                import shutil
-                for item in temp_extract.iterdir():
-                    dest_item = extract_to / item.name
-                    if dest_item.exists():
-                        if dest_item.is_dir():
-                            shutil.rmtree(dest_item)
-                        else:
-                            dest_item.unlink()
-                    shutil.move(str(item), str(extract_to))
-                
-                # Clean up temp directory
-                try:
-                    shutil.rmtree(temp_extract)
-                except Exception as e:
-                    logger.debug(f"Could not clean up temp extract directory: {e}")
-                
-                return extract_to
+                dest_item.unlink()
+        shutil.move(str(item), str(extract_to))
+    
+    # Clean up temp directory
+    try:
+        shutil.rmtree(temp_extract)
+    except Exception as e:
+        logger.debug(f"Could not clean up temp extract directory: {e}")
     
     return extract_to
-
-
-
@@ -43,6 +43,7 @@ from typing import Any, Callable, Dict, Optional
 
 from mlflow.tracking import MlflowClient
 
+from common.shared.archive_utils import detect_archive_format
 from common.shared.logging_utils import get_logger
 from common.shared.platform_detection import detect_platform
 from evaluation.selection.artifact_unified.types import (
@@ -288,9 +289,9 @@ def _find_checkpoint_in_path(path: Path) -> Optional[Path]:
                 if is_valid:
                     return subdir
         
-        # Check for directories that look like extracted tar.gz (name ends with .tar.gz)
+        # Check for directories that look like extracted archives (name ends with .tar.gz etc.)
         for item in path.iterdir():
-            if item.is_dir() and item.name.endswith(".tar.gz"):
+            if item.is_dir() and detect_archive_format(item.name):
                 # Check inside the extracted directory
                 checkpoint_subdir = item / "checkpoint"
                 if checkpoint_subdir.exists() and checkpoint_subdir.is_dir():
@@ -321,15 +322,15 @@ def _find_checkpoint_in_path(path: Path) -> Optional[Path]:
                 if is_valid:
                     return item
     
-    # Check for tar.gz files (not extracted yet) - only if no extracted checkpoint found
+    # Check for archive files (not extracted yet) - only if no extracted checkpoint found
     if path.is_dir():
-        tar_gz_files = list(path.glob("*.tar.gz"))
-        if tar_gz_files:
+        archive_files = [p for p in path.iterdir() if p.is_file() and detect_archive_format(p)]
+        if archive_files:
             # For now, return None for tar.gz files - let acquisition handle extraction
             # In future, could extract to temp and return extracted path
-            logger.debug(f"Found tar.gz file in {path} (extraction not implemented in discovery)")
+            logger.debug(f"Found checkpoint archive in {path} (extraction not implemented in discovery)")
             # TODO: Extract and validate, or return None to trigger download
-            # For now, don't return tar.gz files - let acquisition handle extraction
+            # For now, don't return archive files - let acquisition handle extraction
             return None
     
     return None
@@ -152,8 +152,10 @@ def load_study_from_disk(
     if not study_folder or not study_folder.exists():
         return None
 
-    study_db_path = study_folder / "study.db"
-    if not study_db_path.exists():
+    from training.hpo.checkpoint.storage import find_study_storage, get_storage
+
+    study_db_path = find_study_storage(study_folder)
+    if study_db_path is None:
         return None
 
     try:
@@ -165,9 +167,8 @@ def load_study_from_disk(
         import optuna  # type: ignore[no-redef]
 
     try:
-        storage_uri = f"sqlite:///{study_db_path.resolve()}"
         study = optuna.load_study(
-            study_name=study_folder.name, storage=storage_uri)
+            study_name=study_folder.name, storage=get_storage(study_db_path))
         return study
     except Exception as e:
         logger.debug(f"Could not load study for {backbone_name}: {e}")
@@ -378,8 +378,10 @@ def find_best_trials_for_backbones(
                     hpo_backbone_dir)
 
                 if study_folder:
-                    study_db_path = study_folder / "study.db"
-                    if study_db_path.exists():
+                    from training.hpo.checkpoint.storage import find_study_storage, get_storage
+
+                    study_db_path = find_study_storage(study_folder)
+                    if study_db_path is not None:
                         try:
                             from training.hpo.core.optuna_integration import import_optuna
                             optuna_module_imported, _, _, _ = import_optuna()  # type: ignore[no-untyped-call]
@@ -391,7 +393,7 @@ def find_best_trials_for_backbones(
                         try:
                             study = optuna.load_study(
                                 study_name=study_folder.name,
-                                storage=f"sqlite:///{study_db_path.resolve()}",
+                                storage=get_storage(study_db_path),
                             )
                             logger.debug(
                                 f"Loaded study for {backbone_name} from disk"
@@ -23,6 +23,7 @@ from .experiments import (
 # MLflow naming modules
 from .mlflow.config import (
     get_auto_increment_config,
+    get_checkpoint_archive_config,
     get_index_config,
     get_naming_config,
     get_run_finder_config,
@@ -80,6 +81,7 @@ __all__ = [
     "get_run_finder_config",
     "get_auto_increment_config",
     "get_tracking_config",
+    "get_checkpoint_archive_config",
     # MLflow Run Keys
     "build_mlflow_run_key",
     "build_mlflow_run_key_hash",
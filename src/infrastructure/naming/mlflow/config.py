@@ -378,6 +378,64 @@ def get_auto_increment_config(
     
     return result
 
+def _validate_checkpoint_archive_config(config: Dict[str, Any]) -> Dict[str, Any]:
+    """Validate and apply defaults for tracking.checkpoint_archive config."""
+    from common.shared.archive_utils import ARCHIVE_FORMATS, DEFAULT_ARCHIVE_FORMAT
+
+    defaults = {
+        "format": DEFAULT_ARCHIVE_FORMAT,
+        "compression_level": None,
+        "threads": None,
+    }
+
+    result = defaults.copy()
+
+    if "format" in config:
+        if config["format"] in ARCHIVE_FORMATS:
+            result["format"] = config["format"]
+        else:
+            logger.warning(
+                f"Invalid tracking.checkpoint_archive.format in config "
+                f"(must be one of {list(ARCHIVE_FORMATS)}), using default: {defaults['format']}"
+            )
+
+    for key in ("compression_level", "threads"):
+        value = config.get(key)
+        if value is None:
+            continue
+        if isinstance(value, int) and not isinstance(value, bool) and value > 0:
+            result[key] = value
+        else:
+            logger.warning(
+                f"Invalid tracking.checkpoint_archive.{key} in config "
+                f"(must be a positive int or null), using default"
+            )
+
+    return result
+
+def get_checkpoint_archive_config(
+    config_dir: Optional[Path] = None,
+    config: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """
+    Get checkpoint archive configuration with defaults.
+    
+    Args:
+        config_dir: Path to config directory (defaults to current directory / "config").
+        config: Optional pre-loaded config dict (avoids re-reading file).
+    
+    Returns:
+        Dictionary with:
+        - format: "tar", "tar.gz" or "tar.zst"
+        - compression_level: int or None (format default)
+        - threads: int or None (CPU count, at most 8)
+    """
+    if config is None:
+        config = load_mlflow_config(config_dir)
+    
+    archive_config = config.get("tracking", {}).get("checkpoint_archive") or {}
+    return _validate_checkpoint_archive_config(archive_config)
+
 def get_tracking_config(
     config_dir: Optional[Path] = None,
     stage: Optional[str] = None,
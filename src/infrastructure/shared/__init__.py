@@ -1,4 +1,5 @@
 from .backup import (
+    BackgroundBackupWorker,
     immediate_backup_if_needed,
     backup_hpo_study_to_drive,
     create_incremental_backup_callback,
@@ -6,6 +7,7 @@ from .backup import (
 )
 
 __all__ = [
+    "BackgroundBackupWorker",
     "immediate_backup_if_needed",
     "backup_hpo_study_to_drive",
     "create_incremental_backup_callback",
@@ -5,6 +5,7 @@ type: utility
 domain: infrastructure
 responsibility:
   - Backup HPO study.db and study folders to Google Drive
+  - Run incremental backups on a background worker
   - Verify trial_meta.json files
 inputs:
   - HPO study directories
@@ -26,11 +27,14 @@ lifecycle:
 """HPO backup utilities for Colab environments.
 
 Handles backing up study.db and study folders to Google Drive,
-with verification of trial_meta.json files.
+with verification of trial_meta.json files. Backups requested during
+``study.optimize`` run on a ``BackgroundBackupWorker`` so trials never wait
+for Drive.
 """
 
+import threading
 from pathlib import Path
-from typing import Optional, Callable, Any
+from typing import Dict, Optional, Callable, Any
 
 from common.shared.logging_utils import get_logger
 from common.shared.platform_detection import is_drive_path
@@ -65,6 +69,15 @@ def _should_skip_backup(
     return False
 
 
+def _flush_study_storage(target_path: Path, is_directory: bool) -> None:
+    """Fold a SQLite WAL into study.db so the copied file has every trial."""
+    from training.hpo.checkpoint.storage import checkpoint_sqlite_wal, find_study_storage
+
+    study_storage = find_study_storage(target_path) if is_directory else target_path
+    if study_storage is not None:
+        checkpoint_sqlite_wal(study_storage)
+
+
 def immediate_backup_if_needed(
     target_path: Path,
     backup_to_drive: Callable[[Path, bool], bool],
@@ -106,6 +119,7 @@ def immediate_backup_if_needed(
     
     # Perform backup
     try:
+        _flush_study_storage(target_path, is_directory)
         result = backup_to_drive(target_path, is_directory=is_directory)
         if result:
             logger.info(
@@ -125,11 +139,149 @@ def immediate_backup_if_needed(
         return False
 
 
+class BackgroundBackupWorker:
+    """
+    Run backups on a background thread, coalescing repeated requests.
+
+    ``submit`` only records the path and returns. Requests for a path that
+    is already pending are merged, so a burst of completed trials results in
+    one backup of study.db. A request made while the path is being backed up
+    is kept and runs once more afterwards, so the last state is always
+    backed up.
+    """
+
+    def __init__(
+        self,
+        backup_to_drive: Callable[[Path, bool], bool],
+        coalesce_seconds: float = 1.0,
+    ):
+        """
+        Initialize the worker (the thread starts on the first request).
+
+        Args:
+            backup_to_drive: Function to backup files to Drive (takes Path and bool)
+            coalesce_seconds: Time to wait for further requests before starting
+                a backup (not applied while flushing)
+        """
+        self._backup_to_drive = backup_to_drive
+        self._coalesce_seconds = coalesce_seconds
+        self._pending: Dict[Path, bool] = {}  # path -> is_directory, in request order
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._busy = False
+        self._flushing = 0
+        self._closed = False
+        self.completed = 0
+        self.failed = 0
+
+    def submit(self, target_path: Path, is_directory: bool = False) -> None:
+        """
+        Request a backup of target_path without waiting for it.
+
+        Args:
+            target_path: Path to file or directory to backup
+            is_directory: Whether target_path is a directory (False for files)
+
+        Raises:
+            RuntimeError: If the worker was closed
+        """
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("BackgroundBackupWorker is closed")
+            self._pending[Path(target_path)] = is_directory
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="backup-worker", daemon=True)
+                self._thread.start()
+            self._cond.notify_all()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until all requested backups have finished.
+
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely)
+
+        Returns:
+            True if no backup is pending or running
+        """
+        with self._cond:
+            self._flushing += 1
+            self._cond.notify_all()
+            try:
+                return self._cond.wait_for(
+                    lambda: not self._pending and not self._busy, timeout=timeout)
+            finally:
+                self._flushing -= 1
+
+    def close(self, timeout: Optional[float] = None) -> bool:
+        """
+        Finish pending backups and stop the worker thread.
+
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely)
+
+        Returns:
+            True if all backups finished
+        """
+        done = self.flush(timeout=timeout)
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+        return done
+
+    def __enter__(self) -> "BackgroundBackupWorker":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._pending or self._closed)
+                if not self._pending:
+                    return
+                if self._coalesce_seconds > 0 and not self._flushing and not self._closed:
+                    # Let a burst of requests collapse into one backup
+                    self._cond.wait_for(
+                        lambda: self._flushing or self._closed, timeout=self._coalesce_seconds)
+                target_path = next(iter(self._pending))
+                is_directory = self._pending.pop(target_path)
+                self._busy = True
+            try:
+                self._backup(target_path, is_directory)
+            finally:
+                with self._cond:
+                    self._busy = False
+                    self._cond.notify_all()
+
+    def _backup(self, target_path: Path, is_directory: bool) -> None:
+        if not target_path.exists():
+            logger.debug(f"Skipping backup - target path does not exist: {target_path}")
+            return
+        try:
+            _flush_study_storage(target_path, is_directory)
+            if self._backup_to_drive(target_path, is_directory=is_directory):
+                self.completed += 1
+                logger.debug(f"Background backup successful: {target_path.name}")
+            else:
+                self.failed += 1
+                logger.warning(f"Background backup failed: {target_path.name}")
+        except Exception as e:
+            # Log error but don't stop the worker
+            self.failed += 1
+            logger.warning(f"Background backup error for {target_path.name}: {e}")
+
+
 def create_incremental_backup_callback(
     target_path: Path,
     backup_to_drive: Callable[[Path, bool], bool],
     backup_enabled: bool = True,
     is_directory: bool = False,
+    backup_worker: Optional[BackgroundBackupWorker] = None,
 ) -> Callable[[Any, Any], None]:
     """
     Create reusable Optuna callback for incremental backup of files or directories.
@@ -142,6 +294,9 @@ def create_incremental_backup_callback(
         backup_to_drive: Function to backup files to Drive (takes Path and bool)
         backup_enabled: Whether backup is enabled (if False, callback does nothing)
         is_directory: Whether target_path is a directory (False for files)
+        backup_worker: If given, the backup is handed to this worker and the
+            callback returns immediately (call ``backup_worker.close()`` after
+            ``study.optimize``)
 
     Returns:
         Optuna callback function that can be passed to study.optimize()
@@ -167,8 +322,13 @@ def create_incremental_backup_callback(
                 )
             return
 
+        if backup_worker is not None:
+            backup_worker.submit(target_path, is_directory=is_directory)
+            return
+
         # Perform backup
         try:
+            _flush_study_storage(target_path, is_directory)
             result = backup_to_drive(target_path, is_directory=is_directory)
             if result:
                 logger.debug(
@@ -281,11 +441,14 @@ def backup_hpo_study_to_drive(
             logger.warning(
                 "No trial_meta.json files found in Drive study folder")
     else:
-        # Local - backup study.db and study folder
-        storage_path = study_folder / "study.db"
-        
+        # Local - backup study.db (or study.journal) and study folder
+        from training.hpo.checkpoint.storage import checkpoint_sqlite_wal, find_study_storage
+
+        storage_path = find_study_storage(study_folder)
+
         # Backup study.db
-        if storage_path.exists():
+        if storage_path is not None:
+            checkpoint_sqlite_wal(storage_path)
             result = backup_to_drive(storage_path, is_directory=False)
             if result:
                 logger.info(
@@ -294,7 +457,7 @@ def backup_hpo_study_to_drive(
                 logger.warning(
                     f"Failed to backup HPO checkpoint database: {storage_path.name}")
         else:
-            logger.warning(f"study.db not found: {storage_path}")
+            logger.warning(f"study.db not found in {study_folder}")
 
         # Backup entire study folder (includes study.db + all trials + trial_meta.json)
         result = backup_to_drive(study_folder, is_directory=True)
@@ -11,6 +11,12 @@ from .drive import (
     mount_colab_drive,
     create_colab_store,
 )
+from .sync import (
+    SyncStats,
+    snapshot_sqlite_database,
+    sync_directory,
+    sync_file,
+)
 
 __all__ = [
     "BackupAction",
@@ -19,6 +25,10 @@ __all__ = [
     "DriveBackupStore",
     "mount_colab_drive",
     "create_colab_store",
+    "SyncStats",
+    "snapshot_sqlite_database",
+    "sync_directory",
+    "sync_file",
 ]
 
 
@@ -38,6 +38,8 @@ from typing import Callable, Literal, Optional
 
 from common.shared.platform_detection import is_drive_path
 
+from .sync import sync_directory, sync_file
+
 
 class BackupAction(str, Enum):
     """Action taken during backup/restore operation."""
@@ -91,6 +93,7 @@ class DriveBackupStore:
     backup_root: Path
     only_outputs: bool = True  # Enforce outputs/ restriction
     dry_run: bool = False  # For testing
+    checksum: bool = False  # Compare file hashes instead of size/mtime
 
     def __post_init__(self) -> None:
         """Validate configuration."""
@@ -210,12 +213,14 @@ class DriveBackupStore:
         try:
             drive_path.parent.mkdir(parents=True, exist_ok=True)
 
-            if is_dir:
-                if drive_path.exists():
-                    shutil.rmtree(drive_path)
-                shutil.copytree(local_path, drive_path)
-            else:
-                shutil.copy2(local_path, drive_path)
+            if not self._sync(local_path, drive_path, is_dir, checksum=self.checksum):
+                return BackupResult(
+                    ok=True,
+                    action=BackupAction.SKIPPED,
+                    src=local_path,
+                    dst=drive_path,
+                    reason="Backup is up to date",
+                )
 
             return BackupResult(
                 ok=True,
@@ -295,12 +300,15 @@ class DriveBackupStore:
         try:
             local_path.parent.mkdir(parents=True, exist_ok=True)
 
-            if is_dir:
-                if local_path.exists():
-                    shutil.rmtree(local_path)
-                shutil.copytree(drive_path, local_path)
-            else:
-                shutil.copy2(drive_path, local_path)
+            # A restored file must match the backup even if size and mtime agree
+            if not self._sync(drive_path, local_path, is_dir, checksum=not is_dir or self.checksum):
+                return BackupResult(
+                    ok=True,
+                    action=BackupAction.SKIPPED,
+                    src=drive_path,
+                    dst=local_path,
+                    reason="Local copy is up to date",
+                )
 
             return BackupResult(
                 ok=True,
@@ -319,6 +327,27 @@ class DriveBackupStore:
                 error=e,
             )
 
+    def _sync(self, src: Path, dst: Path, is_dir: bool, checksum: bool) -> bool:
+        """
+        Copy changed files from src to dst (see ``infrastructure.storage.sync``).
+
+        Args:
+            src: Source file or directory
+            dst: Destination file or directory
+            is_dir: Whether src is a directory
+            checksum: Compare file hashes instead of size/mtime
+
+        Returns:
+            True if dst was modified, False if it was already up to date
+        """
+        if is_dir:
+            if dst.is_file():
+                dst.unlink()
+            return sync_directory(src, dst, checksum=checksum).changed
+        if dst.is_dir():
+            shutil.rmtree(dst)
+        return sync_file(src, dst, checksum=checksum)
+
     def ensure_local(
         self, local_path: Path, options: Optional[EnsureLocalOptions] = None
     ) -> BackupResult:
@@ -4,6 +4,7 @@ This module provides centralized utilities for MLflow operations including:
 - Azure ML compatibility patches
 - Safe artifact uploads with retry logic
 - Run lifecycle management (creation, termination)
+- Batched metric, param and tag logging
 - URL generation
 
 The Azure ML compatibility patch is automatically applied when this module is imported.
@@ -32,6 +33,13 @@ from .lifecycle import (
     terminate_run_with_tags,
 )
 
+# Export batched tracking writer
+from .batch_writer import (
+    BatchedTrackingWriter,
+    flush_tracking_writer,
+    get_tracking_writer,
+)
+
 # Export run creation utilities
 from .runs import (
     create_child_run,
@@ -65,6 +73,10 @@ __all__ = [
     "terminate_run_safe",
     "ensure_run_terminated",
     "terminate_run_with_tags",
+    # Batched logging
+    "BatchedTrackingWriter",
+    "flush_tracking_writer",
+    "get_tracking_writer",
     # Runs
     "create_child_run",
     "create_run_safe",
@@ -34,6 +34,7 @@ import json
 import shutil
 
 import mlflow
+from common.shared.archive_utils import detect_archive_format, strip_archive_suffix
 from common.shared.logging_utils import get_logger
 
 from infrastructure.tracking.mlflow.utils import retry_with_backoff
@@ -245,9 +246,11 @@ def upload_checkpoint_archive(
             # To work around this, we use a different filename for the artifact path.
             # The local file is still named manifest.json for consistency.
             if artifact_path:
-                if artifact_path.endswith('.tar.gz') or artifact_path.endswith('.gz'):
+                if detect_archive_format(artifact_path) or artifact_path.endswith('.gz'):
                     # Archive path provided, use same base with _manifest.json
-                    base = artifact_path.rsplit('.', 2)[0]  # Remove .tar.gz
+                    base = strip_archive_suffix(artifact_path)
+                    if base == artifact_path:
+                        base = artifact_path.rsplit('.', 2)[0]  # Remove .gz
                     manifest_filename = f"{base}_manifest.json"
                     manifest_artifact_filename = manifest_filename  # Use same name
                     manifest_artifact_path = None  # Upload to root
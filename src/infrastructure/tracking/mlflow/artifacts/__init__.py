@@ -7,8 +7,10 @@ This module provides a unified interface for artifact management functions.
 
 # Re-export checkpoint archive functions from manager
 from infrastructure.tracking.mlflow.artifacts.manager import (
+    collect_checkpoint_files,
     create_checkpoint_archive,
     should_skip_file,
+    write_checkpoint_archive,
 )
 
 # Import new unified uploader and stage helpers
@@ -61,6 +63,8 @@ else:
 
 __all__ = [
     "create_checkpoint_archive",
+    "write_checkpoint_archive",
+    "collect_checkpoint_files",
     "should_skip_file",
     "log_artifact_safe",
     "log_artifacts_safe",
@@ -27,13 +27,22 @@ lifecycle:
 """
 
 """Artifact upload and checkpoint archive management."""
+import hashlib
+import io
+import json
 import os
 import tarfile
 import tempfile
 import time
 from pathlib import Path
-from typing import Any, Dict, Optional
-
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple
+
+from common.shared.archive_utils import (
+    ARCHIVE_MANIFEST_NAME,
+    DEFAULT_ARCHIVE_FORMAT,
+    archive_suffix,
+    open_archive_writer,
+)
 from common.shared.logging_utils import get_logger
 
 logger = get_logger(__name__)
@@ -74,89 +83,170 @@ def should_skip_file(file_path: Path, relative_path: str) -> bool:
 
     return False
 
-def create_checkpoint_archive(
+class _HashingReader:
+    """File reader that hashes the bytes read through it."""
+
+    def __init__(self, fileobj: BinaryIO):
+        self._fileobj = fileobj
+        self.digest = hashlib.sha256()
+
+    def read(self, size: int = -1) -> bytes:
+        data = self._fileobj.read(size)
+        self.digest.update(data)
+        return data
+
+
+def collect_checkpoint_files(checkpoint_dir: Path) -> List[Tuple[Path, str]]:
+    """
+    List the files of a checkpoint directory that go into its archive.
+
+    Args:
+        checkpoint_dir: Path to checkpoint directory.
+
+    Returns:
+        Sorted (absolute path, relative POSIX path) pairs.
+    """
+    checkpoint_dir = checkpoint_dir.resolve()
+    selected = []
+    for root, dirs, files in os.walk(checkpoint_dir):
+        # Filter out directories to skip
+        dirs[:] = [d for d in dirs if not any(pattern in d for pattern in [
+                                              '.tmp', '.cache', '__pycache__'])]
+
+        for file in files:
+            file_path = Path(root) / file
+            # Only symlinks can point outside checkpoint_dir, so only they are resolved
+            if file_path.is_symlink():
+                file_path = file_path.resolve()
+                try:
+                    file_path.relative_to(checkpoint_dir)
+                except ValueError:
+                    continue
+                if not file_path.is_file():
+                    continue
+            relative_path = (Path(root) / file).relative_to(checkpoint_dir).as_posix()
+            if should_skip_file(file_path, relative_path):
+                continue
+            selected.append((file_path, relative_path))
+    return sorted(selected, key=lambda item: item[1])
+
+
+def write_checkpoint_archive(
     checkpoint_dir: Path,
+    fileobj: BinaryIO,
     trial_number: int,
-    output_path: Optional[Path] = None
-) -> tuple[Path, Dict[str, Any]]:
+    archive_format: str = DEFAULT_ARCHIVE_FORMAT,
+    compression_level: Optional[int] = None,
+    threads: Optional[int] = None,
+) -> Dict[str, Any]:
     """
-    Create compressed archive from checkpoint directory.
+    Stream a checkpoint archive into a binary file object.
+
+    Each file is read once: it is hashed while it is added to the archive.
+    The manifest (with per-file SHA-256) is also added as the archive's last
+    member, so extraction can verify the files.
 
     Args:
         checkpoint_dir: Path to checkpoint directory.
+        fileobj: Writable binary file object (file, pipe, upload stream).
         trial_number: Trial number for manifest.
-        output_path: Optional output path for archive. If None, uses temp file.
+        archive_format: "tar", "tar.gz" or "tar.zst".
+        compression_level: Compression level (format default if None).
+        threads: Compression threads (default: CPU count, at most 8).
 
     Returns:
-        Tuple of (archive_path, manifest_dict).
+        Manifest dictionary.
     """
-    if output_path is None:
-        # Create temp file
-        temp_fd, temp_path = tempfile.mkstemp(
-            suffix='.tar.gz', prefix='checkpoint_')
-        output_path = Path(temp_path)
-        # Close the file descriptor, we'll open it with tarfile
-        os.close(temp_fd)
-
     manifest = {
         "trial_number": trial_number,
-        "archive_format": "tar.gz",
+        "archive_format": archive_format,
         "extracted_path": "best_trial_checkpoint",
         "files": [],
         "total_size": 0,
         "created_at": time.strftime("%Y-%m-%d %H:%M:%S")
     }
 
-    checkpoint_dir = checkpoint_dir.resolve()
-    files_added = 0
-
-    with tarfile.open(output_path, 'w:gz') as tar:
-        for root, dirs, files in os.walk(checkpoint_dir):
-            # Filter out directories to skip
-            dirs[:] = [d for d in dirs if not any(pattern in d for pattern in [
-                                                  '.tmp', '.cache', '__pycache__'])]
-
-            for file in files:
-                file_path = Path(root) / file
+    writer = open_archive_writer(
+        fileobj, archive_format, compression_level=compression_level, threads=threads)
+    try:
+        with tarfile.open(fileobj=writer, mode="w|") as tar:
+            for file_path, relative_path in collect_checkpoint_files(checkpoint_dir):
                 try:
-                    file_path = file_path.resolve()
-
-                    if not file_path.exists():
-                        continue
-
-                    # Get relative path for archive
-                    try:
-                        relative_path = file_path.relative_to(checkpoint_dir)
-                    except ValueError:
-                        # File is outside checkpoint_dir, skip
-                        continue
-
-                    # Check if should skip
-                    if should_skip_file(file_path, str(relative_path)):
-                        continue
-
-                    # Add to archive
-                    arcname = f"best_trial_checkpoint/{relative_path}"
-                    tar.add(file_path, arcname=arcname, recursive=False)
-
-                    # Update manifest
-                    file_size = file_path.stat().st_size
-                    manifest["files"].append({
-                        "path": str(relative_path),
-                        "size": file_size
-                    })
-                    manifest["total_size"] += file_size
-                    files_added += 1
-
-                except Exception as e:
+                    tarinfo = tar.gettarinfo(
+                        str(file_path), arcname=f"best_trial_checkpoint/{relative_path}")
+                    f = open(file_path, "rb")
+                except OSError as e:
                     logger.warning(f"Error adding {file_path} to archive: {e}")
                     continue
+                # Errors past this point leave a partial member, so they are raised
+                with f:
+                    reader = _HashingReader(f)
+                    tar.addfile(tarinfo, fileobj=reader)
+
+                manifest["files"].append({
+                    "path": relative_path,
+                    "size": tarinfo.size,
+                    "sha256": reader.digest.hexdigest(),
+                })
+                manifest["total_size"] += tarinfo.size
+
+            manifest["file_count"] = len(manifest["files"])
+            manifest_bytes = json.dumps(manifest, indent=2).encode("utf-8")
+            manifest_info = tarfile.TarInfo(ARCHIVE_MANIFEST_NAME)
+            manifest_info.size = len(manifest_bytes)
+            manifest_info.mtime = int(time.time())
+            tar.addfile(manifest_info, fileobj=io.BytesIO(manifest_bytes))
+    finally:
+        writer.close()
+
+    return manifest
+
+
+def create_checkpoint_archive(
+    checkpoint_dir: Path,
+    trial_number: int,
+    output_path: Optional[Path] = None,
+    archive_format: str = DEFAULT_ARCHIVE_FORMAT,
+    compression_level: Optional[int] = None,
+    threads: Optional[int] = None,
+) -> tuple[Path, Dict[str, Any]]:
+    """
+    Create archive from checkpoint directory.
+
+    Args:
+        checkpoint_dir: Path to checkpoint directory.
+        trial_number: Trial number for manifest.
+        output_path: Optional output path for archive. If None, uses temp file.
+        archive_format: "tar" (no compression, fastest for model weights),
+            "tar.gz" (parallel gzip) or "tar.zst" (needs zstandard).
+        compression_level: Compression level (format default if None).
+        threads: Compression threads (default: CPU count, at most 8).
+
+    Returns:
+        Tuple of (archive_path, manifest_dict).
+    """
+    if output_path is None:
+        # Create temp file
+        temp_fd, temp_path = tempfile.mkstemp(
+            suffix=archive_suffix(archive_format), prefix='checkpoint_')
+        output_path = Path(temp_path)
+        os.close(temp_fd)
+
+    start = time.perf_counter()
+    with open(output_path, "wb") as f:
+        manifest = write_checkpoint_archive(
+            checkpoint_dir,
+            f,
+            trial_number=trial_number,
+            archive_format=archive_format,
+            compression_level=compression_level,
+            threads=threads,
+        )
 
-    manifest["file_count"] = files_added
     logger.info(
         f"Created checkpoint archive: {output_path} "
-        f"({files_added} files, {manifest['total_size'] / 1024 / 1024:.1f}MB)"
+        f"({manifest['file_count']} files, {manifest['total_size'] / 1024 / 1024:.1f}MB, "
+        f"{archive_format}, {time.perf_counter() - start:.1f}s)"
     )
 
     return output_path, manifest
-
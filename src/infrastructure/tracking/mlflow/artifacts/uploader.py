@@ -53,7 +53,8 @@ if _artifacts_file_path.exists():
         raise ImportError("Could not load artifacts.py module")
 else:
     raise ImportError(f"artifacts.py not found at {_artifacts_file_path}")
-from infrastructure.naming.mlflow.config import get_tracking_config
+from common.shared.archive_utils import archive_suffix, strip_archive_suffix
+from infrastructure.naming.mlflow.config import get_checkpoint_archive_config, get_tracking_config
 from infrastructure.tracking.mlflow.utils import get_mlflow_run_id
 from infrastructure.tracking.mlflow.artifacts.manager import create_checkpoint_archive
 
@@ -117,6 +118,19 @@ class ArtifactUploader:
                 self._tracking_config = {"enabled": True}
         return self._tracking_config
     
+    def _get_archive_config(self) -> Dict[str, Any]:
+        """
+        Get checkpoint archive config (format, compression level, threads).
+        
+        Returns:
+            Checkpoint archive config with defaults applied.
+        """
+        try:
+            return get_checkpoint_archive_config(config_dir=self._config_dir)
+        except Exception as e:
+            logger.debug(f"[ArtifactUploader] Could not load checkpoint archive config: {e}")
+            return get_checkpoint_archive_config(config={})
+    
     def get_tracking_config(self) -> Dict[str, Any]:
         """
         Get tracking config for the current stage.
@@ -149,24 +163,27 @@ class ArtifactUploader:
         artifact_path: str = "checkpoint.tar.gz",
         trial_number: Optional[int] = None,
         skip_if_disabled: bool = True,
+        archive_format: Optional[str] = None,
     ) -> bool:
         """
-        Upload a checkpoint directory to MLflow as a compressed archive.
+        Upload a checkpoint directory to MLflow as an archive.
         
-        This method automatically creates a tar.gz archive from the checkpoint directory,
+        This method automatically creates an archive from the checkpoint directory,
         includes manifest metadata, and uploads it as a single file. This provides:
-        - Compression benefits (smaller upload size)
         - Single file upload (faster, more reliable)
-        - Automatic manifest generation with file count, sizes, and trial number
+        - Parallel compression (or none, see tracking.checkpoint_archive in mlflow.yaml)
+        - Automatic manifest generation with file count, sizes, SHA-256 and trial number
         
         Args:
             checkpoint_dir: Path to checkpoint directory.
             artifact_path: Artifact path within run's artifact directory.
-                          Defaults to "checkpoint.tar.gz". If not ending in .tar.gz,
-                          the extension will be automatically appended.
+                          Defaults to "checkpoint.tar.gz". The archive suffix is
+                          replaced by (or extended with) the suffix of the format.
             trial_number: Optional trial number for manifest metadata (default: 0).
                          Used primarily for HPO checkpoints.
             skip_if_disabled: If True, skip upload when tracking is disabled.
+            archive_format: "tar", "tar.gz" or "tar.zst". If None, uses
+                           tracking.checkpoint_archive.format from mlflow.yaml.
         
         Returns:
             True if upload succeeded, False otherwise.
@@ -193,9 +210,11 @@ class ArtifactUploader:
             logger.warning(f"Checkpoint directory does not exist: {checkpoint_dir}")
             return False
         
-        # Auto-append .tar.gz if not present
-        if not artifact_path.endswith('.tar.gz'):
-            artifact_path = f"{artifact_path}.tar.gz"
+        archive_config = self._get_archive_config()
+        archive_format = archive_format or archive_config["format"]
+        
+        # Use the suffix of the archive format
+        artifact_path = f"{strip_archive_suffix(artifact_path)}{archive_suffix(archive_format)}"
         
         # Use trial_number=0 as default if not provided
         trial_number = trial_number if trial_number is not None else 0
@@ -207,6 +226,9 @@ class ArtifactUploader:
             archive_path, manifest = create_checkpoint_archive(
                 checkpoint_dir=checkpoint_dir,
                 trial_number=trial_number,
+                archive_format=archive_format,
+                compression_level=archive_config["compression_level"],
+                threads=archive_config["threads"],
             )
             
             # Upload archive using upload_checkpoint_archive
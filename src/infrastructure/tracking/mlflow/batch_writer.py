@@ -0,0 +1,373 @@
+from __future__ import annotations
+
+"""
+@meta
+name: tracking_mlflow_batch_writer
+type: utility
+domain: tracking
+responsibility:
+  - Buffer MLflow metrics, params and tags per run
+  - Send them as log_batch calls from a background thread with retries
+  - Flush pending data on run end and process exit
+inputs:
+  - Metrics, params and tags with run IDs
+outputs:
+  - MLflow log_batch calls
+tags:
+  - utility
+  - tracking
+  - mlflow
+  - batching
+ci:
+  runnable: false
+  needs_gpu: false
+  needs_cloud: false
+lifecycle:
+  status: active
+"""
+
+"""Buffered MLflow tracking writer.
+
+Every ``mlflow.log_metric``/``log_param``/``set_tag`` call is a separate
+request to the tracking server, which is slow against AzureML-backed MLflow.
+``BatchedTrackingWriter`` collects them per run and sends them with
+``MlflowClient.log_batch`` (chunked to MLflow's batch limits) from a
+background thread, retrying transient errors with ``retry_with_backoff``.
+
+Pending data is sent every ``flush_interval`` seconds, by ``flush()`` (call it
+before a run ends or its data is read back) and when the process exits; data
+logged after ``close()`` is sent right away. If a batch is rejected (e.g. a
+param logged again with a different value), its metrics and tags are resent
+without the params and each param on its own, so one bad param loses nothing
+else. Tracking failures are logged, never raised.
+"""
+
+import atexit
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Tuple
+
+import mlflow
+from common.shared.logging_utils import get_logger
+
+from infrastructure.tracking.mlflow.utils import retry_with_backoff
+
+logger = get_logger(__name__)
+
+# MLflow log_batch limits
+MAX_METRICS_PER_BATCH = 1000
+MAX_PARAMS_PER_BATCH = 100
+MAX_TAGS_PER_BATCH = 100
+MAX_ENTITIES_PER_BATCH = 1000
+
+DEFAULT_FLUSH_INTERVAL = 2.0
+
+
+@dataclass
+class _RunBuffer:
+    """Data waiting to be sent to one run."""
+
+    metrics: List[Tuple[str, float, int, int]] = field(default_factory=list)
+    params: Dict[str, str] = field(default_factory=dict)
+    tags: Dict[str, str] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return len(self.metrics) + len(self.params) + len(self.tags)
+
+
+def _chunk_batches(buffer: _RunBuffer) -> List[Tuple[list, list, list]]:
+    """Split a run's data into (metrics, params, tags) chunks within MLflow's limits."""
+    metrics = list(buffer.metrics)
+    params = list(buffer.params.items())
+    tags = list(buffer.tags.items())
+    chunks = []
+    while metrics or params or tags:
+        chunk_params, params = params[:MAX_PARAMS_PER_BATCH], params[MAX_PARAMS_PER_BATCH:]
+        chunk_tags, tags = tags[:MAX_TAGS_PER_BATCH], tags[MAX_TAGS_PER_BATCH:]
+        room = min(MAX_METRICS_PER_BATCH,
+                   MAX_ENTITIES_PER_BATCH - len(chunk_params) - len(chunk_tags))
+        chunk_metrics, metrics = metrics[:room], metrics[room:]
+        chunks.append((chunk_metrics, chunk_params, chunk_tags))
+    return chunks
+
+
+class BatchedTrackingWriter:
+    """
+    Collects MLflow metrics, params and tags and sends them with ``log_batch``.
+
+    Data is buffered per (tracking URI, run ID), so runs of different
+    tracking servers can share one writer. Params keep the last value logged
+    for a key, as do tags; metrics keep every value.
+    """
+
+    def __init__(
+        self,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        max_retries: int = 5,
+        base_delay: float = 1.0,
+    ):
+        """
+        Initialize the writer (the background thread starts on first use).
+
+        Args:
+            flush_interval: Seconds between background sends.
+            max_retries: Attempts per ``log_batch`` call for retryable errors.
+            base_delay: Base delay in seconds for exponential backoff.
+        """
+        self.flush_interval = flush_interval
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.sent_batches = 0
+        self.failed_batches = 0
+        self._pending: Dict[Tuple[str, str], _RunBuffer] = {}
+        self._clients: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+        # Held while sending, so batches of a run reach the server in order
+        self._send_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+
+    def log_metric(
+        self,
+        key: str,
+        value: float,
+        step: int = 0,
+        run_id: Optional[str] = None,
+        timestamp: Optional[int] = None,
+    ) -> None:
+        """Queue a metric (``run_id`` defaults to the active run)."""
+        self.log_metrics({key: value}, step=step, run_id=run_id, timestamp=timestamp)
+
+    def log_metrics(
+        self,
+        metrics: Mapping[str, float],
+        step: int = 0,
+        run_id: Optional[str] = None,
+        timestamp: Optional[int] = None,
+    ) -> None:
+        """
+        Queue metrics for a run.
+
+        Args:
+            metrics: Metric names and values.
+            step: Metric step.
+            run_id: Run ID (default: the active run).
+            timestamp: Milliseconds since the epoch (default: now).
+        """
+        timestamp = timestamp if timestamp is not None else int(time.time() * 1000)
+        entries = [(key, float(value), timestamp, int(step)) for key, value in metrics.items()]
+        with self._buffer(run_id) as buffer:
+            buffer.metrics.extend(entries)
+
+    def log_param(self, key: str, value: Any, run_id: Optional[str] = None) -> None:
+        """Queue a param (``run_id`` defaults to the active run)."""
+        self.log_params({key: value}, run_id=run_id)
+
+    def log_params(self, params: Mapping[str, Any], run_id: Optional[str] = None) -> None:
+        """
+        Queue params for a run (values are converted to strings, like ``mlflow.log_param``).
+
+        Args:
+            params: Param names and values.
+            run_id: Run ID (default: the active run).
+        """
+        with self._buffer(run_id) as buffer:
+            buffer.params.update((key, str(value)) for key, value in params.items())
+
+    def set_tag(self, key: str, value: Any, run_id: Optional[str] = None) -> None:
+        """Queue a tag (``run_id`` defaults to the active run)."""
+        self.set_tags({key: value}, run_id=run_id)
+
+    def set_tags(self, tags: Mapping[str, Any], run_id: Optional[str] = None) -> None:
+        """
+        Queue tags for a run.
+
+        Args:
+            tags: Tag names and values.
+            run_id: Run ID (default: the active run).
+        """
+        with self._buffer(run_id) as buffer:
+            buffer.tags.update((key, str(value)) for key, value in tags.items())
+
+    @contextmanager
+    def _buffer(self, run_id: Optional[str]) -> Iterator[_RunBuffer]:
+        """Buffer of a run, held under the writer lock (sent at once after close)."""
+        if run_id is None:
+            active_run = mlflow.active_run()
+            if active_run is None:
+                raise RuntimeError("No active MLflow run and no run_id given")
+            run_id = active_run.info.run_id
+        key = (mlflow.get_tracking_uri(), run_id)
+        if self._closed:
+            # No background thread any more (e.g. logged from a later atexit hook)
+            buffer = _RunBuffer()
+            yield buffer
+            with self._send_lock:
+                self._send({key: buffer})
+            return
+        self._ensure_thread()
+        with self._lock:
+            yield self._pending.setdefault(key, _RunBuffer())
+
+    def _ensure_thread(self) -> None:
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="mlflow-batch-writer", daemon=True)
+                self._thread.start()
+
+    def _run(self) -> None:
+        while not self._closed:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            self._send_pending()
+
+    def _take(self, run_id: Optional[str]) -> Dict[Tuple[str, str], _RunBuffer]:
+        with self._lock:
+            if run_id is None:
+                taken, self._pending = self._pending, {}
+            else:
+                taken = {key: self._pending.pop(key)
+                         for key in [key for key in self._pending if key[1] == run_id]}
+        return taken
+
+    def _client(self, tracking_uri: str) -> Any:
+        if tracking_uri not in self._clients:
+            from infrastructure.tracking.mlflow.client import create_mlflow_client
+            self._clients[tracking_uri] = create_mlflow_client(tracking_uri=tracking_uri)
+        return self._clients[tracking_uri]
+
+    def _send_pending(self, run_id: Optional[str] = None) -> bool:
+        """Send queued data (of one run, or all runs); True if nothing failed."""
+        with self._send_lock:
+            return self._send(self._take(run_id))
+
+    def _send(self, buffers: Dict[Tuple[str, str], _RunBuffer]) -> bool:
+        """Send buffers chunk by chunk (caller holds the send lock); True if nothing failed."""
+        ok = True
+        for (tracking_uri, run_id), buffer in buffers.items():
+            for metrics, params, tags in _chunk_batches(buffer):
+                try:
+                    client = self._client(tracking_uri)
+                    self._log_batch(client, run_id, metrics, params, tags)
+                except Exception as e:
+                    if not params:
+                        ok = False
+                        self._log_failure(run_id, metrics, params, tags, e)
+                        continue
+                    # Params are the usual culprit (a key logged again with a new value)
+                    logger.warning(
+                        f"log_batch for run {run_id[:12]}... failed ({e}); "
+                        f"resending {len(params)} params one at a time"
+                    )
+                    ok = self._send_split(client, run_id, metrics, params, tags) and ok
+        return ok
+
+    def _send_split(self, client: Any, run_id: str, metrics: list, params: list, tags: list) -> bool:
+        """Resend a rejected chunk as metrics and tags plus one batch per param."""
+        parts = [(metrics, [], tags)] if metrics or tags else []
+        parts.extend(([], [param], []) for param in params)
+        ok = True
+        for part_metrics, part_params, part_tags in parts:
+            try:
+                self._log_batch(client, run_id, part_metrics, part_params, part_tags)
+            except Exception as e:
+                ok = False
+                self._log_failure(run_id, part_metrics, part_params, part_tags, e)
+        return ok
+
+    def _log_batch(self, client: Any, run_id: str, metrics: list, params: list, tags: list) -> None:
+        """One ``log_batch`` call, retried on transient errors."""
+        from mlflow.entities import Metric, Param, RunTag
+
+        retry_with_backoff(
+            lambda: client.log_batch(
+                run_id,
+                metrics=[Metric(k, v, ts, step) for k, v, ts, step in metrics],
+                params=[Param(k, v) for k, v in params],
+                tags=[RunTag(k, v) for k, v in tags],
+            ),
+            max_retries=self.max_retries,
+            base_delay=self.base_delay,
+            operation_name=f"log_batch for run {run_id[:12]}",
+        )
+        self.sent_batches += 1
+
+    def _log_failure(
+        self, run_id: str, metrics: list, params: list, tags: list, error: Exception
+    ) -> None:
+        self.failed_batches += 1
+        logger.warning(
+            f"Could not log {len(metrics)} metrics, {len(params)} params and "
+            f"{len(tags)} tags to run {run_id[:12]}...: {error}"
+        )
+
+    def flush(self, run_id: Optional[str] = None) -> bool:
+        """
+        Send queued data now and wait until it is sent.
+
+        Args:
+            run_id: Only flush this run (default: all runs).
+
+        Returns:
+            True if all data was sent, False if a batch failed.
+        """
+        return self._send_pending(run_id)
+
+    def pending_count(self, run_id: Optional[str] = None) -> int:
+        """Number of queued metrics, params and tags (of one run, or all runs)."""
+        with self._lock:
+            return sum(len(buffer) for key, buffer in self._pending.items()
+                       if run_id is None or key[1] == run_id)
+
+    def close(self) -> None:
+        """Stop the background thread and send everything still queued."""
+        if self._closed:
+            return
+        self._closed = True
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.flush_interval + 5.0)
+        self._send_pending()
+
+
+_writer: Optional[BatchedTrackingWriter] = None
+_writer_lock = threading.Lock()
+
+
+def get_tracking_writer() -> BatchedTrackingWriter:
+    """
+    Process-wide tracking writer, flushed when the process exits.
+
+    Returns:
+        Shared BatchedTrackingWriter instance.
+    """
+    global _writer
+    if _writer is None:
+        with _writer_lock:
+            if _writer is None:
+                _writer = BatchedTrackingWriter()
+                atexit.register(_writer.close)
+    return _writer
+
+
+def flush_tracking_writer(run_id: Optional[str] = None) -> bool:
+    """
+    Send data queued on the shared writer (no-op if it was never used).
+
+    Call this before a run is terminated or its metrics are read back.
+
+    Args:
+        run_id: Only flush this run (default: all runs).
+
+    Returns:
+        True if all data was sent, False if a batch failed.
+    """
+    if _writer is None:
+        return True
+    return _writer.flush(run_id)
@@ -64,6 +64,10 @@ def terminate_run_safe(
         from infrastructure.tracking.mlflow.client import create_mlflow_client
         client = create_mlflow_client()
 
+        # Send metrics, params and tags still queued for the run
+        from infrastructure.tracking.mlflow.batch_writer import flush_tracking_writer
+        flush_tracking_writer(run_id)
+
         # Check current status if requested
         if check_status:
             try:
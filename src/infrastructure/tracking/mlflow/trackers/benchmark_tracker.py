@@ -46,6 +46,10 @@ from infrastructure.naming.mlflow.tags import build_mlflow_tags
 from infrastructure.naming.mlflow.run_keys import build_mlflow_run_key, build_mlflow_run_key_hash
 from infrastructure.tracking.mlflow.index import update_mlflow_index
 from infrastructure.tracking.mlflow.utils import retry_with_backoff
+from infrastructure.tracking.mlflow.batch_writer import (
+    flush_tracking_writer,
+    get_tracking_writer,
+)
 # Lazy import to avoid pytest collection issues
 try:
     from infrastructure.tracking.mlflow import get_mlflow_run_url
@@ -473,7 +477,11 @@ class MLflowBenchmarkTracker(BaseTracker):
                     run_key_hash, run_id, experiment_id, tracking_uri, output_dir, config_dir
                 )
 
-                yield handle
+                try:
+                    yield handle
+                finally:
+                    # Queued metrics and params must reach the run before it ends
+                    flush_tracking_writer(run_id)
         except Exception as e:
             logger.warning(f"MLflow tracking failed: {e}")
             logger.warning("Continuing benchmarking without MLflow tracking...")
@@ -505,30 +513,30 @@ class MLflowBenchmarkTracker(BaseTracker):
         """
         try:
             # Log parameters
-            mlflow.log_param("benchmark_batch_sizes", str(batch_sizes))
-            mlflow.log_param("benchmark_iterations", iterations)
-            mlflow.log_param("benchmark_warmup_iterations", warmup_iterations)
-            mlflow.log_param("benchmark_max_length", max_length)
-            mlflow.log_param("benchmark_device", device or "auto")
+            writer = get_tracking_writer()
+            writer.log_params({
+                "benchmark_batch_sizes": str(batch_sizes),
+                "benchmark_iterations": iterations,
+                "benchmark_warmup_iterations": warmup_iterations,
+                "benchmark_max_length": max_length,
+                "benchmark_device": device or "auto",
+            })
 
             # Log per-batch-size metrics
             # Benchmark JSON format: {"batch_1": {...}, "batch_8": {...}, ...}
+            metrics = {}
             for batch_size in batch_sizes:
                 batch_key = f"batch_{batch_size}"
                 if batch_key in benchmark_data:
                     batch_results = benchmark_data[batch_key]
                     if "mean_ms" in batch_results:
-                        mlflow.log_metric(
-                            f"latency_batch_{batch_size}_ms", batch_results["mean_ms"])
+                        metrics[f"latency_batch_{batch_size}_ms"] = batch_results["mean_ms"]
                     if "median_ms" in batch_results:
-                        mlflow.log_metric(
-                            f"latency_batch_{batch_size}_p50_ms", batch_results["median_ms"])
+                        metrics[f"latency_batch_{batch_size}_p50_ms"] = batch_results["median_ms"]
                     if "p95_ms" in batch_results:
-                        mlflow.log_metric(
-                            f"latency_batch_{batch_size}_p95_ms", batch_results["p95_ms"])
+                        metrics[f"latency_batch_{batch_size}_p95_ms"] = batch_results["p95_ms"]
                     if "p99_ms" in batch_results:
-                        mlflow.log_metric(
-                            f"latency_batch_{batch_size}_p99_ms", batch_results["p99_ms"])
+                        metrics[f"latency_batch_{batch_size}_p99_ms"] = batch_results["p99_ms"]
                     # Note: std, min, max not currently in benchmark output, but structure supports them
 
             # Log throughput - calculate from batch results or use overall throughput
@@ -539,8 +547,8 @@ class MLflowBenchmarkTracker(BaseTracker):
                 if max_batch_key in benchmark_data:
                     batch_results = benchmark_data[max_batch_key]
                     if "throughput_docs_per_sec" in batch_results:
-                        mlflow.log_metric(
-                            "throughput_samples_per_sec", batch_results["throughput_docs_per_sec"])
+                        metrics["throughput_samples_per_sec"] = batch_results["throughput_docs_per_sec"]
+            writer.log_metrics(metrics)
 
             # Log artifact using unified uploader (works for both Azure ML and non-Azure ML backends)
             from infrastructure.paths.utils import infer_config_dir
@@ -46,6 +46,10 @@ from infrastructure.naming.mlflow.tags import build_mlflow_tags
 from infrastructure.naming.mlflow.run_keys import build_mlflow_run_key, build_mlflow_run_key_hash
 from infrastructure.tracking.mlflow.index import update_mlflow_index
 from infrastructure.tracking.mlflow.utils import retry_with_backoff
+from infrastructure.tracking.mlflow.batch_writer import (
+    flush_tracking_writer,
+    get_tracking_writer,
+)
 # Lazy import to avoid pytest collection issues
 try:
     from infrastructure.tracking.mlflow import get_mlflow_run_url
@@ -146,7 +150,11 @@ class MLflowConversionTracker(BaseTracker):
                     except Exception as e:
                         logger.debug(f"Could not update MLflow index: {e}")
 
-                yield handle
+                try:
+                    yield handle
+                finally:
+                    # Queued metrics and params must reach the run before it ends
+                    flush_tracking_writer(run_id)
         except Exception as e:
             logger.warning(f"MLflow tracking failed: {e}")
             logger.warning("Continuing conversion without MLflow tracking...")
@@ -163,11 +171,13 @@ class MLflowConversionTracker(BaseTracker):
         backbone: str,
     ) -> None:
         try:
-            mlflow.log_param("conversion_source", checkpoint_path)
-            mlflow.log_param("conversion_target", conversion_target)
-            mlflow.log_param("quantization", quantization)
-            mlflow.log_param("onnx_opset_version", opset_version)
-            mlflow.log_param("conversion_backbone", backbone)
+            get_tracking_writer().log_params({
+                "conversion_source": checkpoint_path,
+                "conversion_target": conversion_target,
+                "quantization": quantization,
+                "onnx_opset_version": opset_version,
+                "conversion_backbone": backbone,
+            })
         except Exception as e:
             logger.warning(
                 f"Could not log conversion parameters to MLflow: {e}"
@@ -182,28 +192,22 @@ class MLflowConversionTracker(BaseTracker):
         conversion_log_path: Optional[Path] = None,
     ) -> None:
         try:
-            mlflow.log_metric(
-                "conversion_success",
-                1 if conversion_success else 0,
-            )
+            metrics = {"conversion_success": 1 if conversion_success else 0}
 
             if onnx_model_path and onnx_model_path.exists():
                 model_size_mb = onnx_model_path.stat().st_size / (1024 * 1024)
-                mlflow.log_metric("onnx_model_size_mb", model_size_mb)
+                metrics["onnx_model_size_mb"] = model_size_mb
 
                 if original_checkpoint_size:
                     compression_ratio = (
                         original_checkpoint_size / model_size_mb
                     )
-                    mlflow.log_metric(
-                        "compression_ratio", compression_ratio
-                    )
+                    metrics["compression_ratio"] = compression_ratio
 
             if smoke_test_passed is not None:
-                mlflow.log_metric(
-                    "smoke_test_passed",
-                    1 if smoke_test_passed else 0,
-                )
+                metrics["smoke_test_passed"] = 1 if smoke_test_passed else 0
+
+            get_tracking_writer().log_metrics(metrics)
 
             # Infer config_dir to check tracking config
             # Try onnx_model_path first, then conversion_log_path, then fallback to current working directory
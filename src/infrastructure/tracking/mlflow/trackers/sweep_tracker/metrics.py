@@ -3,10 +3,9 @@
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-import mlflow
-
 from common.shared.logging_utils import get_logger
 from infrastructure.paths.utils import infer_config_dir
+from infrastructure.tracking.mlflow.batch_writer import get_tracking_writer
 
 logger = get_logger(__name__)
 
@@ -37,35 +36,30 @@ def log_sweep_metadata(
     azureml_run_type = get_azureml_run_type(config_dir)
     mlflow_run_type = get_mlflow_run_type(config_dir)
     azureml_sweep = get_azureml_sweep(config_dir)
-    mlflow.set_tag(azureml_run_type, "sweep")
-    mlflow.set_tag(mlflow_run_type, "sweep")
-    mlflow.set_tag(azureml_sweep, "true")
-
-    # Log primary metric and goal for Azure ML UI to identify best trial
-    mlflow.log_param("primary_metric", objective_metric)
-    mlflow.log_param("objective_goal", goal)
-
-    # Log HPO parameters
-    mlflow.log_param("backbone", backbone)
-    mlflow.log_param("max_trials", max_trials)
-    mlflow.log_param("study_name", study_name)
-    mlflow.log_param("objective_metric", objective_metric)
-    mlflow.log_param("checkpoint_enabled",
-                     checkpoint_config.get("enabled", False) if checkpoint_config else False)
-
-    # Log checkpoint path (even if disabled, log None)
-    if storage_path is not None:
-        mlflow.log_param("checkpoint_path", str(storage_path.resolve()))
-    else:
-        mlflow.log_param("checkpoint_path", None)
-
-    # Log checkpoint storage type
-    mlflow.log_param(
-        "checkpoint_storage_type", "sqlite" if storage_path else None
-    )
-
-    # Log resume status
-    mlflow.log_param("resumed_from_checkpoint", should_resume)
+    writer = get_tracking_writer()
+    writer.set_tags({
+        azureml_run_type: "sweep",
+        mlflow_run_type: "sweep",
+        azureml_sweep: "true",
+    })
+
+    writer.log_params({
+        # Primary metric and goal for Azure ML UI to identify best trial
+        "primary_metric": objective_metric,
+        "objective_goal": goal,
+        # HPO parameters
+        "backbone": backbone,
+        "max_trials": max_trials,
+        "study_name": study_name,
+        "objective_metric": objective_metric,
+        "checkpoint_enabled": (
+            checkpoint_config.get("enabled", False) if checkpoint_config else False
+        ),
+        # Checkpoint path (even if disabled, log None)
+        "checkpoint_path": str(storage_path.resolve()) if storage_path is not None else None,
+        "checkpoint_storage_type": "sqlite" if storage_path else None,
+        "resumed_from_checkpoint": should_resume,
+    })
 
 
 def log_sweep_metrics(
@@ -97,8 +91,11 @@ def log_sweep_metrics(
         f"n_trials={len(study.trials)}, "
         f"n_completed_trials={completed_trials}"
     )
-    mlflow.log_metric("n_trials", len(study.trials))
-    mlflow.log_metric("n_completed_trials", completed_trials)
+    writer = get_tracking_writer()
+    writer.log_metrics({
+        "n_trials": len(study.trials),
+        "n_completed_trials": completed_trials,
+    })
 
     if study.best_trial is not None and study.best_value is not None:
         logger.info(
@@ -106,16 +103,14 @@ def log_sweep_metrics(
             f"{objective_metric}={study.best_value}"
         )
 
-        mlflow.log_metric(
-            f"best_{objective_metric}", study.best_value
-        )
+        writer.log_metric(f"best_{objective_metric}", study.best_value)
 
         logger.info(
             f"[LOG_FINAL_METRICS] Logging best hyperparameters: "
             f"{study.best_params}"
         )
-        for param_name, param_value in study.best_params.items():
-            mlflow.log_param(f"best_{param_name}", param_value)
+        writer.log_params(
+            {f"best_{name}": value for name, value in study.best_params.items()})
 
 
 def log_sweep_parameters(
@@ -129,6 +124,6 @@ def log_sweep_parameters(
         f"[LOG_FINAL_METRICS] Logging best hyperparameters: "
         f"{study.best_params}"
     )
-    for param_name, param_value in study.best_params.items():
-        mlflow.log_param(f"best_{param_name}", param_value)
+    get_tracking_writer().log_params(
+        {f"best_{name}": value for name, value in study.best_params.items()})
 
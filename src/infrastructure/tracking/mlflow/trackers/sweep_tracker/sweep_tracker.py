@@ -46,6 +46,7 @@ import mlflow
 
 from common.shared.logging_utils import get_logger
 
+from infrastructure.tracking.mlflow.batch_writer import flush_tracking_writer
 from infrastructure.tracking.mlflow.trackers.base_tracker import BaseTracker
 from infrastructure.tracking.mlflow.types import RunHandle
 
@@ -171,7 +172,11 @@ class MLflowSweepTracker(BaseTracker):
 
             logger.info(
                 f"[START_SWEEP_RUN] Yielding RunHandle. run_id={handle.run_id[:12]}...")
-            yield handle
+            try:
+                yield handle
+            finally:
+                # Queued metadata must reach the parent run before it ends
+                flush_tracking_writer(handle.run_id)
             logger.info(
                 f"[START_SWEEP_RUN] Context manager exiting normally. run_id={handle.run_id[:12]}...")
         except Exception as e:
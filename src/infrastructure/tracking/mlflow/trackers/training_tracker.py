@@ -46,6 +46,10 @@ from infrastructure.naming.mlflow.tags import build_mlflow_tags
 from infrastructure.naming.mlflow.run_keys import build_mlflow_run_key, build_mlflow_run_key_hash
 from infrastructure.tracking.mlflow.index import update_mlflow_index
 from infrastructure.tracking.mlflow.utils import retry_with_backoff
+from infrastructure.tracking.mlflow.batch_writer import (
+    flush_tracking_writer,
+    get_tracking_writer,
+)
 # Lazy import to avoid pytest collection issues
 try:
     from infrastructure.tracking.mlflow import get_mlflow_run_url
@@ -192,7 +196,11 @@ class MLflowTrainingTracker(BaseTracker):
                         logger.debug(
                             f"Could not save MLflow run info to metadata: {e}")
 
-                yield handle
+                try:
+                    yield handle
+                finally:
+                    # Queued metrics and params must reach the run before it ends
+                    flush_tracking_writer(run_id)
         except Exception as e:
             logger.warning(f"MLflow tracking failed: {e}")
             logger.warning("Continuing training without MLflow tracking...")
@@ -220,45 +228,35 @@ class MLflowTrainingTracker(BaseTracker):
         """
         try:
             training_config = config.get("training", {})
+            params: Dict[str, Any] = {}
 
             # Training config parameters
-            if "learning_rate" in training_config:
-                mlflow.log_param(
-                    "learning_rate", training_config["learning_rate"])
-            if "batch_size" in training_config:
-                mlflow.log_param("batch_size", training_config["batch_size"])
-            if "dropout" in training_config:
-                mlflow.log_param("dropout", training_config["dropout"])
-            if "weight_decay" in training_config:
-                mlflow.log_param(
-                    "weight_decay", training_config["weight_decay"])
-            if "epochs" in training_config:
-                mlflow.log_param("epochs", training_config["epochs"])
+            for key in ("learning_rate", "batch_size", "dropout", "weight_decay", "epochs"):
+                if key in training_config:
+                    params[key] = training_config[key]
 
             # Backbone from model config
             model_config = config.get("model", {})
             if "backbone" in model_config:
-                mlflow.log_param("backbone", model_config["backbone"])
+                params["backbone"] = model_config["backbone"]
 
             # Data config
             if data_config:
-                if "data_version" in data_config:
-                    mlflow.log_param(
-                        "data_version", data_config["data_version"])
-                if "dataset_path" in data_config:
-                    mlflow.log_param(
-                        "dataset_path", data_config["dataset_path"])
+                for key in ("data_version", "dataset_path"):
+                    if key in data_config:
+                        params[key] = data_config[key]
 
             # Additional parameters
-            training_type = "continued" if source_checkpoint else "final"
-            mlflow.log_param("training_type", training_type)
+            params["training_type"] = "continued" if source_checkpoint else "final"
 
             if source_checkpoint:
-                mlflow.log_param("source_checkpoint", source_checkpoint)
+                params["source_checkpoint"] = source_checkpoint
             if data_strategy:
-                mlflow.log_param("data_strategy", data_strategy)
+                params["data_strategy"] = data_strategy
             if random_seed is not None:
-                mlflow.log_param("random_seed", random_seed)
+                params["random_seed"] = random_seed
+
+            get_tracking_writer().log_params(params)
         except Exception as e:
             logger.warning(f"Could not log training parameters to MLflow: {e}")
 
@@ -276,15 +274,15 @@ class MLflowTrainingTracker(BaseTracker):
         """
         try:
             # Main metrics
-            for metric_name, metric_value in metrics.items():
-                mlflow.log_metric(metric_name, metric_value)
+            all_metrics = dict(metrics)
 
             # Per-entity metrics
             if per_entity_metrics:
                 for entity, entity_metrics in per_entity_metrics.items():
                     for metric_type, metric_value in entity_metrics.items():
-                        mlflow.log_metric(
-                            f"{entity}_{metric_type}", metric_value)
+                        all_metrics[f"{entity}_{metric_type}"] = metric_value
+
+            get_tracking_writer().log_metrics(all_metrics)
         except Exception as e:
             logger.warning(f"Could not log training metrics to MLflow: {e}")
 
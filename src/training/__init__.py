@@ -14,7 +14,7 @@ For new code, prefer importing directly from submodules:
 The top-level imports provide convenient access to common training functions.
 """
 
-from .config import build_training_config, resolve_distributed_config
+from .config import build_training_config, resolve_distributed_config, resolve_performance_config
 # Import build_label_list separately since it doesn't require torch
 from data.loaders import build_label_list
 
@@ -29,6 +29,7 @@ __all__ = [
     # Configuration
     "build_training_config",
     "resolve_distributed_config",
+    "resolve_performance_config",
     # Data utilities (lazy)
     "load_dataset",
     "build_label_list",
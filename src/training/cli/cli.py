@@ -1,6 +1,7 @@
 """Command-line argument parsing for training script."""
 
 import argparse
+from typing import List, Optional
 
 from common.shared.argument_parsing import (
     add_config_dir_argument,
@@ -11,8 +12,13 @@ from common.shared.argument_parsing import (
 )
 
 
-def parse_training_arguments() -> argparse.Namespace:
-    """Parse command-line arguments for training script."""
+def parse_training_arguments(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """
+    Parse command-line arguments for training script.
+
+    Args:
+        argv: Arguments to parse (default: ``sys.argv[1:]``).
+    """
     parser = argparse.ArgumentParser(description="Train Resume NER model")
     
     # Data asset argument
@@ -30,5 +36,5 @@ def parse_training_arguments() -> argparse.Namespace:
     add_training_data_arguments(parser)
     add_cross_validation_arguments(parser)
     
-    return parser.parse_args()
+    return parser.parse_args(argv)
 
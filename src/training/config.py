@@ -6,6 +6,7 @@ domain: training
 responsibility:
   - Load configuration files from YAML
   - Build training configuration from arguments
+  - Resolve distributed and performance options
 inputs:
   - Config directories
   - Configuration filenames
@@ -45,21 +46,34 @@ from pathlib import Path
 from typing import Dict, Any, Optional
 from dataclasses import dataclass
 import argparse
+import copy
 
 from common.shared.yaml_utils import load_yaml
 
 
-def build_training_config(args: argparse.Namespace, config_dir: Path) -> Dict[str, Any]:
+def build_training_config(
+    args: argparse.Namespace,
+    config_dir: Path,
+    base_config: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
     """
     Build training configuration from files and command-line arguments.
 
     Args:
         args: Parsed command-line arguments.
         config_dir: Directory containing configuration files.
+        base_config: Optional configuration previously built for the same
+            backbone and config_dir; a copy is used instead of re-reading
+            the YAML files.
 
     Returns:
         Dictionary containing merged configuration.
     """
+    if base_config is not None:
+        config = copy.deepcopy(base_config)
+        _apply_argument_overrides(args, config)
+        return config
+
     # Load base training config
     train_config = load_yaml(config_dir / "train.yaml")
     train_config_dict = train_config.get("training", {}).copy()
@@ -75,6 +89,8 @@ def build_training_config(args: argparse.Namespace, config_dir: Path) -> Dict[st
         # Expose distributed section (if present) at top level so orchestration
         # and training logic can consume it without hard-coding defaults.
         "distributed": base_train_config.get("distributed", {}).copy(),
+        # Logging intervals (eval_interval backs step-level evaluation)
+        "logging": base_train_config.get("logging", {}).copy(),
         "_config_dir": config_dir,  # Store for checkpoint resolution
     }
     
@@ -133,6 +149,64 @@ def resolve_distributed_config(config: Dict[str, Any]) -> ResolvedDistributedCon
     )
 
 
+PRECISIONS = ("fp32", "bf16", "fp16")
+
+
+@dataclass
+class ResolvedPerformanceConfig:
+    """Resolved training performance options.
+
+    Derived from ``training.performance`` plus ``gradient_accumulation_steps``.
+    With ``enabled: false`` (the default) every speed option is off and
+    training runs the plain fp32 loop; ``gradient_accumulation_steps`` still
+    applies because it changes the effective batch size.
+    """
+
+    precision: str = "fp32"
+    compile: bool = False
+    compile_mode: Optional[str] = None
+    non_blocking: bool = False
+    fused_optimizer: bool = False
+    gradient_accumulation_steps: int = 1
+
+
+def resolve_performance_config(config: Dict[str, Any]) -> ResolvedPerformanceConfig:
+    """Resolve the training performance section into a simple dataclass.
+
+    Args:
+        config: Top-level training config returned by build_training_config.
+
+    Returns:
+        ResolvedPerformanceConfig with the options to apply.
+
+    Raises:
+        ValueError: If precision or gradient_accumulation_steps is invalid.
+    """
+    train_cfg = config.get("training") or {}
+    perf_cfg = train_cfg.get("performance") or {}
+
+    accumulation_steps = int(train_cfg.get("gradient_accumulation_steps") or 1)
+    if accumulation_steps < 1:
+        raise ValueError(
+            f"gradient_accumulation_steps must be >= 1, got {accumulation_steps}")
+
+    if not perf_cfg.get("enabled", False):
+        return ResolvedPerformanceConfig(gradient_accumulation_steps=accumulation_steps)
+
+    precision = str(perf_cfg.get("precision", "bf16")).lower()
+    if precision not in PRECISIONS:
+        raise ValueError(f"precision must be one of {PRECISIONS}, got {precision!r}")
+
+    return ResolvedPerformanceConfig(
+        precision=precision,
+        compile=bool(perf_cfg.get("compile", False)),
+        compile_mode=perf_cfg.get("compile_mode"),
+        non_blocking=bool(perf_cfg.get("non_blocking", True)),
+        fused_optimizer=bool(perf_cfg.get("fused_optimizer", True)),
+        gradient_accumulation_steps=accumulation_steps,
+    )
+
+
 def _apply_argument_overrides(args: argparse.Namespace, config: Dict[str, Any]) -> None:
     """Apply command-line argument overrides to configuration."""
     if args.learning_rate is not None:
@@ -7,6 +7,8 @@ This module contains the core training logic including:
 - Model evaluation (evaluator.py)
 - Checkpoint loading (checkpoint_loader.py)
 - Cross-validation utilities (cv_utils.py)
+- Length-grouped batch sampling (samplers.py)
+- In-training evaluation and early stopping (progress.py)
 - Training utilities (utils.py)
 """
 
@@ -14,6 +16,7 @@ from typing import Any
 
 # Import non-torch dependencies first (can be imported eagerly)
 from .cv_utils import create_kfold_splits, load_fold_splits, get_fold_data
+from .samplers import LengthGroupedBatchSampler
 
 # Torch-dependent modules are imported lazily via __getattr__
 # This allows importing core module without requiring torch
@@ -28,6 +31,9 @@ __all__ = [
     "create_kfold_splits",
     "load_fold_splits",
     "get_fold_data",
+    "LengthGroupedBatchSampler",
+    "EarlyStopping",
+    "TrainingMonitor",
     "set_seed",
 ]
 
@@ -52,6 +58,9 @@ def __getattr__(name: str) -> Any:
     elif name == "resolve_training_checkpoint_path":
         from .checkpoint_loader import resolve_training_checkpoint_path
         return resolve_training_checkpoint_path
+    elif name in ("EarlyStopping", "TrainingMonitor"):
+        from . import progress
+        return getattr(progress, name)
     elif name == "set_seed":
         from .utils import set_seed
         return set_seed
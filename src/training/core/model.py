@@ -26,7 +26,7 @@ lifecycle:
 
 """Model initialization utilities."""
 
-from typing import Dict, Any, Optional, Tuple
+from typing import Dict, Any, List, Optional, Tuple
 
 from pathlib import Path
 
@@ -36,6 +36,72 @@ from transformers import (
     AutoModelForTokenClassification,
 )
 
+# Pretrained tokenizers and backbone weights kept in memory between models built
+# in the same process (enabled by in-process HPO trials; None = disabled)
+_pretrained_cache: Optional[
+    Dict[Tuple[str, str, Tuple[str, ...]], Tuple[Any, Any, Any, Dict[str, torch.Tensor]]]
+] = None
+
+
+def enable_pretrained_cache() -> None:
+    """Keep pretrained tokenizers and weights in memory for later models in this process."""
+    global _pretrained_cache
+    if _pretrained_cache is None:
+        _pretrained_cache = {}
+
+
+def clear_pretrained_cache() -> None:
+    """Drop cached pretrained tokenizers and weights and disable caching."""
+    global _pretrained_cache
+    _pretrained_cache = None
+
+
+def _load_pretrained(
+    backbone: str,
+    tokenizer_name: str,
+    label2id: Dict[str, int],
+    id2label: Dict[int, str],
+) -> Tuple[AutoModelForTokenClassification, AutoTokenizer]:
+    """
+    Load a backbone with a fresh token classification head, reusing cached weights.
+
+    Only weights present in the pretrained checkpoint are cached. Cache hits
+    go through the same ``from_pretrained`` path with the cached state dict,
+    so only the missing head weights are initialized, consuming the RNG
+    exactly as a cold load does: with the same seed, cached and uncached
+    loads give identical heads.
+    """
+    key = (backbone, tokenizer_name, tuple(label2id))
+    if _pretrained_cache is not None and key in _pretrained_cache:
+        tokenizer, model_class, model_config, pretrained_state = _pretrained_cache[key]
+        # Clone so training never writes into the cached tensors, whether
+        # loading copies them or assigns them to the parameters
+        model = model_class.from_pretrained(
+            None,
+            config=model_config,
+            state_dict={k: v.clone() for k, v in pretrained_state.items()},
+        )
+        return model, tokenizer
+
+    tokenizer = AutoTokenizer.from_pretrained(tokenizer_name)
+    model = AutoModelForTokenClassification.from_pretrained(
+        backbone,
+        num_labels=len(label2id),
+        id2label=id2label,
+        label2id=label2id,
+        use_safetensors=True,
+        output_loading_info=_pretrained_cache is not None,
+    )
+    if _pretrained_cache is not None:
+        model, loading_info = model
+        fresh: List[str] = list(loading_info.get("missing_keys", []))
+        pretrained_state = {
+            k: v.detach().to("cpu", copy=True)
+            for k, v in model.state_dict().items() if k not in fresh
+        }
+        _pretrained_cache[key] = (tokenizer, type(model), model.config, pretrained_state)
+    return model, tokenizer
+
 
 def create_model_and_tokenizer(
     config: Dict[str, Any],
@@ -116,15 +182,7 @@ def create_model_and_tokenizer(
             )
     
     # Fallback: Create new model from backbone (existing behavior)
-    tokenizer = AutoTokenizer.from_pretrained(tokenizer_name)
-
-    model = AutoModelForTokenClassification.from_pretrained(
-        backbone,
-        num_labels=len(label2id),
-        id2label=id2label,
-        label2id=label2id,
-        use_safetensors=True,
-    )
+    model, tokenizer = _load_pretrained(backbone, tokenizer_name, label2id, id2label)
 
     if device is None:
         device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
@@ -0,0 +1,250 @@
+"""
+@meta
+name: training_progress
+type: utility
+domain: training
+responsibility:
+  - Evaluate during training at epoch or step intervals
+  - Track early stopping and keep the best model state in memory
+  - Stream intermediate metrics to a file readable by the HPO parent
+inputs:
+  - Evaluation callables and metrics
+  - Early stopping configuration
+outputs:
+  - Early stopping decisions
+  - Intermediate metrics file (JSON lines)
+tags:
+  - utility
+  - training
+  - early-stopping
+ci:
+  runnable: true
+  needs_gpu: false
+  needs_cloud: false
+lifecycle:
+  status: active
+"""
+
+"""Intermediate evaluation, early stopping and progress reporting."""
+
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+import torch
+
+from common.shared.logging_utils import get_logger
+
+logger = get_logger(__name__)
+
+EVAL_STRATEGIES = ("epoch", "steps", "end")
+
+
+class EarlyStopping:
+    """Stop once the monitored metric has not improved for ``patience`` evaluations."""
+
+    def __init__(self, patience: int = 3, min_delta: float = 0.0, mode: str = "max"):
+        """
+        Initialize the tracker.
+
+        Args:
+            patience: Evaluations without improvement before stopping.
+            min_delta: Minimum change that counts as an improvement.
+            mode: "max" if higher is better, "min" if lower is better.
+        """
+        if mode not in ("max", "min"):
+            raise ValueError(f"mode must be 'max' or 'min', got {mode!r}")
+        self.patience = patience
+        self.min_delta = min_delta
+        self.mode = mode
+        self.best: Optional[float] = None
+        self.bad_evaluations = 0
+
+    @property
+    def should_stop(self) -> bool:
+        """Whether patience is exhausted."""
+        return self.bad_evaluations >= self.patience
+
+    def update(self, value: float) -> bool:
+        """
+        Record an evaluation result.
+
+        Args:
+            value: Monitored metric value.
+
+        Returns:
+            True if the value improved on the best so far.
+        """
+        if self.best is None or (
+            value > self.best + self.min_delta if self.mode == "max"
+            else value < self.best - self.min_delta
+        ):
+            self.best = value
+            self.bad_evaluations = 0
+            return True
+        self.bad_evaluations += 1
+        return False
+
+
+class IntermediateMetricsWriter:
+    """Append one JSON line per evaluation, flushed so other processes can follow it."""
+
+    def __init__(self, path: Path):
+        """
+        Start a fresh metrics file.
+
+        Args:
+            path: JSON lines file to write.
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text("", encoding="utf-8")
+
+    def write(self, epoch: int, step: int, metrics: Dict[str, Any]) -> None:
+        """
+        Append an evaluation record.
+
+        Args:
+            epoch: Completed epochs (fractional for step-level evaluation).
+            step: Optimizer steps so far.
+            metrics: Metrics from the evaluation; non-scalar values are skipped.
+        """
+        record = {
+            "epoch": epoch,
+            "step": step,
+            "time": time.time(),
+            "metrics": {k: v for k, v in metrics.items() if isinstance(v, (int, float))},
+        }
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+
+class TrainingMonitor:
+    """
+    Evaluation hook for ``run_training_loop``.
+
+    Runs the evaluation callable on the main process, streams the results,
+    applies early stopping and keeps a CPU copy of the best weights. In
+    distributed runs the stop decision is broadcast from rank 0.
+    """
+
+    def __init__(
+        self,
+        model: torch.nn.Module,
+        evaluate: Callable[[], Dict[str, Any]],
+        metric: str,
+        mode: str = "max",
+        early_stopping: Optional[EarlyStopping] = None,
+        writer: Optional[IntermediateMetricsWriter] = None,
+        keep_best: bool = False,
+        is_main_process: bool = True,
+        distributed: bool = False,
+    ):
+        """
+        Initialize the monitor.
+
+        Args:
+            model: Model being trained.
+            evaluate: Callable returning validation metrics for ``model``.
+            metric: Metric used for early stopping and best-state tracking.
+            mode: "max" or "min" for ``metric``.
+            early_stopping: Optional early stopping tracker.
+            writer: Optional intermediate metrics writer.
+            keep_best: Keep the best weights in memory for ``restore_best``.
+            is_main_process: Whether this process evaluates.
+            distributed: Whether to broadcast stop decisions across ranks.
+        """
+        self.model = model
+        self.evaluate = evaluate
+        self.metric = metric
+        self.early_stopping = early_stopping
+        self.best_tracker = EarlyStopping(patience=0, mode=mode)
+        self.writer = writer
+        self.keep_best = keep_best
+        self.is_main_process = is_main_process
+        self.distributed = distributed
+
+        self.last_metrics: Optional[Dict[str, Any]] = None
+        self.last_step: Optional[int] = None
+        self.best_metrics: Optional[Dict[str, Any]] = None
+        self._best_state: Optional[Dict[str, torch.Tensor]] = None
+        self.restored_best = False
+
+    def __call__(self, epoch: float, step: int) -> bool:
+        """
+        Evaluate and decide whether to stop training.
+
+        Args:
+            epoch: Completed epochs (fractional for step-level evaluation).
+            step: Optimizer steps so far.
+
+        Returns:
+            True if training should stop.
+        """
+        stop = False
+        if self.is_main_process:
+            metrics = self.evaluate()
+            self.model.train()
+            self.last_metrics, self.last_step = metrics, step
+            if self.writer is not None:
+                self.writer.write(epoch, step, metrics)
+
+            value = metrics.get(self.metric)
+            if isinstance(value, (int, float)):
+                if self.best_tracker.update(float(value)):
+                    self.best_metrics = metrics
+                    if self.keep_best:
+                        self._best_state = {
+                            k: v.detach().to("cpu", copy=True)
+                            for k, v in self.model.state_dict().items()
+                        }
+                if self.early_stopping is not None:
+                    self.early_stopping.update(float(value))
+                    stop = self.early_stopping.should_stop
+            logger.info(f"Epoch {epoch:g} step {step}: {self.metric}={value}")
+            if stop:
+                logger.info(
+                    f"Early stopping: no {self.metric} improvement in "
+                    f"{self.early_stopping.patience} evaluations")
+
+        if self.distributed:
+            import torch.distributed as dist
+
+            decision = [stop]
+            dist.broadcast_object_list(decision, src=0)
+            stop = bool(decision[0])
+        return stop
+
+    def restore_best(self) -> bool:
+        """
+        Load the best weights seen into the model.
+
+        Returns:
+            True if weights were restored.
+        """
+        if self._best_state is None:
+            return False
+        self.model.load_state_dict(self._best_state)
+        self.restored_best = True
+        return True
+
+    def final_metrics(self, final_step: int) -> Optional[Dict[str, Any]]:
+        """
+        Metrics describing the model's current weights, if already evaluated.
+
+        Args:
+            final_step: Optimizer steps taken when training ended.
+
+        Returns:
+            Best metrics after ``restore_best``, the last evaluation if it
+            ran at ``final_step``, otherwise None.
+        """
+        if self.restored_best:
+            return self.best_metrics
+        if self.last_step == final_step:
+            return self.last_metrics
+        return None
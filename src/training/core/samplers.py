@@ -0,0 +1,151 @@
+"""
+@meta
+name: samplers
+type: utility
+domain: training
+responsibility:
+  - Group samples of similar length into batches to minimize padding
+  - Build batches by token budget instead of a fixed batch size
+  - Shard batches across distributed ranks
+inputs:
+  - Per-sample token lengths
+  - Batching configuration
+outputs:
+  - Batches of sample indices
+tags:
+  - utility
+  - training
+  - batching
+ci:
+  runnable: true
+  needs_gpu: false
+  needs_cloud: false
+lifecycle:
+  status: active
+"""
+
+"""Length-grouped batch sampling for token classification."""
+
+from typing import Iterator, List, Optional, Sequence
+
+import numpy as np
+
+
+class LengthGroupedBatchSampler:
+    """
+    Batch sampler that groups samples of similar length.
+
+    Each epoch, sample indices are shuffled and cut into megabatches of
+    ``megabatch_size`` samples; each megabatch is sorted by length and cut
+    into batches, and the batch order is shuffled. Batches hold either
+    ``batch_size`` samples or as many samples as fit in ``max_tokens``
+    padded tokens. With ``num_replicas > 1`` every rank builds the same
+    batch list from the shared seed and takes every ``num_replicas``-th
+    batch, padding the list by repetition so ranks get equal counts (as
+    ``DistributedSampler`` does with samples).
+    """
+
+    def __init__(
+        self,
+        lengths: Sequence[int],
+        batch_size: Optional[int] = None,
+        max_tokens: Optional[int] = None,
+        megabatch_size: Optional[int] = None,
+        shuffle: bool = True,
+        seed: int = 0,
+        num_replicas: int = 1,
+        rank: int = 0,
+    ):
+        """
+        Initialize the sampler.
+
+        Args:
+            lengths: Token length of each sample.
+            batch_size: Samples per batch (ignored when ``max_tokens`` is set).
+            max_tokens: Maximum padded tokens per batch (batch size times the
+                longest sample in it). A sample longer than the budget forms
+                its own batch.
+            megabatch_size: Samples per length-sorted group (default: 50
+                batches' worth; all samples when not shuffling).
+            shuffle: Shuffle samples and batches each epoch; otherwise
+                batches follow descending length.
+            seed: Base random seed, combined with the epoch.
+            num_replicas: Number of distributed ranks.
+            rank: This process's rank.
+        """
+        if max_tokens is None and (batch_size is None or batch_size < 1):
+            raise ValueError("Either batch_size >= 1 or max_tokens must be set")
+        if max_tokens is not None and max_tokens < 1:
+            raise ValueError(f"max_tokens must be >= 1, got {max_tokens}")
+        if not 0 <= rank < num_replicas:
+            raise ValueError(f"rank must be in [0, {num_replicas}), got {rank}")
+
+        self.lengths = np.asarray(lengths, dtype=np.int64)
+        self.batch_size = batch_size
+        self.max_tokens = max_tokens
+        if megabatch_size is None:
+            megabatch_size = 50 * (batch_size or 1) if shuffle else len(self.lengths)
+        self.megabatch_size = max(1, megabatch_size)
+        self.shuffle = shuffle
+        self.seed = seed
+        self.num_replicas = num_replicas
+        self.rank = rank
+        self.epoch = 0
+        self._batches: Optional[List[List[int]]] = None
+
+    def set_epoch(self, epoch: int) -> None:
+        """Set the epoch used to seed shuffling (call before each epoch)."""
+        if epoch != self.epoch:
+            self.epoch = epoch
+            self._batches = None
+
+    def _split_sorted(self, indices: np.ndarray) -> List[List[int]]:
+        """Cut indices sorted by descending length into batches."""
+        if self.max_tokens is None:
+            return [
+                indices[i:i + self.batch_size].tolist()
+                for i in range(0, len(indices), self.batch_size)
+            ]
+
+        batches: List[List[int]] = []
+        start = 0
+        while start < len(indices):
+            # Sorted descending, so the first sample sets the padded length
+            longest = max(1, int(self.lengths[indices[start]]))
+            count = max(1, self.max_tokens // longest)
+            batches.append(indices[start:start + count].tolist())
+            start += count
+        return batches
+
+    def _build_batches(self) -> List[List[int]]:
+        """Build this rank's batches for the current epoch."""
+        rng = np.random.default_rng(self.seed + self.epoch)
+        order = rng.permutation(len(self.lengths)) if self.shuffle else np.arange(len(self.lengths))
+
+        batches: List[List[int]] = []
+        for start in range(0, len(order), self.megabatch_size):
+            megabatch = order[start:start + self.megabatch_size]
+            megabatch = megabatch[np.argsort(-self.lengths[megabatch], kind="stable")]
+            batches.extend(self._split_sorted(megabatch))
+
+        if self.shuffle:
+            batches = [batches[i] for i in rng.permutation(len(batches))]
+
+        if self.num_replicas > 1 and batches:
+            padding = -len(batches) % self.num_replicas
+            batches += (batches * (padding // len(batches) + 1))[:padding]
+            batches = batches[self.rank::self.num_replicas]
+        return batches
+
+    def _epoch_batches(self) -> List[List[int]]:
+        """Batches of the current epoch, built once per epoch."""
+        if self._batches is None:
+            self._batches = self._build_batches()
+        return self._batches
+
+    def __iter__(self) -> Iterator[List[int]]:
+        return iter(self._epoch_batches())
+
+    def __len__(self) -> int:
+        # Token-budget batch counts depend on the epoch's grouping
+        return len(self._epoch_batches())
@@ -28,9 +28,12 @@ lifecycle:
 
 """Training loop utilities."""
 
+import math
+import os
 import sys
+from contextlib import nullcontext
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Tuple, Union
+from typing import Callable, Dict, Any, List, Optional, Tuple, Union
 
 import torch
 from torch.utils.data import DataLoader, DistributedSampler
@@ -41,12 +44,19 @@ from transformers import (
     get_linear_schedule_with_warmup,
 )
 
-from data.loaders import ResumeNERDataset, build_label_list
+from data.loaders import ResumeNERDataset, build_label_list, load_or_build_tokenized_dataset
 from .model import create_model_and_tokenizer
 from .evaluator import evaluate_model
+from .samplers import LengthGroupedBatchSampler
+from .progress import EVAL_STRATEGIES, EarlyStopping, IntermediateMetricsWriter, TrainingMonitor
 from .cv_utils import load_fold_splits, get_fold_data
+from training.config import ResolvedPerformanceConfig, resolve_performance_config
 from training.execution.distributed import RunContext, create_run_context
 from .checkpoint_loader import resolve_training_checkpoint_path
+from common.constants import INTERMEDIATE_METRICS_FILENAME
+from common.shared.logging_utils import get_logger
+
+logger = get_logger(__name__)
 
 # Default constants (can be overridden via config)
 DEFAULT_VAL_SPLIT_DIVISOR = 10
@@ -63,6 +73,7 @@ def prepare_data_loaders(
     val_indices: Optional[List[int]] = None,
     use_all_data: bool = False,
     context: RunContext | None = None,
+    cache_dir: Optional[Path] = None,
 ) -> tuple[DataLoader, Optional[DataLoader]]:
     """
     Prepare training and validation data loaders.
@@ -75,6 +86,10 @@ def prepare_data_loaders(
         train_indices: Optional list of indices for training subset (for CV).
         val_indices: Optional list of indices for validation subset (for CV).
         use_all_data: If True, use all data for training without validation split.
+        context: Optional distributed training context.
+        cache_dir: Optional tokenization cache directory. When set, the train
+            split is tokenized once into a memory-mapped cache and folds are
+            served as views of it instead of re-tokenizing every epoch.
 
     Returns:
         Tuple of (train_loader, val_loader). val_loader is None if use_all_data=True.
@@ -107,15 +122,54 @@ def prepare_data_loaders(
     train_cfg = config["training"]
     batch_size = train_cfg.get("batch_size", 8)
 
+    batching_cfg = train_cfg.get("batching") or {}
+    max_tokens = batching_cfg.get("max_tokens")
+
     backbone = model_cfg.get("backbone", "distilbert-base-uncased")
     deberta_max_batch_size = config["training"].get(
         "deberta_max_batch_size", DEFAULT_DEBERTA_MAX_BATCH_SIZE)
-    if "deberta" in backbone.lower() and batch_size > deberta_max_batch_size:
+    # A token budget already bounds memory per batch, so the clamp is not needed
+    if not max_tokens and "deberta" in backbone.lower() and batch_size > deberta_max_batch_size:
         batch_size = deberta_max_batch_size
 
-    train_ds = ResumeNERDataset(train_data, tokenizer, max_length, label2id)
+    if cache_dir is not None:
+        train_ds, val_ds = _build_cached_datasets(
+            original_train_data, dataset.get("validation", []), val_data,
+            tokenizer, max_length, label2id, train_indices, val_indices, cache_dir,
+        )
+    else:
+        train_ds = ResumeNERDataset(train_data, tokenizer, max_length, label2id)
+        val_ds = (
+            ResumeNERDataset(val_data, tokenizer, max_length, label2id) if val_data else None
+        )
 
     data_collator = DataCollatorForTokenClassification(tokenizer)
+    loader_kwargs = resolve_dataloader_kwargs(train_cfg, context)
+    if loader_kwargs["num_workers"] > 0:
+        # Forked workers cannot use the Rust tokenizer's thread pool
+        os.environ.setdefault("TOKENIZERS_PARALLELISM", "false")
+    logger.info(
+        f"DataLoader configuration: batch_size={batch_size}, max_tokens={max_tokens}, "
+        f"group_by_length={bool(batching_cfg.get('group_by_length', False))}, {loader_kwargs}")
+
+    if batching_cfg.get("group_by_length", False) or max_tokens:
+        train_loader = DataLoader(
+            train_ds,
+            batch_sampler=_length_grouped_sampler(
+                train_ds, batching_cfg, batch_size, train_cfg, context, shuffle=True),
+            collate_fn=data_collator,
+            **loader_kwargs,
+        )
+        val_loader = None
+        if val_ds is not None:
+            val_loader = DataLoader(
+                val_ds,
+                batch_sampler=_length_grouped_sampler(
+                    val_ds, batching_cfg, batch_size, train_cfg, context, shuffle=False),
+                collate_fn=data_collator,
+                **loader_kwargs,
+            )
+        return train_loader, val_loader
 
     # Choose sampler based on run context
     if context is not None and context.distributed:
@@ -131,6 +185,7 @@ def prepare_data_loaders(
             sampler=train_sampler,
             shuffle=False,
             collate_fn=data_collator,
+            **loader_kwargs,
         )
     else:
         train_loader = DataLoader(
@@ -138,12 +193,11 @@ def prepare_data_loaders(
             batch_size=batch_size,
             shuffle=True,
             collate_fn=data_collator,
+            **loader_kwargs,
         )
 
     # Create validation loader only if validation data exists
-    if val_data:
-        val_ds = ResumeNERDataset(val_data, tokenizer, max_length, label2id)
-
+    if val_ds is not None:
         if context is not None and context.distributed:
             val_sampler: Optional[DistributedSampler] = DistributedSampler(
                 val_ds,
@@ -157,6 +211,7 @@ def prepare_data_loaders(
                 sampler=val_sampler,
                 shuffle=False,
                 collate_fn=data_collator,
+                **loader_kwargs,
             )
         else:
             val_loader = DataLoader(
@@ -164,6 +219,7 @@ def prepare_data_loaders(
                 batch_size=batch_size,
                 shuffle=False,
                 collate_fn=data_collator,
+                **loader_kwargs,
             )
     else:
         val_loader = None
@@ -171,6 +227,137 @@ def prepare_data_loaders(
     return train_loader, val_loader
 
 
+def resolve_dataloader_kwargs(
+    train_cfg: Dict[str, Any],
+    context: RunContext | None = None,
+) -> Dict[str, Any]:
+    """
+    Resolve DataLoader worker and memory options from ``training.dataloader``.
+
+    ``"auto"`` (or a missing key) derives a value: ``num_workers`` splits the
+    CPU count across local training processes (at most 4 each, leaving one
+    core for the training loop), ``pin_memory`` is on for CUDA devices and
+    ``persistent_workers`` is on whenever there are workers.
+
+    Args:
+        train_cfg: Training config section.
+        context: Optional run context (device and world size).
+
+    Returns:
+        Keyword arguments for ``DataLoader``.
+    """
+    loader_cfg = train_cfg.get("dataloader") or {}
+
+    num_workers = loader_cfg.get("num_workers", "auto")
+    if num_workers in (None, "auto"):
+        world_size = context.world_size if context is not None and context.distributed else 1
+        num_workers = max(0, min(4, (os.cpu_count() or 1) // max(1, world_size) - 1))
+    num_workers = int(num_workers)
+
+    pin_memory = loader_cfg.get("pin_memory", "auto")
+    if pin_memory in (None, "auto"):
+        device_type = context.device.type if context is not None else (
+            "cuda" if torch.cuda.is_available() else "cpu")
+        pin_memory = device_type == "cuda"
+
+    kwargs: Dict[str, Any] = {"num_workers": num_workers, "pin_memory": bool(pin_memory)}
+    # Worker-only options; DataLoader rejects them without workers
+    if num_workers > 0:
+        persistent_workers = loader_cfg.get("persistent_workers", "auto")
+        kwargs["persistent_workers"] = (
+            True if persistent_workers in (None, "auto") else bool(persistent_workers))
+        if loader_cfg.get("prefetch_factor") is not None:
+            kwargs["prefetch_factor"] = int(loader_cfg["prefetch_factor"])
+    return kwargs
+
+
+def _length_grouped_sampler(
+    ds: Any,
+    batching_cfg: Dict[str, Any],
+    batch_size: int,
+    train_cfg: Dict[str, Any],
+    context: RunContext | None,
+    shuffle: bool,
+) -> LengthGroupedBatchSampler:
+    """Build a length-grouped batch sampler for a dataset from ``training.batching``."""
+    distributed = context is not None and context.distributed
+    return LengthGroupedBatchSampler(
+        ds.lengths,
+        batch_size=batch_size,
+        max_tokens=batching_cfg.get("max_tokens"),
+        megabatch_size=batching_cfg.get("megabatch_size"),
+        shuffle=shuffle,
+        seed=int(train_cfg.get("random_seed") or 0),
+        num_replicas=context.world_size if distributed else 1,
+        rank=context.rank if distributed else 0,
+    )
+
+
+def _build_cached_datasets(
+    original_train_data: List[Dict[str, Any]],
+    original_val_data: List[Dict[str, Any]],
+    val_data: List[Dict[str, Any]],
+    tokenizer: AutoTokenizer,
+    max_length: int,
+    label2id: Dict[str, int],
+    train_indices: Optional[List[int]],
+    val_indices: Optional[List[int]],
+    cache_dir: Path,
+) -> Tuple[Any, Optional[Any]]:
+    """
+    Build train/validation datasets from the tokenization cache.
+
+    The full train split is cached once; CV folds and the fallback
+    validation slice are index views of it, so every fold and trial shares
+    the same entry.
+    """
+    full_train = load_or_build_tokenized_dataset(
+        original_train_data, tokenizer, max_length, label2id, cache_dir)
+    train_ds = full_train.subset(train_indices) if train_indices is not None else full_train
+
+    if not val_data:
+        return train_ds, None
+    if val_indices is not None:
+        return train_ds, full_train.subset(val_indices)
+    if original_val_data:
+        return train_ds, load_or_build_tokenized_dataset(
+            original_val_data, tokenizer, max_length, label2id, cache_dir)
+    # Fallback split: leading slice of the train data
+    return train_ds, full_train.subset(range(len(val_data)))
+
+
+def resolve_tokenization_cache_dir(config: Dict[str, Any]) -> Optional[Path]:
+    """
+    Resolve the tokenization cache directory from config.
+
+    Reads ``training.tokenization_cache`` (``enabled``, ``dir``). Without an
+    explicit ``dir`` the cache lives under ``outputs/cache/tokenized_datasets``.
+
+    Args:
+        config: Configuration dictionary.
+
+    Returns:
+        Cache directory, or None if the cache is disabled.
+    """
+    cache_cfg = config.get("training", {}).get("tokenization_cache") or {}
+    if not cache_cfg.get("enabled", False):
+        return None
+    if cache_cfg.get("dir"):
+        return Path(cache_cfg["dir"])
+
+    config_dir = config.get("_config_dir")
+    if config_dir is None:
+        return None
+    from infrastructure.paths.resolve import resolve_output_path
+
+    config_dir = Path(config_dir)
+    try:
+        return resolve_output_path(
+            config_dir.parent, config_dir, "cache", subcategory="tokenized_datasets")
+    except (FileNotFoundError, KeyError):
+        return None
+
+
 def create_optimizer_and_scheduler(
     model: torch.nn.Module,
     config: Dict[str, Any],
@@ -193,7 +380,11 @@ def create_optimizer_and_scheduler(
     warmup_steps = train_cfg.get("warmup_steps", 0)
     max_grad_norm = train_cfg.get("max_grad_norm", 1.0)
 
-    optimizer = torch.optim.AdamW(model.parameters(), lr=lr, weight_decay=wd)
+    params = list(model.parameters())
+    # Fused AdamW runs one kernel per step instead of one per parameter (CUDA only)
+    fused = resolve_performance_config(config).fused_optimizer and bool(params) and all(
+        p.is_cuda for p in params)
+    optimizer = torch.optim.AdamW(params, lr=lr, weight_decay=wd, fused=fused or None)
     warmup_steps_divisor = config["training"].get(
         "warmup_steps_divisor", DEFAULT_WARMUP_STEPS_DIVISOR)
     max_warmup_steps = total_steps // warmup_steps_divisor
@@ -206,6 +397,15 @@ def create_optimizer_and_scheduler(
     return optimizer, scheduler, max_grad_norm
 
 
+def _autocast_dtype(precision: str, device: torch.device) -> Optional[torch.dtype]:
+    """Autocast dtype for a precision setting, or None for fp32."""
+    if precision == "fp16" and device.type != "cuda":
+        logger.warning(
+            f"fp16 autocast needs CUDA; using bf16 on {device.type}")
+        precision = "bf16"
+    return {"bf16": torch.bfloat16, "fp16": torch.float16}.get(precision)
+
+
 def run_training_loop(
     model: torch.nn.Module,
     train_loader: DataLoader,
@@ -214,7 +414,10 @@ def run_training_loop(
     epochs: int,
     max_grad_norm: float,
     context: RunContext,
-) -> None:
+    performance: Optional[ResolvedPerformanceConfig] = None,
+    eval_hook: Optional[Callable[[float, int], bool]] = None,
+    eval_interval: Optional[int] = None,
+) -> int:
     """
     Run the training loop for specified epochs.
 
@@ -225,28 +428,148 @@ def run_training_loop(
         scheduler: Learning rate scheduler.
         epochs: Number of training epochs.
         max_grad_norm: Maximum gradient norm for clipping.
-        device: Device to run training on.
+        context: Run context (device and distributed settings).
+        performance: Optional mixed precision, gradient accumulation and
+            host-to-device copy settings (default: plain fp32 loop).
+        eval_hook: Optional callable ``(epoch, global_step) -> stop`` run at
+            the end of each epoch and every ``eval_interval`` optimizer
+            steps; training ends early when it returns True.
+        eval_interval: Optimizer steps between mid-epoch ``eval_hook`` calls
+            (None: epoch ends only).
+
+    Returns:
+        Number of optimizer steps taken.
     """
-    model.train()
+    perf = performance or ResolvedPerformanceConfig()
+    accumulation_steps = perf.gradient_accumulation_steps
     device = context.device
+    amp_dtype = _autocast_dtype(perf.precision, device)
+    # Loss scaling is only needed for fp16; bf16 has fp32's exponent range
+    scaler = torch.amp.GradScaler(device.type, enabled=amp_dtype == torch.float16)
+    num_batches = len(train_loader)
+    # Batches from here on form a final, smaller accumulation group
+    remainder_start = num_batches - num_batches % accumulation_steps
+    global_step = 0
+
+    model.train()
     for epoch in range(epochs):
-        # Ensure each epoch sees a different shard order in distributed mode
-        if (
+        # Reshuffle per epoch: length-grouped batches always, shards in distributed mode
+        if isinstance(getattr(train_loader, "batch_sampler", None), LengthGroupedBatchSampler):
+            train_loader.batch_sampler.set_epoch(epoch)
+        elif (
             context.distributed
             and hasattr(train_loader, "sampler")
             and hasattr(train_loader.sampler, "set_epoch")
         ):
             train_loader.sampler.set_epoch(epoch)
 
-        for batch in train_loader:
-            batch = {k: v.to(device) for k, v in batch.items()}
-            outputs = model(**batch)
-            loss = outputs.loss
-            loss.backward()
-            torch.nn.utils.clip_grad_norm_(model.parameters(), max_grad_norm)
-            optimizer.step()
-            scheduler.step()
-            optimizer.zero_grad()
+        for step, batch in enumerate(train_loader):
+            batch = {k: v.to(device, non_blocking=perf.non_blocking) for k, v in batch.items()}
+            is_update_step = (step + 1) % accumulation_steps == 0 or step + 1 == num_batches
+            group_size = (
+                accumulation_steps if step < remainder_start
+                else num_batches - remainder_start
+            )
+            # Skip DDP's gradient all-reduce on accumulation-only steps
+            sync_context = (
+                model.no_sync() if isinstance(model, DDP) and not is_update_step
+                else nullcontext()
+            )
+            with sync_context:
+                with torch.autocast(
+                    device_type=device.type, dtype=amp_dtype, enabled=amp_dtype is not None
+                ):
+                    loss = model(**batch).loss
+                scaler.scale(loss / group_size).backward()
+
+            if is_update_step:
+                scaler.unscale_(optimizer)
+                torch.nn.utils.clip_grad_norm_(model.parameters(), max_grad_norm)
+                scaler.step(optimizer)
+                scaler.update()
+                scheduler.step()
+                optimizer.zero_grad(set_to_none=True)
+                global_step += 1
+
+                if (
+                    eval_hook is not None
+                    and eval_interval
+                    and global_step % eval_interval == 0
+                    and step + 1 < num_batches
+                    and eval_hook(epoch + (step + 1) / num_batches, global_step)
+                ):
+                    return global_step
+
+        if eval_hook is not None and eval_hook(epoch + 1, global_step):
+            return global_step
+
+    return global_step
+
+
+def build_training_monitor(
+    config: Dict[str, Any],
+    model: torch.nn.Module,
+    val_loader: Optional[DataLoader],
+    id2label: Dict[int, str],
+    context: RunContext,
+    output_dir: Path,
+) -> Tuple[Optional[TrainingMonitor], Optional[int]]:
+    """
+    Build the in-training evaluation hook from ``training.evaluation``.
+
+    Args:
+        config: Configuration dictionary.
+        model: Model being trained (may be wrapped in DDP).
+        val_loader: Validation data loader, if any.
+        id2label: Mapping from label IDs to label strings.
+        context: Run context (device and distributed settings).
+        output_dir: Directory for the intermediate metrics file.
+
+    Returns:
+        Tuple of (monitor, eval_interval). The monitor is None when there is
+        no validation set or evaluation only runs after training.
+    """
+    train_cfg = config.get("training", {})
+    eval_cfg = train_cfg.get("evaluation") or {}
+    strategy = eval_cfg.get("strategy", "epoch")
+    if strategy not in EVAL_STRATEGIES:
+        raise ValueError(f"training.evaluation.strategy must be one of {EVAL_STRATEGIES}, got {strategy!r}")
+    if val_loader is None or strategy == "end":
+        return None, None
+
+    eval_interval = None
+    if strategy == "steps":
+        eval_interval = eval_cfg.get("interval") or config.get("logging", {}).get("eval_interval")
+        if not eval_interval or int(eval_interval) < 1:
+            raise ValueError("training.evaluation.interval must be >= 1 for the 'steps' strategy")
+        eval_interval = int(eval_interval)
+
+    metric = train_cfg.get("metric", "macro-f1")
+    mode = train_cfg.get("metric_mode", "max")
+    es_cfg = train_cfg.get("early_stopping") or {}
+    early_stopping = None
+    if es_cfg.get("enabled", False):
+        early_stopping = EarlyStopping(
+            patience=int(es_cfg.get("patience", 3)),
+            min_delta=float(es_cfg.get("min_delta", 0.0)),
+            mode=mode,
+        )
+
+    # Evaluate the bare module on rank 0 so no DDP collectives run on one rank
+    eval_model = model.module if isinstance(model, DDP) else model
+    is_main = context.is_main_process()
+    monitor = TrainingMonitor(
+        model=eval_model,
+        evaluate=lambda: evaluate_model(eval_model, val_loader, context.device, id2label),
+        metric=metric,
+        mode=mode,
+        early_stopping=early_stopping,
+        writer=IntermediateMetricsWriter(output_dir / INTERMEDIATE_METRICS_FILENAME) if is_main else None,
+        keep_best=early_stopping is not None,
+        is_main_process=is_main,
+        distributed=context.distributed,
+    )
+    return monitor, eval_interval
 
 
 def save_checkpoint(
@@ -268,8 +591,6 @@ def save_checkpoint(
     """
     # Check if we should skip saving
     if save_only_best and not is_best_trial:
-        import logging
-        logger = logging.getLogger(__name__)
         logger.info(
             f"Skipping checkpoint save (save_only_best=True, is_best_trial=False)"
         )
@@ -279,6 +600,9 @@ def save_checkpoint(
     checkpoint_path.mkdir(parents=True, exist_ok=True)
     # Unwrap DDP model if needed (DDP wraps the model in .module)
     unwrapped_model = model.module if isinstance(model, DDP) else model
+    # Unwrap torch.compile wrapper too so saved weights keep their names
+    if isinstance(unwrapped_model, torch.nn.Module) and hasattr(unwrapped_model, "_orig_mod"):
+        unwrapped_model = unwrapped_model._orig_mod
     unwrapped_model.save_pretrained(checkpoint_path)
     tokenizer.save_pretrained(checkpoint_path)
 
@@ -364,6 +688,10 @@ def train_model(
         config, label2id, id2label, device=context.device, checkpoint_path=checkpoint_path
     )
 
+    performance = resolve_performance_config(config)
+    if performance.compile:
+        model = torch.compile(model, mode=performance.compile_mode)
+
     # Wrap model with DDP when running in distributed mode.
     if context.distributed:
         model = DDP(
@@ -399,16 +727,22 @@ def train_model(
         val_indices=val_indices,
         use_all_data=use_all_data,
         context=context,
+        cache_dir=resolve_tokenization_cache_dir(config),
     )
 
     train_cfg = config["training"]
     epochs = max(1, train_cfg.get("epochs", 1))
-    total_steps = epochs * max(1, len(train_loader))
+    # Scheduler steps once per optimizer update, i.e. per accumulated batch group
+    total_steps = epochs * max(
+        1, math.ceil(len(train_loader) / performance.gradient_accumulation_steps))
     optimizer, scheduler, max_grad_norm = create_optimizer_and_scheduler(
         model, config, total_steps
     )
 
-    run_training_loop(
+    monitor, eval_interval = build_training_monitor(
+        config, model, val_loader, id2label, context, output_dir)
+
+    global_step = run_training_loop(
         model,
         train_loader,
         optimizer,
@@ -416,12 +750,22 @@ def train_model(
         epochs,
         max_grad_norm,
         context,
+        performance=performance,
+        eval_hook=monitor,
+        eval_interval=eval_interval,
     )
 
+    # With early stopping, keep the best evaluated weights rather than the last
+    if monitor is not None and monitor.early_stopping is not None and monitor.restore_best():
+        logger.info(f"Restored best weights ({monitor.metric}={monitor.early_stopping.best})")
+
     # Evaluate only if validation loader exists and on main process.
     metrics: Dict[str, Union[float, str, Dict[str, Dict[str, float]]]]
     if val_loader is not None and context.is_main_process():
-        metrics = evaluate_model(model, val_loader, context.device, id2label)
+        final_metrics = monitor.final_metrics(global_step) if monitor is not None else None
+        # Reuse the in-training evaluation of the current weights when there is one
+        metrics = final_metrics if final_metrics is not None else evaluate_model(
+            model, val_loader, context.device, id2label)
     elif val_loader is not None:
         # Non-main processes skip evaluation; metrics not used by callers.
         metrics = {}
@@ -1,10 +1,19 @@
 """HPO checkpoint management."""
 
 from .cleanup import CheckpointCleanupManager
-from .storage import get_storage_uri, resolve_storage_path
+from .storage import (
+    find_study_storage,
+    get_storage,
+    get_storage_uri,
+    migrate_storage,
+    resolve_storage_path,
+)
 
 __all__ = [
+    "find_study_storage",
+    "get_storage",
     "get_storage_uri",
+    "migrate_storage",
     "resolve_storage_path",
     "CheckpointCleanupManager",
 ]
@@ -146,6 +146,31 @@ class CheckpointCleanupManager:
             self.checkpoint_map[trial_num] = trial_checkpoint_paths
         self.completed_trials.append(trial_num)
 
+    def handle_trial_pruned(self, trial_num: int, trial_dir: Optional[str] = None) -> None:
+        """
+        Delete checkpoints of a pruned trial; it can never become the best.
+
+        Args:
+            trial_num: Pruned trial number.
+            trial_dir: Trial directory, for layouts not named ``trial_<n>``.
+        """
+        if not self.save_only_best:
+            return
+
+        paths = self.get_checkpoint_paths(trial_num)
+        if trial_dir:
+            cv_dir = Path(trial_dir) / "cv"
+            if cv_dir.exists():
+                for fold_dir in sorted(cv_dir.iterdir()):
+                    checkpoint_dir = fold_dir / "checkpoint"
+                    if (fold_dir.name.startswith("fold") and checkpoint_dir.exists()
+                            and checkpoint_dir not in paths):
+                        paths.append(checkpoint_dir)
+        self.checkpoint_map.pop(trial_num, None)
+        if paths:
+            logger.debug(f"Trial {trial_num} pruned, deleting {len(paths)} checkpoint(s)")
+            self.delete_checkpoint_paths(paths, trial_num)
+
     def initialize_best_trial_from_study(
         self, trial: Any, metric_value: float
     ) -> Optional[float]:
@@ -6,6 +6,8 @@ domain: hpo
 responsibility:
   - Checkpoint manager for HPO study persistence
   - Resolve checkpoint storage paths with platform awareness
+  - Open concurrent-safe Optuna storages (SQLite WAL or journal file)
+  - Migrate studies between storage backends
 inputs:
   - Output directories
   - Checkpoint configuration
@@ -24,12 +26,75 @@ lifecycle:
   status: active
 """
 
-"""Checkpoint manager for HPO study persistence."""
+"""Checkpoint manager for HPO study persistence.
 
+Two storage backends are supported, selected by the file name of
+``checkpoint.storage_path``:
+
+- ``*.db``: SQLite. Opened in WAL mode (readers never block the writer) with
+  a busy timeout and a connection pool, so parallel trial threads and other
+  processes can share the study. WAL is skipped on Google Drive, where the
+  shared-memory index does not work.
+- ``*.journal`` / ``*.log``: Optuna's append-only journal file, which needs
+  no database locking and suits several worker processes on one machine.
+"""
+
+import sqlite3
 from pathlib import Path
 from typing import Any, Dict, Optional
 
-from common.shared.platform_detection import detect_platform, resolve_platform_checkpoint_path
+from common.shared.logging_utils import get_logger
+from common.shared.platform_detection import (
+    detect_platform,
+    is_drive_path,
+    resolve_platform_checkpoint_path,
+)
+
+logger = get_logger(__name__)
+
+SQLITE_FILENAME = "study.db"
+JOURNAL_FILENAME = "study.journal"
+JOURNAL_SUFFIXES = (".journal", ".log")
+
+# SQLite connection settings (overridable under checkpoint.sqlite)
+DEFAULT_SQLITE_BUSY_TIMEOUT = 60  # seconds to wait for a lock before failing
+DEFAULT_SQLITE_POOL_SIZE = 5
+
+
+def storage_filename(checkpoint_config: Optional[Dict[str, Any]]) -> str:
+    """
+    Study storage file name for the configured backend.
+
+    Args:
+        checkpoint_config: Checkpoint configuration from HPO config.
+
+    Returns:
+        ``study.journal`` if ``storage_path`` names a journal file, else ``study.db``.
+    """
+    configured = str((checkpoint_config or {}).get("storage_path") or "")
+    return JOURNAL_FILENAME if is_journal_storage(Path(configured)) else SQLITE_FILENAME
+
+
+def is_journal_storage(storage_path: Path) -> bool:
+    """Whether a storage path is an Optuna journal file."""
+    return Path(storage_path).suffix in JOURNAL_SUFFIXES
+
+
+def find_study_storage(study_folder: Path) -> Optional[Path]:
+    """
+    Existing study storage in a study folder (journal preferred over SQLite).
+
+    Args:
+        study_folder: ``study-<hash>`` folder.
+
+    Returns:
+        Path of the storage file, or None if the folder has none.
+    """
+    for filename in (JOURNAL_FILENAME, SQLITE_FILENAME):
+        path = Path(study_folder) / filename
+        if path.exists():
+            return path
+    return None
 
 
 def resolve_storage_path(
@@ -75,8 +140,8 @@ def resolve_storage_path(
 
     # Compute study8 token (first 8 characters of hash)
     study8 = study_key_hash[:8] if len(study_key_hash) >= 8 else study_key_hash
-    # Build v2 path: {backbone}/study-{study8}/study.db
-    storage_path_str = f"{backbone}/study-{study8}/study.db"
+    # Build v2 path: {backbone}/study-{study8}/study.db (or study.journal)
+    storage_path_str = f"{backbone}/study-{study8}/{storage_filename(checkpoint_config)}"
 
     # Resolve with platform-specific optimizations
     platform = detect_platform()
@@ -93,8 +158,12 @@ def get_storage_uri(storage_path: Optional[Path]) -> Optional[str]:
     """
     Convert storage path to Optuna storage URI.
 
+    Journal files have no URI form in Optuna; for them a ``journal:///``
+    locator is returned for display only, and ``get_storage`` must be used
+    to open the study.
+
     Args:
-        storage_path: Path to SQLite database file, or None for in-memory
+        storage_path: Path to SQLite database or journal file, or None for in-memory
 
     Returns:
         Optuna storage URI string (e.g., "sqlite:///path/to/study.db"), or None
@@ -104,4 +173,171 @@ def get_storage_uri(storage_path: Optional[Path]) -> Optional[str]:
 
     # Convert to absolute path and use 3 slashes for absolute paths
     abs_path = storage_path.resolve()
-    return f"sqlite:///{abs_path}"
+    scheme = "journal" if is_journal_storage(abs_path) else "sqlite"
+    return f"{scheme}:///{abs_path}"
+
+
+def enable_sqlite_wal(storage_path: Path) -> bool:
+    """
+    Switch a SQLite study database to WAL mode (persistent in the file).
+
+    Args:
+        storage_path: SQLite database path (created if missing).
+
+    Returns:
+        True if the database is in WAL mode.
+    """
+    if is_drive_path(storage_path):
+        logger.debug(f"Keeping rollback journal for study on Drive: {storage_path}")
+        return False
+    Path(storage_path).parent.mkdir(parents=True, exist_ok=True)
+    with sqlite3.connect(str(storage_path), timeout=DEFAULT_SQLITE_BUSY_TIMEOUT) as conn:
+        mode = conn.execute("PRAGMA journal_mode=WAL").fetchone()[0]
+    return str(mode).lower() == "wal"
+
+
+def checkpoint_sqlite_wal(storage_path: Path) -> None:
+    """
+    Fold a SQLite WAL file back into the database file.
+
+    Call before copying ``study.db`` (e.g. to Drive): in WAL mode, recent
+    trials may otherwise only exist in ``study.db-wal``.
+
+    Args:
+        storage_path: SQLite database path.
+    """
+    storage_path = Path(storage_path)
+    if is_journal_storage(storage_path) or not storage_path.with_name(
+        storage_path.name + "-wal"
+    ).exists():
+        return
+    try:
+        with sqlite3.connect(str(storage_path), timeout=DEFAULT_SQLITE_BUSY_TIMEOUT) as conn:
+            conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    except sqlite3.Error as e:
+        logger.warning(f"Could not checkpoint WAL for {storage_path}: {e}")
+
+
+def get_storage(
+    storage_path: Optional[Path],
+    checkpoint_config: Optional[Dict[str, Any]] = None,
+    wal: bool = False,
+) -> Optional[Any]:
+    """
+    Open an Optuna storage for a study file.
+
+    WAL mode persists in the database file, and a WAL database copied
+    without its ``-wal`` sidecar loses recent trials, so only the sweep that
+    owns the study should pass ``wal=True``. Readers (study summaries, trial
+    metadata, warm-start sources, migration) leave the journal mode alone.
+
+    Args:
+        storage_path: ``*.db`` (SQLite) or ``*.journal`` file, or None for in-memory.
+        checkpoint_config: Checkpoint configuration; ``checkpoint.sqlite``
+            may set ``wal`` (default true, applies with ``wal=True``),
+            ``busy_timeout`` (seconds) and ``pool_size``.
+        wal: Switch a SQLite study database to WAL mode before opening it.
+
+    Returns:
+        Optuna storage instance, or None for in-memory.
+    """
+    if storage_path is None:
+        return None
+
+    from optuna.storages import RDBStorage
+
+    storage_path = Path(storage_path).resolve()
+    if is_journal_storage(storage_path):
+        storage_path.parent.mkdir(parents=True, exist_ok=True)
+        return _journal_storage(storage_path)
+
+    sqlite_cfg = (checkpoint_config or {}).get("sqlite") or {}
+    if wal and sqlite_cfg.get("wal", True):
+        enable_sqlite_wal(storage_path)
+
+    from sqlalchemy.pool import QueuePool
+
+    return RDBStorage(
+        url=get_storage_uri(storage_path),
+        engine_kwargs={
+            # Pooled connections are handed to one thread at a time
+            "connect_args": {
+                "timeout": sqlite_cfg.get("busy_timeout", DEFAULT_SQLITE_BUSY_TIMEOUT),
+                "check_same_thread": False,
+            },
+            "poolclass": QueuePool,
+            "pool_size": sqlite_cfg.get("pool_size", DEFAULT_SQLITE_POOL_SIZE),
+            "pool_pre_ping": True,
+        },
+    )
+
+
+def _journal_storage(storage_path: Path) -> Any:
+    """Optuna journal file storage (works across Optuna 3.x and 4.x names)."""
+    from optuna.storages import JournalStorage
+
+    try:
+        from optuna.storages.journal import JournalFileBackend, JournalFileOpenLock
+    except ImportError:  # optuna < 4.0
+        from optuna.storages import JournalFileOpenLock, JournalFileStorage as JournalFileBackend
+
+    # Open-file locks also work on filesystems without symlink support
+    return JournalStorage(
+        JournalFileBackend(str(storage_path), lock_obj=JournalFileOpenLock(str(storage_path)))
+    )
+
+
+def migrate_to_configured_storage(
+    storage_path: Path,
+    checkpoint_config: Optional[Dict[str, Any]] = None,
+) -> bool:
+    """
+    Migrate an existing ``study.db`` when a journal storage is configured.
+
+    Args:
+        storage_path: Configured journal storage path.
+        checkpoint_config: Checkpoint configuration.
+
+    Returns:
+        True if studies were migrated into ``storage_path``.
+    """
+    storage_path = Path(storage_path)
+    legacy_path = storage_path.with_name(SQLITE_FILENAME)
+    if not is_journal_storage(storage_path) or storage_path.exists() or not legacy_path.exists():
+        return False
+    return migrate_storage(legacy_path, storage_path, checkpoint_config) > 0
+
+
+def migrate_storage(
+    source_path: Path,
+    target_path: Path,
+    checkpoint_config: Optional[Dict[str, Any]] = None,
+) -> int:
+    """
+    Copy every study from one storage file to another (e.g. study.db to study.journal).
+
+    Trials, intermediate values and user attributes are copied; the source
+    is left untouched.
+
+    Args:
+        source_path: Existing storage file.
+        target_path: New storage file.
+        checkpoint_config: Checkpoint configuration for opening SQLite storages.
+
+    Returns:
+        Number of copied studies.
+    """
+    from optuna.study import copy_study, get_all_study_names
+
+    source = get_storage(source_path, checkpoint_config)
+    target = get_storage(target_path, checkpoint_config)
+    study_names = get_all_study_names(storage=source)
+    for study_name in study_names:
+        copy_study(
+            from_study_name=study_name,
+            from_storage=source,
+            to_storage=target,
+            to_study_name=study_name,
+        )
+    logger.info(f"Migrated {len(study_names)} study(ies) from {source_path} to {target_path}")
+    return len(study_names)
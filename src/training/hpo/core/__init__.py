@@ -2,6 +2,7 @@
 
 from .optuna_integration import (
     create_optuna_pruner,
+    create_optuna_sampler,
     import_optuna,
 )
 from .search_space import (
@@ -24,6 +25,7 @@ __all__ = [
     # Optuna integration
     "import_optuna",
     "create_optuna_pruner",
+    "create_optuna_sampler",
     # Types
     "HPOParentContext",
 ]
@@ -8,11 +8,11 @@ domain: hpo
 responsibility:
   - Optuna integration utilities for local HPO
   - Lazy import of Optuna modules
-  - Create Optuna pruners from config
+  - Create Optuna pruners and samplers from config
 inputs:
   - HPO configuration
 outputs:
-  - Optuna modules and pruners
+  - Optuna modules, pruners and samplers
 tags:
   - utility
   - hpo
@@ -34,6 +34,9 @@ from common.shared.logging_utils import get_logger
 
 logger = get_logger(__name__)
 
+SAMPLER_ALGORITHMS = ("random", "tpe", "bayesian", "qmc", "sobol", "grid")
+PRUNER_POLICIES = ("bandit", "median", "asha", "successive_halving", "hyperband", "none")
+
 # Suppress Optuna's verbose output to reduce log clutter
 # Only set if optuna is available
 try:
@@ -69,34 +72,147 @@ def create_optuna_pruner(hpo_config: Dict[str, Any]) -> Optional[Any]:
     """
     Create Optuna pruner from HPO config early termination policy.
 
+    Steps are the resource a pruner compares trials on: finished folds for
+    CV trials, evaluations for single-run trials.
+
+    Policies:
+        - ``bandit``: prune trials outside ``slack_factor`` (or
+          ``slack_amount``) of the best trial at the same step.
+        - ``median``: prune trials below the median of earlier trials.
+        - ``asha`` / ``successive_halving``: asynchronous successive halving
+          (``min_resource``, ``reduction_factor``, ``min_early_stopping_rate``).
+        - ``hyperband``: Hyperband over successive-halving brackets
+          (``min_resource``, ``max_resource``, ``reduction_factor``);
+          ``max_resource`` defaults to the number of CV folds.
+
     Args:
         hpo_config: HPO configuration dictionary.
 
     Returns:
-        Optuna pruner instance or None if no early termination configured.
+        Optuna pruner instance, or None if no early termination is configured
+        or the policy is unknown (logged as a warning).
     """
     if "early_termination" not in hpo_config:
         return None
 
     # Lazy import optuna
     _, MedianPruner, _, _ = import_optuna()
+    from optuna.pruners import HyperbandPruner, SuccessiveHalvingPruner
 
     et_cfg = hpo_config["early_termination"]
     policy = et_cfg.get("policy", "").lower()
+    n_startup_trials = et_cfg.get("delay_evaluation", 2)
+    evaluation_interval = et_cfg.get("evaluation_interval", 1)
 
     if policy == "bandit":
-        # Optuna doesn't have exact bandit pruner, use MedianPruner as closest alternative
-        # Bandit policy: stop if trial is worse than best by slack_factor
-        # MedianPruner: stop if trial is worse than median
-        return MedianPruner(
-            n_startup_trials=et_cfg.get("delay_evaluation", 2),
-            n_warmup_steps=et_cfg.get("evaluation_interval", 1),
+        if et_cfg.get("slack_factor") is None and et_cfg.get("slack_amount") is None:
+            logger.warning(
+                "[HPO] bandit early termination without slack_factor or slack_amount; "
+                "using MedianPruner"
+            )
+            return MedianPruner(
+                n_startup_trials=n_startup_trials,
+                n_warmup_steps=evaluation_interval,
+            )
+        from training.hpo.core.pruners import BanditPruner
+
+        return BanditPruner(
+            slack_factor=et_cfg.get("slack_factor"),
+            slack_amount=et_cfg.get("slack_amount") if et_cfg.get("slack_factor") is None else None,
+            n_startup_trials=n_startup_trials,
+            n_warmup_steps=evaluation_interval,
+            interval_steps=evaluation_interval,
         )
     elif policy == "median":
         return MedianPruner(
-            n_startup_trials=et_cfg.get("delay_evaluation", 2),
-            n_warmup_steps=et_cfg.get("evaluation_interval", 1),
+            n_startup_trials=n_startup_trials,
+            n_warmup_steps=evaluation_interval,
+        )
+    elif policy in ("asha", "successive_halving"):
+        return SuccessiveHalvingPruner(
+            min_resource=et_cfg.get("min_resource", "auto"),
+            reduction_factor=et_cfg.get("reduction_factor", 3),
+            min_early_stopping_rate=et_cfg.get("min_early_stopping_rate", 0),
+        )
+    elif policy == "hyperband":
+        k_fold = hpo_config.get("k_fold") or {}
+        default_max = k_fold.get("n_splits", "auto") if k_fold.get("enabled") else "auto"
+        return HyperbandPruner(
+            min_resource=et_cfg.get("min_resource", 1),
+            max_resource=et_cfg.get("max_resource", default_max),
+            reduction_factor=et_cfg.get("reduction_factor", 3),
         )
+    elif policy in ("", "none"):
+        return None
     else:
+        logger.warning(
+            f"[HPO] Unknown early_termination.policy {policy!r} (expected one of "
+            f"{PRUNER_POLICIES}); running without pruning"
+        )
         return None
 
+
+def create_optuna_sampler(hpo_config: Dict[str, Any]) -> Any:
+    """
+    Create Optuna sampler from the HPO ``sampling`` section.
+
+    Algorithms:
+        - ``random``: independent random sampling.
+        - ``tpe`` / ``bayesian``: Tree-structured Parzen Estimator
+          (``n_startup_trials`` random trials first, optional
+          ``multivariate``). Uses the constant liar when trials run in
+          parallel, so concurrent trials do not sample the same region.
+        - ``qmc`` / ``sobol``: quasi-Monte Carlo (``qmc_type``: sobol or
+          halton), covering the space more evenly than random.
+        - ``grid``: every combination of choice values and ``grid_points``
+          values per continuous range (see
+          ``SearchSpaceTranslator.to_optuna_grid``).
+
+    ``sampling.seed`` makes any sampler reproducible.
+
+    Args:
+        hpo_config: HPO configuration dictionary.
+
+    Returns:
+        Optuna sampler instance.
+
+    Raises:
+        ValueError: If the algorithm is unknown.
+    """
+    _, _, RandomSampler, _ = import_optuna()
+    from optuna.samplers import GridSampler, QMCSampler, TPESampler
+
+    sampling = hpo_config.get("sampling") or {}
+    algorithm = sampling.get("algorithm", "random").lower()
+    seed = sampling.get("seed")
+
+    if algorithm == "random":
+        return RandomSampler(seed=seed)
+    if algorithm in ("tpe", "bayesian"):
+        parallel_trials = (hpo_config.get("execution") or {}).get("parallel_trials", 1)
+        return TPESampler(
+            seed=seed,
+            n_startup_trials=sampling.get("n_startup_trials", 10),
+            multivariate=sampling.get("multivariate", False),
+            constant_liar=parallel_trials > 1,
+        )
+    if algorithm in ("qmc", "sobol"):
+        return QMCSampler(
+            qmc_type=sampling.get("qmc_type", "sobol"),
+            scramble=True,
+            seed=seed,
+        )
+    if algorithm == "grid":
+        from training.hpo.core.search_space import SearchSpaceTranslator
+
+        return GridSampler(
+            SearchSpaceTranslator.to_optuna_grid(
+                hpo_config,
+                exclude_params=["backbone"],
+                grid_points=sampling.get("grid_points", 3),
+            ),
+            seed=seed,
+        )
+    raise ValueError(
+        f"Unknown sampling.algorithm {algorithm!r}; expected one of {SAMPLER_ALGORITHMS}"
+    )
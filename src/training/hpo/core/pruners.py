@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+"""
+@meta
+name: hpo_pruners
+type: utility
+domain: hpo
+responsibility:
+  - Optuna pruners not shipped with Optuna
+  - Bandit (slack) early termination matching the Azure ML policy
+inputs:
+  - Trial intermediate values
+outputs:
+  - Pruning decisions
+tags:
+  - utility
+  - hpo
+  - optuna
+ci:
+  runnable: true
+  needs_gpu: false
+  needs_cloud: false
+lifecycle:
+  status: active
+"""
+
+"""Custom Optuna pruners for local HPO.
+
+Imported lazily by ``create_optuna_pruner``, since it requires optuna.
+"""
+
+import math
+from typing import Optional
+
+from optuna.pruners import BasePruner
+from optuna.study import Study, StudyDirection
+from optuna.trial import FrozenTrial, TrialState
+
+
+class BanditPruner(BasePruner):
+    """
+    Prune trials that fall outside a slack of the best trial at the same step.
+
+    Same rule as the Azure ML bandit policy: when maximizing, a trial is
+    pruned if its value is below ``best / (1 + slack_factor)`` (or
+    ``best - slack_amount``); when minimizing, above ``best * (1 +
+    slack_factor)`` (or ``best + slack_amount``). ``best`` is the best value
+    reported at the same step by finished (complete or pruned) trials.
+    """
+
+    def __init__(
+        self,
+        slack_factor: Optional[float] = None,
+        slack_amount: Optional[float] = None,
+        n_startup_trials: int = 0,
+        n_warmup_steps: int = 0,
+        interval_steps: int = 1,
+    ):
+        """
+        Initialize the pruner.
+
+        Args:
+            slack_factor: Allowed ratio to the best value.
+            slack_amount: Allowed absolute distance to the best value (used
+                when ``slack_factor`` is not set).
+            n_startup_trials: Completed trials required before pruning.
+            n_warmup_steps: Steps before a trial can be pruned.
+            interval_steps: Check every this many steps after warm-up.
+
+        Raises:
+            ValueError: If neither or both slack settings are given, or a
+                setting is out of range.
+        """
+        if (slack_factor is None) == (slack_amount is None):
+            raise ValueError("BanditPruner needs exactly one of slack_factor or slack_amount")
+        if (slack_factor if slack_factor is not None else slack_amount) < 0:
+            raise ValueError("BanditPruner slack must be >= 0")
+        if n_startup_trials < 0 or n_warmup_steps < 0 or interval_steps < 1:
+            raise ValueError(
+                "BanditPruner needs n_startup_trials >= 0, n_warmup_steps >= 0 "
+                "and interval_steps >= 1")
+        self._slack_factor = slack_factor
+        self._slack_amount = slack_amount
+        self._n_startup_trials = n_startup_trials
+        self._n_warmup_steps = n_warmup_steps
+        self._interval_steps = interval_steps
+
+    def _threshold(self, best: float, maximize: bool) -> float:
+        if self._slack_factor is not None:
+            return best / (1 + self._slack_factor) if maximize else best * (1 + self._slack_factor)
+        return best - self._slack_amount if maximize else best + self._slack_amount
+
+    def prune(self, study: Study, trial: FrozenTrial) -> bool:
+        """Whether ``trial`` should be pruned at its last reported step."""
+        step = trial.last_step
+        if step is None or step < self._n_warmup_steps:
+            return False
+        if (step - self._n_warmup_steps) % self._interval_steps != 0:
+            return False
+
+        completed = study.get_trials(deepcopy=False, states=(TrialState.COMPLETE,))
+        if len(completed) < self._n_startup_trials:
+            return False
+
+        value = trial.intermediate_values[step]
+        if math.isnan(value):
+            return True
+
+        finished = study.get_trials(
+            deepcopy=False, states=(TrialState.COMPLETE, TrialState.PRUNED))
+        others = [
+            t.intermediate_values[step]
+            for t in finished
+            if t.number != trial.number
+            and step in t.intermediate_values
+            and not math.isnan(t.intermediate_values[step])
+        ]
+        if not others:
+            return False
+
+        maximize = study.direction == StudyDirection.MAXIMIZE
+        best = max(others) if maximize else min(others)
+        threshold = self._threshold(best, maximize)
+        return value < threshold if maximize else value > threshold
@@ -31,6 +31,7 @@ lifecycle:
 Provides unified translation between HPO config format and both Optuna and Azure ML formats.
 """
 
+import math
 from typing import Any, Dict, List, Optional
 
 
@@ -87,6 +88,58 @@ class SearchSpaceTranslator:
 
         return params
 
+    @staticmethod
+    def to_optuna_grid(
+        hpo_config: Dict[str, Any],
+        exclude_params: Optional[List[str]] = None,
+        grid_points: int = 3,
+    ) -> Dict[str, List[Any]]:
+        """
+        Translate HPO config search space to an Optuna ``GridSampler`` grid.
+
+        Choice parameters keep their values. Continuous ranges become
+        ``grid_points`` evenly spaced values (geometrically spaced for
+        loguniform), including both ends; a parameter's own
+        ``grid_points`` overrides the default.
+
+        Args:
+            hpo_config: HPO configuration dictionary with search_space.
+            exclude_params: Optional list of parameter names to exclude from search space.
+            grid_points: Default number of values per continuous range.
+
+        Returns:
+            Dictionary mapping parameter names to their grid values.
+        """
+        grid: Dict[str, List[Any]] = {}
+        exclude_set = set(exclude_params or [])
+
+        for name, spec in hpo_config["search_space"].items():
+            if name in exclude_set:
+                continue
+
+            p_type = spec["type"]
+            if p_type == "choice":
+                grid[name] = list(spec["values"])
+                continue
+            if p_type not in ("uniform", "loguniform"):
+                raise ValueError(f"Unsupported search space type: {p_type}")
+
+            low, high = float(spec["min"]), float(spec["max"])
+            n = int(spec.get("grid_points", grid_points))
+            if n < 1:
+                raise ValueError(f"grid_points for {name} must be >= 1, got {n}")
+            if n == 1:
+                grid[name] = [low]
+            elif p_type == "uniform":
+                grid[name] = [low + (high - low) * i / (n - 1) for i in range(n)]
+            else:
+                log_low, log_high = math.log(low), math.log(high)
+                grid[name] = [
+                    math.exp(log_low + (log_high - log_low) * i / (n - 1)) for i in range(n)
+                ]
+
+        return grid
+
     @staticmethod
     def to_azure_ml(hpo_config: Dict[str, Any]) -> Dict[str, Any]:
         """
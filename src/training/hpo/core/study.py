@@ -41,8 +41,10 @@ from common.shared.platform_detection import is_drive_path
 
 from .optuna_integration import (
     create_optuna_pruner,
+    create_optuna_sampler,
     import_optuna as _import_optuna,
 )
+from .warm_start import STUDY_FAMILY_ATTR, warm_start_study
 
 logger = get_logger(__name__)
 
@@ -159,7 +161,7 @@ class StudyManager:
         self.config_dir = config_dir
 
         # Lazy import optuna
-        self.optuna, _, self.RandomSampler, _ = _import_optuna()
+        self.optuna, _, _, _ = _import_optuna()
 
         # Extract configuration
         self.objective_metric = hpo_config["objective"]["metric"]
@@ -169,11 +171,7 @@ class StudyManager:
 
         # Create pruner and sampler
         self.pruner = create_optuna_pruner(hpo_config)
-        algorithm = hpo_config["sampling"]["algorithm"].lower()
-        if algorithm == "random":
-            self.sampler = self.RandomSampler()
-        else:
-            self.sampler = self.RandomSampler()  # Default to random
+        self.sampler = create_optuna_sampler(hpo_config)
 
         self.checkpoint_enabled = (
             checkpoint_config is not None and checkpoint_config.get(
@@ -186,6 +184,7 @@ class StudyManager:
         run_id: str,
         v2_study_folder: Optional[Path] = None,
         study_key_hash: Optional[str] = None,
+        study_family_hash: Optional[str] = None,
     ) -> Tuple[Any, str, Path, str, bool]:
         """
         Create or load Optuna study with proper resume handling.
@@ -194,13 +193,19 @@ class StudyManager:
             output_dir: Base output directory for checkpoints.
             run_id: Unique run ID for study naming.
             v2_study_folder: Optional v2 study folder path (if provided, study.db will be created here instead of legacy folder).
+            study_family_hash: Optional study family hash; recorded on the study
+                and used to find related studies for warm start.
 
         Returns:
             Tuple of (study, study_name, storage_path, storage_uri, should_resume).
         """
         # Lazy imports to avoid circular dependency
         from training.hpo.utils.helpers import create_study_name, setup_checkpoint_storage
-        from training.hpo.checkpoint.storage import get_storage_uri
+        from training.hpo.checkpoint.storage import (
+            get_storage_uri,
+            migrate_to_configured_storage,
+            storage_filename,
+        )
 
         # Resolve study_name FIRST (needed for {study_name} placeholder in storage_path)
         # Use temporary should_resume=False for initial study_name resolution
@@ -222,12 +227,15 @@ class StudyManager:
         # If v2_study_folder is provided, use it for study.db location
         if v2_study_folder and self.checkpoint_config and self.checkpoint_config.get("enabled", False):
             # Create study.db directly in v2 folder
-            storage_path = v2_study_folder / "study.db"
+            storage_path = v2_study_folder / storage_filename(self.checkpoint_config)
             storage_path.parent.mkdir(parents=True, exist_ok=True)
             storage_uri = get_storage_uri(storage_path)
 
-            # Check if storage exists
-            storage_exists = storage_path.exists()
+            # Check if storage exists (moving an existing study.db to a configured journal)
+            storage_exists = (
+                migrate_to_configured_storage(storage_path, self.checkpoint_config)
+                or storage_path.exists()
+            )
 
             # If not found in v2 folder, check if legacy folder has it (for migration)
             if not storage_exists and self.restore_from_drive is not None:
@@ -275,9 +283,16 @@ class StudyManager:
                 )
 
         if should_resume:
-            return self._load_existing_study(study_name, storage_path, storage_uri)
+            result = self._load_existing_study(study_name, storage_path, storage_uri)
         else:
-            return self._create_new_study(study_name, storage_path, storage_uri)
+            result = self._create_new_study(study_name, storage_path, storage_uri)
+
+        study, _, _, _, resumed = result
+        if not resumed:
+            warm_start_study(study, self.hpo_config, storage_path, study_family_hash)
+        elif study_family_hash and STUDY_FAMILY_ATTR not in study.user_attrs:
+            study.set_user_attr(STUDY_FAMILY_ATTR, study_family_hash)
+        return result
 
     def _load_existing_study(
         self, study_name: str, storage_path: Path, storage_uri: str
@@ -293,7 +308,7 @@ class StudyManager:
                 sampler=self.sampler,
                 pruner=self.pruner,
                 study_name=study_name,
-                storage=storage_uri,
+                storage=self._open_storage(storage_path),
                 load_if_exists=True,
             )
 
@@ -353,7 +368,7 @@ class StudyManager:
                 sampler=self.sampler,
                 pruner=self.pruner,
                 study_name=study_name,
-                storage=storage_uri,
+                storage=self._open_storage(storage_path),
                 load_if_exists=False,
             )
             return study, study_name, storage_path, storage_uri, False
@@ -380,7 +395,7 @@ class StudyManager:
                 sampler=self.sampler,
                 pruner=self.pruner,
                 study_name=study_name,
-                storage=storage_uri,
+                storage=self._open_storage(storage_path),
                 load_if_exists=load_if_exists,
             )
         except self.optuna.exceptions.DuplicatedStudyError:
@@ -443,6 +458,12 @@ class StudyManager:
 
         return study, study_name, storage_path, storage_uri, should_resume
 
+    def _open_storage(self, storage_path: Optional[Path]) -> Optional[Any]:
+        """Optuna storage for the study file (SQLite WAL or journal), None for in-memory."""
+        from training.hpo.checkpoint.storage import get_storage
+
+        return get_storage(storage_path, self.checkpoint_config, wal=True)
+
     def _mark_running_trials_as_failed(self, study: Any) -> None:
         """Mark any RUNNING trials as FAILED (they were interrupted)."""
         # Can be disabled via config or environment variable
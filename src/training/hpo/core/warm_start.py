@@ -0,0 +1,248 @@
+from __future__ import annotations
+
+"""
+@meta
+name: hpo_warm_start
+type: utility
+domain: hpo
+responsibility:
+  - Seed new Optuna studies from completed trials of related studies
+  - Check search space compatibility of transferred trials
+inputs:
+  - Related study.db files
+  - HPO configuration
+outputs:
+  - Enqueued trials in the new study
+tags:
+  - utility
+  - hpo
+  - optuna
+ci:
+  runnable: true
+  needs_gpu: false
+  needs_cloud: false
+lifecycle:
+  status: active
+"""
+
+"""Warm-start for local HPO studies.
+
+A new study (e.g. after a small data update changes the study key) is seeded
+with the best configurations of earlier studies in the same study family.
+They are enqueued, so they are re-evaluated on the current data first and
+become the observations the sampler (TPE) models from, instead of its random
+startup trials.
+"""
+
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+from common.shared.logging_utils import get_logger
+
+from .optuna_integration import import_optuna
+
+logger = get_logger(__name__)
+
+# Study user attributes identifying where a study's trials can be reused
+STUDY_FAMILY_ATTR = "study_family_hash"
+WARM_START_SOURCE_ATTR = "warm_start_source"
+
+
+def is_compatible_params(
+    params: Dict[str, Any],
+    search_space: Dict[str, Any],
+    exclude_params: Optional[Sequence[str]] = None,
+) -> bool:
+    """
+    Whether trial parameters are a valid point of the search space.
+
+    Every searched parameter must be present, choice values must still be
+    offered and continuous values must lie within the current range.
+
+    Args:
+        params: Trial parameters.
+        search_space: HPO config ``search_space`` section.
+        exclude_params: Parameters not searched (e.g. "backbone").
+
+    Returns:
+        True if the parameters can be enqueued in a study with this space.
+    """
+    exclude_set = set(exclude_params or [])
+    for name, spec in search_space.items():
+        if name in exclude_set:
+            continue
+        if name not in params:
+            return False
+        value = params[name]
+        if spec["type"] == "choice":
+            if value not in spec["values"]:
+                return False
+        elif not float(spec["min"]) <= float(value) <= float(spec["max"]):
+            return False
+    return True
+
+
+def find_related_storages(storage_path: Path) -> List[Path]:
+    """
+    Study storages of sibling v2 study folders (same backbone), newest first.
+
+    Args:
+        storage_path: The new study's ``study-<hash>/study.db`` (or journal) path.
+
+    Returns:
+        Storage files of the other ``study-*`` folders next to the study's folder.
+    """
+    from training.hpo.checkpoint.storage import find_study_storage
+
+    study_folder = Path(storage_path).parent
+    if not study_folder.name.startswith("study-"):
+        return []
+    candidates = [
+        path for path in (
+            find_study_storage(folder) for folder in study_folder.parent.glob("study-*")
+            if folder != study_folder
+        )
+        if path is not None
+    ]
+    return sorted(candidates, key=lambda path: path.stat().st_mtime, reverse=True)
+
+
+def collect_transfer_configs(
+    storages: Sequence[Path],
+    hpo_config: Dict[str, Any],
+    direction: str,
+    study_family_hash: Optional[str],
+    require_family: bool = True,
+) -> List[Dict[str, Any]]:
+    """
+    Compatible configurations of completed trials in related studies.
+
+    Args:
+        storages: Study database paths to read.
+        hpo_config: HPO configuration of the new study.
+        direction: "maximize" or "minimize".
+        study_family_hash: Family hash of the new study.
+        require_family: Only use studies tagged with the same family hash.
+
+    Returns:
+        List of ``{"params", "value", "source"}`` dicts.
+    """
+    import_optuna()
+    from optuna.study import get_all_study_names, load_study
+    from optuna.trial import TrialState
+    from training.hpo.checkpoint.storage import get_storage
+
+    configs = []
+    for storage in storages:
+        if not Path(storage).exists():
+            logger.warning(f"[Warm start] Source study not found: {storage}")
+            continue
+        try:
+            source_storage = get_storage(Path(storage))
+            study_names = get_all_study_names(storage=source_storage)
+        except Exception as e:
+            logger.debug(f"[Warm start] Could not read {storage}: {e}")
+            continue
+
+        for study_name in study_names:
+            source = load_study(study_name=study_name, storage=source_storage)
+            if require_family and (
+                study_family_hash is None
+                or source.user_attrs.get(STUDY_FAMILY_ATTR) != study_family_hash
+            ):
+                continue
+            if source.direction.name.lower() != direction:
+                continue
+            for trial in source.get_trials(deepcopy=False, states=(TrialState.COMPLETE,)):
+                if trial.value is not None and is_compatible_params(
+                    trial.params, hpo_config["search_space"], exclude_params=["backbone"]
+                ):
+                    configs.append({
+                        "params": {k: v for k, v in trial.params.items() if k != "backbone"},
+                        "value": trial.value,
+                        "source": f"{study_name}#{trial.number}",
+                    })
+    return configs
+
+
+def select_transfer_configs(
+    configs: Sequence[Dict[str, Any]], direction: str, max_trials: int
+) -> List[Dict[str, Any]]:
+    """
+    Best distinct configurations, best first.
+
+    Args:
+        configs: Configurations from ``collect_transfer_configs``.
+        direction: "maximize" or "minimize".
+        max_trials: Maximum number of configurations to keep.
+
+    Returns:
+        Up to ``max_trials`` configurations with distinct parameters.
+    """
+    ranked = sorted(configs, key=lambda c: c["value"], reverse=direction == "maximize")
+    selected, seen = [], set()
+    for config in ranked:
+        key = tuple(sorted(config["params"].items()))
+        if key not in seen:
+            seen.add(key)
+            selected.append(config)
+        if len(selected) == max_trials:
+            break
+    return selected
+
+
+def warm_start_study(
+    study: Any,
+    hpo_config: Dict[str, Any],
+    storage_path: Optional[Path],
+    study_family_hash: Optional[str] = None,
+) -> int:
+    """
+    Enqueue the best configurations of related studies into a new study.
+
+    Configured by the HPO ``warm_start`` section: ``enabled``,
+    ``max_trials`` (default 5) and ``sources`` (extra study.db paths, used
+    without the family check). Sibling study folders of the same backbone
+    are used when they carry the same ``study_family_hash``.
+
+    Args:
+        study: Newly created Optuna study.
+        hpo_config: HPO configuration dictionary.
+        storage_path: The study's database path (used to find sibling studies).
+        study_family_hash: Family hash of the study, recorded on it for
+            future warm starts.
+
+    Returns:
+        Number of enqueued trials.
+    """
+    if study_family_hash:
+        study.set_user_attr(STUDY_FAMILY_ATTR, study_family_hash)
+
+    ws_cfg = hpo_config.get("warm_start") or {}
+    if not ws_cfg.get("enabled", False) or study.trials:
+        return 0
+
+    direction = hpo_config["objective"].get("direction", "maximize")
+    configs = []
+    if storage_path is not None:
+        configs += collect_transfer_configs(
+            find_related_storages(storage_path), hpo_config, direction, study_family_hash)
+    explicit = [Path(path) for path in ws_cfg.get("sources") or []]
+    if explicit:
+        configs += collect_transfer_configs(
+            explicit, hpo_config, direction, study_family_hash, require_family=False)
+    configs = select_transfer_configs(configs, direction, ws_cfg.get("max_trials", 5))
+
+    for config in configs:
+        study.enqueue_trial(
+            config["params"],
+            user_attrs={WARM_START_SOURCE_ATTR: config["source"]},
+            skip_if_exists=True,
+        )
+    if configs:
+        study.set_user_attr("warm_start_trials", len(configs))
+        logger.info(
+            f"[HPO] Warm start: enqueued {len(configs)} configurations from related studies "
+            f"(best previous value {configs[0]['value']:.4f})"
+        )
+    return len(configs)
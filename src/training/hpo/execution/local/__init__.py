@@ -1,6 +1,7 @@
 """Local HPO execution."""
 
 from .cv import run_training_trial_with_cv
+from .inprocess import InProcessTrialRunner, resolve_trial_execution_mode
 from .sweep import run_local_hpo_sweep
 from .trial import TrialExecutor, run_training_trial
 
@@ -9,5 +10,7 @@ __all__ = [
     "run_training_trial_with_cv",
     "TrialExecutor",
     "run_training_trial",
+    "InProcessTrialRunner",
+    "resolve_trial_execution_mode",
 ]
 
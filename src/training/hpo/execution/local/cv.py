@@ -31,12 +31,15 @@ lifecycle:
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple, TypedDict
 import json
+import threading
 from datetime import datetime
 
 import mlflow
 import numpy as np
 from common.shared.logging_utils import get_logger
 
+from .inprocess import resolve_trial_execution_mode
+from .parallel import WorkerPool, get_worker_pool
 from .trial import run_training_trial
 
 logger = get_logger(__name__)
@@ -313,6 +316,57 @@ def _write_trial_metadata(
     return trial_base_dir_abs
 
 
+class FoldPruningReporter:
+    """
+    Reports CV progress to an Optuna trial and decides when to stop folding.
+
+    Fold means are reported in fold order: step k is the mean of folds
+    0..k-1, reported once all of them have finished. Trials are compared at
+    equal fold counts, the pruner can act right after the first fold, and
+    with parallel folds the reported values do not depend on which fold
+    happens to finish first. ``report`` may be called from several worker
+    threads; calls are serialized.
+    """
+
+    def __init__(self, trial: Optional[Any]):
+        """
+        Initialize the reporter.
+
+        Args:
+            trial: Optuna trial to report to (None disables pruning).
+        """
+        self.trial = trial
+        self.fold_metrics: Dict[int, float] = {}
+        self.pruned = False
+        self._reported_steps = 0
+        self._lock = threading.Lock()
+
+    def report(self, fold_idx: int, metric: float) -> None:
+        """
+        Record a finished fold and ask the pruner whether to continue.
+
+        Args:
+            fold_idx: Finished fold index.
+            metric: The fold's objective metric.
+        """
+        with self._lock:
+            self.fold_metrics[fold_idx] = metric
+            if self.trial is None:
+                return
+            # Report every step whose folds have now all finished
+            while not self.pruned and self._reported_steps in self.fold_metrics:
+                self._reported_steps += 1
+                step = self._reported_steps
+                mean = float(np.mean([self.fold_metrics[i] for i in range(step)]))
+                self.trial.report(mean, step=step)
+                if self.trial.should_prune():
+                    self.pruned = True
+                    logger.info(
+                        f"[CV] Trial {self.trial.number} pruned after {step} fold(s) "
+                        f"(mean={mean:.4f})"
+                    )
+
+
 def _execute_cv_folds(
     trial_params: Dict[str, Any],
     dataset_path: str,
@@ -326,39 +380,62 @@ def _execute_cv_folds(
     trial_base_dir: Path,
     trial_run_id: Optional[str],
     hpo_parent_run_id: Optional[str],
+    execution_mode: str = "subprocess",
+    worker_pool: Optional[WorkerPool] = None,
+    reporter: Optional[FoldPruningReporter] = None,
 ) -> List[float]:
     """
     Execute training for each CV fold.
 
+    With a parallel ``worker_pool``, folds run concurrently as subprocesses,
+    each on its own worker slot (device and thread limits). With a
+    ``reporter``, folds that have not started when the trial is pruned are
+    skipped: each fold checks for pruning once it holds a worker slot, right
+    before training. Folds already running in parallel always finish, so
+    pruning saves less with more workers (nothing when every fold gets a
+    slot up front).
+
     Returns:
-        List of metrics for each fold.
+        List of metrics for each finished fold, in fold order.
     """
-    fold_metrics = []
+    reporter = reporter or FoldPruningReporter(None)
 
-    for fold_idx, (train_indices, val_indices) in enumerate(fold_splits):
-        # Construct fold-specific output directory
-        fold_output_dir = trial_base_dir / "cv" / f"fold{fold_idx}"
+    # Fold runs should always be direct children of the HPO parent run,
+    # not the trial run, to maintain proper hierarchy in MLflow
+    fold_parent_id = hpo_parent_run_id if hpo_parent_run_id else trial_run_id
 
-        # Run training for this fold
-        # Fold runs should always be direct children of the HPO parent run,
-        # not the trial run, to maintain proper hierarchy in MLflow
-        fold_parent_id = hpo_parent_run_id if hpo_parent_run_id else trial_run_id
-        fold_metric = run_training_trial(
+    def run_fold(fold_idx: int, env_overrides: Optional[Dict[str, str]] = None) -> Optional[float]:
+        # Runs once the fold holds a worker slot, so a fold queued behind
+        # busy slots is dropped if the trial was pruned in the meantime
+        if reporter.pruned:
+            return None
+        metric = run_training_trial(
             trial_params=trial_params,
             dataset_path=dataset_path,
             config_dir=config_dir,
             backbone=backbone,
-            output_dir=fold_output_dir,
+            output_dir=trial_base_dir / "cv" / f"fold{fold_idx}",
             train_config=train_config,
             mlflow_experiment_name=mlflow_experiment_name,
             objective_metric=objective_metric,
             fold_idx=fold_idx,
             fold_splits_file=fold_splits_file,
             parent_run_id=fold_parent_id,
+            execution_mode=execution_mode,
+            env_overrides=env_overrides,
         )
-        fold_metrics.append(fold_metric)
+        reporter.report(fold_idx, metric)
+        return metric
 
-    return fold_metrics
+    if worker_pool is not None and worker_pool.parallel:
+        fold_metrics = worker_pool.map([
+            lambda slot, fold_idx=fold_idx: run_fold(fold_idx, slot.env())
+            for fold_idx in range(len(fold_splits))
+        ])
+    else:
+        fold_metrics = [run_fold(fold_idx) for fold_idx in range(len(fold_splits))]
+
+    return [metric for metric in fold_metrics if metric is not None]
 
 def run_training_trial_with_cv(
     trial_params: Dict[str, Any],
@@ -377,6 +454,7 @@ def run_training_trial_with_cv(
     data_config: Optional[Dict[str, Any]] = None,
     hpo_config: Optional[Dict[str, Any]] = None,
     benchmark_config: Optional[Dict[str, Any]] = None,
+    trial: Optional[Any] = None,
 ) -> Tuple[float, List[float]]:
     """
     Run training trial with k-fold cross-validation.
@@ -399,11 +477,17 @@ def run_training_trial_with_cv(
         hpo_parent_run_id: Optional HPO parent run ID to create trial run as child.
         study_key_hash: Optional study key hash from parent run (for grouping tags).
         study_family_hash: Optional study family hash from parent run (for grouping tags).
+        trial: Optional Optuna trial; each fold's running mean is reported to
+            it and folds not yet started are skipped once its pruner says so.
 
     Returns:
         Tuple of (average_metric, fold_metrics) where:
         - average_metric: Average metric across all folds
         - fold_metrics: List of metrics for each fold
+
+    Raises:
+        optuna.TrialPruned: If the trial was pruned; the trial run is marked
+            KILLED and ``trial_dir`` is set as a trial user attribute.
     """
     # Create trial-level run (child of HPO parent) if parent is provided
     trial_run_id = _create_trial_run(
@@ -458,6 +542,7 @@ def run_training_trial_with_cv(
     )
 
     # Execute CV folds
+    reporter = FoldPruningReporter(trial)
     fold_metrics = _execute_cv_folds(
         trial_params,
         dataset_path,
@@ -471,8 +556,21 @@ def run_training_trial_with_cv(
         trial_base_dir,
         trial_run_id,
         hpo_parent_run_id,
+        execution_mode=resolve_trial_execution_mode(hpo_config),
+        worker_pool=get_worker_pool(hpo_config),
+        reporter=reporter,
     )
 
+    if reporter.pruned:
+        if trial_run_id:
+            _log_pruned_trial_run(trial_run_id, objective_metric, reporter.fold_metrics)
+        trial.set_user_attr("trial_dir", str(trial_base_dir))
+        from training.hpo.core.optuna_integration import import_optuna
+
+        optuna, _, _, _ = import_optuna()
+        raise optuna.TrialPruned(
+            f"Pruned after {len(reporter.fold_metrics)}/{len(fold_splits)} folds")
+
     # Calculate average metric
     average_metric = np.mean(fold_metrics)
 
@@ -699,23 +797,28 @@ def _log_cv_metrics_to_trial_run(
 ) -> None:
     """Log aggregated CV metrics to trial run."""
     try:
-        from infrastructure.tracking.mlflow.client import create_mlflow_client
-        client = create_mlflow_client()
-
-        # Log aggregated metrics
-        client.log_metric(trial_run_id, objective_metric, average_metric)
-        client.log_metric(trial_run_id, "cv_std", float(np.std(fold_metrics)))
-        client.log_metric(trial_run_id, "cv_mean", average_metric)
-
-        # Log individual fold metrics
+        from infrastructure.tracking.mlflow.batch_writer import get_tracking_writer
+        writer = get_tracking_writer()
+
+        # Aggregated and individual fold metrics
+        metrics = {
+            objective_metric: average_metric,
+            "cv_std": float(np.std(fold_metrics)),
+            "cv_mean": average_metric,
+        }
         for i, fold_metric in enumerate(fold_metrics):
-            client.log_metric(
-                trial_run_id, f"fold_{i}_{objective_metric}", fold_metric)
+            metrics[f"fold_{i}_{objective_metric}"] = fold_metric
+        writer.log_metrics(metrics, run_id=trial_run_id)
 
         # Log hyperparameters to trial run
-        for param_name, param_value in trial_params.items():
-            if param_name not in ["trial_number", "run_id", "backbone"]:
-                client.log_param(trial_run_id, param_name, param_value)
+        writer.log_params(
+            {
+                param_name: param_value
+                for param_name, param_value in trial_params.items()
+                if param_name not in ["trial_number", "run_id", "backbone"]
+            },
+            run_id=trial_run_id,
+        )
 
         # End the trial run to mark it as completed
         trial_number = trial_params.get('trial_number', 'unknown')
@@ -724,3 +827,30 @@ def _log_cv_metrics_to_trial_run(
     except Exception as e:
         logger.warning(f"Could not log metrics to trial run: {e}")
 
+
+def _log_pruned_trial_run(
+    trial_run_id: str,
+    objective_metric: str,
+    fold_metrics: Dict[int, float],
+) -> None:
+    """Log finished folds to a pruned trial run and mark it KILLED."""
+    try:
+        from infrastructure.tracking.mlflow.batch_writer import get_tracking_writer
+
+        metrics = {
+            f"fold_{i}_{objective_metric}": fold_metric
+            for i, fold_metric in sorted(fold_metrics.items())
+        }
+        if fold_metrics:
+            metrics["cv_partial_mean"] = float(np.mean(list(fold_metrics.values())))
+        get_tracking_writer().log_metrics(metrics, run_id=trial_run_id)
+
+        from infrastructure.tracking.mlflow import terminate_run_safe
+        terminate_run_safe(
+            trial_run_id,
+            status="KILLED",
+            tags={"pruned": "true", "pruned_after_folds": str(len(fold_metrics))},
+            check_status=True,
+        )
+    except Exception as e:
+        logger.warning(f"Could not mark pruned trial run: {e}")
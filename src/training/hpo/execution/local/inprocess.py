@@ -0,0 +1,226 @@
+from __future__ import annotations
+
+"""
+@meta
+name: hpo_inprocess_trial_execution
+type: script
+domain: hpo
+responsibility:
+  - Execute HPO training trials inside the calling process
+  - Reuse loaded datasets, configs, tokenizers and backbone weights across trials and folds
+inputs:
+  - Training command arguments
+  - Training environment variables
+outputs:
+  - Trial metrics and checkpoints (written to the trial output directory)
+tags:
+  - execution
+  - hpo
+  - training
+ci:
+  runnable: true
+  needs_gpu: true
+  needs_cloud: false
+lifecycle:
+  status: active
+"""
+
+"""In-process trial execution for local HPO.
+
+Runs the same training entry point as the ``training.cli.train`` subprocess,
+with the same arguments and environment, but in the current interpreter so
+imports, YAML configs, the dataset and pretrained weights are loaded once
+per sweep instead of once per fold.
+"""
+import gc
+import os
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from common.shared.argument_parsing import validate_config_dir
+from common.shared.logging_utils import get_logger
+
+from .parallel import resolve_worker_slots
+
+logger = get_logger(__name__)
+
+EXECUTION_MODES = ("in_process", "subprocess")
+
+# Variables run_training writes itself; restored along with the run's overrides
+_TRAINING_WRITTEN_KEYS = ("MLFLOW_TRIAL_NUMBER", "MLFLOW_FOLD_IDX")
+
+# CUDA and the BLAS/OpenMP thread pools are already initialized in this
+# process, so these only take effect in a training subprocess
+_PLACEMENT_ENV_KEYS = (
+    "CUDA_VISIBLE_DEVICES", "OMP_NUM_THREADS", "MKL_NUM_THREADS", "OPENBLAS_NUM_THREADS")
+
+
+def resolve_trial_execution_mode(hpo_config: Optional[Dict[str, Any]]) -> str:
+    """
+    Resolve how HPO trials are executed from the ``execution`` section.
+
+    Parallel worker slots each run their own training subprocess, so
+    ``in_process`` only applies when ``parallel_workers`` resolves to a
+    single worker; otherwise trials run as subprocesses.
+
+    Args:
+        hpo_config: HPO configuration dictionary.
+
+    Returns:
+        "in_process" or "subprocess" (default).
+
+    Raises:
+        ValueError: If the configured mode is unknown.
+    """
+    mode = ((hpo_config or {}).get("execution") or {}).get("mode", "subprocess")
+    if mode not in EXECUTION_MODES:
+        raise ValueError(f"hpo execution.mode must be one of {EXECUTION_MODES}, got {mode!r}")
+    if mode == "in_process" and len(resolve_worker_slots(hpo_config)) > 1:
+        return "subprocess"
+    return mode
+
+
+@contextmanager
+def _temporary_environ(
+    overrides: Dict[str, str],
+    restore_keys: Tuple[str, ...] = (),
+) -> Iterator[None]:
+    """
+    Set ``overrides`` in ``os.environ`` for the duration of the block.
+
+    Only the overridden keys and ``restore_keys`` are put back afterwards
+    (removed if they were unset); every other variable is left alone.
+    """
+    saved = {key: os.environ.get(key) for key in {*overrides, *restore_keys}}
+    os.environ.update(overrides)
+    try:
+        yield
+    finally:
+        for key, value in saved.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+
+
+class InProcessTrialRunner:
+    """Runs training commands in the current process with warm caches."""
+
+    def __init__(self) -> None:
+        self._base_configs: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._datasets: Dict[str, Dict[str, Any]] = {}
+        # Environment overrides are process-wide, so concurrent trials train
+        # one at a time
+        self._lock = threading.Lock()
+
+    def _base_config(self, config_dir: Path, backbone: str, data_asset: str) -> Dict[str, Any]:
+        """Training config without command-line overrides, read once per backbone."""
+        from training.cli.cli import parse_training_arguments
+        from training.config import build_training_config
+
+        key = (str(config_dir), backbone)
+        if key not in self._base_configs:
+            base_args = parse_training_arguments([
+                "--data-asset", data_asset,
+                "--config-dir", str(config_dir),
+                "--backbone", backbone,
+            ])
+            self._base_configs[key] = build_training_config(base_args, config_dir)
+        return self._base_configs[key]
+
+    def _dataset(self, data_asset: str) -> Dict[str, Any]:
+        """Dataset loaded once per path."""
+        from data.loaders import load_dataset
+
+        if data_asset not in self._datasets:
+            self._datasets[data_asset] = load_dataset(data_asset)
+        return self._datasets[data_asset]
+
+    def supports(self, command: List[str]) -> bool:
+        """
+        Whether the command can run in-process.
+
+        Multi-GPU (DDP) runs spawn one process per device, so they keep using
+        the subprocess launcher.
+
+        Args:
+            command: Training command built by ``build_training_command``.
+        """
+        from training.cli.cli import parse_training_arguments
+        from training.config import resolve_distributed_config
+        from training.execution.distributed import detect_hardware, should_use_ddp
+
+        args = parse_training_arguments(command[3:])
+        config_dir = validate_config_dir(args.config_dir)
+        config = self._base_config(config_dir, args.backbone, args.data_asset)
+        _, device_count = detect_hardware()
+        return not should_use_ddp(resolve_distributed_config(config), device_count)
+
+    def run(self, command: List[str], env: Dict[str, str]) -> None:
+        """
+        Run a training command in this process.
+
+        Args:
+            command: Training command built by ``build_training_command``
+                (``[python, "-m", "training.cli.train", *args]``).
+            env: Environment built by ``setup_training_environment``; the
+                variables that differ from ``os.environ`` are set for the
+                duration of the run and restored afterwards.
+
+        Raises:
+            ValueError: If ``env`` changes device or thread variables, which
+                cannot take effect in a running process (run those trials
+                as subprocesses, as parallel worker slots do).
+        """
+        overrides = {key: value for key, value in env.items() if os.environ.get(key) != value}
+        placement = sorted(key for key in overrides if key in _PLACEMENT_ENV_KEYS)
+        if placement:
+            raise ValueError(
+                f"{placement} cannot be changed for an in-process run; "
+                "use execution.mode: subprocess to pin devices or thread counts")
+
+        from training.cli.cli import parse_training_arguments
+        from training.config import build_training_config
+        from training.core.model import enable_pretrained_cache
+        from training.orchestrator import run_training
+
+        args = parse_training_arguments(command[3:])
+        config_dir = validate_config_dir(args.config_dir)
+        config = build_training_config(
+            args, config_dir,
+            base_config=self._base_config(config_dir, args.backbone, args.data_asset),
+        )
+        dataset = self._dataset(args.data_asset)
+        enable_pretrained_cache()
+
+        import torch
+
+        try:
+            with self._lock, _temporary_environ(overrides, _TRAINING_WRITTEN_KEYS):
+                run_training(args, prebuilt_config=config, dataset=dataset)
+        finally:
+            # Release the trial's model and optimizer before the next one starts
+            gc.collect()
+            if torch.cuda.is_available():
+                torch.cuda.empty_cache()
+
+    def clear(self) -> None:
+        """Drop cached configs, datasets and pretrained weights."""
+        from training.core.model import clear_pretrained_cache
+
+        self._base_configs.clear()
+        self._datasets.clear()
+        clear_pretrained_cache()
+
+
+_runner: Optional[InProcessTrialRunner] = None
+
+
+def get_in_process_runner() -> InProcessTrialRunner:
+    """Process-wide runner, so caches survive across trials of a sweep."""
+    global _runner
+    if _runner is None:
+        _runner = InProcessTrialRunner()
+    return _runner
@@ -0,0 +1,244 @@
+from __future__ import annotations
+
+"""
+@meta
+name: hpo_parallel_execution
+type: utility
+domain: hpo
+responsibility:
+  - Run CV folds and HPO trials concurrently on a pool of worker slots
+  - Assign a device and CPU thread budget to each worker
+inputs:
+  - HPO execution configuration
+  - Fold or trial tasks
+outputs:
+  - Task results in submission order
+tags:
+  - execution
+  - hpo
+  - parallel
+ci:
+  runnable: true
+  needs_gpu: false
+  needs_cloud: false
+lifecycle:
+  status: active
+"""
+
+"""Worker-pool scheduling for parallel CV folds and trials.
+
+Each worker slot owns one device (a GPU, or a group of CPU cores) and runs
+one training subprocess at a time with ``CUDA_VISIBLE_DEVICES`` and thread
+limits set for it. A single pool is shared by every trial of a sweep, so
+folds of concurrently running trials never oversubscribe the machine.
+"""
+import os
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, TypeVar
+
+from common.shared.logging_utils import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+# Minimum CPU threads per worker when the worker count is derived automatically
+DEFAULT_MIN_THREADS_PER_WORKER = 4
+
+
+@dataclass(frozen=True)
+class WorkerSlot:
+    """A device and CPU thread budget for one concurrent training run."""
+
+    index: int
+    num_threads: int
+    gpu: Optional[int] = None
+
+    def env(self) -> Dict[str, str]:
+        """Environment overrides confining a training subprocess to this slot."""
+        threads = str(self.num_threads)
+        env = {
+            "OMP_NUM_THREADS": threads,
+            "MKL_NUM_THREADS": threads,
+            "OPENBLAS_NUM_THREADS": threads,
+            # Fast tokenizers would otherwise start a thread per core per worker
+            "TOKENIZERS_PARALLELISM": "false",
+        }
+        # Hide GPUs from CPU slots too, so a CPU worker never grabs a device
+        env["CUDA_VISIBLE_DEVICES"] = str(self.gpu) if self.gpu is not None else ""
+        return env
+
+
+def _gpu_count() -> int:
+    try:
+        import torch
+    except ImportError:
+        return 0
+    return torch.cuda.device_count() if torch.cuda.is_available() else 0
+
+
+def resolve_worker_slots(
+    hpo_config: Optional[Dict[str, Any]],
+    cpu_count: Optional[int] = None,
+    gpu_count: Optional[int] = None,
+) -> List[WorkerSlot]:
+    """
+    Resolve worker slots from the HPO ``execution`` section.
+
+    ``parallel_workers: "auto"`` means one worker per GPU, or on CPU-only
+    hosts one worker per ``threads_per_worker`` cores (default 4). Workers
+    share GPUs round-robin when there are more workers than GPUs. CPU
+    threads are split evenly unless ``threads_per_worker`` is set.
+
+    Args:
+        hpo_config: HPO configuration dictionary.
+        cpu_count: CPU cores to divide (default: ``os.cpu_count()``).
+        gpu_count: Visible GPUs (default: detected with torch).
+
+    Returns:
+        Worker slots; a single slot means sequential execution.
+
+    Raises:
+        ValueError: If ``parallel_workers`` or ``threads_per_worker`` is invalid.
+    """
+    exec_cfg = (hpo_config or {}).get("execution") or {}
+    workers_cfg = exec_cfg.get("parallel_workers", 1)
+    threads_cfg = exec_cfg.get("threads_per_worker", "auto")
+    cpu_count = cpu_count if cpu_count is not None else (os.cpu_count() or 1)
+    gpu_count = gpu_count if gpu_count is not None else _gpu_count()
+
+    if threads_cfg != "auto" and (not isinstance(threads_cfg, int) or threads_cfg < 1):
+        raise ValueError(f"threads_per_worker must be 'auto' or >= 1, got {threads_cfg!r}")
+
+    if workers_cfg == "auto":
+        if gpu_count > 0:
+            num_workers = gpu_count
+        else:
+            per_worker = threads_cfg if threads_cfg != "auto" else DEFAULT_MIN_THREADS_PER_WORKER
+            num_workers = max(1, cpu_count // per_worker)
+    elif isinstance(workers_cfg, int) and workers_cfg >= 1:
+        num_workers = workers_cfg
+    else:
+        raise ValueError(f"parallel_workers must be 'auto' or >= 1, got {workers_cfg!r}")
+
+    num_threads = threads_cfg if threads_cfg != "auto" else max(1, cpu_count // num_workers)
+    return [
+        WorkerSlot(index=i, num_threads=num_threads, gpu=i % gpu_count if gpu_count else None)
+        for i in range(num_workers)
+    ]
+
+
+class WorkerPool:
+    """Runs tasks concurrently, each holding one worker slot while it runs."""
+
+    def __init__(self, slots: Sequence[WorkerSlot]):
+        """
+        Initialize the pool.
+
+        Args:
+            slots: Worker slots; tasks run at most ``len(slots)`` at a time.
+        """
+        if not slots:
+            raise ValueError("WorkerPool needs at least one slot")
+        self.slots = list(slots)
+        self._free: "queue.Queue[WorkerSlot]" = queue.Queue()
+        for slot in self.slots:
+            self._free.put(slot)
+        self._executor = ThreadPoolExecutor(
+            max_workers=len(self.slots), thread_name_prefix="hpo-worker")
+
+    @property
+    def parallel(self) -> bool:
+        """Whether tasks can run concurrently."""
+        return len(self.slots) > 1
+
+    def _run_on_slot(self, task: Callable[[WorkerSlot], T]) -> T:
+        slot = self._free.get()
+        try:
+            return task(slot)
+        finally:
+            self._free.put(slot)
+
+    def map(self, tasks: Sequence[Callable[[WorkerSlot], T]]) -> List[T]:
+        """
+        Run tasks on free slots and wait for all of them.
+
+        Args:
+            tasks: Callables receiving the slot they run on.
+
+        Returns:
+            Task results in submission order.
+
+        Raises:
+            Exception: The first task failure (in submission order), after
+                the remaining tasks have finished.
+        """
+        futures = [self._executor.submit(self._run_on_slot, task) for task in tasks]
+        errors = [f.exception() for f in futures]
+        for error in errors:
+            if error is not None:
+                raise error
+        return [f.result() for f in futures]
+
+
+_pools: Dict[Tuple[WorkerSlot, ...], WorkerPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_worker_pool(hpo_config: Optional[Dict[str, Any]]) -> WorkerPool:
+    """
+    Process-wide worker pool for the HPO config's execution settings.
+
+    Trials running concurrently get the same pool, so the slot limit holds
+    across all of their folds.
+
+    Args:
+        hpo_config: HPO configuration dictionary.
+
+    Returns:
+        Shared WorkerPool.
+    """
+    slots = tuple(resolve_worker_slots(hpo_config))
+    with _pools_lock:
+        if slots not in _pools:
+            _pools[slots] = WorkerPool(slots)
+            if len(slots) > 1:
+                logger.info(
+                    f"[HPO] Running folds on {len(slots)} parallel workers "
+                    f"({slots[0].num_threads} threads each, "
+                    f"GPUs: {[s.gpu for s in slots] if slots[0].gpu is not None else 'none'})"
+                )
+                exec_cfg = (hpo_config or {}).get("execution") or {}
+                if exec_cfg.get("mode") == "in_process":
+                    # "auto" is expected to trade in-process reuse for parallelism;
+                    # an explicit worker count with in_process likely is not
+                    log = (logger.info if exec_cfg.get("parallel_workers") == "auto"
+                           else logger.warning)
+                    log(
+                        f"[HPO] {len(slots)} parallel workers: folds and trials run as "
+                        "subprocesses instead of in_process. Set parallel_workers: 1 "
+                        "to train in process."
+                    )
+        return _pools[slots]
+
+
+def resolve_parallel_trials(hpo_config: Optional[Dict[str, Any]]) -> int:
+    """
+    Number of trials Optuna runs concurrently (``execution.parallel_trials``).
+
+    Args:
+        hpo_config: HPO configuration dictionary.
+
+    Returns:
+        Number of concurrent trials (>= 1).
+
+    Raises:
+        ValueError: If the setting is not a positive integer.
+    """
+    value = ((hpo_config or {}).get("execution") or {}).get("parallel_trials", 1)
+    if not isinstance(value, int) or value < 1:
+        raise ValueError(f"parallel_trials must be >= 1, got {value!r}")
+    return value
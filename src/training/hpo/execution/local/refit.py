@@ -562,8 +562,8 @@ def _log_refit_metrics_to_mlflow(
 ) -> None:
     """Log metrics and parameters to MLflow refit run."""
     try:
-        from infrastructure.tracking.mlflow.client import create_mlflow_client
-        client = create_mlflow_client()
+        from infrastructure.tracking.mlflow.batch_writer import get_tracking_writer
+        writer = get_tracking_writer()
 
         # Split metrics into numeric (for log_metric) and string notes (for tags)
         numeric_metrics = {}
@@ -578,12 +578,10 @@ def _log_refit_metrics_to_mlflow(
                 string_notes[k] = str(v)
 
         # Log numeric metrics
-        for k, v in numeric_metrics.items():
-            client.log_metric(refit_run_id, k, v)
+        writer.log_metrics(numeric_metrics, run_id=refit_run_id)
 
         # Log string notes as tags
-        for k, v in string_notes.items():
-            client.set_tag(refit_run_id, f"note.{k}", v)
+        writer.set_tags({f"note.{k}": v for k, v in string_notes.items()}, run_id=refit_run_id)
 
         # Set explicit refit tags
         from infrastructure.naming.mlflow.tag_keys import (
@@ -595,8 +593,8 @@ def _log_refit_metrics_to_mlflow(
         tags_registry = load_tags_registry(config_dir)
         refit_tag = get_refit(config_dir)
         refit_has_validation_tag = get_refit_has_validation(config_dir)
-        client.set_tag(refit_run_id, refit_tag, "true")
-        client.set_tag(refit_run_id, refit_has_validation_tag, "false")
+        writer.set_tags(
+            {refit_tag: "true", refit_has_validation_tag: "false"}, run_id=refit_run_id)
         
         # CRITICAL: Link refit run to trial run for deterministic mapping
         # This is called after training completes, but we also try immediately after run creation
@@ -611,8 +609,10 @@ def _log_refit_metrics_to_mlflow(
         )
 
         # Log hyperparameters
-        for param_name, param_value in refit_params.items():
-            client.log_param(refit_run_id, param_name, str(param_value))
+        writer.log_params(refit_params, run_id=refit_run_id)
+
+        # Send now so the refit run is complete before its artifacts are uploaded
+        writer.flush(refit_run_id)
 
         logger.info(
             f"[REFIT] Logged metrics to MLflow (run will be marked FINISHED after artifacts are uploaded)"
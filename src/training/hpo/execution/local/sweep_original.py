@@ -66,13 +66,15 @@ from training.hpo.utils.helpers import (
 # Import from extracted modules
 from training.hpo.core.optuna_integration import import_optuna as _import_optuna, create_optuna_pruner
 from training.hpo.core.types import HPOParentContext
-from infrastructure.shared.backup import create_incremental_backup_callback
+from infrastructure.shared.backup import BackgroundBackupWorker, create_incremental_backup_callback
 # optuna imported lazily when needed (in run_local_hpo_sweep function)
+from .inprocess import resolve_trial_execution_mode
+from .parallel import get_worker_pool, resolve_parallel_trials
 from .trial import run_training_trial
 from .cv import run_training_trial_with_cv
 from .refit import run_refit_training
 from training.hpo.checkpoint.cleanup import CheckpointCleanupManager
-from training.hpo.trial.metrics import store_metrics_in_trial_attributes
+from training.hpo.trial.metrics import read_intermediate_metrics, store_metrics_in_trial_attributes
 from training.hpo.tracking.runs import create_trial_run_no_cv, finalize_trial_run_no_cv
 from training.hpo.trial.callback import create_trial_callback
 from training.hpo.core.study import StudyManager
@@ -387,8 +389,14 @@ def _run_cv_trial(
     """
     Run k-fold CV trial.
 
+    Fold results are reported to the trial as they finish, so the study's
+    pruner can stop the remaining folds.
+
     Returns:
         Average metric value across folds.
+
+    Raises:
+        optuna.TrialPruned: If the pruner stopped the trial between folds.
     """
     logger.info(f"[Trial {trial.number}] Running {len(fold_splits)}-fold CV")
 
@@ -409,6 +417,7 @@ def _run_cv_trial(
         data_config=config["data_config"],
         hpo_config=config["hpo_config"],
         benchmark_config=config["benchmark_config"],
+        trial=trial,
     )
 
     # Log CV statistics to trial user attributes
@@ -451,24 +460,62 @@ def _run_non_cv_trial(
         captured_run_id,
     )
 
-    metric_value = run_training_trial(
-        trial_params=trial_params,
-        dataset_path=config["dataset_path"],
-        config_dir=config["config_dir"],
-        backbone=config["backbone"],
-        output_dir=trial_output_dir,
-        train_config=config["train_config"],
-        mlflow_experiment_name=config["mlflow_experiment_name"],
-        objective_metric=config["objective_metric"],
-        parent_run_id=trial_run_id_for_no_cv if trial_run_id_for_no_cv else parent_context["hpo_parent_run_id"],
-    )
+    def run_trial(env_overrides: Optional[Dict[str, str]] = None) -> float:
+        return run_training_trial(
+            trial_params=trial_params,
+            dataset_path=config["dataset_path"],
+            config_dir=config["config_dir"],
+            backbone=config["backbone"],
+            output_dir=trial_output_dir,
+            train_config=config["train_config"],
+            mlflow_experiment_name=config["mlflow_experiment_name"],
+            objective_metric=config["objective_metric"],
+            parent_run_id=trial_run_id_for_no_cv if trial_run_id_for_no_cv else parent_context["hpo_parent_run_id"],
+            execution_mode=resolve_trial_execution_mode(config["hpo_config"]),
+            env_overrides=env_overrides,
+        )
+
+    # With parallel workers, concurrent trials each take a worker slot
+    worker_pool = get_worker_pool(config["hpo_config"])
+    if worker_pool.parallel:
+        metric_value = worker_pool.map([lambda slot: run_trial(slot.env())])[0]
+    else:
+        metric_value = run_trial()
 
     # Mark trial run as FINISHED after training completes
     if trial_run_id_for_no_cv:
         finalize_trial_run_no_cv(trial_run_id_for_no_cv, trial.number)
 
+    _report_training_curve(trial, trial_output_dir, config["objective_metric"], float(metric_value))
+
     return float(metric_value)
 
+
+def _report_training_curve(
+    trial: Any,
+    trial_output_dir: Path,
+    objective_metric: str,
+    metric_value: float,
+) -> None:
+    """
+    Report a finished single-run trial's learning curve to Optuna.
+
+    Each evaluation streamed during training becomes an intermediate value
+    (step = evaluation number), giving the pruner per-epoch history to
+    compare later trials against. Runs without streamed evaluations report
+    the final metric at step 0.
+    """
+    values = [
+        record["metrics"][objective_metric]
+        for record in read_intermediate_metrics(trial_output_dir)
+        if objective_metric in record.get("metrics", {})
+    ]
+    if not values:
+        trial.report(metric_value, step=0)
+        return
+    for step, value in enumerate(values, start=1):
+        trial.report(float(value), step=step)
+
 # Re-export for backward compatibility
 __all__ = [
     "run_training_trial",
@@ -582,9 +629,14 @@ def create_local_hpo_objective(
 
         if fold_splits is not None:
             # Run k-fold CV
-            metric_value = _run_cv_trial(
-                trial, trial_params, config, fold_splits, fold_splits_file, parent_context
-            )
+            try:
+                metric_value = _run_cv_trial(
+                    trial, trial_params, config, fold_splits, fold_splits_file, parent_context
+                )
+            except _import_optuna()[0].TrialPruned:
+                cleanup_manager.handle_trial_pruned(
+                    trial.number, trial.user_attrs.get("trial_dir"))
+                raise
         else:
             # Run single training (no CV)
             metric_value = _run_non_cv_trial(
@@ -604,9 +656,6 @@ def create_local_hpo_objective(
             fold_splits=fold_splits,
         )
 
-        # Report to Optuna
-        trial.report(metric_value, step=0)
-
         # Handle checkpoint cleanup
         cleanup_manager.register_trial_checkpoint(trial.number)
         early_return = cleanup_manager.handle_trial_completion(
@@ -934,10 +983,24 @@ def run_local_hpo_sweep(
             logger.warning(
                 f"Could not create v2 study folder early, will use legacy: {e}")
 
+    # Study family hash identifies related studies (other data fingerprints) for warm start
+    study_family_hash = None
+    if data_config and hpo_config:
+        try:
+            from infrastructure.naming.mlflow.hpo_keys import (
+                build_hpo_study_family_hash,
+                build_hpo_study_family_key,
+            )
+            study_family_hash = build_hpo_study_family_hash(
+                build_hpo_study_family_key(data_config, hpo_config, benchmark_config))
+        except Exception as e:
+            logger.debug(f"Could not compute study_family_hash: {e}")
+
     # Create or load study - pass v2_study_folder if available to use for study.db
     study, study_name, storage_path, storage_uri, should_resume = (
         study_manager.create_or_load_study(
-            output_dir, run_id, v2_study_folder=v2_study_folder, study_key_hash=study_key_hash)
+            output_dir, run_id, v2_study_folder=v2_study_folder, study_key_hash=study_key_hash,
+            study_family_hash=study_family_hash)
     )
 
     # Immediate backup of study.db after creation/loading (using centralized utility)
@@ -1052,6 +1115,8 @@ def run_local_hpo_sweep(
     # Calculate remaining trials
     max_trials = hpo_config["sampling"]["max_trials"]
     timeout_seconds = hpo_config["sampling"]["timeout_minutes"] * 60
+    # Concurrent trials share one worker pool for their folds (see parallel.py)
+    parallel_trials = resolve_parallel_trials(hpo_config)
 
     # Cleanup stale reservations from crashed processes
     try:
@@ -1230,14 +1295,18 @@ def run_local_hpo_sweep(
             trial_callback = create_trial_callback(
                 objective_metric, parent_run_id)
 
-            # Create incremental backup callback for study.db
+            # Create incremental backup callback for study.db (runs on a background
+            # worker so trials don't wait for Drive)
             backup_callback = None
+            backup_worker = None
             if _should_backup_to_drive(backup_to_drive, backup_enabled, storage_path):
+                backup_worker = BackgroundBackupWorker(backup_to_drive)
                 backup_callback = create_incremental_backup_callback(
                     target_path=storage_path,
                     backup_to_drive=backup_to_drive,
                     backup_enabled=backup_enabled,
                     is_directory=False,
+                    backup_worker=backup_worker,
                 )
 
             # Combine callbacks
@@ -1245,31 +1314,38 @@ def run_local_hpo_sweep(
             if backup_callback:
                 all_callbacks.append(backup_callback)
 
-            if should_resume:
-                completed_trials = len(
-                    [
-                        t for t in study.trials
-                        if t.state == optuna.trial.TrialState.COMPLETE
-                    ]
-                )
-                remaining_trials = max(0, max_trials - completed_trials)
-
-                if remaining_trials > 0:
+            try:
+                if should_resume:
+                    completed_trials = len(
+                        [
+                            t for t in study.trials
+                            if t.state == optuna.trial.TrialState.COMPLETE
+                        ]
+                    )
+                    remaining_trials = max(0, max_trials - completed_trials)
+
+                    if remaining_trials > 0:
+                        study.optimize(
+                            objective,
+                            n_trials=remaining_trials,
+                            timeout=timeout_seconds,
+                            show_progress_bar=True,
+                            n_jobs=parallel_trials,
+                            callbacks=all_callbacks,
+                        )
+                else:
                     study.optimize(
                         objective,
-                        n_trials=remaining_trials,
+                        n_trials=max_trials,
                         timeout=timeout_seconds,
                         show_progress_bar=True,
+                        n_jobs=parallel_trials,
                         callbacks=all_callbacks,
                     )
-            else:
-                study.optimize(
-                    objective,
-                    n_trials=max_trials,
-                    timeout=timeout_seconds,
-                    show_progress_bar=True,
-                    callbacks=all_callbacks,
-                )
+            finally:
+                # Wait for the last study.db backup before refit/cleanup
+                if backup_worker is not None:
+                    backup_worker.close()
 
             if parent_run_id and parent_run_handle:
                 try:
@@ -1709,6 +1785,7 @@ def run_local_hpo_sweep(
             n_trials=max_trials,
             timeout=timeout_seconds,
             show_progress_bar=True,
+            n_jobs=parallel_trials,
             callbacks=[trial_callback],
         )
 
@@ -7,7 +7,7 @@ type: script
 domain: hpo
 responsibility:
   - Execute single HPO training trial
-  - Handle subprocess execution
+  - Handle subprocess or in-process execution
   - Read trial metrics
 inputs:
   - Trial hyperparameters
@@ -29,7 +29,7 @@ lifecycle:
 
 """Trial execution for HPO training runs.
 
-Handles subprocess execution, environment setup, and metrics reading.
+Handles subprocess or in-process execution, environment setup, and metrics reading.
 Combines TrialExecutor class and run_training_trial function.
 """
 import json
@@ -50,17 +50,19 @@ from training.execution import (
     verify_training_environment,
 )
 
+from training.hpo.execution.local.inprocess import get_in_process_runner
 from training.hpo.trial.metrics import read_trial_metrics
 
 logger = get_logger(__name__)
 
 class TrialExecutor:
-    """Executes a single training trial via subprocess and returns metrics."""
+    """Executes a single training trial (in-process or via subprocess) and returns metrics."""
 
     def __init__(
         self,
         config_dir: Path,
         mlflow_experiment_name: str,
+        execution_mode: str = "subprocess",
     ):
         """
         Initialize trial executor.
@@ -68,11 +70,15 @@ class TrialExecutor:
         Args:
             config_dir: Path to configuration directory.
             mlflow_experiment_name: MLflow experiment name.
+            execution_mode: "in_process" to train in this interpreter with
+                cached datasets and weights (falls back to a subprocess for
+                multi-GPU runs), or "subprocess" for full isolation.
         """
         # Derive project root from config_dir (config_dir is ROOT_DIR / "config")
         self.root_dir = config_dir.parent
         self.config_dir = config_dir
         self.mlflow_experiment_name = mlflow_experiment_name
+        self.execution_mode = execution_mode
 
     def execute(
         self,
@@ -85,6 +91,7 @@ class TrialExecutor:
         fold_idx: Optional[int] = None,
         fold_splits_file: Optional[Path] = None,
         parent_run_id: Optional[str] = None,
+        env_overrides: Optional[Dict[str, str]] = None,
     ) -> float:
         """
         Execute training trial and return objective metric value.
@@ -99,6 +106,10 @@ class TrialExecutor:
             fold_idx: Optional fold index for cross-validation.
             fold_splits_file: Optional path to fold splits file.
             parent_run_id: Optional parent MLflow run ID for nested runs.
+            env_overrides: Optional environment variables for this run (e.g.
+                a parallel worker's device and thread limits). Forces
+                subprocess execution, since they cannot be scoped to one
+                in-process run among concurrent ones.
 
         Returns:
             Objective metric value (e.g., macro-f1).
@@ -120,6 +131,8 @@ class TrialExecutor:
             hyperparameters=trial_params,
             training_options=training_options,
         )
+        if fold_splits_file is not None:
+            args.extend(["--fold-splits-file", str(fold_splits_file)])
 
         # Set up environment using shared infrastructure
         mlflow_config = MLflowConfig(
@@ -141,17 +154,25 @@ class TrialExecutor:
             fold_config=fold_config,
             trial_config=trial_config,
         )
+        if env_overrides:
+            env.update(env_overrides)
 
         # Verify environment before running
         verify_training_environment(root_dir, env, logger)
 
-        # Run training subprocess using shared infrastructure
-        result = execute_training_subprocess(
-            command=args,
-            cwd=root_dir,
-            env=env,
-            logger_instance=logger,
-        )
+        # Worker-slot env overrides (parallel workers) need a process of their own
+        in_process = self.execution_mode == "in_process" and not env_overrides
+        runner = get_in_process_runner() if in_process else None
+        if runner is not None and runner.supports(args):
+            runner.run(args, env)
+        else:
+            # Run training subprocess using shared infrastructure
+            execute_training_subprocess(
+                command=args,
+                cwd=root_dir,
+                env=env,
+                logger_instance=logger,
+            )
 
         # Read metrics from output directory
         metrics = read_trial_metrics(
@@ -186,6 +207,8 @@ def run_training_trial(
     fold_idx: Optional[int] = None,
     fold_splits_file: Optional[Path] = None,
     parent_run_id: Optional[str] = None,
+    execution_mode: str = "subprocess",
+    env_overrides: Optional[Dict[str, str]] = None,
 ) -> float:
     """
     Execute a single training trial with given hyperparameters.
@@ -204,11 +227,13 @@ def run_training_trial(
         fold_idx: Optional fold index for cross-validation.
         fold_splits_file: Optional path to fold splits file.
         parent_run_id: Optional parent MLflow run ID for nested runs.
+        execution_mode: "in_process" or "subprocess" (see TrialExecutor).
+        env_overrides: Optional environment variables for this run.
 
     Returns:
         Objective metric value (e.g., macro-f1).
     """
-    executor = TrialExecutor(config_dir, mlflow_experiment_name)
+    executor = TrialExecutor(config_dir, mlflow_experiment_name, execution_mode=execution_mode)
     return executor.execute(
         trial_params=trial_params,
         dataset_path=dataset_path,
@@ -219,4 +244,5 @@ def run_training_trial(
         fold_idx=fold_idx,
         fold_splits_file=fold_splits_file,
         parent_run_id=parent_run_id,
+        env_overrides=env_overrides,
     )
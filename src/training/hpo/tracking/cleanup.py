@@ -21,6 +21,10 @@ from common.constants.mlflow import (
 )
 from common.shared.logging_utils import get_logger
 from common.types import MLflowRun, HPOConfigDict
+from infrastructure.tracking.mlflow.batch_writer import (
+    flush_tracking_writer,
+    get_tracking_writer,
+)
 from infrastructure.tracking.mlflow.client import create_mlflow_client
 from training.hpo.core.types import HPOParentContext
 # Tag key imports moved to local scope where needed
@@ -476,7 +480,6 @@ def _find_orphaned_children(
 
 
 def _tag_interrupted_parent_and_children(
-    client: MlflowClient,
     interrupted_parents: list[MLflowRun],
     parent_to_children: Dict[str, list[MLflowRun]],
     parent_run_id: str,
@@ -484,11 +487,14 @@ def _tag_interrupted_parent_and_children(
     """
     Tag interrupted parent runs and their children.
 
+    Tags are queued on the shared tracking writer; the caller flushes them.
+
     Returns:
         Tuple of (total_tagged_parents, total_tagged_children).
     """
     from infrastructure.naming.mlflow.tag_keys import get_interrupted
 
+    writer = get_tracking_writer()
     total_tagged_parents = 0
     total_tagged_children = 0
 
@@ -510,7 +516,7 @@ def _tag_interrupted_parent_and_children(
 
         try:
             interrupted_tag = get_interrupted(None)
-            client.set_tag(run_id_to_mark, interrupted_tag, "true")
+            writer.set_tag(interrupted_tag, "true", run_id=run_id_to_mark)
             total_tagged_parents += 1
             logger.info(
                 f"[CLEANUP] Successfully tagged interrupted parent run {run_id_to_mark[:12]}... as interrupted"
@@ -557,7 +563,7 @@ def _tag_interrupted_parent_and_children(
                     f"(name: {child_name}, status: {child_status})"
                 )
                 try:
-                    client.set_tag(child_run_id, interrupted_tag, "true")
+                    writer.set_tag(interrupted_tag, "true", run_id=child_run_id)
                     tagged_children += 1
                     total_tagged_children += 1
                     logger.info(
@@ -584,7 +590,6 @@ def _tag_interrupted_parent_and_children(
 
 
 def _tag_orphaned_children(
-    client: MlflowClient,
     orphaned_children: list[MLflowRun],
     parent_run_id: str,
 ) -> int:
@@ -596,6 +601,7 @@ def _tag_orphaned_children(
     """
     from infrastructure.naming.mlflow.tag_keys import get_interrupted
 
+    writer = get_tracking_writer()
     total_tagged_orphaned = 0
 
     for child_run in orphaned_children:
@@ -616,7 +622,7 @@ def _tag_orphaned_children(
         )
         try:
             interrupted_tag = get_interrupted(None)
-            client.set_tag(child_run_id, interrupted_tag, "true")
+            writer.set_tag(interrupted_tag, "true", run_id=child_run_id)
             total_tagged_orphaned += 1
             logger.info(
                 f"[CLEANUP] Successfully tagged orphaned child run {child_run_id[:12]}... as interrupted"
@@ -739,7 +745,7 @@ def cleanup_interrupted_runs(
 
         # Tag interrupted parent runs and their children
         total_tagged_parents, total_tagged_children = _tag_interrupted_parent_and_children(
-            client, interrupted_parents, parent_to_children, parent_run_id
+            interrupted_parents, parent_to_children, parent_run_id
         )
 
         if interrupted_parents:
@@ -751,7 +757,11 @@ def cleanup_interrupted_runs(
             logger.info("[CLEANUP] No interrupted parent runs found to tag")
 
         # Tag orphaned child runs
-        total_tagged_orphaned = _tag_orphaned_children(client, orphaned_children, parent_run_id)
+        total_tagged_orphaned = _tag_orphaned_children(orphaned_children, parent_run_id)
+
+        # Send all interrupted tags as a few log_batch calls
+        if not flush_tracking_writer():
+            logger.warning("[CLEANUP] Some interrupted tags could not be set")
 
         if orphaned_children:
             logger.info(
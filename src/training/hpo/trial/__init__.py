@@ -6,10 +6,11 @@ from .meta import (
     generate_missing_trial_meta,
     generate_missing_trial_meta_for_all_studies,
 )
-from .metrics import read_trial_metrics
+from .metrics import read_intermediate_metrics, read_trial_metrics
 
 __all__ = [
     "create_trial_callback",
+    "read_intermediate_metrics",
     "read_trial_metrics",
     "extract_trial_info_from_dirname",
     "generate_missing_trial_meta",
@@ -64,13 +64,14 @@ def generate_missing_trial_meta(
     Returns:
         Number of trial_meta.json files created
     """
-    study_db_path = study_folder / "study.db"
-    if not study_db_path.exists():
-        logger.info(f"study.db not found: {study_db_path}")
+    from training.hpo.checkpoint.storage import find_study_storage, get_storage
+
+    study_db_path = find_study_storage(study_folder)
+    if study_db_path is None:
+        logger.info(f"study.db not found in {study_folder}")
         return 0
 
     study_name = study_folder.name
-    storage_uri = f"sqlite:///{study_db_path.resolve()}"
 
     # Try to import Optuna
     try:
@@ -80,7 +81,7 @@ def generate_missing_trial_meta(
         import optuna
 
     try:
-        study = optuna.load_study(study_name=study_name, storage=storage_uri)
+        study = optuna.load_study(study_name=study_name, storage=get_storage(study_db_path))
         logger.info(f"Loaded study with {len(study.trials)} trials")
     except Exception as e:
         logger.error(f"Could not load study: {e}")
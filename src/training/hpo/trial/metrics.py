@@ -27,11 +27,11 @@ lifecycle:
 
 import json
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 from common.shared.logging_utils import get_logger
 from common.shared.metrics_utils import read_all_metrics_from_file, read_metric_from_mlflow
-from common.constants import METRICS_FILENAME
+from common.constants import INTERMEDIATE_METRICS_FILENAME, METRICS_FILENAME
 
 logger = get_logger(__name__)
 
@@ -103,6 +103,34 @@ def read_trial_metrics(
     return {}
 
 
+def read_intermediate_metrics(trial_output_dir: Path) -> List[Dict[str, Any]]:
+    """
+    Read the evaluations a training run has streamed so far.
+
+    Safe to call while training is still running: a partially written last
+    line is ignored.
+
+    Args:
+        trial_output_dir: Training output directory.
+
+    Returns:
+        List of ``{"epoch", "step", "time", "metrics"}`` records in
+        evaluation order, or empty list if none were written.
+    """
+    metrics_file = trial_output_dir / INTERMEDIATE_METRICS_FILENAME
+    if not metrics_file.exists():
+        return []
+
+    records = []
+    with open(metrics_file, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                records.append(json.loads(line))
+            except json.JSONDecodeError:
+                break
+    return records
+
+
 def store_metrics_in_trial_attributes(
     trial: Any,
     output_base_dir: Path,
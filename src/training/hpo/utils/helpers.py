@@ -71,7 +71,12 @@ def setup_checkpoint_storage(
         Tuple of (storage_path, storage_uri, should_resume).
     """
     # Lazy import to avoid circular dependency
-    from training.hpo.checkpoint.storage import get_storage_uri, resolve_storage_path
+    from training.hpo.checkpoint.storage import (
+        get_storage_uri,
+        migrate_to_configured_storage,
+        resolve_storage_path,
+        storage_filename,
+    )
 
     checkpoint_config = checkpoint_config or {}
     
@@ -83,7 +88,7 @@ def setup_checkpoint_storage(
         study_folder = find_study_folder_in_backbone_dir(output_dir)
         if study_folder and study_folder.exists():
             # Use v2 folder path directly (local path, not mapped to Drive)
-            storage_path = study_folder / "study.db"
+            storage_path = study_folder / storage_filename(checkpoint_config)
             logger.debug(f"Using v2 study folder for storage: {storage_path}")
     
     # Fallback to legacy resolve_storage_path if v2 folder not found
@@ -97,6 +102,8 @@ def setup_checkpoint_storage(
     )
     
     storage_uri = get_storage_uri(storage_path)
+    if storage_path is not None:
+        migrate_to_configured_storage(storage_path, checkpoint_config)
 
     # If local checkpoint missing and restore_from_drive provided, attempt restore
     if storage_path is not None and not storage_path.exists() and restore_from_drive is not None:
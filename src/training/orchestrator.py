@@ -67,7 +67,11 @@ def log_training_parameters(config: dict, logging_adapter) -> None:
         {k: v for k, v in params.items() if v is not None})
 
 
-def run_training(args: argparse.Namespace, prebuilt_config: dict | None = None) -> None:
+def run_training(
+    args: argparse.Namespace,
+    prebuilt_config: dict | None = None,
+    dataset: dict | None = None,
+) -> None:
     """
     Run a single training process (rank-agnostic).
 
@@ -78,6 +82,7 @@ def run_training(args: argparse.Namespace, prebuilt_config: dict | None = None)
     Args:
         args: Parsed command-line arguments.
         prebuilt_config: Optional pre-built configuration dictionary.
+        dataset: Optional already loaded dataset (default: load ``args.data_asset``).
     """
     config_dir = validate_config_dir(args.config_dir)
 
@@ -103,7 +108,8 @@ def run_training(args: argparse.Namespace, prebuilt_config: dict | None = None)
     seed = config["training"].get("random_seed")
     set_seed(seed)
 
-    dataset = load_dataset(args.data_asset)
+    if dataset is None:
+        dataset = load_dataset(args.data_asset)
 
     # Get platform adapter for output paths, logging, and MLflow context
     platform_adapter = get_platform_adapter(
@@ -248,8 +254,8 @@ def run_training(args: argparse.Namespace, prebuilt_config: dict | None = None)
                 trial_number=trial_number,
                 fold_idx=fold_idx,
             )
-            # Start the child run
-            mlflow.start_run(run_id=child_run_id)
+            # Start the child run (nested when run in-process under an active HPO run)
+            mlflow.start_run(run_id=child_run_id, nested=mlflow.active_run() is not None)
             started_run_directly = True
             print(
                 f"  [Training] ✓ Started child run",
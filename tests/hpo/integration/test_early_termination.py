@@ -7,20 +7,21 @@ from unittest.mock import Mock, patch
 # Lazy import optuna to allow tests to be skipped if not available
 try:
     import optuna
-    from optuna.pruners import MedianPruner
+    from optuna.pruners import HyperbandPruner, MedianPruner, SuccessiveHalvingPruner
 except ImportError:
     optuna = None
     MedianPruner = None
     pytest.skip("optuna not available", allow_module_level=True)
 
 from training.hpo.core.optuna_integration import create_optuna_pruner
+from training.hpo.core.pruners import BanditPruner
 
 
 class TestPrunerCreation:
     """Test pruner creation from HPO config."""
 
     def test_create_pruner_bandit_policy(self):
-        """Test that bandit policy creates MedianPruner with correct parameters."""
+        """Test that bandit policy creates BanditPruner with correct parameters."""
         hpo_config = {
             "early_termination": {
                 "policy": "bandit",
@@ -33,8 +34,9 @@ class TestPrunerCreation:
         pruner = create_optuna_pruner(hpo_config)
         
         assert pruner is not None
-        assert isinstance(pruner, MedianPruner)
+        assert isinstance(pruner, BanditPruner)
         # Verify parameters are set correctly
+        assert pruner._slack_factor == 0.2
         assert pruner._n_startup_trials == 2  # delay_evaluation
         assert pruner._n_warmup_steps == 1  # evaluation_interval
 
@@ -75,11 +77,83 @@ class TestPrunerCreation:
         pruner = create_optuna_pruner(hpo_config)
         
         assert pruner is not None
-        assert isinstance(pruner, MedianPruner)
+        assert isinstance(pruner, BanditPruner)
         assert pruner._n_startup_trials == 2
         assert pruner._n_warmup_steps == 1
 
 
+class TestPrunerPolicies:
+    """Test bandit, successive halving and Hyperband pruning."""
+
+    def _study(self, pruner):
+        return optuna.create_study(direction="maximize", pruner=pruner)
+
+    def _trial(self, study, values):
+        trial = study.ask()
+        for step, value in enumerate(values, start=1):
+            trial.report(value, step=step)
+            if trial.should_prune():
+                study.tell(trial, state=optuna.trial.TrialState.PRUNED)
+                return optuna.trial.TrialState.PRUNED
+        study.tell(trial, values[-1])
+        return optuna.trial.TrialState.COMPLETE
+
+    def test_bandit_prunes_outside_slack(self):
+        """Test that the bandit pruner keeps trials within the slack of the best."""
+        study = self._study(BanditPruner(slack_factor=0.2, n_startup_trials=1))
+        self._trial(study, [0.6, 0.8])
+
+        # Thresholds are best / 1.2: 0.5 at step 1, 0.667 at step 2
+        assert self._trial(study, [0.55, 0.7]) == optuna.trial.TrialState.COMPLETE
+        assert self._trial(study, [0.45, 0.9]) == optuna.trial.TrialState.PRUNED
+        assert self._trial(study, [0.6, 0.6]) == optuna.trial.TrialState.PRUNED
+        assert study.trials[-1].last_step == 2
+
+    def test_bandit_slack_amount_minimize(self):
+        """Test slack_amount when minimizing."""
+        study = optuna.create_study(
+            direction="minimize", pruner=BanditPruner(slack_amount=0.1))
+        self._trial(study, [0.3])
+
+        assert self._trial(study, [0.38]) == optuna.trial.TrialState.COMPLETE
+        assert self._trial(study, [0.45]) == optuna.trial.TrialState.PRUNED
+
+    def test_bandit_requires_one_slack(self):
+        """Test that bandit settings are validated."""
+        with pytest.raises(ValueError):
+            BanditPruner()
+        with pytest.raises(ValueError):
+            BanditPruner(slack_factor=0.1, slack_amount=0.1)
+
+    def test_bandit_without_slack_uses_median(self):
+        """Test that a bandit policy without slack keeps the median fallback."""
+        pruner = create_optuna_pruner({"early_termination": {"policy": "bandit"}})
+
+        assert isinstance(pruner, MedianPruner)
+
+    def test_successive_halving_and_hyperband(self):
+        """Test that ASHA and Hyperband policies create Optuna's pruners."""
+        asha = create_optuna_pruner({
+            "early_termination": {"policy": "asha", "min_resource": 1, "reduction_factor": 2}
+        })
+        hyperband = create_optuna_pruner({
+            "early_termination": {"policy": "hyperband"},
+            "k_fold": {"enabled": True, "n_splits": 5},
+        })
+
+        assert isinstance(asha, SuccessiveHalvingPruner)
+        assert isinstance(hyperband, HyperbandPruner)
+        assert hyperband._max_resource == 5
+
+    def test_unknown_policy_warns(self):
+        """Test that unknown policies disable pruning with a warning."""
+        with patch("training.hpo.core.optuna_integration.logger") as mock_logger:
+            pruner = create_optuna_pruner({"early_termination": {"policy": "truncation"}})
+
+        assert pruner is None
+        assert "truncation" in mock_logger.warning.call_args[0][0]
+
+
 class TestPruningBehavior:
     """Test actual pruning behavior during study execution."""
 
@@ -423,6 +497,113 @@ class TestPruningIntegration:
         assert all(t.state == optuna.trial.TrialState.COMPLETE for t in study.trials)
 
 
+class TestFoldPruning:
+    """Test pruning between CV folds."""
+
+    def _run_folds(self, trial, fold_metric, tmp_path):
+        from training.hpo.execution.local.cv import FoldPruningReporter, _execute_cv_folds
+
+        reporter = FoldPruningReporter(trial)
+        with patch("training.hpo.execution.local.cv.run_training_trial") as mock_run_trial:
+            mock_run_trial.side_effect = lambda **kwargs: fold_metric
+            fold_metrics = _execute_cv_folds(
+                {"trial_number": trial.number}, "dataset", Path("config"), "distilbert", {},
+                "exp", "macro-f1", [([0], [1])] * 3, tmp_path / "splits.json", tmp_path,
+                None, None, reporter=reporter,
+            )
+        return reporter, fold_metrics, mock_run_trial.call_count
+
+    def test_poor_trial_pruned_after_first_fold(self, tmp_path):
+        """Test that fold means are reported per fold and remaining folds are skipped."""
+        study = optuna.create_study(
+            direction="maximize", pruner=MedianPruner(n_startup_trials=1, n_warmup_steps=1))
+
+        good = study.ask()
+        reporter, fold_metrics, calls = self._run_folds(good, 0.8, tmp_path)
+        assert not reporter.pruned and calls == 3
+        study.tell(good, float(sum(fold_metrics) / len(fold_metrics)))
+        assert study.trials[0].intermediate_values == pytest.approx({1: 0.8, 2: 0.8, 3: 0.8})
+
+        poor = study.ask()
+        reporter, fold_metrics, calls = self._run_folds(poor, 0.2, tmp_path)
+        assert reporter.pruned
+        assert calls == 1
+        assert fold_metrics == [0.2]
+
+    def test_parallel_folds_report_in_fold_order_and_skip_after_prune(self, tmp_path):
+        """Test that parallel folds report in fold order and unstarted folds are skipped."""
+        import threading
+        import time
+
+        from training.hpo.execution.local.cv import FoldPruningReporter, _execute_cv_folds
+        from training.hpo.execution.local.parallel import WorkerPool, WorkerSlot
+
+        trial = Mock(number=0)
+        trial.should_prune.return_value = True
+        reporter = FoldPruningReporter(trial)
+        fold1_done = threading.Event()
+        started = []
+
+        def run_fold(fold_idx, **kwargs):
+            started.append(fold_idx)
+            if fold_idx == 0:
+                # Finishes after fold 1, so finish order differs from fold order
+                assert fold1_done.wait(2)
+                return 0.2
+            if fold_idx == 1:
+                fold1_done.set()
+                return 0.9
+            # Fold 2 took fold 1's slot; it is still running when fold 0 prunes
+            for _ in range(200):
+                if reporter.pruned:
+                    break
+                time.sleep(0.01)
+            return 0.5
+
+        pool = WorkerPool([WorkerSlot(index=0, num_threads=1), WorkerSlot(index=1, num_threads=1)])
+        with patch("training.hpo.execution.local.cv.run_training_trial") as mock_run_trial:
+            mock_run_trial.side_effect = lambda **kwargs: run_fold(**kwargs)
+            fold_metrics = _execute_cv_folds(
+                {"trial_number": 0}, "dataset", Path("config"), "distilbert", {},
+                "exp", "macro-f1", [([0], [1])] * 4, tmp_path / "splits.json", tmp_path,
+                None, None, worker_pool=pool, reporter=reporter,
+            )
+
+        # Step 1 is fold 0's metric even though fold 1 finished first
+        trial.report.assert_called_once_with(pytest.approx(0.2), step=1)
+        assert reporter.pruned
+        assert sorted(started) == [0, 1, 2]
+        assert fold_metrics == [0.2, 0.9, 0.5]
+
+    def test_without_trial_runs_all_folds(self, tmp_path):
+        """Test that folds all run when there is no trial to report to."""
+        from training.hpo.execution.local.cv import FoldPruningReporter
+
+        reporter = FoldPruningReporter(None)
+        for fold_idx, metric in enumerate([0.1, 0.2]):
+            reporter.report(fold_idx, metric)
+
+        assert not reporter.pruned
+        assert reporter.fold_metrics == {0: 0.1, 1: 0.2}
+
+    def test_pruned_trial_checkpoints_deleted(self, tmp_path):
+        """Test that the cleanup manager drops a pruned trial's fold checkpoints."""
+        from training.hpo.checkpoint.cleanup import CheckpointCleanupManager
+
+        trial_dir = tmp_path / "study-abc" / "trial-def"
+        for fold in ("fold0", "fold1"):
+            (trial_dir / "cv" / fold / "checkpoint").mkdir(parents=True)
+        manager = CheckpointCleanupManager(
+            output_base_dir=tmp_path, hpo_config={"checkpoint": {"save_only_best": True}})
+        manager.checkpoint_map[4] = []
+
+        manager.handle_trial_pruned(4, str(trial_dir))
+
+        assert not (trial_dir / "cv" / "fold0" / "checkpoint").exists()
+        assert not (trial_dir / "cv" / "fold1" / "checkpoint").exists()
+        assert 4 not in manager.checkpoint_map
+
+
 class TestPruningSmokeYaml:
     """Test pruning with smoke.yaml configuration."""
 
@@ -432,7 +613,7 @@ class TestPruningSmokeYaml:
             "early_termination": {
                 "policy": "bandit",  # smoke.yaml
                 "evaluation_interval": 1,  # smoke.yaml
-                "slack_factor": 0.2,  # smoke.yaml (not used by MedianPruner, but present)
+                "slack_factor": 0.2,  # smoke.yaml
                 "delay_evaluation": 2,  # smoke.yaml
             }
         }
@@ -440,7 +621,8 @@ class TestPruningSmokeYaml:
         pruner = create_optuna_pruner(hpo_config)
         
         assert pruner is not None
-        assert isinstance(pruner, MedianPruner)
+        assert isinstance(pruner, BanditPruner)
+        assert pruner._slack_factor == 0.2
         # Verify smoke.yaml parameters are applied
         assert pruner._n_startup_trials == 2  # delay_evaluation
         assert pruner._n_warmup_steps == 1  # evaluation_interval
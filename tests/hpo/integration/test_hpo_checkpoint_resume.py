@@ -637,3 +637,83 @@ class TestCheckpointFileIO:
         # Verify trial is preserved
         assert len(study2.trials) == 1
         assert study2.trials[0].value == 0.75
+
+
+class TestStorageBackends:
+    """Test SQLite WAL and journal file storages."""
+
+    def _add_trials(self, storage, n, study_name="hpo_distilbert"):
+        study = optuna.create_study(
+            direction="maximize", study_name=study_name, storage=storage, load_if_exists=True)
+        study.optimize(lambda trial: trial.suggest_float("x", 0, 1), n_trials=n)
+        return study
+
+    def test_journal_storage_selected_by_storage_path(self, tmp_path):
+        """Test that a .journal storage_path resolves to a journal study file."""
+        from training.hpo.checkpoint.storage import get_storage
+
+        checkpoint_config = {"enabled": True, "storage_path": "{study_name}/study.journal"}
+        storage_path = resolve_storage_path(
+            output_dir=tmp_path,
+            checkpoint_config=checkpoint_config,
+            backbone="distilbert",
+            study_key_hash=TEST_STUDY_KEY_HASH,
+        )
+
+        assert storage_path.name == "study.journal"
+        self._add_trials(get_storage(storage_path, checkpoint_config), 3)
+        reloaded = optuna.load_study(
+            study_name="hpo_distilbert", storage=get_storage(storage_path))
+        assert len(reloaded.trials) == 3
+
+    def test_sqlite_storage_uses_wal_and_parallel_trials(self, tmp_path):
+        """Test that SQLite studies run in WAL mode and accept concurrent trials."""
+        from training.hpo.checkpoint.storage import get_storage
+
+        storage_path = tmp_path / "study-abc" / "study.db"
+        study = optuna.create_study(
+            direction="maximize", study_name="hpo_distilbert",
+            storage=get_storage(storage_path, wal=True))
+        study.optimize(lambda trial: trial.suggest_float("x", 0, 1), n_trials=8, n_jobs=4)
+
+        with sqlite3.connect(str(storage_path)) as conn:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert len(study.trials) == 8
+
+    def test_readers_keep_journal_mode(self, tmp_path):
+        """Test that opening a study without wal=True leaves its journal mode alone."""
+        from training.hpo.checkpoint.storage import get_storage, migrate_storage
+
+        storage_path = tmp_path / "study-abc" / "study.db"
+        self._add_trials(get_storage(storage_path), 2)
+
+        optuna.load_study(study_name="hpo_distilbert", storage=get_storage(storage_path))
+        migrate_storage(storage_path, tmp_path / "study.journal")
+
+        with sqlite3.connect(str(storage_path)) as conn:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "delete"
+        assert not storage_path.with_name("study.db-wal").exists()
+
+    def test_migrate_sqlite_to_journal(self, tmp_path):
+        """Test that an existing study.db is migrated when a journal is configured."""
+        from training.hpo.checkpoint.storage import (
+            checkpoint_sqlite_wal,
+            find_study_storage,
+            get_storage,
+            migrate_to_configured_storage,
+        )
+
+        study_folder = tmp_path / "study-abc"
+        source = self._add_trials(get_storage(study_folder / "study.db", wal=True), 2)
+        source.set_user_attr("study_family_hash", "fam")
+        checkpoint_sqlite_wal(study_folder / "study.db")
+        assert (study_folder / "study.db-wal").stat().st_size == 0
+
+        journal = study_folder / "study.journal"
+        assert migrate_to_configured_storage(journal, {"storage_path": "study.journal"})
+        assert find_study_storage(study_folder) == journal
+
+        migrated = optuna.load_study(study_name="hpo_distilbert", storage=get_storage(journal))
+        assert [t.params for t in migrated.trials] == [t.params for t in source.trials]
+        assert migrated.user_attrs["study_family_hash"] == "fam"
+        assert not migrate_to_configured_storage(journal, {"storage_path": "study.journal"})
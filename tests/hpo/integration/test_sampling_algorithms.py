@@ -0,0 +1,98 @@
+"""Component tests for Optuna sampler creation from HPO config."""
+
+import pytest
+
+# Lazy import optuna to allow tests to be skipped if not available
+try:
+    import optuna
+    from optuna import samplers
+except ImportError:
+    optuna = None
+    pytest.skip("optuna not available", allow_module_level=True)
+
+from training.hpo.core.optuna_integration import create_optuna_sampler
+from training.hpo.core.search_space import SearchSpaceTranslator
+
+SEARCH_SPACE = {
+    "backbone": {"type": "choice", "values": ["distilbert"]},
+    "learning_rate": {"type": "loguniform", "min": 1e-5, "max": 1e-3},
+    "batch_size": {"type": "choice", "values": [4, 8]},
+    "dropout": {"type": "uniform", "min": 0.1, "max": 0.3, "grid_points": 2},
+}
+
+
+def sampling(**kwargs):
+    return {"search_space": SEARCH_SPACE, "sampling": kwargs}
+
+
+class TestSamplerCreation:
+    """Test sampler creation from sampling.algorithm."""
+
+    @pytest.mark.parametrize("algorithm,sampler_type", [
+        ("random", "RandomSampler"),
+        ("tpe", "TPESampler"),
+        ("bayesian", "TPESampler"),
+        ("qmc", "QMCSampler"),
+        ("grid", "GridSampler"),
+    ])
+    def test_algorithms(self, algorithm, sampler_type):
+        """Test that each algorithm creates its Optuna sampler."""
+        sampler = create_optuna_sampler(sampling(algorithm=algorithm, seed=0))
+
+        assert isinstance(sampler, getattr(samplers, sampler_type))
+
+    def test_unknown_algorithm_rejected(self):
+        """Test that unknown algorithms raise instead of falling back to random."""
+        with pytest.raises(ValueError, match="cmaes"):
+            create_optuna_sampler(sampling(algorithm="cmaes"))
+
+    def test_tpe_constant_liar_for_parallel_trials(self):
+        """Test that TPE uses the constant liar when trials run concurrently."""
+        config = sampling(algorithm="tpe")
+        config["execution"] = {"parallel_trials": 4}
+
+        assert create_optuna_sampler(config)._constant_liar is True
+        assert create_optuna_sampler(sampling(algorithm="tpe"))._constant_liar is False
+
+    def test_seeded_samplers_reproducible(self):
+        """Test that sampling.seed makes suggestions reproducible."""
+        def first_params():
+            study = optuna.create_study(
+                sampler=create_optuna_sampler(sampling(algorithm="qmc", seed=7)))
+            trial = study.ask()
+            return SearchSpaceTranslator.to_optuna(
+                {"search_space": SEARCH_SPACE}, trial, exclude_params=["backbone"])
+
+        assert first_params() == first_params()
+
+
+class TestGridSearchSpace:
+    """Test grid translation of the search space."""
+
+    def test_grid_values(self):
+        """Test choice, uniform and loguniform grid values."""
+        grid = SearchSpaceTranslator.to_optuna_grid(
+            {"search_space": SEARCH_SPACE}, exclude_params=["backbone"], grid_points=3)
+
+        assert set(grid) == {"learning_rate", "batch_size", "dropout"}
+        assert grid["batch_size"] == [4, 8]
+        assert grid["dropout"] == pytest.approx([0.1, 0.3])
+        assert grid["learning_rate"] == pytest.approx([1e-5, 1e-4, 1e-3])
+
+    def test_grid_study_covers_every_combination(self):
+        """Test that a grid study visits each combination once and then stops."""
+        config = sampling(algorithm="grid", grid_points=2)
+        study = optuna.create_study(sampler=create_optuna_sampler(config))
+
+        def objective(trial):
+            params = SearchSpaceTranslator.to_optuna(config, trial, exclude_params=["backbone"])
+            return params["dropout"]
+
+        study.optimize(objective, n_trials=20)
+
+        combos = {
+            (t.params["learning_rate"], t.params["batch_size"], t.params["dropout"])
+            for t in study.trials
+        }
+        assert len(study.trials) == 8
+        assert len(combos) == 8
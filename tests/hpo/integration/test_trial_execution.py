@@ -1,6 +1,7 @@
 """Component tests for trial execution with and without CV."""
 
 import json
+import os
 import pytest
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
@@ -507,3 +508,153 @@ class TestTrialExecutionWithCV:
         assert len(fold_metrics) == 2
         assert mock_run_trial.call_count == 2
         assert avg_metric == pytest.approx(0.775)
+
+
+class TestInProcessTrialExecution:
+    """Test in-process trial execution and its subprocess fallback."""
+
+    def _execute(self, tmp_path, runner, **kwargs):
+        config_dir = tmp_path / "config"
+        config_dir.mkdir()
+        (tmp_path / "src" / "training").mkdir(parents=True)
+        (tmp_path / "src" / "training" / "__init__.py").touch()
+        output_dir = tmp_path / "outputs" / "hpo" / "trial_0"
+        output_dir.mkdir(parents=True)
+        (output_dir / "metrics.json").write_text(json.dumps({"macro-f1": 0.7}))
+
+        env = {"AZURE_ML_OUTPUT_checkpoint": str(output_dir)}
+        with patch("training.hpo.execution.local.trial.get_in_process_runner", return_value=runner), \
+                patch("training.hpo.execution.local.trial.setup_training_environment", return_value=env), \
+                patch("training.hpo.execution.local.trial.verify_training_environment"), \
+                patch("training.hpo.execution.local.trial.execute_training_subprocess") as mock_execute:
+            executor = TrialExecutor(
+                config_dir=config_dir,
+                mlflow_experiment_name="test",
+                execution_mode="in_process",
+            )
+            metric_value = executor.execute(
+                trial_params={"learning_rate": 3e-5, "trial_number": 0},
+                dataset_path=str(tmp_path / "dataset"),
+                backbone="distilbert",
+                output_dir=output_dir,
+                train_config={},
+                **kwargs,
+            )
+        return metric_value, mock_execute
+
+    def test_runs_in_process(self, tmp_path):
+        """Test that supported trials train in-process with the subprocess command and env."""
+        runner = MagicMock()
+        runner.supports.return_value = True
+        fold_splits_file = tmp_path / "fold_splits.json"
+
+        metric_value, mock_execute = self._execute(
+            tmp_path, runner, fold_idx=1, fold_splits_file=fold_splits_file)
+
+        assert metric_value == 0.7
+        assert not mock_execute.called
+        command, env = runner.run.call_args.args
+        assert command[1:3] == ["-m", "training.cli.train"]
+        assert command[command.index("--fold-idx") + 1] == "1"
+        assert command[command.index("--fold-splits-file") + 1] == str(fold_splits_file)
+        assert env["AZURE_ML_OUTPUT_checkpoint"].endswith("trial_0")
+
+    def test_falls_back_to_subprocess(self, tmp_path):
+        """Test that unsupported (multi-GPU) trials still run as a subprocess."""
+        runner = MagicMock()
+        runner.supports.return_value = False
+
+        metric_value, mock_execute = self._execute(tmp_path, runner)
+
+        assert metric_value == 0.7
+        assert mock_execute.called
+        assert not runner.run.called
+
+    def test_resolve_execution_mode(self):
+        """Test the hpo execution.mode setting."""
+        from training.hpo.execution.local import resolve_trial_execution_mode
+
+        assert resolve_trial_execution_mode(None) == "subprocess"
+        assert resolve_trial_execution_mode({"execution": {"mode": "in_process"}}) == "in_process"
+        with pytest.raises(ValueError):
+            resolve_trial_execution_mode({"execution": {"mode": "thread"}})
+
+    def test_runner_reuses_dataset_and_restores_env(self, tmp_path, monkeypatch):
+        """Test that the dataset loads once across runs and the environment is restored."""
+        pytest.importorskip("torch")
+        from training.execution import build_training_command
+        from training.hpo.execution.local.inprocess import InProcessTrialRunner
+
+        config_dir = Path(__file__).resolve().parents[3] / "config"
+        monkeypatch.setenv("KEEP_ME", "1")
+        seen = []
+
+        def fake_run_training(args, prebuilt_config=None, dataset=None):
+            seen.append((args.fold_idx, prebuilt_config["training"]["learning_rate"],
+                         dataset, dict(os.environ)))
+            # Written by run_training itself; must not outlive the run
+            os.environ["MLFLOW_TRIAL_NUMBER"] = "unknown"
+
+        runner = InProcessTrialRunner()
+        with patch("data.loaders.load_dataset", return_value={"train": []}) as mock_load, \
+                patch("training.orchestrator.run_training", side_effect=fake_run_training):
+            for fold_idx, lr in ((0, 1e-5), (1, 2e-5)):
+                command = build_training_command(
+                    backbone="distilbert",
+                    dataset_path=str(tmp_path / "dataset"),
+                    config_dir=config_dir,
+                    hyperparameters={"learning_rate": lr},
+                )
+                command += ["--fold-idx", str(fold_idx)]
+                runner.run(command, {"MLFLOW_FOLD_IDX": str(fold_idx)})
+
+        assert mock_load.call_count == 1
+        assert [(fold, lr) for fold, lr, _, _ in seen] == [(0, 1e-5), (1, 2e-5)]
+        assert seen[0][2] is seen[1][2]
+        assert seen[1][3]["MLFLOW_FOLD_IDX"] == "1"
+        assert seen[1][3]["KEEP_ME"] == "1"
+        assert os.environ["KEEP_ME"] == "1"
+        assert "MLFLOW_FOLD_IDX" not in os.environ
+        assert "MLFLOW_TRIAL_NUMBER" not in os.environ
+        runner.clear()
+
+    def test_runner_touches_only_override_keys(self, monkeypatch):
+        """Test that a run leaves variables it does not override untouched."""
+        from training.hpo.execution.local.inprocess import _temporary_environ
+
+        monkeypatch.setenv("KEEP_ME", "1")
+        monkeypatch.setenv("OVERRIDDEN", "old")
+        with _temporary_environ({"OVERRIDDEN": "new", "ADDED": "x"}):
+            # Set by another thread while the run is active
+            os.environ["OTHER_THREAD"] = "kept"
+            assert (os.environ["OVERRIDDEN"], os.environ["ADDED"]) == ("new", "x")
+
+        assert os.environ["OVERRIDDEN"] == "old"
+        assert "ADDED" not in os.environ
+        assert os.environ.pop("OTHER_THREAD") == "kept"
+        assert os.environ["KEEP_ME"] == "1"
+
+    def test_runner_rejects_device_env_overrides(self, tmp_path, monkeypatch):
+        """Test that in-process runs refuse device placement env overrides."""
+        pytest.importorskip("torch")
+        from training.execution import build_training_command
+        from training.hpo.execution.local.inprocess import InProcessTrialRunner
+
+        config_dir = Path(__file__).resolve().parents[3] / "config"
+        monkeypatch.delenv("CUDA_VISIBLE_DEVICES", raising=False)
+        command = build_training_command(
+            backbone="distilbert",
+            dataset_path=str(tmp_path / "dataset"),
+            config_dir=config_dir,
+            hyperparameters={},
+        )
+        runner = InProcessTrialRunner()
+        with patch("data.loaders.load_dataset", return_value={"train": []}), \
+                patch("training.orchestrator.run_training") as mock_run:
+            with pytest.raises(ValueError, match="CUDA_VISIBLE_DEVICES"):
+                runner.run(command, {"CUDA_VISIBLE_DEVICES": "1"})
+            assert not mock_run.called
+
+            runner.run(command, {})
+        assert mock_run.called
+        runner.clear()
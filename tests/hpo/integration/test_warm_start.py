@@ -0,0 +1,113 @@
+"""Component tests for warm-starting HPO studies from related studies."""
+
+import pytest
+
+# Lazy import optuna to allow tests to be skipped if not available
+try:
+    import optuna
+    from optuna.distributions import CategoricalDistribution, FloatDistribution
+    from optuna.trial import TrialState, create_trial
+except ImportError:
+    optuna = None
+    pytest.skip("optuna not available", allow_module_level=True)
+
+from training.hpo.core.warm_start import (
+    STUDY_FAMILY_ATTR,
+    WARM_START_SOURCE_ATTR,
+    is_compatible_params,
+    warm_start_study,
+)
+
+SEARCH_SPACE = {
+    "backbone": {"type": "choice", "values": ["distilbert"]},
+    "learning_rate": {"type": "loguniform", "min": 1e-5, "max": 5e-5},
+    "batch_size": {"type": "choice", "values": [4, 8]},
+}
+DISTRIBUTIONS = {
+    "learning_rate": FloatDistribution(1e-6, 1e-3, log=True),
+    "batch_size": CategoricalDistribution([4, 8, 16]),
+}
+
+
+def hpo_config(**warm_start):
+    return {
+        "search_space": SEARCH_SPACE,
+        "objective": {"metric": "macro-f1", "direction": "maximize"},
+        "warm_start": {"enabled": True, **warm_start},
+    }
+
+
+def make_source(folder, family, trials):
+    """Create a study.db in ``folder`` with completed trials (lr, batch_size, value)."""
+    folder.mkdir(parents=True)
+    study = optuna.create_study(
+        direction="maximize", study_name="hpo_distilbert",
+        storage=f"sqlite:///{folder / 'study.db'}")
+    if family:
+        study.set_user_attr(STUDY_FAMILY_ATTR, family)
+    study.add_trials([
+        create_trial(
+            params={"learning_rate": lr, "batch_size": bs},
+            distributions=DISTRIBUTIONS,
+            value=value,
+            state=TrialState.COMPLETE,
+        )
+        for lr, bs, value in trials
+    ])
+    return folder / "study.db"
+
+
+class TestWarmStart:
+    """Test seeding a new study from sibling and explicit studies."""
+
+    def test_enqueues_best_compatible_trials_of_same_family(self, tmp_path):
+        """Test that the best in-space configurations of the same family are enqueued."""
+        make_source(tmp_path / "study-aaa", "fam", [
+            (2e-5, 4, 0.70),
+            (3e-5, 8, 0.80),
+            (4e-4, 8, 0.95),  # learning rate outside the current range
+            (3e-5, 16, 0.90),  # batch size no longer offered
+        ])
+        make_source(tmp_path / "study-bbb", "other", [(2e-5, 8, 0.99)])
+
+        study = optuna.create_study(direction="maximize")
+        enqueued = warm_start_study(
+            study, hpo_config(max_trials=5), tmp_path / "study-new" / "study.db", "fam")
+
+        assert enqueued == 2
+        assert study.user_attrs[STUDY_FAMILY_ATTR] == "fam"
+        first = study.ask()
+        assert first.params == {}  # params are fixed when suggested
+        assert first.suggest_float("learning_rate", 1e-5, 5e-5, log=True) == 3e-5
+        assert first.suggest_categorical("batch_size", [4, 8]) == 8
+        assert first.user_attrs[WARM_START_SOURCE_ATTR] == "hpo_distilbert#1"
+
+    def test_explicit_sources_skip_family_check(self, tmp_path):
+        """Test that configured sources are used even without a family match."""
+        source = make_source(tmp_path / "old", None, [(2e-5, 4, 0.7), (4e-5, 8, 0.6)])
+
+        study = optuna.create_study(direction="maximize")
+        enqueued = warm_start_study(
+            study, hpo_config(max_trials=1, sources=[str(source)]), None, "fam")
+
+        assert enqueued == 1
+        assert len(study.get_trials(states=(TrialState.WAITING,))) == 1
+
+    def test_disabled_only_records_family(self, tmp_path):
+        """Test that nothing is enqueued unless warm_start is enabled."""
+        make_source(tmp_path / "study-aaa", "fam", [(2e-5, 4, 0.7)])
+        config = hpo_config()
+        config["warm_start"]["enabled"] = False
+
+        study = optuna.create_study(direction="maximize")
+        assert warm_start_study(study, config, tmp_path / "study-new" / "study.db", "fam") == 0
+        assert study.trials == []
+        assert study.user_attrs[STUDY_FAMILY_ATTR] == "fam"
+
+    def test_is_compatible_params(self):
+        """Test search space compatibility checks."""
+        assert is_compatible_params(
+            {"learning_rate": 2e-5, "batch_size": 4}, SEARCH_SPACE, exclude_params=["backbone"])
+        assert not is_compatible_params({"learning_rate": 2e-5}, SEARCH_SPACE, ["backbone"])
+        assert not is_compatible_params(
+            {"learning_rate": 2e-5, "batch_size": 4}, SEARCH_SPACE)
@@ -0,0 +1,160 @@
+"""Unit tests for parallel fold and trial execution."""
+
+import threading
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from training.hpo.execution.local.parallel import (
+    WorkerPool,
+    WorkerSlot,
+    get_worker_pool,
+    resolve_parallel_trials,
+    resolve_worker_slots,
+)
+
+
+def execution(**kwargs):
+    return {"execution": kwargs}
+
+
+class TestResolveWorkerSlots:
+    """Test worker slot resolution from the execution config."""
+
+    def test_sequential_by_default(self):
+        """Test that a missing section gives one slot with all cores."""
+        slots = resolve_worker_slots({}, cpu_count=8, gpu_count=0)
+
+        assert slots == [WorkerSlot(index=0, num_threads=8)]
+
+    def test_auto_one_worker_per_gpu(self):
+        """Test that auto assigns one GPU per worker and splits CPU threads."""
+        slots = resolve_worker_slots(
+            execution(parallel_workers="auto"), cpu_count=16, gpu_count=4)
+
+        assert [s.gpu for s in slots] == [0, 1, 2, 3]
+        assert {s.num_threads for s in slots} == {4}
+        assert slots[2].env()["CUDA_VISIBLE_DEVICES"] == "2"
+
+    def test_auto_cpu_core_groups(self):
+        """Test that CPU-only hosts get core groups of threads_per_worker."""
+        slots = resolve_worker_slots(
+            execution(parallel_workers="auto", threads_per_worker=6), cpu_count=24, gpu_count=0)
+
+        assert len(slots) == 4
+        env = slots[0].env()
+        assert env["OMP_NUM_THREADS"] == "6"
+        assert env["CUDA_VISIBLE_DEVICES"] == ""
+
+    def test_explicit_workers_share_gpus(self):
+        """Test that extra workers share GPUs round-robin."""
+        slots = resolve_worker_slots(execution(parallel_workers=3), cpu_count=12, gpu_count=2)
+
+        assert [s.gpu for s in slots] == [0, 1, 0]
+        assert slots[0].num_threads == 4
+
+    def test_invalid_values(self):
+        """Test that invalid settings are rejected."""
+        with pytest.raises(ValueError):
+            resolve_worker_slots(execution(parallel_workers=0), cpu_count=4, gpu_count=0)
+        with pytest.raises(ValueError):
+            resolve_worker_slots(execution(threads_per_worker="many"), cpu_count=4, gpu_count=0)
+        with pytest.raises(ValueError):
+            resolve_parallel_trials(execution(parallel_trials=0))
+        assert resolve_parallel_trials(None) == 1
+
+    def test_in_process_with_parallel_workers_warns(self):
+        """Test that in_process mode with several workers warns about subprocesses."""
+        with patch.dict("training.hpo.execution.local.parallel._pools", clear=True), \
+                patch("training.hpo.execution.local.parallel.logger") as mock_logger:
+            get_worker_pool(execution(mode="in_process", parallel_workers=1))
+            mock_logger.warning.assert_not_called()
+
+            pool = get_worker_pool(execution(mode="in_process", parallel_workers=2))
+
+        assert pool.parallel
+        assert "parallel_workers: 1" in mock_logger.warning.call_args[0][0]
+
+    def test_parallel_workers_switch_in_process_to_subprocess(self):
+        """Test that in_process mode only applies with a single worker slot."""
+        from training.hpo.execution.local import resolve_trial_execution_mode
+
+        with patch("training.hpo.execution.local.parallel._gpu_count", return_value=0), \
+                patch("os.cpu_count", return_value=8):
+            assert resolve_trial_execution_mode(
+                execution(mode="in_process", parallel_workers=1)) == "in_process"
+            assert resolve_trial_execution_mode(
+                execution(mode="in_process", parallel_workers="auto")) == "subprocess"
+            # threads_per_worker covering every core leaves one worker
+            assert resolve_trial_execution_mode(execution(
+                mode="in_process", parallel_workers="auto", threads_per_worker=8)) == "in_process"
+            assert resolve_trial_execution_mode(
+                execution(mode="subprocess", parallel_workers=2)) == "subprocess"
+
+
+class TestWorkerPool:
+    """Test WorkerPool scheduling."""
+
+    def test_limits_concurrency_and_keeps_order(self):
+        """Test that at most len(slots) tasks run at once and results keep input order."""
+        pool = WorkerPool([WorkerSlot(index=i, num_threads=1) for i in range(2)])
+        lock = threading.Lock()
+        running, peak, used = [0], [0], set()
+
+        def task(value):
+            def run(slot):
+                with lock:
+                    running[0] += 1
+                    peak[0] = max(peak[0], running[0])
+                    used.add(slot.index)
+                time.sleep(0.02)
+                with lock:
+                    running[0] -= 1
+                return value
+            return run
+
+        assert pool.map([task(i) for i in range(5)]) == [0, 1, 2, 3, 4]
+        assert peak[0] == 2
+        assert used == {0, 1}
+
+    def test_failure_raised_after_all_tasks(self):
+        """Test that a failing task raises once the other tasks have finished."""
+        pool = WorkerPool([WorkerSlot(index=i, num_threads=1) for i in range(2)])
+        finished = []
+
+        def fail(slot):
+            raise RuntimeError("fold failed")
+
+        def slow(slot):
+            time.sleep(0.02)
+            finished.append(slot.index)
+
+        with pytest.raises(RuntimeError, match="fold failed"):
+            pool.map([fail, slow, slow])
+        assert len(finished) == 2
+
+
+class TestParallelCVFolds:
+    """Test parallel fold execution in _execute_cv_folds."""
+
+    @patch("training.hpo.execution.local.cv.run_training_trial")
+    def test_folds_run_on_worker_slots(self, mock_run_trial, tmp_path):
+        """Test that folds run with their slot's limits and metrics come back in fold order."""
+        from training.hpo.execution.local.cv import _execute_cv_folds
+
+        mock_run_trial.side_effect = lambda **kwargs: 0.5 + kwargs["fold_idx"] / 10
+        pool = WorkerPool([WorkerSlot(index=i, num_threads=2, gpu=i) for i in range(3)])
+
+        fold_metrics = _execute_cv_folds(
+            {"trial_number": 0}, "dataset", Path("config"), "distilbert", {}, "exp",
+            "macro-f1", [([0], [1])] * 3, tmp_path / "splits.json", tmp_path,
+            "trial_run", "parent_run", worker_pool=pool,
+        )
+
+        assert fold_metrics == [0.5, 0.6, 0.7]
+        calls = {c.kwargs["fold_idx"]: c.kwargs for c in mock_run_trial.call_args_list}
+        assert {c["env_overrides"]["OMP_NUM_THREADS"] for c in calls.values()} == {"2"}
+        assert calls[1]["output_dir"] == tmp_path / "cv" / "fold1"
+        assert all(c["parent_run_id"] == "parent_run" for c in calls.values())
@@ -39,6 +39,10 @@ def mock_model_loaded():
                     "confidence": 0.95,
                 }
             ]
+            # Mock predict_batch method (one entity list per text)
+            mock_engine.predict_batch.side_effect = lambda texts, **kwargs: [
+                mock_engine.predict.return_value for _ in texts
+            ]
             # Mock predict_tokens method for single predictions
             # Returns: logits, tokens, tokenizer_output, offset_mapping
             import numpy as np
@@ -101,6 +105,24 @@ class TestHealthEndpoint:
                 assert "backbone" in data
                 assert "entity_types" in data
 
+    def test_model_info_cache_stats(self, client):
+        """Test that /info reports cache statistics when caching is enabled."""
+        from src.deployment.api.result_cache import ResultCache
+
+        with patch("src.deployment.api.routes.health.is_model_loaded", return_value=True), \
+                patch("src.deployment.api.routes.health.get_model_info") as mock_info, \
+                patch("src.deployment.api.routes.health.get_result_cache",
+                      return_value=ResultCache()):
+            mock_info.return_value = {
+                "backbone": "distilroberta",
+                "entity_types": ["SKILL", "NAME"],
+                "max_sequence_length": 512,
+                "version": "0.1.0",
+            }
+            response = client.get("/info")
+        assert response.status_code == 200
+        assert response.json()["cache"]["misses"] == 0
+
 
 class TestPredictEndpoint:
     """Test prediction endpoints."""
@@ -137,6 +159,105 @@ class TestPredictEndpoint:
         assert "predictions" in data
         assert len(data["predictions"]) == 2
 
+    def test_predict_batch_single_engine_call(self, client, mock_model_loaded):
+        """Test that a batch runs through one batched engine call."""
+        response = client.post(
+            "/predict/batch",
+            json={"texts": ["Text 1", "Text 2", "Text 3"]},
+        )
+        assert response.status_code == 200
+        assert mock_model_loaded.predict_batch.call_count == 1
+        assert mock_model_loaded.predict_batch.call_args.args[0] == ["Text 1", "Text 2", "Text 3"]
+        mock_model_loaded.predict.assert_not_called()
+
+    def test_predict_batch_partial_failure_keeps_order(self, client, mock_model_loaded):
+        """Test that an invalid text fails alone and results keep input order."""
+        response = client.post(
+            "/predict/batch",
+            json={"texts": ["Text 1", "   ", "Text 3"]},
+        )
+        assert response.status_code == 200
+        predictions = response.json()["predictions"]
+        assert [len(p["entities"]) for p in predictions] == [1, 0, 1]
+        assert mock_model_loaded.predict_batch.call_args.args[0] == ["Text 1", "Text 3"]
+
+    def test_predict_overloaded_returns_503(self, client, mock_model_loaded):
+        """Test that a saturated inference pool is reported as a retryable 503."""
+        from src.deployment.api.exceptions import ServiceOverloadedError
+
+        with patch("src.deployment.api.routes.predictions.get_batcher", return_value=None), \
+                patch("src.deployment.api.routes.predictions.get_inference_executor") as mock_pool:
+            mock_pool.return_value.run.side_effect = ServiceOverloadedError("busy")
+            response = client.post("/predict", json={"text": "John Doe"})
+        assert response.status_code == 503
+        assert response.headers["Retry-After"] == "1"
+
+    def test_predict_batching_queue_full_returns_503(self, client, mock_model_loaded):
+        """Test that /predict gets a 503 when the micro-batch queue is full."""
+        import threading
+        from src.deployment.api.inference.batching import MicroBatchScheduler
+
+        started, release = threading.Event(), threading.Event()
+
+        def batch_fn(texts):
+            started.set()
+            release.wait(5)
+            return [[] for _ in texts]
+
+        batcher = MicroBatchScheduler(
+            batch_fn, max_batch_size=1, max_wait_ms=0, max_queue_size=1)
+        try:
+            batcher.submit("running")
+            assert started.wait(2)
+            batcher.submit("queued")
+            with patch("src.deployment.api.routes.predictions.get_batcher", return_value=batcher):
+                response = client.post("/predict", json={"text": "John Doe"})
+            assert response.status_code == 503
+            assert response.headers["Retry-After"] == "1"
+        finally:
+            release.set()
+            batcher.close()
+
+    def test_predict_served_from_cache(self, client, mock_model_loaded):
+        """Test that a repeated text is answered from the result cache."""
+        from src.deployment.api.result_cache import ResultCache
+
+        cache = ResultCache(model_fingerprint="test")
+        with patch("src.deployment.api.routes.predictions.get_result_cache", return_value=cache), \
+                patch("src.deployment.api.routes.predictions.get_batcher", return_value=None):
+            first = client.post("/predict", json={"text": "John Doe"})
+            second = client.post("/predict", json={"text": "John Doe"})
+        assert first.json()["entities"] == second.json()["entities"]
+        assert mock_model_loaded.predict.call_count == 1
+        assert cache.stats()["hits"] == 1
+
+    def test_disk_cache_runs_off_event_loop(self, client, mock_model_loaded, tmp_path):
+        """Test that disk-tier cache reads and writes never run on the event loop."""
+        import asyncio
+
+        from src.deployment.api.result_cache import ResultCache
+
+        cache = ResultCache(disk_dir=tmp_path, model_fingerprint="test")
+        on_loop = []
+
+        def record(method):
+            def wrapper(*args, **kwargs):
+                try:
+                    asyncio.get_running_loop()
+                    on_loop.append(method.__name__)
+                except RuntimeError:
+                    pass
+                return method(*args, **kwargs)
+            return wrapper
+
+        cache.get, cache.put = record(cache.get), record(cache.put)
+        with patch("src.deployment.api.routes.predictions.get_result_cache", return_value=cache), \
+                patch("src.deployment.api.routes.predictions.get_batcher", return_value=None):
+            client.post("/predict", json={"text": "John Doe"})
+            client.post("/predict/batch", json={"texts": ["John Doe", "Jane Roe"]})
+        assert cache.stats()["disk_bytes"] > 0
+        assert on_loop == []
+
     def test_predict_batch_size_exceeded(self, client, mock_model_loaded):
         """Test batch size limit."""
         with patch("src.deployment.api.config.APIConfig.MAX_BATCH_SIZE", 1):
@@ -1,12 +1,14 @@
 """Unit tests for HPO backup to Drive functionality."""
 
 import tempfile
+import threading
 from pathlib import Path
 from unittest.mock import MagicMock, patch, Mock
 
 import pytest
 
 from infrastructure.shared.backup import (
+    BackgroundBackupWorker,
     backup_hpo_study_to_drive,
     create_incremental_backup_callback,
     create_study_db_backup_callback,
@@ -525,6 +527,75 @@ class TestIncrementalBackupCallback:
         assert call_args.kwargs.get('is_directory') is False  # is_directory=False (default for study.db)
 
 
+class TestBackgroundBackupWorker:
+    """Test non-blocking, coalescing backups."""
+
+    def test_callback_hands_backup_to_worker(self, tmp_path):
+        """Test that the callback returns before the backup runs."""
+        target_file = tmp_path / "study.db"
+        target_file.write_text("test content")
+        release = threading.Event()
+        backup_to_drive_mock = MagicMock(side_effect=lambda *a, **k: release.wait(5))
+        worker = BackgroundBackupWorker(backup_to_drive_mock, coalesce_seconds=0)
+
+        callback = create_incremental_backup_callback(
+            target_path=target_file,
+            backup_to_drive=backup_to_drive_mock,
+            is_directory=False,
+            backup_worker=worker,
+        )
+        optuna_module = MagicMock()
+        optuna_module.trial.TrialState.COMPLETE = "COMPLETE"
+        trial = MagicMock(state="COMPLETE", number=0)
+
+        with patch("infrastructure.shared.backup._import_optuna") as mock_import:
+            mock_import.return_value = (optuna_module, None, None, None)
+            callback(MagicMock(), trial)  # would hang here if the backup ran inline
+
+        release.set()
+        assert worker.close(timeout=5) is True
+        backup_to_drive_mock.assert_called_once_with(target_file, is_directory=False)
+
+    def test_burst_is_coalesced(self, tmp_path):
+        """Test that requests made during a running backup collapse into one more backup."""
+        target_file = tmp_path / "study.db"
+        target_file.write_text("test content")
+        started, release = threading.Event(), threading.Event()
+
+        def slow_backup(path, is_directory=False):
+            started.set()
+            release.wait(5)
+            return True
+
+        backup_to_drive_mock = MagicMock(side_effect=slow_backup)
+        worker = BackgroundBackupWorker(backup_to_drive_mock, coalesce_seconds=0)
+        worker.submit(target_file)
+        assert started.wait(5)
+        for _ in range(10):
+            worker.submit(target_file)
+        release.set()
+
+        assert worker.close(timeout=5) is True
+        assert backup_to_drive_mock.call_count == 2
+        assert worker.completed == 2
+
+    def test_failures_do_not_stop_worker(self, tmp_path):
+        """Test that a failing backup is counted and later backups still run."""
+        first, second = tmp_path / "a.db", tmp_path / "b.db"
+        first.write_text("a")
+        second.write_text("b")
+        backup_to_drive_mock = MagicMock(side_effect=[OSError("Drive unavailable"), True])
+
+        with BackgroundBackupWorker(backup_to_drive_mock, coalesce_seconds=0) as worker:
+            worker.submit(first)
+            worker.flush(timeout=5)
+            worker.submit(second)
+
+        assert (worker.failed, worker.completed) == (1, 1)
+        with pytest.raises(RuntimeError):
+            worker.submit(first)
+
+
 class TestImmediateBackupIfNeeded:
     """Test immediate_backup_if_needed function."""
 
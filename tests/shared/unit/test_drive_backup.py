@@ -1,6 +1,9 @@
 """Unit tests for Google Drive backup module."""
 
+import os
+import sqlite3
 import tempfile
+from contextlib import closing
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -14,6 +17,7 @@ from infrastructure.storage.drive import (
     create_colab_store,
     mount_colab_drive,
 )
+from infrastructure.storage import sync
 
 
 class TestBackupResult:
@@ -383,6 +387,83 @@ class TestDriveBackupStore:
         assert "Drive paths cannot be backed up to Drive" in result.reason
 
 
+class TestIncrementalSync:
+    """Test that backup/restore only copy what changed."""
+
+    @pytest.fixture
+    def store(self, tmp_path):
+        """Create DriveBackupStore under tmp_path."""
+        (tmp_path / "project").mkdir()
+        return DriveBackupStore(root_dir=tmp_path / "project", backup_root=tmp_path / "backup")
+
+    def test_directory_backup_copies_changed_files_only(self, store, tmp_path):
+        """Test that unchanged files are skipped and removed files are deleted."""
+        checkpoint = tmp_path / "project" / "outputs" / "checkpoint"
+        checkpoint.mkdir(parents=True)
+        (checkpoint / "model.bin").write_bytes(b"weights")
+        (checkpoint / "old.txt").write_text("old")
+        backup_dir = tmp_path / "backup" / "outputs" / "checkpoint"
+
+        assert store.backup(checkpoint).action == BackupAction.COPIED
+        assert store.backup(checkpoint).action == BackupAction.SKIPPED
+
+        (checkpoint / "old.txt").unlink()
+        (checkpoint / "config.json").write_text("{}")
+        with patch("infrastructure.storage.sync.copy_file_atomic",
+                   wraps=sync.copy_file_atomic) as mock_copy:
+            result = store.backup(checkpoint)
+
+        assert result.action == BackupAction.COPIED
+        assert [c.args[0].name for c in mock_copy.call_args_list] == ["config.json"]
+        assert sorted(p.name for p in backup_dir.iterdir()) == ["config.json", "model.bin"]
+
+    def test_sqlite_backup_includes_wal(self, store, tmp_path):
+        """Test that a live WAL-mode database is copied with its uncheckpointed writes."""
+        db_path = tmp_path / "project" / "outputs" / "study.db"
+        db_path.parent.mkdir(parents=True)
+        conn = sqlite3.connect(str(db_path))
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA wal_autocheckpoint=0")
+        conn.execute("CREATE TABLE trials (value REAL)")
+        conn.executemany("INSERT INTO trials VALUES (?)", [(0.5,), (0.7,)])
+        conn.commit()
+        try:
+            assert store.backup(db_path).action == BackupAction.COPIED
+            assert store.backup(db_path).action == BackupAction.SKIPPED
+        finally:
+            conn.close()
+
+        backup_db = tmp_path / "backup" / "outputs" / "study.db"
+        with closing(sqlite3.connect(str(backup_db))) as backup_conn:
+            assert backup_conn.execute("SELECT COUNT(*) FROM trials").fetchone() == (2,)
+
+    def test_directory_sync_skips_sqlite_sidecars(self, tmp_path):
+        """Test that WAL/SHM files are not copied next to the database snapshot."""
+        src = tmp_path / "study"
+        src.mkdir()
+        conn = sqlite3.connect(str(src / "study.db"))
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("CREATE TABLE t (x INTEGER)")
+        conn.commit()
+        try:
+            stats = sync.sync_directory(src, tmp_path / "dst")
+        finally:
+            conn.close()
+
+        assert stats.copied == 1
+        assert [p.name for p in (tmp_path / "dst").iterdir()] == ["study.db"]
+
+    def test_checksum_detects_same_size_changes(self, tmp_path):
+        """Test that checksum mode compares content when size and mtime match."""
+        src, dst = tmp_path / "a.txt", tmp_path / "b.txt"
+        src.write_text("aaaa")
+        dst.write_text("bbbb")
+        os.utime(dst, (src.stat().st_atime, src.stat().st_mtime))
+
+        assert sync.files_differ(src, dst) is False
+        assert sync.files_differ(src, dst, checksum=True) is True
+
+
 class TestEnsureLocalOptions:
     """Test EnsureLocalOptions dataclass."""
 
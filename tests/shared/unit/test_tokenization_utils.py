@@ -0,0 +1,159 @@
+"""Unit tests for shared tokenization utilities."""
+
+import numpy as np
+import pytest
+
+transformers = pytest.importorskip("transformers")
+
+from common.shared.tokenization_utils import (
+    bucket_length,
+    get_offset_mapping,
+    pad_to_length,
+    prepare_onnx_inputs,
+    tokenize_for_onnx,
+)
+
+
+@pytest.fixture
+def tokenizer(tmp_path):
+    """Build a small fast BERT tokenizer from a local vocab (no downloads)."""
+    words = ["john", "doe", "works", "at", "microsoft", "in", "seattle", "."]
+    vocab = ["[PAD]", "[UNK]", "[CLS]", "[SEP]", "[MASK]"] + words
+    vocab_file = tmp_path / "vocab.txt"
+    vocab_file.write_text("\n".join(vocab))
+    return transformers.BertTokenizerFast(str(vocab_file))
+
+
+class TestBucketLength:
+    """Test cases for bucket_length."""
+
+    def test_rounds_up_to_nearest_bucket(self):
+        """Test that lengths round up to the smallest fitting bucket."""
+        assert bucket_length(5, [32, 64, 128], 512) == 32
+        assert bucket_length(32, [32, 64, 128], 512) == 32
+        assert bucket_length(33, [128, 32, 64], 512) == 64
+
+    def test_capped_at_max_length(self):
+        """Test that buckets never exceed max_length."""
+        assert bucket_length(100, [32, 256], 128) == 128
+        assert bucket_length(300, [32, 256], 512) == 512
+
+
+class TestPadToLength:
+    """Test cases for pad_to_length."""
+
+    def test_right_padding(self):
+        """Test that arrays are padded on the right by default."""
+        padded = pad_to_length(np.array([[1, 2]]), 4, pad_value=9)
+        assert padded.tolist() == [[1, 2, 9, 9]]
+
+    def test_left_padding(self):
+        """Test that left padding follows the tokenizer padding side."""
+        padded = pad_to_length(np.array([[1, 2]]), 3, padding_side="left")
+        assert padded.tolist() == [[0, 1, 2]]
+
+    def test_no_op_when_long_enough(self):
+        """Test that arrays already at the target length are returned as-is."""
+        array = np.array([[1, 2, 3]])
+        assert pad_to_length(array, 2) is array
+
+
+class TestPrepareOnnxInputs:
+    """Test cases for prepare_onnx_inputs padding strategies."""
+
+    def test_max_length_padding_by_default(self, tokenizer):
+        """Test that inputs pad to max_length without buckets."""
+        feeds = prepare_onnx_inputs(tokenizer, "john doe", 64)
+        assert feeds["input_ids"].shape == (1, 64)
+        assert feeds["input_ids"].dtype == np.int64
+
+    def test_bucketed_padding(self, tokenizer):
+        """Test that short texts pad only to their bucket."""
+        feeds = prepare_onnx_inputs(
+            tokenizer, "john doe works", 512, padding_buckets=[8, 16, 512])
+        assert feeds["input_ids"].shape == (1, 8)
+        assert feeds["attention_mask"][0].tolist() == [1, 1, 1, 1, 1, 0, 0, 0]
+        assert feeds["input_ids"][0, -1] == tokenizer.pad_token_id
+
+    def test_bucketed_batch_shares_bucket(self, tokenizer):
+        """Test that a batch pads to the bucket of its longest text."""
+        feeds = prepare_onnx_inputs(
+            tokenizer,
+            ["john", "john doe works at microsoft in seattle ."],
+            512,
+            padding_buckets=[8, 16],
+        )
+        assert feeds["input_ids"].shape == (2, 16)
+
+    def test_offset_mapping_matches_bucket(self, tokenizer):
+        """Test that offset mapping is padded to the same bucket."""
+        offsets = get_offset_mapping(
+            tokenizer, "john doe", 512, padding_buckets=[8, 16])
+        assert offsets.shape == (8, 2)
+        assert offsets[1].tolist() == [0, 4]
+        assert offsets[-1].tolist() == [0, 0]
+
+
+class TestTokenizeForOnnx:
+    """Test cases for the single-pass tokenize_for_onnx."""
+
+    def test_single_tokenizer_call(self, tokenizer):
+        """Test that feeds and offsets come from one tokenizer call."""
+        calls = []
+        original_call = type(tokenizer).__call__
+
+        def counting_call(self, *args, **kwargs):
+            calls.append(kwargs)
+            return original_call(self, *args, **kwargs)
+
+        type(tokenizer).__call__ = counting_call
+        try:
+            tokenization = tokenize_for_onnx(tokenizer, "john doe", 16)
+        finally:
+            type(tokenizer).__call__ = original_call
+
+        assert len(calls) == 1
+        assert tokenization.input_ids.dtype == np.int64
+        assert tokenization.offset_mapping.shape == (1, 16, 2)
+        assert tokenization.offset_mapping[0, 1].tolist() == [0, 4]
+
+    def test_matches_separate_calls(self, tokenizer):
+        """Test that fused output matches prepare_onnx_inputs and get_offset_mapping."""
+        text = "john doe works at microsoft"
+        tokenization = tokenize_for_onnx(tokenizer, text, 32, padding_buckets=[8, 16])
+        feeds = prepare_onnx_inputs(tokenizer, text, 32, padding_buckets=[8, 16])
+        offsets = get_offset_mapping(tokenizer, text, 32, padding_buckets=[8, 16])
+
+        for k, v in feeds.items():
+            np.testing.assert_array_equal(tokenization.feeds[k], v)
+        np.testing.assert_array_equal(tokenization.offset_mapping[0], offsets)
+
+    def test_batch_non_padding_ids(self, tokenizer):
+        """Test that non-padding ids exclude each row's padding."""
+        tokenization = tokenize_for_onnx(
+            tokenizer, ["john", "john doe works"], 512, padding_buckets=[8])
+        assert tokenization.input_ids.shape == (2, 8)
+        assert [len(ids) for ids in tokenization.non_padding_ids] == [3, 5]
+        assert tokenization.offset_mapping.shape == (2, 8, 2)
+
+    def test_input_names_filter(self, tokenizer):
+        """Test that feeds only contain inputs the model expects."""
+        tokenization = tokenize_for_onnx(
+            tokenizer, "john", 16, input_names={"input_ids", "attention_mask"})
+        assert set(tokenization.feeds) == {"input_ids", "attention_mask"}
+
+    def test_stride_splits_long_text_into_windows(self, tokenizer):
+        """Test that a stride yields overlapping windows mapped to their text."""
+        tokenization = tokenize_for_onnx(
+            tokenizer, ["john doe works at microsoft in seattle .", "john"], 6, stride=2)
+        assert tokenization.sample_mapping.tolist() == [0, 0, 0, 1]
+        assert tokenization.has_overflow
+        # Windows share `stride` tokens: the last two of one start the next
+        np.testing.assert_array_equal(
+            tokenization.offset_mapping[0, 3:5], tokenization.offset_mapping[1, 1:3])
+
+    def test_no_overflow_without_long_texts(self, tokenizer):
+        """Test that short texts keep one row each with a stride."""
+        tokenization = tokenize_for_onnx(tokenizer, ["john", "doe"], 16, stride=4)
+        assert tokenization.sample_mapping.tolist() == [0, 1]
+        assert not tokenization.has_overflow
@@ -0,0 +1,170 @@
+"""Unit tests for the batched MLflow tracking writer against a local file store."""
+
+from unittest.mock import Mock, patch
+
+import mlflow
+import pytest
+from mlflow.tracking import MlflowClient
+
+from infrastructure.tracking.mlflow.batch_writer import (
+    MAX_PARAMS_PER_BATCH,
+    BatchedTrackingWriter,
+)
+
+
+@pytest.fixture
+def tracking_uri(tmp_path):
+    """Point MLflow at a file store in tmp_path."""
+    uri = (tmp_path / "mlruns").as_uri()
+    previous = mlflow.get_tracking_uri()
+    mlflow.set_tracking_uri(uri)
+    yield uri
+    mlflow.set_tracking_uri(previous)
+
+
+@pytest.fixture
+def client(tracking_uri):
+    """Client of the file store."""
+    return MlflowClient(tracking_uri=tracking_uri)
+
+
+@pytest.fixture
+def run_id(client):
+    """A run in the file store."""
+    experiment_id = client.create_experiment("batch-writer")
+    # Tracking service client: MlflowClient.create_run may be wrapped by run-name patches
+    run = client._tracking_client.create_run(experiment_id, run_name="batch_writer_run")
+    return run.info.run_id
+
+
+@pytest.fixture
+def writer():
+    """Writer that only sends on flush (long interval)."""
+    writer = BatchedTrackingWriter(flush_interval=60.0, base_delay=0.01)
+    yield writer
+    writer.close()
+
+
+class TestBatchedTrackingWriter:
+    """Test buffering and log_batch sending."""
+
+    def test_flush_sends_metrics_params_and_tags(self, writer, client, run_id):
+        """Test that queued data reaches the run on flush."""
+        writer.log_metrics({"loss": 0.5, "macro-f1": 0.8}, run_id=run_id)
+        writer.log_metric("loss", 0.4, step=1, run_id=run_id)
+        writer.log_params({"learning_rate": 1e-4, "checkpoint_path": None}, run_id=run_id)
+        writer.set_tag("stage", "hpo", run_id=run_id)
+
+        assert writer.pending_count(run_id) == 6
+        assert client.get_run(run_id).data.metrics == {}
+
+        assert writer.flush(run_id) is True
+        data = client.get_run(run_id).data
+        assert data.metrics == {"loss": 0.4, "macro-f1": 0.8}
+        assert data.params == {"learning_rate": "0.0001", "checkpoint_path": "None"}
+        assert data.tags["stage"] == "hpo"
+        assert [m.value for m in client.get_metric_history(run_id, "loss")] == [0.5, 0.4]
+        assert writer.sent_batches == 1
+        assert writer.pending_count() == 0
+
+    def test_active_run_is_default(self, writer, client, run_id):
+        """Test that data goes to the active run when no run_id is given."""
+        active_run = Mock()
+        active_run.info.run_id = run_id
+        with patch("mlflow.active_run", return_value=active_run):
+            writer.log_param("backbone", "distilbert")
+        writer.flush()
+
+        assert client.get_run(run_id).data.params == {"backbone": "distilbert"}
+
+    def test_no_active_run_raises(self, writer, tracking_uri):
+        """Test that logging without a run is rejected."""
+        with patch("mlflow.active_run", return_value=None), pytest.raises(RuntimeError, match="No active MLflow run"):
+            writer.log_metric("loss", 0.1)
+
+    def test_large_batches_are_chunked(self, writer, client, run_id):
+        """Test that data beyond MLflow's batch limits is split into several calls."""
+        params = {f"p{i}": i for i in range(MAX_PARAMS_PER_BATCH + 20)}
+        writer.log_params(params, run_id=run_id)
+        writer.log_metrics({f"m{i}": float(i) for i in range(1500)}, run_id=run_id)
+
+        assert writer.flush() is True
+        data = client.get_run(run_id).data
+        assert len(data.params) == len(params)
+        assert len(data.metrics) == 1500
+        assert writer.sent_batches == 2
+
+    def test_background_thread_flushes(self, client, run_id):
+        """Test that the background thread sends without an explicit flush."""
+        writer = BatchedTrackingWriter(flush_interval=0.05)
+        try:
+            writer.log_metric("n_trials", 3, run_id=run_id)
+            for _ in range(100):
+                if writer.sent_batches:
+                    break
+                writer._wakeup.wait(0.05)
+            assert client.get_run(run_id).data.metrics == {"n_trials": 3.0}
+        finally:
+            writer.close()
+
+    def test_close_flushes_pending(self, client, run_id):
+        """Test that closing (as at process exit) sends queued data."""
+        writer = BatchedTrackingWriter(flush_interval=60.0)
+        writer.set_tags({"a": 1, "b": 2}, run_id=run_id)
+        writer.close()
+
+        tags = client.get_run(run_id).data.tags
+        assert tags["a"] == "1" and tags["b"] == "2"
+
+    def test_logging_after_close_is_sent_directly(self, client, run_id):
+        """Test that data logged after close (e.g. from a later atexit hook) is not lost."""
+        writer = BatchedTrackingWriter(flush_interval=60.0)
+        writer.close()
+        writer.set_tag("c", 3, run_id=run_id)
+
+        assert client.get_run(run_id).data.tags["c"] == "3"
+        assert writer.pending_count() == 0
+        assert writer.sent_batches == 1
+
+    def test_retryable_errors_are_retried(self, writer, client, run_id):
+        """Test that transient log_batch errors are retried with backoff."""
+        real_log_batch = MlflowClient.log_batch
+        calls = []
+
+        def flaky_log_batch(self, *args, **kwargs):
+            calls.append(1)
+            if len(calls) == 1:
+                raise ConnectionError("connection reset")
+            return real_log_batch(self, *args, **kwargs)
+
+        writer.log_metric("loss", 0.2, run_id=run_id)
+        with patch.object(MlflowClient, "log_batch", flaky_log_batch):
+            assert writer.flush() is True
+
+        assert len(calls) == 2
+        assert client.get_run(run_id).data.metrics == {"loss": 0.2}
+
+    def test_failures_are_logged_not_raised(self, writer, run_id):
+        """Test that a failing batch is reported by flush() instead of raising."""
+        writer.log_metric("loss", 0.2, run_id="0" * 32)
+        writer.log_metric("loss", 0.3, run_id=run_id)
+
+        assert writer.flush() is False
+        assert writer.failed_batches == 1
+        assert writer.sent_batches == 1
+        assert writer.pending_count() == 0
+
+    def test_conflicting_param_does_not_drop_metrics(self, writer, client, run_id):
+        """Test that a rejected param is isolated and the rest of its batch is still sent."""
+        client.log_param(run_id, "learning_rate", "0.001")
+        writer.log_params({"learning_rate": 0.002, "batch_size": 16}, run_id=run_id)
+        writer.log_metric("loss", 0.2, run_id=run_id)
+        writer.set_tag("stage", "hpo", run_id=run_id)
+
+        assert writer.flush() is False
+        data = client.get_run(run_id).data
+        assert data.metrics == {"loss": 0.2}
+        assert data.params == {"learning_rate": "0.001", "batch_size": "16"}
+        assert data.tags["stage"] == "hpo"
+        assert writer.failed_batches == 1
+        assert writer.sent_batches == 2
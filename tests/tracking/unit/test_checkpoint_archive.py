@@ -0,0 +1,122 @@
+"""Unit tests for checkpoint archive formats, manifests and extraction."""
+
+import gzip
+import hashlib
+import io
+import json
+import tarfile
+
+import pytest
+
+from common.shared.archive_utils import (
+    ARCHIVE_MANIFEST_NAME,
+    ParallelGzipWriter,
+    detect_archive_format,
+    extract_archive,
+    strip_archive_suffix,
+)
+from infrastructure.tracking.mlflow.artifacts.manager import (
+    create_checkpoint_archive,
+    write_checkpoint_archive,
+)
+
+
+@pytest.fixture
+def checkpoint_dir(tmp_path):
+    """Create a small checkpoint directory."""
+    checkpoint = tmp_path / "checkpoint"
+    (checkpoint / "tokenizer").mkdir(parents=True)
+    (checkpoint / "model.safetensors").write_bytes(bytes(range(256)) * 4096)
+    (checkpoint / "config.json").write_text(json.dumps({"model_type": "deberta-v2"}))
+    (checkpoint / "tokenizer" / "vocab.txt").write_text("[PAD]\n[UNK]\n")
+    (checkpoint / "train.log").write_text("skipped")
+    return checkpoint
+
+
+class TestArchiveFormats:
+    """Test archive format names and suffixes."""
+
+    @pytest.mark.parametrize("name,archive_format,base", [
+        ("best_trial_checkpoint.tar.gz", "tar.gz", "best_trial_checkpoint"),
+        ("checkpoint.tgz", "tar.gz", "checkpoint"),
+        ("checkpoint.tar", "tar", "checkpoint"),
+        ("checkpoint.tar.zst", "tar.zst", "checkpoint"),
+        ("checkpoint_manifest.json", None, "checkpoint_manifest.json"),
+    ])
+    def test_detect_and_strip(self, name, archive_format, base):
+        """Test format detection and suffix removal."""
+        assert detect_archive_format(name) == archive_format
+        assert strip_archive_suffix(name) == base
+
+    def test_parallel_gzip_is_standard_gzip(self):
+        """Test that block-compressed output decompresses with the gzip module."""
+        data = bytes(range(256)) * 1000
+        out = io.BytesIO()
+        writer = ParallelGzipWriter(out, compression_level=1, threads=3, block_size=10_000)
+        for i in range(0, len(data), 7_000):
+            writer.write(data[i:i + 7_000])
+        writer.close()
+
+        assert gzip.decompress(out.getvalue()) == data
+
+
+class TestCheckpointArchive:
+    """Test checkpoint archive creation and extraction."""
+
+    @pytest.mark.parametrize("archive_format", ["tar", "tar.gz"])
+    def test_round_trip(self, checkpoint_dir, tmp_path, archive_format):
+        """Test that files are archived with hashes and extracted with verification."""
+        archive_path, manifest = create_checkpoint_archive(
+            checkpoint_dir, trial_number=3, archive_format=archive_format, threads=2)
+
+        assert archive_path.name.endswith(f".{archive_format}")
+        assert manifest["archive_format"] == archive_format
+        assert manifest["file_count"] == 3
+        files = {f["path"]: f for f in manifest["files"]}
+        assert set(files) == {"model.safetensors", "config.json", "tokenizer/vocab.txt"}
+        assert files["config.json"]["sha256"] == hashlib.sha256(
+            (checkpoint_dir / "config.json").read_bytes()).hexdigest()
+
+        extracted = extract_archive(archive_path, tmp_path / "out", threads=2)
+
+        assert extracted == manifest
+        root = tmp_path / "out" / "best_trial_checkpoint"
+        assert (root / "model.safetensors").read_bytes() == (
+            checkpoint_dir / "model.safetensors").read_bytes()
+        assert (root / "tokenizer" / "vocab.txt").exists()
+        assert not (tmp_path / "out" / ARCHIVE_MANIFEST_NAME).exists()
+
+    def test_tar_gz_readable_by_tarfile(self, checkpoint_dir):
+        """Test that parallel-gzip archives stay readable by plain tar.gz readers."""
+        out = io.BytesIO()
+        write_checkpoint_archive(checkpoint_dir, out, trial_number=0, archive_format="tar.gz")
+
+        with tarfile.open(fileobj=io.BytesIO(out.getvalue()), mode="r:gz") as tar:
+            names = tar.getnames()
+        assert "best_trial_checkpoint/config.json" in names
+        assert names[-1] == ARCHIVE_MANIFEST_NAME
+
+    def test_tar_zst_round_trip(self, checkpoint_dir, tmp_path):
+        """Test the zstd format when zstandard is installed."""
+        pytest.importorskip("zstandard")
+        archive_path, manifest = create_checkpoint_archive(
+            checkpoint_dir, trial_number=0, archive_format="tar.zst")
+
+        assert extract_archive(archive_path, tmp_path / "out") == manifest
+
+    def test_corrupt_file_detected(self, checkpoint_dir, tmp_path):
+        """Test that extraction fails when a file does not match the manifest."""
+        archive_path, _ = create_checkpoint_archive(
+            checkpoint_dir, trial_number=0, archive_format="tar")
+        data = bytearray(archive_path.read_bytes())
+        offset = data.index(bytes(range(256)))
+        data[offset] ^= 0xFF
+        archive_path.write_bytes(bytes(data))
+
+        with pytest.raises(ValueError, match="Checksum mismatch"):
+            extract_archive(archive_path, tmp_path / "out")
+
+    def test_unknown_format_rejected(self, checkpoint_dir):
+        """Test that unknown formats raise ValueError."""
+        with pytest.raises(ValueError, match="zip"):
+            create_checkpoint_archive(checkpoint_dir, trial_number=0, archive_format="zip")
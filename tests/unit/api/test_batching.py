@@ -0,0 +1,145 @@
+"""Unit tests for the micro-batching scheduler."""
+
+import threading
+
+import pytest
+
+from src.deployment.api.exceptions import ServiceOverloadedError
+from src.deployment.api.inference.batching import MicroBatchScheduler
+
+
+class TestMicroBatchScheduler:
+    """Test cases for MicroBatchScheduler."""
+
+    def test_single_text_result(self):
+        """Test that a lone submission is resolved with its own result."""
+        scheduler = MicroBatchScheduler(lambda texts: [t.upper() for t in texts])
+        try:
+            assert scheduler.submit("hello").result(timeout=2) == "HELLO"
+        finally:
+            scheduler.close()
+
+    def test_concurrent_texts_coalesced_into_one_batch(self):
+        """Test that texts queued within the wait window share one call."""
+        calls = []
+        release = threading.Event()
+
+        def batch_fn(texts):
+            calls.append(list(texts))
+            release.wait(2)
+            return [len(t) for t in texts]
+
+        scheduler = MicroBatchScheduler(batch_fn, max_batch_size=8, max_wait_ms=200)
+        try:
+            futures = [scheduler.submit(t) for t in ["a", "bb", "ccc"]]
+            release.set()
+            assert [f.result(timeout=2) for f in futures] == [1, 2, 3]
+            assert calls == [["a", "bb", "ccc"]]
+        finally:
+            scheduler.close()
+
+    def test_max_batch_size_respected(self):
+        """Test that batches never exceed max_batch_size."""
+        sizes = []
+
+        def batch_fn(texts):
+            sizes.append(len(texts))
+            return texts
+
+        scheduler = MicroBatchScheduler(batch_fn, max_batch_size=2, max_wait_ms=50)
+        try:
+            futures = [scheduler.submit(str(i)) for i in range(5)]
+            assert [f.result(timeout=2) for f in futures] == [str(i) for i in range(5)]
+            assert max(sizes) <= 2
+            assert sum(sizes) == 5
+        finally:
+            scheduler.close()
+
+    def test_failing_text_isolated_from_batch(self):
+        """Test that one failing text does not fail the texts batched with it."""
+        def batch_fn(texts):
+            if "bad" in texts:
+                raise ValueError("bad input")
+            return texts
+
+        scheduler = MicroBatchScheduler(batch_fn, max_batch_size=4, max_wait_ms=100)
+        try:
+            good = scheduler.submit("good")
+            bad = scheduler.submit("bad")
+            assert good.result(timeout=2) == "good"
+            with pytest.raises(ValueError):
+                bad.result(timeout=2)
+        finally:
+            scheduler.close()
+
+    def test_full_queue_rejects_submissions(self):
+        """Test that texts beyond max_queue_size are rejected instead of queued."""
+        started, release = threading.Event(), threading.Event()
+
+        def batch_fn(texts):
+            started.set()
+            release.wait(2)
+            return texts
+
+        scheduler = MicroBatchScheduler(
+            batch_fn, max_batch_size=1, max_wait_ms=0, max_queue_size=2)
+        try:
+            running = scheduler.submit("running")
+            assert started.wait(2)
+            queued = [scheduler.submit("a"), scheduler.submit("b")]
+            with pytest.raises(ServiceOverloadedError):
+                scheduler.submit("c")
+
+            release.set()
+            assert running.result(timeout=2) == "running"
+            assert [f.result(timeout=2) for f in queued] == ["a", "b"]
+            # Slots free up once the worker drains the queue
+            assert scheduler.submit("d").result(timeout=2) == "d"
+        finally:
+            release.set()
+            scheduler.close()
+
+    def test_submit_after_close_raises(self):
+        """Test that a closed scheduler rejects new texts."""
+        scheduler = MicroBatchScheduler(lambda texts: texts)
+        scheduler.close()
+        with pytest.raises(RuntimeError):
+            scheduler.submit("text")
+
+    def test_invalid_configuration(self):
+        """Test that invalid batch size and wait values are rejected."""
+        with pytest.raises(ValueError):
+            MicroBatchScheduler(lambda texts: texts, max_batch_size=0)
+        with pytest.raises(ValueError):
+            MicroBatchScheduler(lambda texts: texts, max_wait_ms=-1)
+        with pytest.raises(ValueError):
+            MicroBatchScheduler(lambda texts: texts, max_queue_size=0)
+
+    def test_concurrent_batches_use_different_pooled_sessions(self, monkeypatch):
+        """Test that batches flushed onto the executor run on separate sessions."""
+        from src.deployment.api.executors import BoundedExecutor
+        from src.deployment.api.inference.session_pool import SessionPool
+
+        monkeypatch.setattr(SessionPool, "_create_session", lambda self, affinity: object())
+        pool = SessionPool("model.onnx", ["CPUExecutionProvider"], num_sessions=2)
+        executor = BoundedExecutor("inference", max_workers=2, max_queue=4)
+        both_running = threading.Barrier(2, timeout=2)
+        used = []
+
+        def batch_fn(texts):
+            with pool.acquire(timeout=2) as session:
+                used.append(session)
+                # Only passes if both batches hold a session at the same time
+                both_running.wait()
+            return texts
+
+        scheduler = MicroBatchScheduler(
+            batch_fn, max_batch_size=1, max_wait_ms=0, executor=executor)
+        try:
+            futures = [scheduler.submit("a"), scheduler.submit("b")]
+            assert [f.result(timeout=3) for f in futures] == ["a", "b"]
+            assert len(used) == 2
+            assert used[0] is not used[1]
+        finally:
+            scheduler.close()
+            executor.shutdown()
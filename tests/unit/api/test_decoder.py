@@ -0,0 +1,95 @@
+"""Unit tests for the entity decoder."""
+
+import numpy as np
+import pytest
+
+from src.deployment.api.inference.decoder import EntityDecoder
+
+
+TEXT = "john doe works at microsoft in seattle"
+# [CLS] john doe works at microsoft in seattle [SEP] [PAD]
+OFFSETS = np.array([
+    (0, 0), (0, 4), (5, 8), (9, 14), (15, 17), (18, 27), (28, 30), (31, 38), (0, 0), (0, 0),
+])
+MASK = np.array([1, 1, 1, 1, 1, 1, 1, 1, 1, 0])
+
+
+def one_hot_logits(label_ids, num_labels):
+    """Build logits whose argmax follows ``label_ids``."""
+    logits = np.zeros((len(label_ids), num_labels), dtype=np.float32)
+    logits[np.arange(len(label_ids)), label_ids] = 5.0
+    return logits
+
+
+def reference_decode(decoder, text, logits, offsets, mask):
+    """Decode with the per-token Python path."""
+    labels = [decoder.id2label.get(int(i), "O") for i in np.argmax(logits, axis=-1)]
+    tokens = ["tok"] * len(logits)
+    return decoder._extract_entities_from_bio(text, tokens, labels, logits, mask, offsets)
+
+
+class TestEntityDecoder:
+    """Test cases for vectorized EntityDecoder decoding."""
+
+    @pytest.fixture
+    def bio_decoder(self):
+        """Decoder with BIO labels."""
+        return EntityDecoder({0: "O", 1: "B-NAME", 2: "I-NAME", 3: "B-ORG", 4: "I-ORG"})
+
+    def test_bio_spans(self, bio_decoder):
+        """Test B-/I- runs, type switches and O gaps."""
+        logits = one_hot_logits([0, 1, 2, 0, 0, 3, 0, 2, 0, 4], 5)
+        entities = bio_decoder.decode_batch([TEXT], [logits], [MASK], [OFFSETS])[0]
+
+        assert [(e["text"], e["label"]) for e in entities] == [
+            ("john doe", "NAME"), ("microsoft", "ORG"), ("seattle", "NAME"),
+        ]
+        # Padding tokens never start an entity
+        assert all(e["end"] <= len(TEXT) for e in entities)
+
+    def test_flat_labels(self):
+        """Test that consecutive flat labels of one type merge."""
+        decoder = EntityDecoder({0: "O", 1: "NAME", 2: "LOCATION"})
+        logits = one_hot_logits([0, 1, 1, 0, 0, 0, 0, 2, 0, 0], 3)
+        entities = decoder.decode_batch([TEXT], [logits], [MASK], [OFFSETS])[0]
+
+        assert [(e["text"], e["label"]) for e in entities] == [
+            ("john doe", "NAME"), ("seattle", "LOCATION"),
+        ]
+
+    def test_matches_per_token_path(self, bio_decoder):
+        """Test that vectorized output matches the Python fallback on random logits."""
+        rng = np.random.default_rng(0)
+        for _ in range(20):
+            logits = rng.normal(size=(len(OFFSETS), 5)).astype(np.float32)
+            vectorized = bio_decoder.decode_batch([TEXT], [logits], [MASK], [OFFSETS])[0]
+            reference = reference_decode(bio_decoder, TEXT, logits, OFFSETS, MASK)
+
+            assert [{k: v for k, v in e.items() if k != "confidence"} for e in vectorized] == [
+                {k: v for k, v in e.items() if k != "confidence"} for e in reference
+            ]
+            np.testing.assert_allclose(
+                [e["confidence"] for e in vectorized],
+                [e["confidence"] for e in reference],
+                rtol=1e-5,
+            )
+
+    def test_batch_rows_do_not_merge(self, bio_decoder):
+        """Test that an entity ending one row does not continue into the next."""
+        logits = one_hot_logits([0, 0, 0, 0, 0, 0, 0, 2, 0, 0], 5)
+        first_token = one_hot_logits([0, 2, 0, 0, 0, 0, 0, 0, 0, 0], 5)
+        entities = bio_decoder.decode_batch(
+            [TEXT, TEXT], np.stack([logits, first_token]), [MASK, MASK], [OFFSETS, OFFSETS])
+
+        assert [[e["text"] for e in row] for row in entities] == [["seattle"], ["john"]]
+
+    def test_decode_entities_without_confidence(self, bio_decoder):
+        """Test the single-text entry point with confidence disabled."""
+        logits = one_hot_logits([0, 1, 2, 0, 0, 0, 0, 0, 0, 0], 5)
+        entities = bio_decoder.decode_entities(
+            TEXT, logits, ["tok"] * len(logits), {"attention_mask": MASK[None, :]},
+            OFFSETS, return_confidence=False)
+
+        assert entities == [
+            {"text": "john doe", "label": "NAME", "start": 0, "end": 8, "confidence": None},
+        ]
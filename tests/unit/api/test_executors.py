@@ -0,0 +1,58 @@
+"""Unit tests for the bounded API worker pools."""
+
+import asyncio
+import threading
+
+import pytest
+
+from src.deployment.api.exceptions import ServiceOverloadedError
+from src.deployment.api.executors import BoundedExecutor
+
+
+class TestBoundedExecutor:
+    """Test cases for BoundedExecutor."""
+
+    def test_run_returns_result(self):
+        """Test that awaiting run yields the callable's result."""
+        executor = BoundedExecutor("test", max_workers=1, max_queue=0)
+        try:
+            assert asyncio.run(executor.run(lambda x, y=1: x + y, 2, y=3)) == 5
+        finally:
+            executor.shutdown()
+
+    def test_rejects_when_saturated(self):
+        """Test that submissions beyond workers + queue raise ServiceOverloadedError."""
+        release = threading.Event()
+        executor = BoundedExecutor("test", max_workers=1, max_queue=1)
+        try:
+            running = executor.submit(release.wait, 2)
+            queued = executor.submit(release.wait, 2)
+            assert executor.pending == 2
+            with pytest.raises(ServiceOverloadedError):
+                executor.submit(release.wait, 2)
+
+            release.set()
+            running.result(timeout=2)
+            queued.result(timeout=2)
+            # Slots are released once tasks finish
+            assert executor.submit(lambda: "ok").result(timeout=2) == "ok"
+        finally:
+            release.set()
+            executor.shutdown()
+
+    def test_failed_task_releases_slot(self):
+        """Test that exceptions propagate and free their slot."""
+        executor = BoundedExecutor("test", max_workers=1, max_queue=0)
+        try:
+            with pytest.raises(ZeroDivisionError):
+                executor.submit(lambda: 1 / 0).result(timeout=2)
+            assert executor.submit(lambda: 1).result(timeout=2) == 1
+        finally:
+            executor.shutdown()
+
+    def test_invalid_configuration(self):
+        """Test that invalid pool sizes are rejected."""
+        with pytest.raises(ValueError):
+            BoundedExecutor("test", max_workers=0, max_queue=1)
+        with pytest.raises(ValueError):
+            BoundedExecutor("test", max_workers=1, max_queue=-1)
@@ -5,8 +5,9 @@ from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
 import numpy as np
 
-from src.deployment.api.inference import ONNXInferenceEngine
+from src.deployment.api.inference import InferenceRunner, ONNXInferenceEngine
 from src.deployment.api.exceptions import InferenceError, ModelNotLoadedError
+from common.shared.tokenization_utils import OnnxTokenization
 
 
 class TestONNXInferenceEngine:
@@ -69,8 +70,7 @@ class TestONNXInferenceEngine:
                 tmp_path / "nonexistent",
             )
 
-    @patch("src.deployment.api.inference.engine.prepare_onnx_inputs")
-    @patch("src.deployment.api.inference.engine.get_offset_mapping")
+    @patch("src.deployment.api.inference.engine.tokenize_for_onnx")
     @patch("transformers.AutoTokenizer")
     @patch("transformers.AutoConfig")
     @patch("onnxruntime.InferenceSession")
@@ -79,8 +79,7 @@ class TestONNXInferenceEngine:
         mock_session,
         mock_config,
         mock_tokenizer,
-        mock_get_offset_mapping,
-        mock_prepare_onnx_inputs,
+        mock_tokenize_for_onnx,
         mock_onnx_path,
         mock_checkpoint_dir,
     ):
@@ -96,12 +95,14 @@ class TestONNXInferenceEngine:
             np.random.randn(1, 10, 5)  # (batch, seq_len, num_labels)
         ]
 
-        # Mock prepare_onnx_inputs to return proper format
-        mock_prepare_onnx_inputs.return_value = {
-            "input_ids": np.array([[1, 2, 3, 4, 5]], dtype=np.int64),
-            "attention_mask": np.array([[1, 1, 1, 1, 1]], dtype=np.int64),
-        }
-        mock_get_offset_mapping.return_value = np.array([[(0, 0), (0, 4), (5, 8), (0, 0), (0, 0)]])
+        # Mock tokenize_for_onnx to return proper format
+        mock_tokenize_for_onnx.return_value = OnnxTokenization.from_feeds(
+            {
+                "input_ids": np.array([[1, 2, 3, 4, 5]], dtype=np.int64),
+                "attention_mask": np.array([[1, 1, 1, 1, 1]], dtype=np.int64),
+            },
+            np.array([[(0, 0), (0, 4), (5, 8), (0, 0), (0, 0)]]),
+        )
 
         # Create a callable mock tokenizer
         mock_tokenizer_instance = MagicMock()
@@ -116,11 +117,13 @@ class TestONNXInferenceEngine:
         mock_config.from_pretrained.return_value = mock_config_instance
 
         # Set return values for the already-patched functions
-        mock_prepare_onnx_inputs.return_value = {
-            "input_ids": np.array([[1, 2, 3, 4, 5]], dtype=np.int64),
-            "attention_mask": np.array([[1, 1, 1, 1, 1]], dtype=np.int64),
-        }
-        mock_get_offset_mapping.return_value = np.array([[(0, 0), (0, 4), (5, 8), (0, 0), (0, 0)]])
+        mock_tokenize_for_onnx.return_value = OnnxTokenization.from_feeds(
+            {
+                "input_ids": np.array([[1, 2, 3, 4, 5]], dtype=np.int64),
+                "attention_mask": np.array([[1, 1, 1, 1, 1]], dtype=np.int64),
+            },
+            np.array([[(0, 0), (0, 4), (5, 8), (0, 0), (0, 0)]]),
+        )
 
         # Create engine and predict
         engine = ONNXInferenceEngine(mock_onnx_path, mock_checkpoint_dir)
@@ -145,3 +148,134 @@ class TestONNXInferenceEngine:
             engine.predict_tokens("test")
 
 
+
+
+class TestSlidingWindowInference:
+    """Test cases for merging overlapping windows in InferenceRunner."""
+
+    @patch("src.deployment.api.inference.engine.tokenize_for_onnx")
+    def test_overlapping_windows_merged(self, mock_tokenize_for_onnx):
+        """Test that windows of a long text merge into one sequence."""
+        # Text 0 spans two windows sharing the token at (5, 8); text 1 fits in one
+        mock_tokenize_for_onnx.return_value = OnnxTokenization.from_feeds(
+            {
+                "input_ids": np.array([[101, 7, 8, 102], [101, 8, 9, 102], [101, 5, 102, 0]]),
+                "attention_mask": np.array([[1, 1, 1, 1], [1, 1, 1, 1], [1, 1, 1, 0]]),
+            },
+            np.array([
+                [(0, 0), (0, 4), (5, 8), (0, 0)],
+                [(0, 0), (5, 8), (9, 12), (0, 0)],
+                [(0, 0), (0, 3), (0, 0), (0, 0)],
+            ]),
+            sample_mapping=np.array([0, 0, 1]),
+        )
+        logits = np.zeros((3, 4, 2), dtype=np.float32)
+        logits[0, 2] = [1.0, 0.0]
+        logits[1, 1] = [0.0, 1.0]
+        session = MagicMock()
+        session.run.return_value = [logits]
+        tokenizer = MagicMock()
+        tokenizer.convert_ids_to_tokens.side_effect = lambda ids: [str(i) for i in ids]
+
+        runner = InferenceRunner(session, tokenizer, 4, padding_buckets=[], window_stride=1)
+        results = runner.predict_tokens_batch(["john doe smith", "bob"])
+
+        assert session.run.call_count == 1
+        merged_logits, tokens, tokenizer_output, offsets = results[0]
+        assert offsets.tolist() == [[0, 4], [5, 8], [9, 12]]
+        assert tokens == ["7", "8", "9"]
+        np.testing.assert_allclose(merged_logits[1], [0.5, 0.5])
+        assert tokenizer_output["attention_mask"].shape == (1, 3)
+        assert results[1][3].tolist() == [[0, 3]]
+        assert mock_tokenize_for_onnx.call_args.kwargs["stride"] == 1
+
+
+class TestLeanInferencePath:
+    """Test cases for input caching and the memory guard in InferenceRunner."""
+
+    @pytest.fixture
+    def tokenization(self):
+        """Single-text tokenization returned by the patched tokenizer helper."""
+        return OnnxTokenization.from_feeds(
+            {"input_ids": np.array([[101, 7, 102]]), "attention_mask": np.array([[1, 1, 1]])},
+            np.array([[(0, 0), (0, 4), (0, 0)]]),
+        )
+
+    @pytest.fixture
+    def session(self):
+        """Mock ONNX session with two named inputs."""
+        session = MagicMock()
+        inputs = [MagicMock(), MagicMock()]
+        inputs[0].name, inputs[1].name = "input_ids", "attention_mask"
+        session.get_inputs.return_value = inputs
+        session.run.side_effect = lambda *args: [np.zeros((1, 3, 2), dtype=np.float32)]
+        return session
+
+    @patch("src.deployment.api.inference.engine.tokenize_for_onnx")
+    def test_input_names_read_once(self, mock_tokenize_for_onnx, session, tokenization):
+        """Test that session inputs are read at load time, not per request."""
+        mock_tokenize_for_onnx.return_value = tokenization
+        runner = InferenceRunner(session, MagicMock(), 3, padding_buckets=[])
+        for _ in range(3):
+            runner.predict_tokens("john")
+
+        assert session.get_inputs.call_count == 1
+        assert mock_tokenize_for_onnx.call_args.args[3] == {"input_ids", "attention_mask"}
+
+    @patch("src.deployment.api.inference.engine.tokenize_for_onnx")
+    def test_arena_shrink_every_interval(
+        self, mock_tokenize_for_onnx, session, tokenization, monkeypatch
+    ):
+        """Test that arena shrinkage is requested every N runs only."""
+        pytest.importorskip("onnxruntime")
+        from src.deployment.api.config import APIConfig
+
+        monkeypatch.setattr(APIConfig, "ARENA_SHRINK_INTERVAL", 2)
+        mock_tokenize_for_onnx.return_value = tokenization
+        runner = InferenceRunner(
+            session, MagicMock(), 3, padding_buckets=[], memory_guard_mode="arena_shrink")
+        for _ in range(4):
+            runner.predict_tokens("john")
+
+        run_options = [c.args[2] for c in session.run.call_args_list]
+        assert [o is not None for o in run_options] == [False, True, False, True]
+        assert runner.arena_shrink_count == 2
+
+    def test_run_count_is_thread_safe(self, session):
+        """Test that concurrent session runs are all counted."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        runner = InferenceRunner(session, MagicMock(), 3, padding_buckets=[])
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(lambda _: runner._next_run_options(), range(2000)))
+
+        assert runner.run_count == 2000
+
+    @patch("src.deployment.api.inference.engine.tokenize_for_onnx")
+    def test_sub_batches_sorted_and_trimmed(self, mock_tokenize_for_onnx, session):
+        """Test that large batches run as length-sorted sub-batches in row order."""
+        lengths = [6, 2, 5, 1]
+        mask = np.array([[1] * n + [0] * (8 - n) for n in lengths])
+        mock_tokenize_for_onnx.return_value = OnnxTokenization.from_feeds(
+            {"input_ids": mask * 7, "attention_mask": mask},
+            np.zeros((4, 8, 2), dtype=np.int64),
+        )
+        # Each row's logits encode its number of real tokens
+        session.run.side_effect = lambda names, feeds, options: [
+            np.repeat(feeds["attention_mask"].sum(axis=1)[:, None, None], 2, axis=2)
+            * np.ones((1, feeds["attention_mask"].shape[1], 1))
+        ]
+        tokenizer = MagicMock(padding_side="right")
+        runner = InferenceRunner(
+            session, tokenizer, 8, padding_buckets=[2, 4, 8], sub_batch_size=2)
+        results = runner.predict_tokens_batch(["a", "b", "c", "d"])
+
+        widths = [c.args[1]["input_ids"].shape for c in session.run.call_args_list]
+        assert widths == [(2, 2), (2, 8)]
+        assert [int(r[0][0, 0]) for r in results] == lengths
+        assert all(r[0].shape == (8, 2) for r in results)
+
+    def test_unknown_memory_guard_mode(self, session):
+        """Test that an unknown memory guard mode is rejected."""
+        with pytest.raises(ValueError):
+            InferenceRunner(session, MagicMock(), 3, memory_guard_mode="gc")
@@ -13,6 +13,7 @@ from unittest.mock import Mock, patch, MagicMock
 # Handle missing dependencies gracefully
 try:
     from src.deployment.api.inference import ONNXInferenceEngine
+    from common.shared.tokenization_utils import OnnxTokenization
     from src.deployment.api.exceptions import InferenceError
     INFERENCE_AVAILABLE = True
 except ImportError:
@@ -54,18 +55,19 @@ class TestInferenceFixes:
         """Test that tokenization with return_tensors='np' returns numpy arrays."""
         onnx_path, checkpoint_dir = mock_setup
         
-        with patch("src.deployment.api.inference.engine.prepare_onnx_inputs") as mock_prepare, \
-             patch("src.deployment.api.inference.engine.get_offset_mapping") as mock_get_offset, \
+        with patch("src.deployment.api.inference.engine.tokenize_for_onnx") as mock_tokenize, \
              patch("onnxruntime.InferenceSession") as mock_session, \
              patch("transformers.AutoTokenizer") as mock_tokenizer_class, \
              patch("transformers.AutoConfig") as mock_config:
             
-            # Setup prepare_onnx_inputs and get_offset_mapping mocks
-            mock_prepare.return_value = {
-                "input_ids": np.array([[1, 2, 3, 4]], dtype=np.int64),
-                "attention_mask": np.array([[1, 1, 1, 1]], dtype=np.int64),
-            }
-            mock_get_offset.return_value = np.array([[(0, 0), (0, 4), (5, 8), (0, 0)]])
+            # Setup tokenize_for_onnx mock (feeds and offsets from one tokenizer call)
+            mock_tokenize.return_value = OnnxTokenization.from_feeds(
+                {
+                    "input_ids": np.array([[1, 2, 3, 4]], dtype=np.int64),
+                    "attention_mask": np.array([[1, 1, 1, 1]], dtype=np.int64),
+                },
+                np.array([[(0, 0), (0, 4), (5, 8), (0, 0)]]),
+            )
             
             # Setup session
             mock_session_instance = MagicMock()
@@ -138,19 +140,20 @@ class TestInferenceFixes:
         """Test that offset mapping is correctly extracted from tokenizer output."""
         onnx_path, checkpoint_dir = mock_setup
         
-        with patch("src.deployment.api.inference.engine.prepare_onnx_inputs") as mock_prepare, \
-             patch("src.deployment.api.inference.engine.get_offset_mapping") as mock_get_offset, \
+        with patch("src.deployment.api.inference.engine.tokenize_for_onnx") as mock_tokenize, \
              patch("onnxruntime.InferenceSession") as mock_session, \
              patch("transformers.AutoTokenizer") as mock_tokenizer_class, \
              patch("transformers.AutoConfig") as mock_config:
             
-            # Setup prepare_onnx_inputs and get_offset_mapping mocks
+            # Setup tokenize_for_onnx mock (feeds and offsets from one tokenizer call)
             expected_offsets = [(0, 0), (0, 4), (5, 8), (0, 0)]  # CLS, John, Doe, SEP
-            mock_prepare.return_value = {
-                "input_ids": np.array([[1, 2, 3, 4]], dtype=np.int64),
-                "attention_mask": np.array([[1, 1, 1, 1]], dtype=np.int64),
-            }
-            mock_get_offset.return_value = np.array([expected_offsets])
+            mock_tokenize.return_value = OnnxTokenization.from_feeds(
+                {
+                    "input_ids": np.array([[1, 2, 3, 4]], dtype=np.int64),
+                    "attention_mask": np.array([[1, 1, 1, 1]], dtype=np.int64),
+                },
+                np.array([expected_offsets]),
+            )
             
             # Setup mocks
             mock_session_instance = MagicMock()
@@ -194,31 +197,20 @@ class TestInferenceFixes:
             
             # Verify offset mapping
             assert offset_mapping is not None
-            # offset_mapping is returned from get_offset_mapping which returns a 2D array
-            # The shape should be (1, 4) for batch_size=1, seq_len=4
-            # We need to check the first (and only) row
-            if offset_mapping.ndim >= 2:
-                # It's a 2D array, check the first row
-                actual_offsets = offset_mapping[0]
-                assert len(actual_offsets) == len(expected_offsets), \
-                    f"Expected {len(expected_offsets)} offsets, got {len(actual_offsets)}. Shape: {offset_mapping.shape}"
-                # Check that special tokens have (0, 0) offset
-                assert actual_offsets[0][0] == 0 and actual_offsets[0][1] == 0  # CLS
-                assert actual_offsets[3][0] == 0 and actual_offsets[3][1] == 0  # SEP
-            else:
-                # It's a 1D array
-                assert len(offset_mapping) == len(expected_offsets)
-                # Check that special tokens have (0, 0) offset
-                assert offset_mapping[0][0] == 0 and offset_mapping[0][1] == 0  # CLS
-                assert offset_mapping[3][0] == 0 and offset_mapping[3][1] == 0  # SEP
+            # Per-text offset mapping has shape (seq_len, 2)
+            assert offset_mapping.shape == (len(expected_offsets), 2), \
+                f"Expected shape {(len(expected_offsets), 2)}, got {offset_mapping.shape}"
+            assert offset_mapping.tolist() == [list(o) for o in expected_offsets]
+            # Check that special tokens have (0, 0) offset
+            assert offset_mapping[0][0] == 0 and offset_mapping[0][1] == 0  # CLS
+            assert offset_mapping[3][0] == 0 and offset_mapping[3][1] == 0  # SEP
 
     def test_entity_extraction_with_offsets(self, mock_setup, mock_id2label):
         """Test that entities are extracted correctly using offset mapping."""
         onnx_path, checkpoint_dir = mock_setup
         text = "John Doe works at Google"
         
-        with patch("src.deployment.api.inference.engine.prepare_onnx_inputs") as mock_prepare, \
-             patch("src.deployment.api.inference.engine.get_offset_mapping") as mock_get_offset, \
+        with patch("src.deployment.api.inference.engine.tokenize_for_onnx") as mock_tokenize, \
              patch("onnxruntime.InferenceSession") as mock_session, \
              patch("transformers.AutoTokenizer") as mock_tokenizer_class, \
              patch("transformers.AutoConfig") as mock_config:
@@ -235,12 +227,14 @@ class TestInferenceFixes:
                 (0, 0),      # SEP
             ]
             
-            # Setup prepare_onnx_inputs and get_offset_mapping mocks
-            mock_prepare.return_value = {
-                "input_ids": np.array([[1, 2, 3, 4, 5, 6, 7]], dtype=np.int64),
-                "attention_mask": np.array([[1, 1, 1, 1, 1, 1, 1]], dtype=np.int64),
-            }
-            mock_get_offset.return_value = np.array([offset_mapping_list])
+            # Setup tokenize_for_onnx mock (feeds and offsets from one tokenizer call)
+            mock_tokenize.return_value = OnnxTokenization.from_feeds(
+                {
+                    "input_ids": np.array([[1, 2, 3, 4, 5, 6, 7]], dtype=np.int64),
+                    "attention_mask": np.array([[1, 1, 1, 1, 1, 1, 1]], dtype=np.int64),
+                },
+                np.array([offset_mapping_list]),
+            )
             
             # Setup mocks
             mock_session_instance = MagicMock()
@@ -323,18 +317,19 @@ class TestInferenceFixes:
         """Test that special tokens don't cause the code to hang."""
         onnx_path, checkpoint_dir = mock_setup
         
-        with patch("src.deployment.api.inference.engine.prepare_onnx_inputs") as mock_prepare, \
-             patch("src.deployment.api.inference.engine.get_offset_mapping") as mock_get_offset, \
+        with patch("src.deployment.api.inference.engine.tokenize_for_onnx") as mock_tokenize, \
              patch("onnxruntime.InferenceSession") as mock_session, \
              patch("transformers.AutoTokenizer") as mock_tokenizer_class, \
              patch("transformers.AutoConfig") as mock_config:
             
-            # Setup prepare_onnx_inputs and get_offset_mapping mocks
-            mock_prepare.return_value = {
-                "input_ids": np.array([[1, 2, 3, 0, 0, 0]], dtype=np.int64),
-                "attention_mask": np.array([[1, 1, 1, 0, 0, 0]], dtype=np.int64),
-            }
-            mock_get_offset.return_value = np.array([[(0, 0), (0, 0), (0, 0), (0, 0), (0, 0), (0, 0)]])
+            # Setup tokenize_for_onnx mock (feeds and offsets from one tokenizer call)
+            mock_tokenize.return_value = OnnxTokenization.from_feeds(
+                {
+                    "input_ids": np.array([[1, 2, 3, 0, 0, 0]], dtype=np.int64),
+                    "attention_mask": np.array([[1, 1, 1, 0, 0, 0]], dtype=np.int64),
+                },
+                np.array([[(0, 0), (0, 0), (0, 0), (0, 0), (0, 0), (0, 0)]]),
+            )
             
             # Setup mocks
             mock_session_instance = MagicMock()
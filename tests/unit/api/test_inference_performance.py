@@ -22,6 +22,7 @@ except ImportError:
 
 try:
     from src.deployment.api.inference import ONNXInferenceEngine
+    from common.shared.tokenization_utils import OnnxTokenization
     from src.deployment.api.exceptions import InferenceError, ModelNotLoadedError
     INFERENCE_AVAILABLE = True
 except ImportError:
@@ -139,8 +140,7 @@ class TestInferencePerformance:
         mock_tokenizer.convert_ids_to_tokens.return_value = ["[CLS]", "John", "Doe", "[SEP]"]
         return mock_tokenizer
 
-    @patch("src.deployment.api.inference.engine.prepare_onnx_inputs")
-    @patch("src.deployment.api.inference.engine.get_offset_mapping")
+    @patch("src.deployment.api.inference.engine.tokenize_for_onnx")
     @patch("transformers.AutoTokenizer")
     @patch("transformers.AutoConfig")
     @patch("onnxruntime.InferenceSession")
@@ -149,20 +149,21 @@ class TestInferencePerformance:
         mock_session,
         mock_config,
         mock_tokenizer_class,
-        mock_get_offset_mapping,
-        mock_prepare_onnx_inputs,
+        mock_tokenize_for_onnx,
         mock_onnx_path,
         mock_checkpoint_dir,
         sample_text,
         mock_id2label,
     ):
         """Test that tokenization completes quickly without hanging."""
-        # Setup prepare_onnx_inputs and get_offset_mapping mocks
-        mock_prepare_onnx_inputs.return_value = {
-            "input_ids": np.array([[1, 2, 3, 4, 5]], dtype=np.int64),
-            "attention_mask": np.array([[1, 1, 1, 1, 1]], dtype=np.int64),
-        }
-        mock_get_offset_mapping.return_value = np.array([[(0, 0), (0, 4), (5, 8), (0, 0), (0, 0)]])
+        # Setup tokenize_for_onnx mock (feeds and offsets from one tokenizer call)
+        mock_tokenize_for_onnx.return_value = OnnxTokenization.from_feeds(
+            {
+                "input_ids": np.array([[1, 2, 3, 4, 5]], dtype=np.int64),
+                "attention_mask": np.array([[1, 1, 1, 1, 1]], dtype=np.int64),
+            },
+            np.array([[(0, 0), (0, 4), (5, 8), (0, 0), (0, 0)]]),
+        )
         
         # Setup mocks
         mock_session_instance = MagicMock()
@@ -208,8 +209,7 @@ class TestInferencePerformance:
         assert "input_ids" in tokenizer_output
         assert offset_mapping is not None or "offset_mapping" in tokenizer_output
 
-    @patch("src.deployment.api.inference.engine.prepare_onnx_inputs")
-    @patch("src.deployment.api.inference.engine.get_offset_mapping")
+    @patch("src.deployment.api.inference.engine.tokenize_for_onnx")
     @patch("transformers.AutoTokenizer")
     @patch("transformers.AutoConfig")
     @patch("onnxruntime.InferenceSession")
@@ -218,20 +218,21 @@ class TestInferencePerformance:
         mock_session,
         mock_config,
         mock_tokenizer_class,
-        mock_get_offset_mapping,
-        mock_prepare_onnx_inputs,
+        mock_tokenize_for_onnx,
         mock_onnx_path,
         mock_checkpoint_dir,
         sample_text,
         mock_id2label,
     ):
         """Test that entities are extracted correctly with offset mapping."""
-        # Setup prepare_onnx_inputs and get_offset_mapping mocks
-        mock_prepare_onnx_inputs.return_value = {
-            "input_ids": np.array([[1, 2, 3, 4, 5]], dtype=np.int64),
-            "attention_mask": np.array([[1, 1, 1, 1, 1]], dtype=np.int64),
-        }
-        mock_get_offset_mapping.return_value = np.array([[(0, 0), (0, 4), (5, 8), (0, 0), (0, 0)]])
+        # Setup tokenize_for_onnx mock (feeds and offsets from one tokenizer call)
+        mock_tokenize_for_onnx.return_value = OnnxTokenization.from_feeds(
+            {
+                "input_ids": np.array([[1, 2, 3, 4, 5]], dtype=np.int64),
+                "attention_mask": np.array([[1, 1, 1, 1, 1]], dtype=np.int64),
+            },
+            np.array([[(0, 0), (0, 4), (5, 8), (0, 0), (0, 0)]]),
+        )
         
         # Setup mocks similar to above
         mock_session_instance = MagicMock()
@@ -296,10 +297,10 @@ class TestInferencePerformance:
         mock_tokenizer_class.from_pretrained.return_value = mock_tokenizer_instance
         
         # Create logits that predict "John Doe" as PERSON
-        # First, we need to know the actual sequence length from prepare_onnx_inputs
+        # First, we need to know the actual sequence length from tokenize_for_onnx
         # The mock returns 5 tokens, so seq_len = 5
         num_labels = len(mock_id2label)
-        seq_len = 5  # From mock_prepare_onnx_inputs return value
+        seq_len = 5  # From mock_tokenize_for_onnx return value
         mock_logits = np.zeros((1, seq_len, num_labels))
         # Set high probability for O (label 0) for most tokens
         mock_logits[0, :, 0] = 10.0
@@ -329,8 +330,7 @@ class TestInferencePerformance:
         assert any("John" in text or "Doe" in text for text in entity_texts), \
             f"Expected 'John' or 'Doe' in entities, got: {entity_texts}"
 
-    @patch("src.deployment.api.inference.engine.prepare_onnx_inputs")
-    @patch("src.deployment.api.inference.engine.get_offset_mapping")
+    @patch("src.deployment.api.inference.engine.tokenize_for_onnx")
     @patch("transformers.AutoTokenizer")
     @patch("transformers.AutoConfig")
     @patch("onnxruntime.InferenceSession")
@@ -339,19 +339,20 @@ class TestInferencePerformance:
         mock_session,
         mock_config,
         mock_tokenizer_class,
-        mock_get_offset_mapping,
-        mock_prepare_onnx_inputs,
+        mock_tokenize_for_onnx,
         mock_onnx_path,
         mock_checkpoint_dir,
         mock_id2label,
     ):
         """Test that empty text is handled gracefully."""
-        # Setup prepare_onnx_inputs and get_offset_mapping mocks
-        mock_prepare_onnx_inputs.return_value = {
-            "input_ids": np.array([[1, 2]], dtype=np.int64),
-            "attention_mask": np.array([[1, 1]], dtype=np.int64),
-        }
-        mock_get_offset_mapping.return_value = np.array([[(0, 0), (0, 0)]])
+        # Setup tokenize_for_onnx mock (feeds and offsets from one tokenizer call)
+        mock_tokenize_for_onnx.return_value = OnnxTokenization.from_feeds(
+            {
+                "input_ids": np.array([[1, 2]], dtype=np.int64),
+                "attention_mask": np.array([[1, 1]], dtype=np.int64),
+            },
+            np.array([[(0, 0), (0, 0)]]),
+        )
         
         # Setup mocks
         mock_session_instance = MagicMock()
@@ -386,8 +387,7 @@ class TestInferencePerformance:
         # Empty text should produce no entities (or only special tokens)
         assert len(entities) == 0 or all(e["label"] == "O" for e in entities)
 
-    @patch("src.deployment.api.inference.engine.prepare_onnx_inputs")
-    @patch("src.deployment.api.inference.engine.get_offset_mapping")
+    @patch("src.deployment.api.inference.engine.tokenize_for_onnx")
     @patch("transformers.AutoTokenizer")
     @patch("transformers.AutoConfig")
     @patch("onnxruntime.InferenceSession")
@@ -396,8 +396,7 @@ class TestInferencePerformance:
         mock_session,
         mock_config,
         mock_tokenizer_class,
-        mock_get_offset_mapping,
-        mock_prepare_onnx_inputs,
+        mock_tokenize_for_onnx,
         mock_onnx_path,
         mock_checkpoint_dir,
         mock_id2label,
@@ -405,12 +404,14 @@ class TestInferencePerformance:
         """Test that special characters are handled correctly."""
         special_text = "Email: test@example.com Phone: +1-555-1234"
         
-        # Setup prepare_onnx_inputs and get_offset_mapping mocks
-        mock_prepare_onnx_inputs.return_value = {
-            "input_ids": np.array([[1, 2, 3, 4, 5]], dtype=np.int64),
-            "attention_mask": np.array([[1, 1, 1, 1, 1]], dtype=np.int64),
-        }
-        mock_get_offset_mapping.return_value = np.array([[(0, 0), (0, 4), (5, 8), (0, 0), (0, 0)]])
+        # Setup tokenize_for_onnx mock (feeds and offsets from one tokenizer call)
+        mock_tokenize_for_onnx.return_value = OnnxTokenization.from_feeds(
+            {
+                "input_ids": np.array([[1, 2, 3, 4, 5]], dtype=np.int64),
+                "attention_mask": np.array([[1, 1, 1, 1, 1]], dtype=np.int64),
+            },
+            np.array([[(0, 0), (0, 4), (5, 8), (0, 0), (0, 0)]]),
+        )
         
         # Setup mocks
         mock_session_instance = MagicMock()
@@ -480,8 +481,7 @@ class TestInferencePerformance:
         entities = engine.predict(special_text, return_confidence=False)
         assert isinstance(entities, list)
 
-    @patch("src.deployment.api.inference.engine.prepare_onnx_inputs")
-    @patch("src.deployment.api.inference.engine.get_offset_mapping")
+    @patch("src.deployment.api.inference.engine.tokenize_for_onnx")
     @patch("transformers.AutoTokenizer")
     @patch("transformers.AutoConfig")
     @patch("onnxruntime.InferenceSession")
@@ -490,20 +490,21 @@ class TestInferencePerformance:
         mock_session,
         mock_config,
         mock_tokenizer_class,
-        mock_get_offset_mapping,
-        mock_prepare_onnx_inputs,
+        mock_tokenize_for_onnx,
         mock_onnx_path,
         mock_checkpoint_dir,
         sample_text,
         mock_id2label,
     ):
         """Test that tokenization is consistent between offset mapping and ONNX calls."""
-        # Setup prepare_onnx_inputs and get_offset_mapping mocks
-        mock_prepare_onnx_inputs.return_value = {
-            "input_ids": np.array([[1, 2, 3, 4, 5]], dtype=np.int64),
-            "attention_mask": np.array([[1, 1, 1, 1, 1]], dtype=np.int64),
-        }
-        mock_get_offset_mapping.return_value = np.array([[(0, 0), (0, 4), (5, 8), (0, 0), (0, 0)]])
+        # Setup tokenize_for_onnx mock (feeds and offsets from one tokenizer call)
+        mock_tokenize_for_onnx.return_value = OnnxTokenization.from_feeds(
+            {
+                "input_ids": np.array([[1, 2, 3, 4, 5]], dtype=np.int64),
+                "attention_mask": np.array([[1, 1, 1, 1, 1]], dtype=np.int64),
+            },
+            np.array([[(0, 0), (0, 4), (5, 8), (0, 0), (0, 0)]]),
+        )
         
         # Setup mocks
         mock_session_instance = MagicMock()
@@ -576,23 +577,9 @@ class TestInferencePerformance:
         # Predict
         engine.predict(sample_text, return_confidence=False)
         
-        # Verify that prepare_onnx_inputs and get_offset_mapping were called
-        # Since we're mocking these functions, the tokenizer won't be called directly
-        # But the mocks should be called, which is what we care about for consistency
-        assert mock_prepare_onnx_inputs.called, "prepare_onnx_inputs should be called"
-        assert mock_get_offset_mapping.called, "get_offset_mapping should be called"
-        
-        # Verify both were called with the same text
-        prepare_calls = mock_prepare_onnx_inputs.call_args_list
-        get_offset_calls = mock_get_offset_mapping.call_args_list
-        assert len(prepare_calls) > 0, "prepare_onnx_inputs should be called at least once"
-        assert len(get_offset_calls) > 0, "get_offset_mapping should be called at least once"
-        
-        # Check that both were called with the same text (second argument)
-        if len(prepare_calls) > 0 and len(get_offset_calls) > 0:
-            prepare_text = prepare_calls[0][0][1] if len(prepare_calls[0][0]) > 1 else None
-            get_offset_text = get_offset_calls[0][0][1] if len(get_offset_calls[0][0]) > 1 else None
-            if prepare_text and get_offset_text:
-                assert prepare_text == get_offset_text == sample_text, \
-                    f"Both functions should be called with the same text: {sample_text}"
-
+        # Feeds and offsets must come from the same (single) tokenizer call
+        assert mock_tokenize_for_onnx.call_count == 1, \
+            "tokenize_for_onnx should be called exactly once per prediction"
+        tokenize_args = mock_tokenize_for_onnx.call_args[0]
+        assert tokenize_args[1] == [sample_text], \
+            f"tokenize_for_onnx should be called with the input text: {sample_text}"
@@ -0,0 +1,97 @@
+"""Unit tests for the prediction result cache."""
+
+import pytest
+
+from src.deployment.api.result_cache import (
+    ResultCache,
+    fingerprint_file,
+    inference_fingerprint,
+)
+
+
+ENTITIES = [{"text": "John", "label": "NAME", "start": 0, "end": 4, "confidence": 0.9}]
+
+
+class TestResultCache:
+    """Test cases for ResultCache."""
+
+    def test_hit_and_miss_counters(self):
+        """Test that lookups count hits and misses."""
+        cache = ResultCache(model_fingerprint="m1")
+        key = cache.text_key("John works")
+        assert cache.get(key) is None
+        cache.put(key, ENTITIES)
+        assert cache.get(key) == ENTITIES
+
+        stats = cache.stats()
+        assert (stats["hits"], stats["misses"], stats["hit_rate"]) == (1, 1, 0.5)
+
+    def test_keys(self):
+        """Test key normalization and separation of texts, files and models."""
+        cache = ResultCache(model_fingerprint="m1")
+        assert cache.text_key("John works \n") == cache.text_key("John works")
+        assert cache.text_key(" John works") != cache.text_key("John works")
+        assert cache.file_key(b"pdf", "pdf:pymupdf") != cache.file_key(b"pdf", "pdf:pdfplumber")
+        assert ResultCache(model_fingerprint="m2").text_key("a") != cache.text_key("a")
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted first."""
+        cache = ResultCache(max_entries=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.stats()["evictions"] == 1
+
+    def test_ttl_expiry(self, monkeypatch):
+        """Test that entries expire after the TTL."""
+        now = [1000.0]
+        monkeypatch.setattr("src.deployment.api.result_cache.time.time", lambda: now[0])
+        cache = ResultCache(ttl_seconds=10)
+        cache.put("a", 1)
+        now[0] += 11
+        assert cache.get("a") is None
+
+    def test_disk_tier_survives_restart(self, tmp_path):
+        """Test that a new cache instance reads entries from disk."""
+        ResultCache(disk_dir=tmp_path, model_fingerprint="m1").put("a", ENTITIES)
+
+        cache = ResultCache(disk_dir=tmp_path, model_fingerprint="m1")
+        assert cache.get("a") == ENTITIES
+        assert cache.stats()["disk_hits"] == 1
+
+    def test_disk_size_eviction(self, tmp_path):
+        """Test that the disk tier stays under its byte limit."""
+        cache = ResultCache(max_entries=1, disk_dir=tmp_path, disk_max_bytes=300)
+        for i in range(10):
+            cache.put(str(i), "x" * 50)
+        assert 0 < cache.stats()["disk_bytes"] <= 300
+
+    def test_model_change_invalidates(self, tmp_path):
+        """Test that switching models drops cached results in both tiers."""
+        cache = ResultCache(disk_dir=tmp_path, model_fingerprint="m1")
+        cache.put("a", 1)
+        cache.set_model("m2")
+        assert cache.get("a") is None
+        assert not (tmp_path / "m1").exists()
+
+    def test_fingerprint_file(self, tmp_path):
+        """Test that file fingerprints follow content."""
+        first, second = tmp_path / "a.onnx", tmp_path / "b.onnx"
+        first.write_bytes(b"model")
+        second.write_bytes(b"model")
+        assert fingerprint_file(first) == fingerprint_file(second)
+        second.write_bytes(b"other")
+        assert fingerprint_file(first) != fingerprint_file(second)
+
+    def test_inference_fingerprint_tracks_settings(self):
+        """Test that changing inference settings changes the fingerprint."""
+        settings = {"max_length": 512, "window_stride": None, "padding_buckets": [64, 512]}
+        base = inference_fingerprint("m1", settings)
+
+        assert inference_fingerprint("m1", dict(reversed(list(settings.items())))) == base
+        assert inference_fingerprint("m2", settings) != base
+        for change in ({"max_length": 256}, {"window_stride": 128}, {"padding_buckets": []}):
+            assert inference_fingerprint("m1", {**settings, **change}) != base
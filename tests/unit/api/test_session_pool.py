@@ -0,0 +1,81 @@
+"""Unit tests for the ONNX session pool."""
+
+import numpy as np
+import pytest
+
+onnx = pytest.importorskip("onnx")
+pytest.importorskip("onnxruntime")
+
+from src.deployment.api.inference.session_pool import SessionPool, default_intra_op_threads
+
+
+@pytest.fixture
+def identity_model(tmp_path):
+    """Write a one-node Identity model with a dynamic batch axis."""
+    from onnx import TensorProto, helper
+
+    graph = helper.make_graph(
+        [helper.make_node("Identity", ["x"], ["y"])],
+        "identity",
+        [helper.make_tensor_value_info("x", TensorProto.FLOAT, ["batch", 2])],
+        [helper.make_tensor_value_info("y", TensorProto.FLOAT, ["batch", 2])],
+    )
+    model = helper.make_model(graph, opset_imports=[helper.make_opsetid("", 13)])
+    model.ir_version = 8
+    path = tmp_path / "identity.onnx"
+    onnx.save(model, str(path))
+    return path
+
+
+class TestSessionPool:
+    """Test cases for SessionPool."""
+
+    def test_run_and_metadata(self, identity_model):
+        """Test that the pool runs like a single session."""
+        pool = SessionPool(identity_model, ["CPUExecutionProvider"], num_sessions=2)
+        x = np.ones((3, 2), dtype=np.float32)
+
+        assert pool.size == 2
+        assert [i.name for i in pool.get_inputs()] == ["x"]
+        np.testing.assert_array_equal(pool.run(None, {"x": x})[0], x)
+
+    def test_acquire_hands_out_distinct_sessions(self, identity_model):
+        """Test that concurrent borrowers get different idle sessions."""
+        pool = SessionPool(identity_model, ["CPUExecutionProvider"], num_sessions=2)
+        with pool.acquire() as first, pool.acquire() as second:
+            assert first is not second
+            with pytest.raises(TimeoutError):
+                with pool.acquire(timeout=0.01):
+                    pass
+        # Both sessions are returned once released
+        with pool.acquire(timeout=0.01), pool.acquire(timeout=0.01):
+            pass
+
+    def test_parallel_execution_mode(self, identity_model):
+        """Test that parallel execution mode and explicit threads are accepted."""
+        pool = SessionPool(
+            identity_model,
+            ["CPUExecutionProvider"],
+            intra_op_threads=1,
+            inter_op_threads=2,
+            execution_mode="parallel",
+        )
+        assert pool.intra_op_threads == 1
+        assert pool.run(None, {"x": np.zeros((1, 2), dtype=np.float32)})[0].shape == (1, 2)
+
+    def test_invalid_configuration(self, identity_model):
+        """Test that invalid pool settings are rejected."""
+        with pytest.raises(ValueError):
+            SessionPool(identity_model, ["CPUExecutionProvider"], num_sessions=0)
+        with pytest.raises(ValueError):
+            SessionPool(identity_model, ["CPUExecutionProvider"], execution_mode="async")
+        with pytest.raises(ValueError):
+            SessionPool(
+                identity_model, ["CPUExecutionProvider"], num_sessions=2, cpu_affinities=["1"])
+
+    def test_default_threads_split_cores(self, monkeypatch):
+        """Test that default intra-op threads split cores across sessions."""
+        monkeypatch.setattr("os.cpu_count", lambda: 8)
+        assert default_intra_op_threads(1) == 4
+        assert default_intra_op_threads(4) == 2
+        assert default_intra_op_threads(16) == 1
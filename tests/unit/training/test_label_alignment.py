@@ -0,0 +1,85 @@
+"""Tests for annotation-to-token label alignment."""
+
+import random
+
+import numpy as np
+
+from data.loaders import align_annotations_to_tokens, encode_annotations_to_labels
+
+
+LABEL2ID = {"O": 0, "NAME": 1, "SKILL": 2}
+BIO_LABEL2ID = {"O": 0, "B-NAME": 1, "I-NAME": 2, "B-SKILL": 3, "I-SKILL": 4}
+# [CLS] john doe knows python java [SEP] [PAD]
+OFFSETS = [(0, 0), (0, 4), (5, 8), (9, 14), (15, 21), (22, 26), (0, 0), (0, 0)]
+
+
+def reference_labels(annotations, offsets, label2id):
+    """Per-token scan over all annotations (first overlapping annotation wins)."""
+    labels = []
+    for start, end in offsets:
+        lab = "O"
+        for ann_start, ann_end, ent in annotations:
+            if not (end <= ann_start or start >= ann_end):
+                lab = ent
+                break
+        labels.append(label2id.get(lab, label2id["O"]))
+    return labels
+
+
+class TestAlignAnnotationsToTokens:
+    """Test cases for align_annotations_to_tokens."""
+
+    def test_single_document(self):
+        """Test entity spans, special tokens and padding."""
+        annotations = [[0, 8, "NAME"], [15, 21, "SKILL"], [22, 26, "SKILL"]]
+        labels = encode_annotations_to_labels("", annotations, OFFSETS, LABEL2ID)
+
+        assert labels == [0, 1, 1, 0, 2, 2, 0, 0]
+
+    def test_bio_tags(self):
+        """Test that each annotation starts with B- even when adjacent to the same type."""
+        annotations = [[0, 8, "NAME"], [15, 21, "SKILL"], [22, 26, "SKILL"]]
+        labels = encode_annotations_to_labels("", annotations, OFFSETS, BIO_LABEL2ID, bio=True)
+
+        assert labels == [0, 1, 2, 0, 3, 3, 0, 0]
+
+    def test_batch_with_ragged_rows(self):
+        """Test that documents in one batch do not bleed into each other."""
+        offsets = [OFFSETS, [(0, 0), (0, 4), (0, 0)], []]
+        annotations = [[[22, 26, "SKILL"]], [[0, 4, "NAME"]], [[0, 3, "NAME"]]]
+        labels = align_annotations_to_tokens(annotations, offsets, LABEL2ID)
+
+        assert [row.tolist() for row in labels] == [[0, 0, 0, 0, 0, 2, 0, 0], [0, 1, 0], []]
+
+    def test_matches_reference_on_random_batches(self):
+        """Test equivalence with the per-token scan, including overlaps and unknown types."""
+        rng = random.Random(0)
+        for _ in range(300):
+            offsets, annotations = [], []
+            for _ in range(rng.randint(1, 4)):
+                pos, doc_offsets = rng.randint(0, 3), [(0, 0)]
+                for _ in range(rng.randint(0, 12)):
+                    length = rng.randint(0, 4)
+                    doc_offsets.append((pos, pos + length))
+                    pos += length + rng.randint(0, 2)
+                doc_offsets.append((0, 0))
+                if rng.random() < 0.1:
+                    rng.shuffle(doc_offsets)
+                doc_annotations = []
+                for _ in range(rng.randint(0, 4)):
+                    start = rng.randint(0, pos + 2)
+                    doc_annotations.append(
+                        [start, start + rng.randint(-1, 6), rng.choice(["NAME", "SKILL", "ORG"])])
+                offsets.append(doc_offsets)
+                annotations.append(doc_annotations)
+
+            labels = align_annotations_to_tokens(annotations, offsets, LABEL2ID)
+            for row, doc_annotations, doc_offsets in zip(labels, annotations, offsets):
+                assert row.tolist() == reference_labels(doc_annotations, doc_offsets, LABEL2ID)
+
+    def test_padded_batch_array(self):
+        """Test a padded (batch, seq_len, 2) offsets array."""
+        offsets = np.array([OFFSETS, OFFSETS])
+        labels = align_annotations_to_tokens([[[0, 4, "NAME"]], None], offsets, LABEL2ID)
+
+        assert [row.tolist() for row in labels] == [[0, 1, 0, 0, 0, 0, 0, 0], [0] * 8]
@@ -0,0 +1,81 @@
+"""Tests for length-grouped batch sampling."""
+
+import numpy as np
+import pytest
+
+from training.core.samplers import LengthGroupedBatchSampler
+
+
+LENGTHS = [30, 512, 40, 500, 35, 480, 25, 510, 45, 490, 20, 505]
+
+
+def padded_tokens(batches, lengths):
+    """Total tokens after padding each batch to its longest sample."""
+    return sum(len(b) * max(lengths[i] for i in b) for b in batches)
+
+
+class TestLengthGroupedBatchSampler:
+    """Test cases for LengthGroupedBatchSampler."""
+
+    def test_covers_every_sample_once(self):
+        """Test that an epoch yields each index exactly once."""
+        sampler = LengthGroupedBatchSampler(LENGTHS, batch_size=4, megabatch_size=12, seed=1)
+        indices = [i for batch in sampler for i in batch]
+
+        assert sorted(indices) == list(range(len(LENGTHS)))
+        assert len(sampler) == 3
+
+    def test_groups_reduce_padding(self):
+        """Test that grouping pads far less than a random batching."""
+        sampler = LengthGroupedBatchSampler(LENGTHS, batch_size=2, megabatch_size=12)
+        rng = np.random.default_rng(0)
+        random_batches = np.array_split(rng.permutation(len(LENGTHS)), 6)
+
+        assert padded_tokens(sampler, LENGTHS) < padded_tokens(random_batches, LENGTHS)
+        for batch in sampler:
+            assert len({LENGTHS[i] > 100 for i in batch}) == 1
+
+    def test_set_epoch_reshuffles_deterministically(self):
+        """Test that the order depends on seed and epoch only."""
+        first = LengthGroupedBatchSampler(LENGTHS, batch_size=2, seed=3)
+        second = LengthGroupedBatchSampler(LENGTHS, batch_size=2, seed=3)
+
+        assert list(first) == list(second)
+        epoch0 = list(first)
+        first.set_epoch(1)
+        assert list(first) != epoch0
+
+    def test_token_budget(self):
+        """Test that batches stay within max_tokens, except single oversized samples."""
+        sampler = LengthGroupedBatchSampler(LENGTHS, max_tokens=1024, megabatch_size=12)
+        batches = list(sampler)
+
+        assert sorted(i for b in batches for i in b) == list(range(len(LENGTHS)))
+        for batch in batches:
+            assert len(batch) * max(LENGTHS[i] for i in batch) <= 1024
+        # Short samples share a batch
+        assert max(len(b) for b in batches) > 2
+
+        oversized = LengthGroupedBatchSampler([10, 4000], max_tokens=1024, shuffle=False)
+        assert list(oversized) == [[1], [0]]
+
+    def test_distributed_shards(self):
+        """Test that ranks get disjoint, equally sized shards of the same batch list."""
+        shards = [
+            list(LengthGroupedBatchSampler(
+                LENGTHS, batch_size=3, seed=7, num_replicas=3, rank=rank))
+            for rank in range(3)
+        ]
+        full = list(LengthGroupedBatchSampler(LENGTHS, batch_size=3, seed=7))
+
+        assert {len(shard) for shard in shards} == {2}
+        assert sorted(sum(shards, [])) == sorted(full + full[:2])
+
+    def test_invalid_arguments(self):
+        """Test that missing or invalid sizes are rejected."""
+        with pytest.raises(ValueError):
+            LengthGroupedBatchSampler(LENGTHS)
+        with pytest.raises(ValueError):
+            LengthGroupedBatchSampler(LENGTHS, max_tokens=0)
+        with pytest.raises(ValueError):
+            LengthGroupedBatchSampler(LENGTHS, batch_size=2, num_replicas=2, rank=2)
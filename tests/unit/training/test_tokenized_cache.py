@@ -0,0 +1,188 @@
+"""Tests for the pre-tokenized dataset cache."""
+
+import pytest
+
+pytestmark = pytest.mark.torch
+
+torch = pytest.importorskip("torch")
+transformers = pytest.importorskip("transformers")
+
+from data.loaders import ResumeNERDataset, TokenizedDataset, load_or_build_tokenized_dataset
+from data.loaders.tokenized_cache import dataset_fingerprint
+
+
+LABEL2ID = {"O": 0, "NAME": 1, "ORG": 2}
+SAMPLES = [
+    {"text": "john doe works at microsoft", "annotations": [[0, 8, "NAME"], [18, 27, "ORG"]]},
+    {"text": "microsoft in seattle .", "annotations": [[0, 9, "ORG"]]},
+    {"text": ["john", "doe"], "annotations": None},
+    {"text": "", "annotations": []},
+]
+
+
+@pytest.fixture
+def tokenizer(tmp_path):
+    """Build a small fast BERT tokenizer from a local vocab (no downloads)."""
+    words = ["john", "doe", "works", "at", "microsoft", "in", "seattle", "."]
+    vocab = ["[PAD]", "[UNK]", "[CLS]", "[SEP]", "[MASK]"] + words
+    vocab_file = tmp_path / "vocab.txt"
+    vocab_file.write_text("\n".join(vocab))
+    return transformers.BertTokenizerFast(str(vocab_file))
+
+
+def assert_items_equal(actual, expected):
+    """Assert two encoded items have the same keys and tensors."""
+    assert set(actual) == set(expected)
+    for key in expected:
+        assert actual[key].dtype == torch.long
+        assert torch.equal(actual[key], expected[key]), key
+
+
+class TestTokenizedCache:
+    """Test cases for load_or_build_tokenized_dataset."""
+
+    def test_items_match_resume_ner_dataset(self, tokenizer, tmp_path):
+        """Test that cached items equal on-the-fly encoding, including truncation."""
+        for max_length in (6, 32):
+            cached = load_or_build_tokenized_dataset(
+                SAMPLES, tokenizer, max_length, LABEL2ID, tmp_path / "cache")
+            reference = ResumeNERDataset(SAMPLES, tokenizer, max_length, LABEL2ID)
+
+            assert len(cached) == len(reference)
+            for i in range(len(reference)):
+                assert_items_equal(cached[i], reference[i])
+
+    def test_cache_is_reused(self, tokenizer, tmp_path, monkeypatch):
+        """Test that a second load reads the cache instead of re-tokenizing."""
+        cache_dir = tmp_path / "cache"
+        load_or_build_tokenized_dataset(SAMPLES, tokenizer, 32, LABEL2ID, cache_dir)
+        entries = list(cache_dir.iterdir())
+
+        def fail(*args, **kwargs):
+            raise AssertionError("dataset was re-tokenized")
+
+        monkeypatch.setattr("data.loaders.tokenized_cache._encode_samples", fail)
+        dataset = load_or_build_tokenized_dataset(SAMPLES, tokenizer, 32, LABEL2ID, cache_dir)
+
+        assert list(cache_dir.iterdir()) == entries
+        assert len(dataset) == len(SAMPLES)
+
+    def test_key_changes_with_inputs(self, tokenizer, tmp_path):
+        """Test that data, max_length and labels each get their own entry."""
+        cache_dir = tmp_path / "cache"
+        load_or_build_tokenized_dataset(SAMPLES, tokenizer, 32, LABEL2ID, cache_dir)
+        load_or_build_tokenized_dataset(SAMPLES, tokenizer, 16, LABEL2ID, cache_dir)
+        load_or_build_tokenized_dataset(SAMPLES[:2], tokenizer, 32, LABEL2ID, cache_dir)
+        load_or_build_tokenized_dataset(SAMPLES, tokenizer, 32, {"O": 0}, cache_dir)
+
+        assert len(list(cache_dir.iterdir())) == 4
+        assert dataset_fingerprint(SAMPLES) != dataset_fingerprint(SAMPLES[::-1])
+
+    def test_empty_dataset(self, tokenizer, tmp_path):
+        """Test that an empty split gets an empty cache entry instead of failing."""
+        cache_dir = tmp_path / "cache"
+        dataset = load_or_build_tokenized_dataset([], tokenizer, 32, LABEL2ID, cache_dir)
+
+        assert len(dataset) == 0
+        assert dataset.arrays["labels"].dtype == "int32"
+        assert len(load_or_build_tokenized_dataset([], tokenizer, 32, LABEL2ID, cache_dir)) == 0
+
+    def test_subset_views(self, tokenizer, tmp_path):
+        """Test that subsets index the shared arrays like fold lists."""
+        full = load_or_build_tokenized_dataset(
+            SAMPLES, tokenizer, 32, LABEL2ID, tmp_path / "cache")
+        fold = full.subset([3, 1])
+        nested = fold.subset([1])
+
+        assert len(fold) == 2
+        assert_items_equal(fold[1], full[1])
+        assert_items_equal(nested[0], full[1])
+        assert list(fold.lengths) == [len(full[3]["input_ids"]), len(full[1]["input_ids"])]
+
+    def test_corrupt_entry_is_rebuilt(self, tokenizer, tmp_path):
+        """Test that an unreadable entry is rebuilt rather than raising."""
+        cache_dir = tmp_path / "cache"
+        load_or_build_tokenized_dataset(SAMPLES, tokenizer, 32, LABEL2ID, cache_dir)
+        entry = next(cache_dir.iterdir())
+        (entry / "meta.json").write_text("{")
+
+        dataset = load_or_build_tokenized_dataset(SAMPLES, tokenizer, 32, LABEL2ID, cache_dir)
+
+        assert isinstance(dataset, TokenizedDataset)
+        assert len(TokenizedDataset.load(entry)) == len(SAMPLES)
+
+
+class TestPrepareDataLoadersWithCache:
+    """Test cases for prepare_data_loaders with a tokenization cache."""
+
+    def test_folds_share_one_cache_entry(self, tokenizer, tmp_path):
+        """Test that CV folds are views of one cached train split."""
+        from training.core.trainer import prepare_data_loaders
+
+        config = {
+            "model": {"preprocessing": {"max_length": 32}, "backbone": "bert"},
+            "training": {"batch_size": 2},
+        }
+        dataset = {"train": SAMPLES, "validation": []}
+        cache_dir = tmp_path / "cache"
+
+        for train_indices, val_indices in (([0, 1], [2, 3]), ([2, 3], [0, 1])):
+            train_loader, val_loader = prepare_data_loaders(
+                config, dataset, tokenizer, LABEL2ID,
+                train_indices=train_indices, val_indices=val_indices, cache_dir=cache_dir,
+            )
+            assert len(train_loader.dataset) == 2
+            assert len(val_loader.dataset) == 2
+            batch = next(iter(val_loader))
+            assert batch["labels"].shape == batch["input_ids"].shape
+
+        assert len(list(cache_dir.iterdir())) == 1
+
+    def test_token_budget_batches(self, tokenizer, tmp_path):
+        """Test that training.batching switches to length-grouped token-budget batches."""
+        from training.core.samplers import LengthGroupedBatchSampler
+        from training.core.trainer import prepare_data_loaders
+
+        config = {
+            "model": {"preprocessing": {"max_length": 32}, "backbone": "deberta-v3"},
+            "training": {"batch_size": 1, "batching": {"max_tokens": 24}},
+        }
+        dataset = {"train": SAMPLES, "validation": SAMPLES[:2]}
+        train_loader, val_loader = prepare_data_loaders(
+            config, dataset, tokenizer, LABEL2ID, cache_dir=tmp_path / "cache")
+
+        assert isinstance(train_loader.batch_sampler, LengthGroupedBatchSampler)
+        for batch in train_loader:
+            assert batch["input_ids"].numel() <= 24
+        assert sum(len(b["input_ids"]) for b in val_loader) == 2
+        # Short samples share a batch despite batch_size=1
+        assert len(train_loader) < len(SAMPLES)
+
+    def test_worker_processes(self, tokenizer, tmp_path):
+        """Test that cached datasets load through DataLoader worker processes."""
+        from training.core.trainer import prepare_data_loaders
+
+        config = {
+            "model": {"preprocessing": {"max_length": 32}, "backbone": "bert"},
+            "training": {"batch_size": 2, "dataloader": {"num_workers": 2, "prefetch_factor": 1}},
+        }
+        train_loader, val_loader = prepare_data_loaders(
+            config, {"train": SAMPLES, "validation": SAMPLES[:1]}, tokenizer, LABEL2ID,
+            cache_dir=tmp_path / "cache")
+
+        assert train_loader.num_workers == 2
+        assert train_loader.persistent_workers
+        assert sum(len(batch["labels"]) for batch in train_loader) == len(SAMPLES)
+        assert sum(len(batch["labels"]) for batch in val_loader) == 1
+
+    def test_resolve_cache_dir(self, tmp_path):
+        """Test cache directory resolution from the training config."""
+        from training.core.trainer import resolve_tokenization_cache_dir
+
+        assert resolve_tokenization_cache_dir({"training": {}}) is None
+        assert resolve_tokenization_cache_dir(
+            {"training": {"tokenization_cache": {"enabled": False, "dir": str(tmp_path)}}}
+        ) is None
+        assert resolve_tokenization_cache_dir(
+            {"training": {"tokenization_cache": {"enabled": True, "dir": str(tmp_path)}}}
+        ) == tmp_path
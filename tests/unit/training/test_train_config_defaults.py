@@ -21,7 +21,7 @@ def test_core_training_defaults():
     assert float(training["weight_decay"]) == 0.01
     assert training["warmup_steps"] == 500
     assert float(training["max_grad_norm"]) == 1.0
-    assert training["gradient_accumulation_steps"] == 2
+    assert training["gradient_accumulation_steps"] == 1
 
 
 def test_metric_defaults():
@@ -354,6 +354,38 @@ class TestCreateOptimizerAndScheduler:
         assert call_kwargs["num_warmup_steps"] == 10
 
 
+class TestResolveDataloaderKwargs:
+    """Tests for resolve_dataloader_kwargs function."""
+
+    def test_auto_defaults(self, monkeypatch):
+        """Test auto worker count per process and CUDA-only pinned memory."""
+        from training.core.trainer import resolve_dataloader_kwargs
+        from training.execution.distributed import RunContext
+
+        monkeypatch.setattr("os.cpu_count", lambda: 8)
+        cpu = RunContext(device=torch.device("cpu"))
+        ddp = RunContext(device=torch.device("cuda", 0), world_size=4, distributed=True)
+
+        assert resolve_dataloader_kwargs({}, cpu) == {
+            "num_workers": 4, "pin_memory": False, "persistent_workers": True}
+        assert resolve_dataloader_kwargs({}, ddp) == {
+            "num_workers": 1, "pin_memory": True, "persistent_workers": True}
+
+    def test_explicit_values(self):
+        """Test explicit settings, and that worker-only options are dropped without workers."""
+        from training.core.trainer import resolve_dataloader_kwargs
+        from training.execution.distributed import RunContext
+
+        cpu = RunContext(device=torch.device("cpu"))
+        cfg = {"dataloader": {"num_workers": 2, "pin_memory": True,
+                              "persistent_workers": False, "prefetch_factor": 4}}
+        assert resolve_dataloader_kwargs(cfg, cpu) == {
+            "num_workers": 2, "pin_memory": True, "persistent_workers": False, "prefetch_factor": 4}
+
+        cfg = {"dataloader": {"num_workers": 0, "prefetch_factor": 4}}
+        assert resolve_dataloader_kwargs(cfg, cpu) == {"num_workers": 0, "pin_memory": False}
+
+
 class TestRunTrainingLoop:
     """Tests for run_training_loop function."""
 
@@ -446,6 +478,291 @@ class TestRunTrainingLoop:
         assert mock_scheduler.step.call_count == 3
 
 
+class _TinyTokenModel(torch.nn.Module if torch is not None else object):
+    """Embedding + linear token classifier that records autocast state."""
+
+    def __init__(self):
+        super().__init__()
+        self.embed = torch.nn.Embedding(16, 8)
+        self.head = torch.nn.Linear(8, 3)
+        self.autocast_dtypes = []
+
+    def forward(self, input_ids, labels):
+        from types import SimpleNamespace
+
+        self.autocast_dtypes.append(
+            torch.get_autocast_dtype("cpu") if torch.is_autocast_enabled("cpu") else None)
+        logits = self.head(self.embed(input_ids))
+        loss = torch.nn.functional.cross_entropy(logits.float().view(-1, 3), labels.view(-1))
+        return SimpleNamespace(loss=loss)
+
+
+class TestTrainingPerformance:
+    """Tests for mixed precision and gradient accumulation in the training loop."""
+
+    def _run(self, performance, num_batches=5, epochs=1):
+        from training.core.trainer import run_training_loop
+        from training.execution.distributed import RunContext
+
+        torch.manual_seed(0)
+        model = _TinyTokenModel()
+        batches = [
+            {
+                "input_ids": torch.randint(0, 16, (2, 6)),
+                "labels": torch.randint(0, 3, (2, 6)),
+            }
+            for _ in range(num_batches)
+        ]
+        optimizer = MagicMock(wraps=torch.optim.SGD(model.parameters(), lr=0.1))
+        scheduler = MagicMock()
+        context = MagicMock(spec=RunContext)
+        context.device = torch.device("cpu")
+        context.distributed = False
+
+        run_training_loop(
+            model, batches, optimizer, scheduler, epochs=epochs, max_grad_norm=1.0,
+            context=context, performance=performance,
+        )
+        return model, optimizer, scheduler
+
+    def test_gradient_accumulation_steps(self):
+        """Test that the optimizer steps once per accumulated group, including the remainder."""
+        from training.config import ResolvedPerformanceConfig
+
+        _, optimizer, scheduler = self._run(
+            ResolvedPerformanceConfig(gradient_accumulation_steps=2), num_batches=5, epochs=2)
+
+        assert optimizer.step.call_count == 6
+        assert scheduler.step.call_count == 6
+        optimizer.zero_grad.assert_called_with(set_to_none=True)
+
+    def test_partial_accumulation_group_is_scaled_by_its_size(self):
+        """Test that a final group smaller than gradient_accumulation_steps is not down-weighted."""
+        from training.config import ResolvedPerformanceConfig
+
+        def record_grads(performance):
+            grads = []
+            with patch(
+                "torch.nn.utils.clip_grad_norm_",
+                side_effect=lambda params, _: grads.append(
+                    [p.grad.clone() for p in params]),
+            ):
+                self._run(performance, num_batches=1)
+            return grads
+
+        plain = record_grads(None)
+        accumulated = record_grads(ResolvedPerformanceConfig(gradient_accumulation_steps=4))
+
+        assert len(accumulated) == 1
+        for expected, actual in zip(plain[0], accumulated[0]):
+            assert torch.allclose(expected, actual)
+
+    def test_bf16_autocast_on_cpu(self):
+        """Test that bf16 precision runs the forward pass under CPU autocast."""
+        from training.config import ResolvedPerformanceConfig
+
+        model, optimizer, _ = self._run(ResolvedPerformanceConfig(precision="bf16"), num_batches=2)
+
+        assert model.autocast_dtypes == [torch.bfloat16, torch.bfloat16]
+        assert optimizer.step.call_count == 2
+        assert all(torch.isfinite(p).all() for p in model.parameters())
+
+    def test_default_loop_is_fp32(self):
+        """Test that no autocast is used without a performance config."""
+        model, _, _ = self._run(None, num_batches=1)
+
+        assert model.autocast_dtypes == [None]
+
+    def test_resolve_performance_config(self):
+        """Test that performance options are off unless enabled."""
+        from training.config import resolve_performance_config
+
+        disabled = resolve_performance_config(
+            {"training": {"gradient_accumulation_steps": 4,
+                          "performance": {"enabled": False, "compile": True}}})
+        assert disabled.precision == "fp32"
+        assert not disabled.compile
+        assert disabled.gradient_accumulation_steps == 4
+
+        enabled = resolve_performance_config(
+            {"training": {"gradient_accumulation_steps": 4,
+                          "performance": {"enabled": True, "precision": "FP16"}}})
+        assert enabled.precision == "fp16"
+        assert enabled.non_blocking
+        assert enabled.gradient_accumulation_steps == 4
+
+        with pytest.raises(ValueError):
+            resolve_performance_config(
+                {"training": {"performance": {"enabled": True, "precision": "int8"}}})
+
+
+class TestTrainingProgress:
+    """Tests for in-training evaluation and early stopping."""
+
+    def _loop(self, make_hook, num_batches=5, epochs=2, eval_interval=None):
+        from training.core.trainer import run_training_loop
+        from training.execution.distributed import RunContext
+
+        torch.manual_seed(0)
+        model = _TinyTokenModel()
+        batches = [
+            {"input_ids": torch.randint(0, 16, (2, 6)), "labels": torch.randint(0, 3, (2, 6))}
+            for _ in range(num_batches)
+        ]
+        context = MagicMock(spec=RunContext)
+        context.device = torch.device("cpu")
+        context.distributed = False
+
+        steps = run_training_loop(
+            model, batches, torch.optim.SGD(model.parameters(), lr=0.1), MagicMock(),
+            epochs=epochs, max_grad_norm=1.0, context=context,
+            eval_hook=make_hook(model), eval_interval=eval_interval,
+        )
+        return model, steps
+
+    def test_early_stopping_tracker(self):
+        """Test patience and min_delta in both modes."""
+        from training.core.progress import EarlyStopping
+
+        stopper = EarlyStopping(patience=2, min_delta=0.01, mode="max")
+        assert [stopper.update(v) for v in (0.5, 0.505, 0.52, 0.52)] == [True, False, True, False]
+        assert not stopper.should_stop
+        stopper.update(0.4)
+        assert stopper.should_stop and stopper.best == 0.52
+
+        lower = EarlyStopping(patience=1, mode="min")
+        assert lower.update(1.0) and lower.update(0.5) and not lower.update(0.7)
+        assert lower.should_stop
+
+    def test_step_interval_hook_calls(self):
+        """Test that the hook runs every N optimizer steps and at each epoch end."""
+        hook = MagicMock(return_value=False)
+        _, steps = self._loop(lambda model: hook, num_batches=5, epochs=2, eval_interval=2)
+
+        calls = [c.args for c in hook.call_args_list]
+        assert steps == 10
+        assert [step for _, step in calls] == [2, 4, 5, 6, 8, 10]
+        assert [epoch for epoch, _ in calls] == pytest.approx([0.4, 0.8, 1, 1.2, 1.6, 2])
+
+    def test_early_stop_restores_best_and_streams_metrics(self, tmp_path):
+        """Test that training stops on a plateau, best weights return and metrics stream."""
+        from training.core.progress import EarlyStopping, IntermediateMetricsWriter, TrainingMonitor
+        from training.hpo.trial.metrics import read_intermediate_metrics
+
+        scores = iter([0.5, 0.7, 0.6, 0.65, 0.9])
+        snapshots = []
+        monitors = []
+
+        def make_monitor(model):
+            def evaluate():
+                snapshots.append({k: v.clone() for k, v in model.state_dict().items()})
+                return {"macro-f1": next(scores), "per_entity": {"NAME": {"f1": 1.0}}}
+
+            monitor = TrainingMonitor(
+                model, evaluate, metric="macro-f1",
+                early_stopping=EarlyStopping(patience=2), keep_best=True,
+                writer=IntermediateMetricsWriter(tmp_path / "intermediate_metrics.jsonl"),
+            )
+            monitors.append(monitor)
+            return monitor
+
+        model, steps = self._loop(make_monitor, num_batches=3, epochs=10)
+        monitor = monitors[0]
+
+        assert steps == 12
+        assert model.training
+        assert monitor.restore_best()
+        assert all(torch.equal(model.state_dict()[k], v) for k, v in snapshots[1].items())
+        assert monitor.final_metrics(steps)["macro-f1"] == 0.7
+
+        records = read_intermediate_metrics(tmp_path)
+        assert [r["epoch"] for r in records] == [1, 2, 3, 4]
+        assert [r["metrics"]["macro-f1"] for r in records] == [0.5, 0.7, 0.6, 0.65]
+        assert "per_entity" not in records[0]["metrics"]
+
+    def test_partial_line_is_ignored(self, tmp_path):
+        """Test that a line still being written is skipped by the reader."""
+        from training.hpo.trial.metrics import read_intermediate_metrics
+
+        (tmp_path / "intermediate_metrics.jsonl").write_text(
+            '{"epoch": 1, "step": 3, "metrics": {"macro-f1": 0.5}}\n{"epoch": 2, "st')
+
+        assert [r["step"] for r in read_intermediate_metrics(tmp_path)] == [3]
+        assert read_intermediate_metrics(tmp_path / "missing") == []
+
+
+class TestPretrainedCache:
+    """Tests for reusing pretrained weights across models in one process."""
+
+    def test_cached_backbone_with_fresh_head(self, tmp_path):
+        """Test that cached loads reuse backbone weights but re-initialize the head."""
+        import transformers
+        from training.core import model as model_module
+
+        bert_config = transformers.BertConfig(
+            vocab_size=16, hidden_size=8, num_hidden_layers=1,
+            num_attention_heads=2, intermediate_size=16)
+        transformers.BertModel(bert_config).save_pretrained(tmp_path)
+        (tmp_path / "vocab.txt").write_text("\n".join(
+            ["[PAD]", "[UNK]", "[CLS]", "[SEP]", "[MASK]"] + [f"w{i}" for i in range(11)]))
+        label2id = {"O": 0, "NAME": 1}
+        id2label = {0: "O", 1: "NAME"}
+        config = {"model": {"backbone": str(tmp_path)}}
+
+        model_module.enable_pretrained_cache()
+        try:
+            first, tokenizer, _ = model_module.create_model_and_tokenizer(
+                config, label2id, id2label, device=torch.device("cpu"))
+            with patch.object(transformers.AutoModelForTokenClassification, "from_pretrained",
+                              side_effect=AssertionError("weights were reloaded")):
+                second, cached_tokenizer, _ = model_module.create_model_and_tokenizer(
+                    config, label2id, id2label, device=torch.device("cpu"))
+        finally:
+            model_module.clear_pretrained_cache()
+
+        assert cached_tokenizer is tokenizer
+        assert second.config.label2id == label2id
+        first_state, second_state = first.state_dict(), second.state_dict()
+        assert all(torch.equal(first_state[k], second_state[k])
+                   for k in first_state if not k.startswith("classifier."))
+        assert not torch.equal(first_state["classifier.weight"], second_state["classifier.weight"])
+
+    def test_same_seed_gives_same_head_on_cache_hit_and_miss(self, tmp_path):
+        """Test that a cached load initializes the head exactly like a cold load."""
+        import transformers
+        from training.core import model as model_module
+
+        bert_config = transformers.BertConfig(
+            vocab_size=16, hidden_size=8, num_hidden_layers=1,
+            num_attention_heads=2, intermediate_size=16)
+        transformers.BertModel(bert_config).save_pretrained(tmp_path)
+        (tmp_path / "vocab.txt").write_text("\n".join(
+            ["[PAD]", "[UNK]", "[CLS]", "[SEP]", "[MASK]"] + [f"w{i}" for i in range(11)]))
+        label2id = {"O": 0, "NAME": 1}
+        id2label = {0: "O", 1: "NAME"}
+        config = {"model": {"backbone": str(tmp_path)}}
+
+        def load():
+            torch.manual_seed(0)
+            model, _, _ = model_module.create_model_and_tokenizer(
+                config, label2id, id2label, device=torch.device("cpu"))
+            # Draw after loading too, so differing RNG consumption shows up
+            return model.state_dict(), torch.rand(1)
+
+        uncached_state, uncached_draw = load()
+        model_module.enable_pretrained_cache()
+        try:
+            miss_state, miss_draw = load()
+            hit_state, hit_draw = load()
+        finally:
+            model_module.clear_pretrained_cache()
+
+        for state in (miss_state, hit_state):
+            assert state.keys() == uncached_state.keys()
+            assert all(torch.equal(uncached_state[k], state[k]) for k in state)
+        assert torch.equal(uncached_draw, miss_draw) and torch.equal(miss_draw, hit_draw)
+
+
 class TestSaveCheckpoint:
     """Tests for save_checkpoint function."""
 